@@ -1,7 +1,15 @@
+import math
+from typing import Any
+
 from fastapi import APIRouter, Response
 
 from ..core.observability import observability
+from ..core.persistence import persistence
 from ..core.tls_status import get_tls_status
+from ..middleware.pipeline import pipeline_stats
+from ..middleware.rate_limiting import rate_limiter_stats
+from ..services.mjpeg_hub import mjpeg_hub
+from ..services.websocket_hub import websocket_hub
 
 router = APIRouter()
 
@@ -10,6 +18,29 @@ def _sanitize_metric_name(name: str) -> str:
     return "lawnberry_" + "".join(ch if ch.isalnum() else "_" for ch in name).lower()
 
 
+# Windowed summary keys exported as Prometheus-style quantile labels.
+_WINDOW_QUANTILES = {"p50": "0.5", "p90": "0.9", "p95": "0.95", "p99": "0.99", "max": "1"}
+
+
+def _label_value(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, Any], **extra: Any) -> str:
+    pairs = {**labels, **extra}
+    if not pairs:
+        return ""
+    body = ",".join(
+        f'{"".join(ch if ch.isalnum() else "_" for ch in key)}="{_label_value(value)}"'
+        for key, value in pairs.items()
+    )
+    return "{" + body + "}"
+
+
+def _format_le(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else f"{bound:g}"
+
+
 @router.get("/metrics")
 def metrics() -> Response:
     """Expose a Prometheus-compatible metrics snapshot."""
@@ -49,6 +80,106 @@ def metrics() -> Response:
         lines.append(f"{metric_base}_avg_ms {avg:.2f}")
         lines.append(f"{metric_base}_min_ms {min_v:.2f}")
         lines.append(f"{metric_base}_max_ms {max_v:.2f}")
+        # Tail latency over sliding windows; averages hide tick jitter.
+        for window, window_stats in stats.get("windows", {}).items():
+            for key, quantile in _WINDOW_QUANTILES.items():
+                if key not in window_stats:
+                    continue
+                lines.append(
+                    f'{metric_base}_quantile_ms{{window="{window}",quantile="{quantile}"}} '
+                    f"{window_stats[key]:.3f}"
+                )
+            lines.append(f'{metric_base}_window_count{{window="{window}"}} {window_stats["count"]}')
+
+    # Native Prometheus histograms, one series per label set.
+    for timer, series_list in snapshot.get("histograms", {}).items():
+        family = _sanitize_metric_name(f"{timer}_ms")
+        lines.append(f"# TYPE {family} histogram")
+        for series in series_list:
+            labels = series.get("labels", {})
+            for bound, cumulative in series.get("buckets", []):
+                lines.append(
+                    f"{family}_bucket{_format_labels(labels, le=_format_le(bound))} {cumulative}"
+                )
+            lines.append(f"{family}_sum{_format_labels(labels)} {series.get('sum', 0.0):.3f}")
+            lines.append(f"{family}_count{_format_labels(labels)} {series.get('count', 0)}")
+
+    # Per-client WebSocket delivery metrics
+    try:
+        client_stats = websocket_hub.get_client_stats()
+    except Exception:
+        client_stats = {}
+    for client_id, stats in sorted(client_stats.items()):
+        label = f'client="{client_id}"'
+        lines.append(f"lawnberry_websocket_client_queue_depth{{{label}}} {stats['queue_depth']}")
+        lines.append(f"lawnberry_websocket_client_dropped_total{{{label}}} {stats['dropped']}")
+        lines.append(
+            f"lawnberry_websocket_client_coalesced_total{{{label}}} {stats['coalesced']}"
+        )
+        lines.append(f"lawnberry_websocket_client_sent_total{{{label}}} {stats['sent']}")
+        lines.append(
+            f"lawnberry_websocket_client_cadence_hz{{{label}}} {stats['cadence_hz']:.2f}"
+        )
+        lines.append(
+            f"lawnberry_websocket_client_send_avg_ms{{{label}}} {stats['send_avg_ms']:.2f}"
+        )
+        lines.append(
+            f"lawnberry_websocket_client_send_max_ms{{{label}}} {stats['send_max_ms']:.2f}"
+        )
+
+    # MJPEG fan-out: one upstream fetch per tick however many viewers watch
+    try:
+        mjpeg = mjpeg_hub.stats()
+    except Exception:
+        mjpeg = None
+    if mjpeg is not None:
+        lines.append(f"lawnberry_mjpeg_viewers {mjpeg['viewers']}")
+        lines.append(f"lawnberry_mjpeg_degraded_viewers {mjpeg['degraded_viewers']}")
+        lines.append(f"lawnberry_mjpeg_frames_fetched_total {mjpeg['frames_fetched']}")
+        lines.append(f"lawnberry_mjpeg_fetch_errors_total {mjpeg['fetch_errors']}")
+        lines.append(f"lawnberry_mjpeg_chunks_built_total {mjpeg['chunks_built']}")
+        lines.append(f"lawnberry_mjpeg_chunks_sent_total {mjpeg['chunks_sent']}")
+        lines.append(f"lawnberry_mjpeg_chunks_dropped_total {mjpeg['chunks_dropped']}")
+
+    # Global rate limiter: allowed/denied per policy and live bucket count
+    try:
+        limiter = rate_limiter_stats()
+    except Exception:
+        limiter = None
+    if limiter is not None:
+        for policy, counts in limiter["policies"].items():
+            for outcome in ("allowed", "denied"):
+                labels = _format_labels({"policy": policy, "outcome": outcome})
+                lines.append(f"lawnberry_rate_limit_requests_total{labels} {counts[outcome]}")
+        lines.append(f"lawnberry_rate_limit_exempt_total {limiter['exempted']}")
+        lines.append(f"lawnberry_rate_limit_buckets {limiter['buckets']}")
+        lines.append(f"lawnberry_rate_limit_buckets_evicted_total {limiter['evicted']}")
+
+    # Request pipeline: self time spent in each middleware stage and the handler
+    try:
+        stages = pipeline_stats()
+    except Exception:
+        stages = None
+    for stage, counts in (stages or {}).items():
+        labels = _format_labels({"stage": stage})
+        lines.append(f"lawnberry_http_stage_requests_total{labels} {counts['requests']}")
+        lines.append(f"lawnberry_http_stage_seconds_total{labels} {counts['total_s']:.6f}")
+        lines.append(f"lawnberry_http_stage_max_ms{labels} {counts['max_ms']:.3f}")
+
+    # SQLite read pool: contention shows up as waits for a free connection
+    try:
+        pool = persistence.read_pool_stats()
+    except Exception:
+        pool = None
+    if pool is not None:
+        lines.append(f"lawnberry_persistence_read_pool_size {pool['size']}")
+        lines.append(f"lawnberry_persistence_read_pool_in_use {pool['in_use']}")
+        lines.append(f"lawnberry_persistence_read_pool_acquired_total {pool['acquired']}")
+        lines.append(f"lawnberry_persistence_read_pool_waits_total {pool['waits']}")
+        lines.append(
+            f"lawnberry_persistence_read_pool_wait_total_ms {pool['wait_total_ms']:.2f}"
+        )
+        lines.append(f"lawnberry_persistence_read_pool_wait_max_ms {pool['wait_max_ms']:.2f}")
 
     # TLS certificate metrics
     try:
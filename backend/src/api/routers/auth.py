@@ -22,6 +22,7 @@ from ...services.auth_service import (
     AuthenticationError,
     AuthStatePersistenceError,
     primary_auth_service,
+    run_credential_work,
 )
 from ...services.cloudflare_access_service import (
     CloudflareAccessError,
@@ -252,7 +253,7 @@ def _manual_unlock_principal(request: Request, method: str) -> str:
     return f"{method}:{host_str}" if host_str else method
 
 
-def _validate_manual_password(password: str | None) -> str:
+async def _validate_manual_password(password: str | None) -> str:
     pwd = (password or "").strip()
     security_settings = _current_security_settings()
     required = bool(
@@ -268,8 +269,10 @@ def _validate_manual_password(password: str | None) -> str:
         return pwd
     if security_settings.password_hash:
         try:
-            if not bcrypt.checkpw(
-                pwd.encode("utf-8"), security_settings.password_hash.encode("utf-8")
+            if not await run_credential_work(
+                bcrypt.checkpw,
+                pwd.encode("utf-8"),
+                security_settings.password_hash.encode("utf-8"),
             ):
                 raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Invalid password")
         except ValueError as exc:
@@ -714,7 +717,9 @@ async def configure_password(payload: SetPasswordRequest, request: Request):
         )
     
     # Hash the password with bcrypt
-    hashed = bcrypt.hashpw(payload.password.encode("utf-8"), bcrypt.gensalt(rounds=12))
+    hashed = await run_credential_work(
+        bcrypt.hashpw, payload.password.encode("utf-8"), bcrypt.gensalt(rounds=12)
+    )
     hashed_str = hashed.decode("utf-8")
     
     # Update the auth service config with new password hash
@@ -903,7 +908,7 @@ async def manual_unlock(request: Request, body: ManualUnlockRequest):
         )
 
     if method in {"password", "password_only"}:
-        password = _validate_manual_password(body.password)
+        password = await _validate_manual_password(body.password)
         principal = _manual_unlock_principal(request, "password")
         timeout_minutes = getattr(_current_security_settings(), "session_timeout_minutes", 60)
         expires_at = _manual_session_expiry(timeout_minutes)
@@ -921,7 +926,7 @@ async def manual_unlock(request: Request, body: ManualUnlockRequest):
 
     if method in {"totp", "password_totp"}:
         totp_ok, backup_used = _verify_totp_code(body.totp_code)
-        password = _validate_manual_password(body.password)
+        password = await _validate_manual_password(body.password)
         principal = _manual_unlock_principal(request, "totp")
         timeout_minutes = getattr(_current_security_settings(), "session_timeout_minutes", 60)
         expires_at = _manual_session_expiry(timeout_minutes)
@@ -1,11 +1,11 @@
-import asyncio
 import logging
-import time
 
 from fastapi import APIRouter, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 
 from ...services.camera_runtime import camera_service
+from ...services.mjpeg_hub import MAX_FPS as MJPEG_MAX_FPS
+from ...services.mjpeg_hub import mjpeg_hub
 from ...services.power_manager import get_power_manager
 
 logger = logging.getLogger(__name__)
@@ -159,8 +159,8 @@ async def get_current_frame():
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-_MJPEG_TARGET_FPS = 5
-_MJPEG_INTERVAL = 1.0 / _MJPEG_TARGET_FPS
+# Wait this long for a chunk before re-checking whether the viewer left.
+_MJPEG_POLL_S = 1.0
 
 
 @router.get("/camera/stream.mjpeg")
@@ -168,45 +168,24 @@ async def stream_mjpeg(
     request: Request,
     client: str | None = Query(None),
     ts: str | None = Query(None),
+    fps: float | None = Query(None, gt=0, le=MJPEG_MAX_FPS),
 ):
-    """Stream camera frames as Motion JPEG."""
+    """Stream camera frames as Motion JPEG.
+
+    Viewers share one upstream frame fetch through ``mjpeg_hub``; ``fps``
+    caps this viewer's rate (default 5).
+    """
 
     async def generate_mjpeg():
-        """Generate MJPEG stream at a fixed target rate.
-
-        Uses timestamp-based pacing so the loop never drifts above the target
-        FPS regardless of how long frame retrieval takes.  Client disconnection
-        is detected via request.is_disconnected() so the generator exits
-        promptly instead of leaking until the next write raises an OSError.
-        """
-        next_tick = time.monotonic()
-
-        while True:
-            if await request.is_disconnected():
-                break
-
-            frame = await camera_service.get_current_frame()
-            if frame is not None:
-                frame_bytes = frame.get_frame_data() if hasattr(frame, "get_frame_data") else None
-                if frame_bytes:
-                    yield (
-                        b"--frame\r\n"
-                        b"Content-Type: image/jpeg\r\n"
-                        + f"Content-Length: {len(frame_bytes)}\r\n\r\n".encode()
-                        + frame_bytes
-                        + b"\r\n"
-                    )
-
-            # Pace to target FPS; skip tick if we're already behind so the
-            # generator never queues up a backlog of work.
-            next_tick += _MJPEG_INTERVAL
-            remaining = next_tick - time.monotonic()
-            if remaining > 0:
-                await asyncio.sleep(remaining)
-            else:
-                # Already behind; reset clock and yield control briefly.
-                next_tick = time.monotonic()
-                await asyncio.sleep(0)
+        """Yield this viewer's chunks from the hub until the client disconnects."""
+        viewer = mjpeg_hub.subscribe(fps)
+        try:
+            while not await request.is_disconnected():
+                chunk = await viewer.next_chunk(timeout=_MJPEG_POLL_S)
+                if chunk is not None:
+                    yield chunk
+        finally:
+            mjpeg_hub.unsubscribe(viewer)
 
     try:
         await _wake_camera_for_viewer()
@@ -14,6 +14,7 @@ from fastapi import APIRouter, HTTPException, Query, Request, Response, WebSocke
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
+from ...core import telemetry_export
 from ...core.persistence import persistence
 from ...services.websocket_hub import websocket_hub
 from .auth import _authorize_websocket, _extract_bearer_token
@@ -150,6 +151,16 @@ async def ws_telemetry(websocket: WebSocket):
                 except Exception:
                     hz = 5.0
                 await websocket_hub.set_cadence(client_id, hz)
+            elif mtype == "set_encoding":
+                await websocket_hub.set_encoding(client_id, str(payload.get("encoding", "full")))
+            elif mtype == "ack":
+                topic = str(payload.get("topic", "")).strip()
+                try:
+                    seq = int(payload.get("seq"))
+                except Exception:
+                    continue
+                if topic:
+                    websocket_hub.acknowledge(client_id, topic, seq)
             elif mtype == "ping":
                 await websocket.send_text(
                     json.dumps(
@@ -267,14 +278,21 @@ async def websocket_notifications_handshake(request: Request):
 
 @router.get("/telemetry/stream")
 async def get_telemetry_stream(limit: int = Query(5, ge=1, le=500), since: str | None = None):
-    """Contract-shaped telemetry stream: items + latency_summary_ms + next_since"""
+    """Contract-shaped telemetry stream: items + latency_summary_ms + next_since
+
+    Without ``since`` the newest ``limit`` items are returned, newest first.
+    With it, the next ``limit`` items after that cursor, oldest first.
+    ``next_since`` is the cursor of the newest item returned (or ``since``
+    itself when nothing new has arrived), so polling with it never re-reads
+    rows.
+    """
     try:
-        # Ensure table exists and seed in SIM mode if empty
-        persistence._init_database()
-        streams = persistence.load_telemetry_streams(limit=limit)
-        if not streams:
+        after = telemetry_export.parse_cursor(since)
+        streams = persistence.load_telemetry_stream_page(limit, after=after)
+        if not streams and (after is None or not persistence.load_telemetry_stream_page(1)):
+            # Seed in SIM mode if the table is empty
             persistence.seed_simulated_streams(count=limit)
-            streams = persistence.load_telemetry_streams(limit=limit)
+            streams = persistence.load_telemetry_stream_page(limit, after=after)
 
         # Project to items with required fields and metadata placeholders
         items = []
@@ -309,10 +327,16 @@ async def get_telemetry_stream(limit: int = Query(5, ge=1, le=500), since: str |
             "min": min(latencies) if latencies else 0.0,
             "max": max(latencies) if latencies else 0.0,
         }
+        newest = streams[-1] if after is not None else (streams[0] if streams else None)
+        next_since = (
+            telemetry_export.encode_cursor(newest["timestamp"], newest["db_id"])
+            if newest is not None
+            else since
+        )
         return {
             "items": items,
             "latency_summary_ms": summary,
-            "next_since": items[-1]["timestamp"] if items else None,
+            "next_since": next_since,
         }
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -323,68 +347,40 @@ async def export_telemetry_diagnostic(
     component: str | None = Query(None),
     start: str | None = Query(None),
     end: str | None = Query(None),
-    format: str = Query("csv", description="Export format: json or csv"),
+    format: str = Query(
+        "csv", description="Export format: csv, ndjson, json or columnar (Arrow IPC or packed)"
+    ),
+    since: str | None = Query(None, description="Resume after this row cursor or timestamp"),
+    compress: str | None = Query(None, description="Set to gzip to compress on the fly"),
 ):
-    """Export telemetry diagnostic data including power metrics for troubleshooting"""
-
-    # Generate diagnostic export
-    diagnostic_data = persistence.export_telemetry_diagnostic(
+    """Stream telemetry diagnostic data including power metrics for troubleshooting"""
+    try:
+        export_format = telemetry_export.resolve_format(format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if compress not in (None, "", "gzip"):
+        raise HTTPException(status_code=400, detail=f"Unsupported compression: {compress}")
+    gzip = compress == "gzip"
+
+    chunks = telemetry_export.iter_export(
+        persistence,
+        export_format,
         component_id=component,
         start_time=start,
         end_time=end,
+        since=since,
+        gzip=gzip,
+    )
+    stamp = datetime.datetime.now(datetime.UTC).strftime("%Y%m%d_%H%M%S")
+    filename = f"telemetry_diagnostic_{stamp}.{export_format.extension}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        telemetry_export.stream_export(chunks),
+        media_type="application/gzip" if gzip else export_format.media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "X-Telemetry-Export-Format": export_format.name,
+        },
     )
-
-    if format == "csv":
-        # Convert to CSV format
-        import csv
-
-        output = io.StringIO()
-
-        # Write header
-        fieldnames = [
-            "timestamp",
-            "component",
-            "value",
-            "status",
-            "latency_ms",
-            "battery_channel",
-            "solar_channel",
-        ]
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        # Write rows
-        for stream in diagnostic_data.get("streams", []):
-            writer.writerow(
-                {
-                    "timestamp": stream.get("timestamp"),
-                    "component": stream.get("component_id"),
-                    "value": str(stream.get("value")),
-                    "status": stream.get("status"),
-                    "latency_ms": stream.get("latency_ms"),
-                    "battery_channel": "ina3221_ch1",
-                    "solar_channel": "ina3221_ch2",
-                }
-            )
-
-        csv_content = output.getvalue()
-        output.close()
-
-        return StreamingResponse(
-            io.BytesIO(csv_content.encode("utf-8")),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename=telemetry_diagnostic_{datetime.datetime.now(datetime.UTC).strftime('%Y%m%d_%H%M%S')}.csv"
-            },
-        )
-    else:
-        # Return JSON
-        return JSONResponse(
-            content=diagnostic_data,
-            headers={
-                "Content-Disposition": f"attachment; filename=telemetry_diagnostic_{datetime.datetime.now(datetime.UTC).strftime('%Y%m%d_%H%M%S')}.json"
-            },
-        )
 
 
 @router.post("/telemetry/ping")
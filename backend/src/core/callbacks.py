@@ -0,0 +1,43 @@
+"""Lock-free callback lists for cross-thread change notifications."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CallbackList(Generic[T]):
+    """Subscribers called with one value per notification.
+
+    The callbacks are held in a tuple that ``add`` and its unsubscribe function
+    replace rather than mutate, so ``notify`` can iterate from another thread
+    without a lock. A failing callback is logged and does not stop the others.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._callbacks: tuple[Callable[[T], None], ...] = ()
+
+    def add(self, callback: Callable[[T], None]) -> Callable[[], None]:
+        """Register *callback*; returns a function that removes it again."""
+        self._callbacks = (*self._callbacks, callback)
+
+        def unsubscribe() -> None:
+            self._callbacks = tuple(cb for cb in self._callbacks if cb is not callback)
+
+        return unsubscribe
+
+    def notify(self, value: T) -> None:
+        for callback in self._callbacks:
+            try:
+                callback(value)
+            except Exception:
+                logger.exception("%s subscriber failed", self._name)
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
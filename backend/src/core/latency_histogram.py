@@ -0,0 +1,265 @@
+"""Fixed-bucket latency histograms with sliding windows.
+
+Bucket bounds grow geometrically by 2**(1/4), about 19% per bucket. They run
+from 2**-7 ms (~8 µs) to 2**16 ms (~65 s), with one overflow bucket above
+that. A percentile is interpolated inside its bucket, so its error is bounded
+by one bucket width, and averages no longer hide tail jitter. Every fourth
+bound is a power of two. Only those bounds are exported as Prometheus ``le``
+buckets; because they coincide with fine bounds, their cumulative counts are
+exact.
+
+Recording takes no lock. Each thread writes to its own shard, which no other
+thread mutates, and readers merge the shards. Besides all-time counts, every
+shard keeps two rings of time slots: 10 s slots serve the 1 m and 5 m windows,
+and 1 min slots serve the 1 h window.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+_SUBDIVISIONS = 4
+_MIN_EXPONENT = -7
+_MAX_EXPONENT = 16
+
+BUCKET_BOUNDS_MS: tuple[float, ...] = tuple(
+    2.0 ** (k / _SUBDIVISIONS)
+    for k in range(_MIN_EXPONENT * _SUBDIVISIONS, _MAX_EXPONENT * _SUBDIVISIONS + 1)
+)
+PROMETHEUS_BOUNDS_MS: tuple[float, ...] = BUCKET_BOUNDS_MS[::_SUBDIVISIONS]
+_BUCKETS = len(BUCKET_BOUNDS_MS) + 1  # last bucket is the +Inf overflow
+
+WINDOWS: dict[str, float] = {"1m": 60.0, "5m": 300.0, "1h": 3600.0}
+DEFAULT_QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.95, 0.99)
+
+_FINE_SLOT_S = 10.0
+_FINE_SLOTS = 30  # 5 minutes
+_COARSE_SLOT_S = 60.0
+_COARSE_SLOTS = 60  # 1 hour
+
+
+def bucket_index(value_ms: float) -> int:
+    """Index of the first bucket whose upper bound is >= *value_ms*."""
+    return bisect_left(BUCKET_BOUNDS_MS, value_ms)
+
+
+@dataclass
+class HistogramSnapshot:
+    """Merged, immutable-by-convention view of one histogram (or several)."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * _BUCKETS)
+    count: int = 0
+    total: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: HistogramSnapshot) -> HistogramSnapshot:
+        for index, value in enumerate(other.counts):
+            if value:
+                self.counts[index] += value
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Value at quantile *q* (0..1), interpolated within its bucket."""
+        if self.count <= 0:
+            return 0.0
+        q = min(1.0, max(0.0, float(q)))
+        rank = q * self.count
+        seen = 0
+        for index, in_bucket in enumerate(self.counts):
+            if not in_bucket:
+                continue
+            if seen + in_bucket >= rank:
+                lower = BUCKET_BOUNDS_MS[index - 1] if index > 0 else 0.0
+                upper = BUCKET_BOUNDS_MS[index] if index < len(BUCKET_BOUNDS_MS) else self.max
+                lower = max(lower, self.min)
+                upper = min(upper, self.max)
+                if upper <= lower:
+                    return upper
+                fraction = (rank - seen) / in_bucket
+                return lower + (upper - lower) * fraction
+            seen += in_bucket
+        return self.max
+
+    def quantiles(self, qs: Iterable[float] = DEFAULT_QUANTILES) -> dict[str, float]:
+        return {_quantile_key(q): self.quantile(q) for q in qs}
+
+    def cumulative(
+        self, bounds: tuple[float, ...] = PROMETHEUS_BOUNDS_MS
+    ) -> list[tuple[float, int]]:
+        """Cumulative ``(le, count)`` pairs; *bounds* must be a subset of the fine bounds."""
+        pairs: list[tuple[float, int]] = []
+        running = 0
+        index = 0
+        for bound in bounds:
+            stop = bucket_index(bound) + 1
+            running += sum(self.counts[index:stop])
+            index = stop
+            pairs.append((bound, running))
+        pairs.append((math.inf, self.count))
+        return pairs
+
+    def summary(self, qs: Iterable[float] = DEFAULT_QUANTILES) -> dict[str, float]:
+        summary: dict[str, float] = {
+            "count": self.count,
+            "avg": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0,
+        }
+        summary.update(self.quantiles(qs))
+        return summary
+
+
+def _quantile_key(q: float) -> str:
+    return f"p{q * 100:g}".replace(".", "_")
+
+
+class _Slot:
+    __slots__ = ("epoch", "counts", "total", "min", "max")
+
+    def __init__(self, epoch: int) -> None:
+        self.epoch = epoch
+        self.counts: dict[int, int] = {}
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+
+class _Shard:
+    """Counters written by exactly one thread."""
+
+    __slots__ = ("counts", "count", "total", "min", "max", "fine", "coarse")
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.fine: list[_Slot | None] = [None] * _FINE_SLOTS
+        self.coarse: list[_Slot | None] = [None] * _COARSE_SLOTS
+
+    def observe(self, index: int, value: float, now: float) -> None:
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        _bump(self.fine, int(now // _FINE_SLOT_S), index, value)
+        _bump(self.coarse, int(now // _COARSE_SLOT_S), index, value)
+
+
+def _bump(ring: list[_Slot | None], epoch: int, index: int, value: float) -> None:
+    position = epoch % len(ring)
+    slot = ring[position]
+    if slot is None or slot.epoch != epoch:
+        # Replacing the slot object is a single store, so a concurrent reader
+        # sees either the expired slot (and skips it) or the fresh one.
+        slot = _Slot(epoch)
+        ring[position] = slot
+    slot.counts[index] = slot.counts.get(index, 0) + 1
+    slot.total += value
+    if value < slot.min:
+        slot.min = value
+    if value > slot.max:
+        slot.max = value
+
+
+class LatencyHistogram:
+    """Latency distribution in milliseconds, recorded lock-free per thread."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._shards_lock = threading.Lock()
+
+    def observe(self, value_ms: float) -> None:
+        value = float(value_ms)
+        if value != value:  # NaN
+            return
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._new_shard()
+        shard.observe(bucket_index(value), value, self._clock())
+
+    def snapshot(self) -> HistogramSnapshot:
+        """All-time distribution since creation (what Prometheus scrapes)."""
+        merged = HistogramSnapshot()
+        for shard in self._shard_list():
+            merged.merge(
+                HistogramSnapshot(
+                    counts=list(shard.counts),
+                    count=shard.count,
+                    total=shard.total,
+                    min=shard.min,
+                    max=shard.max,
+                )
+            )
+        return merged
+
+    def window(self, window: str | float = "5m") -> HistogramSnapshot:
+        """Distribution over the trailing *window* ("1m", "5m", "1h" or seconds).
+
+        Windows are built from whole slots (10 s up to 5 m, 1 min beyond), so
+        the oldest edge is accurate to one slot width.
+        """
+        seconds = WINDOWS[window] if isinstance(window, str) else float(window)
+        if seconds <= _FINE_SLOT_S * _FINE_SLOTS:
+            width, attr = _FINE_SLOT_S, "fine"
+        else:
+            width, attr = _COARSE_SLOT_S, "coarse"
+        ring_slots = _FINE_SLOTS if attr == "fine" else _COARSE_SLOTS
+        now_epoch = int(self._clock() // width)
+        span = max(1, min(math.ceil(seconds / width), ring_slots))
+        oldest = now_epoch - span + 1
+        merged = HistogramSnapshot()
+        for shard in self._shard_list():
+            for slot in list(getattr(shard, attr)):
+                if slot is None or not oldest <= slot.epoch <= now_epoch:
+                    continue
+                counts = dict(slot.counts)
+                for index, value in counts.items():
+                    merged.counts[index] += value
+                merged.count += sum(counts.values())
+                merged.total += slot.total
+                merged.min = min(merged.min, slot.min)
+                merged.max = max(merged.max, slot.max)
+        return merged
+
+    def _new_shard(self) -> _Shard:
+        shard = _Shard()
+        with self._shards_lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def _shard_list(self) -> list[_Shard]:
+        with self._shards_lock:
+            return list(self._shards)
+
+
+__all__ = [
+    "BUCKET_BOUNDS_MS",
+    "DEFAULT_QUANTILES",
+    "HistogramSnapshot",
+    "LatencyHistogram",
+    "PROMETHEUS_BOUNDS_MS",
+    "WINDOWS",
+    "bucket_index",
+]
@@ -1,51 +1,306 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 import time
-from collections.abc import Awaitable, Callable
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 from backend.src.models.message_bus_event import MessageBusEvent, PersistenceTier
 
-Handler = Callable[[dict[str, Any]], Awaitable[None]]
+logger = logging.getLogger(__name__)
+
+Event = Mapping[str, Any]
+Handler = Callable[[Event], Awaitable[None]]
+KeyFn = Callable[[Event], Hashable]
+
+DEFAULT_QUEUE_SIZE = 256
+
+
+class OverflowPolicy(str, Enum):
+    """What a subscriber queue does with a new event when it is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+    COALESCE = "coalesce"
+
+
+def topic_matches(pattern: str, topic: str) -> bool:
+    """Match a dotted topic against a pattern.
+
+    ``*`` matches exactly one segment; a trailing ``#`` matches zero or more.
+    """
+    if pattern == topic:
+        return True
+    p_parts = pattern.split(".")
+    t_parts = topic.split(".")
+    for i, part in enumerate(p_parts):
+        if part == "#" and i == len(p_parts) - 1:
+            return True
+        if i >= len(t_parts) or (part != "*" and part != t_parts[i]):
+            return False
+    return len(p_parts) == len(t_parts)
+
+
+class Subscription:
+    """One subscriber: a bounded queue drained by its own task.
+
+    A slow handler only backs up its own queue; the publisher and other
+    subscribers are unaffected unless this subscription uses ``BLOCK``.
+    """
+
+    def __init__(
+        self,
+        pattern: str,
+        handler: Handler,
+        *,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        coalesce_key: KeyFn | None = None,
+    ) -> None:
+        self.pattern = pattern
+        self.handler = handler
+        self.maxsize = max(1, maxsize)
+        self.overflow = overflow
+        self._key = coalesce_key or (lambda evt: evt["topic"])
+        self._items: deque[Event] | OrderedDict[Hashable, Event] = (
+            OrderedDict() if overflow is OverflowPolicy.COALESCE else deque()
+        )
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._unfinished = 0
+        self._task: asyncio.Task | None = None
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.high_water = 0
+
+    def offer(self, evt: Event) -> None:
+        """Enqueue without waiting, applying the overflow policy."""
+        items = self._items
+        if isinstance(items, OrderedDict):
+            key = self._key(evt)
+            if key in items:
+                items[key] = evt
+                self.coalesced += 1
+                return
+            if len(items) >= self.maxsize:
+                items.popitem(last=False)
+                self._drop()
+            items[key] = evt
+        else:
+            if len(items) >= self.maxsize:
+                items.popleft()
+                self._drop()
+            items.append(evt)
+        self._unfinished += 1
+        self._idle.clear()
+        self.high_water = max(self.high_water, len(items))
+        if len(items) >= self.maxsize:
+            self._space.clear()
+        self._ready.set()
+        self._ensure_worker()
+
+    async def put(self, evt: Event, *, block: bool | None = None) -> None:
+        """Enqueue, waiting for space when blocking (``BLOCK`` policy by default)."""
+        if block is None:
+            block = self.overflow is OverflowPolicy.BLOCK
+        if block:
+            while len(self._items) >= self.maxsize:
+                self._space.clear()
+                await self._space.wait()
+        self.offer(evt)
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        await self._idle.wait()
+
+    def cancel(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pattern": self.pattern,
+            "overflow": self.overflow.value,
+            "queue_depth": len(self._items),
+            "high_water": self.high_water,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+        }
+
+    def _drop(self) -> None:
+        self.dropped += 1
+        self._unfinished -= 1
+
+    def _ensure_worker(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(
+                self._drain(), name=f"bus:{self.pattern}"
+            )
+
+    async def _drain(self) -> None:
+        items = self._items
+        while True:
+            while not items:
+                self._ready.clear()
+                await self._ready.wait()
+            if isinstance(items, OrderedDict):
+                _key, evt = items.popitem(last=False)
+            else:
+                evt = items.popleft()
+            self._space.set()
+            try:
+                await self.handler(evt)
+                self.delivered += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.errors += 1
+                logger.exception("MessageBus handler for %s failed", self.pattern)
+            finally:
+                self._unfinished -= 1
+                if self._unfinished <= 0:
+                    self._unfinished = 0
+                    self._idle.set()
 
 
 class MessageBus:
     def __init__(self, persistence: Any | None = None) -> None:
-        self._subscriptions: dict[str, list[Handler]] = {}
+        self._subscriptions: list[Subscription] = []
+        self._routes: dict[str, tuple[Subscription, ...]] = {}
+        self._validated: set[tuple[str, bool]] = set()
         self._persistence = persistence
 
-    async def subscribe(self, topic: str, handler: Handler, persistent: bool = False) -> None:
-        self._subscriptions.setdefault(topic, []).append(handler)
+    async def subscribe(
+        self,
+        topic: str,
+        handler: Handler,
+        persistent: bool = False,
+        *,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        coalesce_key: KeyFn | None = None,
+    ) -> Subscription:
+        """Subscribe *handler* to a topic or wildcard pattern (``nav.*``, ``safety.#``)."""
+        sub = Subscription(
+            topic, handler, maxsize=maxsize, overflow=overflow, coalesce_key=coalesce_key
+        )
+        self._subscriptions.append(sub)
+        self._routes.clear()
+        return sub
+
+    async def unsubscribe(self, sub: Subscription) -> None:
+        if sub in self._subscriptions:
+            self._subscriptions.remove(sub)
+            self._routes.clear()
+        sub.cancel()
 
     async def publish(self, topic: str, payload: dict[str, Any], persistent: bool = False) -> None:
-        evt = MessageBusEvent(
-            topic=topic,
-            timestamp_us=int(time.time() * 1_000_000),
-            payload=payload,
-            source_service="backend",
-            persistence_tier=PersistenceTier.CRITICAL
-            if persistent
-            else PersistenceTier.BEST_EFFORT,
-        )
+        evt = self._make_event(topic, payload, persistent)
 
-        # persist if requested and persistence available
+        # persist if requested and persistence available (group-committed)
         if persistent and self._persistence is not None:
-            self._persistence.save(evt.topic, evt.timestamp_us, evt.payload)
+            self._persistence.save(topic, evt["timestamp_us"], payload)
 
-        for handler in self._subscriptions.get(topic, []):
-            await handler(evt.model_dump())
+        subs = self._route(topic)
+        for sub in subs:
+            if sub.overflow is OverflowPolicy.BLOCK:
+                await sub.put(evt)
+            else:
+                sub.offer(evt)
+        if subs:
+            # Yield once so idle subscribers pick the event up before the
+            # publisher continues, as they did when handlers were awaited inline.
+            await asyncio.sleep(0)
 
     async def replay_persistent(self, topic: str) -> None:
+        """Stream stored messages for *topic* to current subscribers, oldest first.
+
+        Replay waits for queue space rather than dropping, and returns once
+        every matching subscriber has handled the backlog.
+        """
         if self._persistence is None:
             return
-        for ts, payload in self._persistence.load(topic):
-            evt = {
+        subs = self._route(topic)
+        if not subs:
+            return
+        rows = (
+            self._persistence.iter_load(topic)
+            if hasattr(self._persistence, "iter_load")
+            else self._persistence.load(topic)
+        )
+        for ts, payload in rows:
+            evt = MappingProxyType(
+                {
+                    "topic": topic,
+                    "timestamp_us": ts,
+                    "payload": payload,
+                    "source_service": "replay",
+                    "message_id": None,
+                    "persistence_tier": PersistenceTier.CRITICAL.value,
+                }
+            )
+            for sub in subs:
+                await sub.put(evt, block=True)
+        for sub in subs:
+            await sub.join()
+
+    async def drain(self) -> None:
+        """Wait until every subscriber queue is empty."""
+        for sub in list(self._subscriptions):
+            await sub.join()
+
+    async def close(self) -> None:
+        for sub in self._subscriptions:
+            sub.cancel()
+        self._subscriptions.clear()
+        self._routes.clear()
+        if self._persistence is not None and hasattr(self._persistence, "flush"):
+            await asyncio.to_thread(self._persistence.flush)
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [sub.stats() for sub in self._subscriptions]
+
+    def _route(self, topic: str) -> tuple[Subscription, ...]:
+        subs = self._routes.get(topic)
+        if subs is None:
+            subs = tuple(s for s in self._subscriptions if topic_matches(s.pattern, topic))
+            self._routes[topic] = subs
+        return subs
+
+    def _make_event(self, topic: str, payload: dict[str, Any], persistent: bool) -> Event:
+        tier = PersistenceTier.CRITICAL if persistent else PersistenceTier.BEST_EFFORT
+        timestamp_us = int(time.time() * 1_000_000)
+        # Topic and tier rules are validated by the model once per (topic, tier);
+        # afterwards the event is built directly and shared, read-only, by all
+        # subscribers.
+        if (topic, persistent) not in self._validated:
+            MessageBusEvent(
+                topic=topic,
+                timestamp_us=timestamp_us,
+                payload=payload,
+                source_service="backend",
+                persistence_tier=tier,
+            )
+            self._validated.add((topic, persistent))
+        return MappingProxyType(
+            {
                 "topic": topic,
-                "timestamp_us": ts,
+                "timestamp_us": timestamp_us,
                 "payload": payload,
-                "source_service": "replay",
+                "source_service": "backend",
                 "message_id": None,
-                "persistence_tier": PersistenceTier.CRITICAL.value,
+                "persistence_tier": tier.value,
             }
-            for handler in self._subscriptions.get(topic, []):
-                await handler(evt)
+        )
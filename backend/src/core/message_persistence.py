@@ -1,39 +1,135 @@
 from __future__ import annotations
 
 import json
+import logging
 import sqlite3
 import threading
+from collections.abc import Iterator
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 
 class PersistenceLayer:
     """SQLite-backed persistence for critical messages (simplified).
 
-    Uses a single table with (topic, timestamp_us, payload_json).
+    Uses a single table with (topic, timestamp_us, payload_json), indexed on
+    (topic, timestamp_us). Saves are buffered and group-committed by a
+    background flusher thread: after ``max_delay_s``, or immediately once
+    ``batch_size`` rows are pending. Reads flush first, so a saved message is
+    always visible to a subsequent load.
     """
 
-    def __init__(self, db_path: str = ":memory:") -> None:
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        *,
+        batch_size: int = 256,
+        max_delay_s: float = 0.05,
+    ) -> None:
         self._conn = sqlite3.connect(db_path, check_same_thread=False)
         self._lock = threading.Lock()
+        self._batch_size = batch_size
+        self._max_delay_s = max_delay_s
+        self._pending: list[tuple[str, int, str]] = []
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._closed = threading.Event()
         self._conn.execute(
             "CREATE TABLE IF NOT EXISTS messages (topic TEXT, timestamp_us INTEGER, payload TEXT)"
         )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_messages_topic_ts ON messages(topic, timestamp_us)"
+        )
         self._conn.commit()
 
     def save(self, topic: str, timestamp_us: int, payload: dict[str, Any]) -> None:
+        self.save_many([(topic, timestamp_us, payload)])
+
+    def save_many(self, rows: list[tuple[str, int, dict[str, Any]]]) -> None:
+        encoded = [(topic, ts, json.dumps(payload)) for topic, ts, payload in rows]
+        with self._pending_lock:
+            self._pending.extend(encoded)
+            pending = len(self._pending)
+        if pending >= self._batch_size:
+            self.flush()
+        else:
+            self._ensure_flusher()
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """Commit all pending rows in one transaction; returns rows written."""
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return 0
         with self._lock:
-            self._conn.execute(
-                "INSERT INTO messages(topic, timestamp_us, payload) VALUES(?,?,?)",
-                (topic, timestamp_us, json.dumps(payload)),
-            )
-            self._conn.commit()
+            try:
+                self._conn.executemany(
+                    "INSERT INTO messages(topic, timestamp_us, payload) VALUES(?,?,?)", batch
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                # Put the batch back so a later flush can retry it in order.
+                with self._pending_lock:
+                    self._pending[:0] = batch
+                raise
+        return len(batch)
+
+    def iter_load(
+        self, topic: str, since_us: int | None = None, batch_size: int = 500
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Stream messages for *topic* oldest first, one page at a time.
+
+        Pages are fetched by keyset on (timestamp_us, rowid), so the lock is
+        only held per page and memory stays bounded however long the backlog.
+        """
+        self.flush()
+        last_ts = -1 if since_us is None else since_us
+        last_rowid = -1
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT timestamp_us, rowid, payload FROM messages "
+                    "WHERE topic=? AND (timestamp_us, rowid) > (?, ?) "
+                    "ORDER BY timestamp_us ASC, rowid ASC LIMIT ?",
+                    (topic, last_ts, last_rowid, batch_size),
+                ).fetchall()
+            for ts, _rowid, payload in rows:
+                yield ts, json.loads(payload)
+            if len(rows) < batch_size:
+                return
+            last_ts, last_rowid = rows[-1][0], rows[-1][1]
 
     def load(self, topic: str) -> list[tuple[int, dict[str, Any]]]:
-        with self._lock:
-            cur = self._conn.execute(
-                "SELECT timestamp_us, payload FROM messages WHERE topic=? ORDER BY timestamp_us ASC",
-                (topic,),
-            )
-            rows = cur.fetchall()
-        return [(ts, json.loads(payload)) for ts, payload in rows]
+        return list(self.iter_load(topic))
+
+    def close(self) -> None:
+        self._closed.set()
+        self._wakeup.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5.0)
+        self.flush()
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None or self._closed.is_set():
+            return
+        with self._pending_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run_flusher, name="message-persistence", daemon=True
+                )
+                self._flusher.start()
 
+    def _run_flusher(self) -> None:
+        while not self._closed.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            # Let a burst accumulate into one commit; close() cuts the wait short.
+            self._closed.wait(self._max_delay_s)
+            try:
+                self.flush()
+            except sqlite3.Error:
+                logger.exception("Message persistence flush failed; will retry")
@@ -14,7 +14,7 @@ import threading
 import time
 import traceback
 from collections import defaultdict, deque
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime, timedelta
 from functools import wraps
@@ -29,6 +29,12 @@ except Exception:  # pragma: no cover - fallback when psutil is missing
     psutil = None  # type: ignore
 
 from .context import get_correlation_id
+from .latency_histogram import (
+    DEFAULT_QUANTILES,
+    WINDOWS,
+    HistogramSnapshot,
+    LatencyHistogram,
+)
 from .logging import apply_privacy_filter
 
 DEFAULT_LOG_CONFIG_PATH = Path("config/logging.yaml")
@@ -154,17 +160,25 @@ class CorrelationIdFilter(logging.Filter):
         return True
 
 
+LabelKey = tuple[tuple[str, str], ...]
+
+
 class MetricsCollector:
-    """Tracks runtime metrics with configurable retention."""
+    """Tracks runtime metrics with configurable retention.
+
+    Timers are latency histograms keyed by name and an optional label set
+    (route, topic, sensor, ...). Each name keeps at most ``max_label_sets``
+    label sets; further label values are folded into an ``"other"`` series.
+    """
 
-    def __init__(self, retention_minutes: int = 60) -> None:
+    def __init__(self, retention_minutes: int = 60, max_label_sets: int = 64) -> None:
         self.retention_minutes = max(1, retention_minutes)
+        self.max_label_sets = max(1, max_label_sets)
         self._system_metrics: deque[SystemMetrics] = deque()
         self._counters: dict[str, int] = defaultdict(int)
         self._gauges: dict[str, float] = {}
-        self._timers: dict[str, dict[str, Any]] = defaultdict(
-            lambda: {"count": 0, "total": 0.0, "min": None, "max": None}
-        )
+        self._histograms: dict[tuple[str, LabelKey], LatencyHistogram] = {}
+        self._label_set_counts: dict[str, int] = defaultdict(int)
         self._lock = threading.Lock()
 
     def increment_counter(self, name: str, value: int = 1) -> None:
@@ -175,21 +189,67 @@ class MetricsCollector:
         with self._lock:
             self._gauges[name] = float(value)
 
-    def record_timer(self, name: str, duration_ms: float) -> None:
+    def record_timer(
+        self, name: str, duration_ms: float, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """Record one duration; lock-free once the (name, labels) series exists."""
+        key = (name, _label_key(labels))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._create_histogram(key)
+        histogram.observe(duration_ms)
+
+    def _create_histogram(self, key: tuple[str, LabelKey]) -> LatencyHistogram:
+        name, label_key = key
         with self._lock:
-            stats = self._timers[name]
-            stats["count"] += 1
-            stats["total"] += float(duration_ms)
-            stats["min"] = (
-                float(duration_ms)
-                if stats["min"] is None
-                else min(float(duration_ms), stats["min"])
-            )
-            stats["max"] = (
-                float(duration_ms)
-                if stats["max"] is None
-                else max(float(duration_ms), stats["max"])
-            )
+            histogram = self._histograms.get(key)
+            if histogram is not None:
+                return histogram
+            if label_key and self._label_set_counts[name] >= self.max_label_sets:
+                key = (name, tuple((label, "other") for label, _ in label_key))
+                histogram = self._histograms.get(key)
+                if histogram is not None:
+                    return histogram
+            histogram = LatencyHistogram()
+            self._histograms[key] = histogram
+            self._label_set_counts[name] += 1
+            return histogram
+
+    def get_timer_histogram(
+        self,
+        name: str,
+        *,
+        labels: Mapping[str, str] | None = None,
+        window: str | float | None = None,
+    ) -> HistogramSnapshot:
+        """Merged distribution for *name*.
+
+        With ``labels=None`` every label set is merged. Otherwise only the
+        series whose labels include *labels* are merged. ``window`` is "1m",
+        "5m", "1h" or seconds; ``None`` means since start.
+        """
+        wanted = set(_label_key(labels))
+        merged = HistogramSnapshot()
+        for (series_name, label_key), histogram in self._histogram_items():
+            if series_name != name or not wanted.issubset(label_key):
+                continue
+            merged.merge(histogram.snapshot() if window is None else histogram.window(window))
+        return merged
+
+    def timer_percentiles(
+        self,
+        name: str,
+        *,
+        window: str | float | None = "5m",
+        labels: Mapping[str, str] | None = None,
+        quantiles: tuple[float, ...] = DEFAULT_QUANTILES,
+    ) -> dict[str, float]:
+        """count/avg/min/max plus ``p50``-style percentiles for *name*."""
+        return self.get_timer_histogram(name, labels=labels, window=window).summary(quantiles)
+
+    def _histogram_items(self) -> list[tuple[tuple[str, LabelKey], LatencyHistogram]]:
+        with self._lock:
+            return list(self._histograms.items())
 
     def collect_system_metrics(self) -> SystemMetrics:
         timestamp = time.time()
@@ -244,10 +304,7 @@ class MetricsCollector:
         return metric
 
     def _timer_average(self, name: str) -> float:
-        stats = self._timers.get(name)
-        if not stats or stats["count"] == 0:
-            return 0.0
-        return stats["total"] / stats["count"]
+        return self.get_timer_histogram(name).mean
 
     def _prune_system_metrics_locked(self, now: float) -> None:
         cutoff = now - (self.retention_minutes * 60)
@@ -259,22 +316,41 @@ class MetricsCollector:
             system_snapshot = [asdict(metric) for metric in self._system_metrics]
             counters_snapshot = dict(self._counters)
             gauges_snapshot = dict(self._gauges)
-            timers_snapshot: dict[str, dict[str, float]] = {}
-            for name, stats in self._timers.items():
-                count = stats["count"]
-                avg = stats["total"] / count if count else 0.0
-                timers_snapshot[name] = {
-                    "count": count,
-                    "avg": avg,
-                    "min": stats["min"] if stats["min"] is not None else 0.0,
-                    "max": stats["max"] if stats["max"] is not None else 0.0,
+
+        # Timers: all label sets merged per name, with all-time percentiles
+        # and per-window summaries. Histograms: one entry per label set, with
+        # cumulative Prometheus buckets.
+        merged: dict[str, HistogramSnapshot] = {}
+        windowed: dict[str, dict[str, HistogramSnapshot]] = {}
+        histograms_snapshot: dict[str, list[dict[str, Any]]] = {}
+        for (name, label_key), histogram in sorted(self._histogram_items()):
+            total = histogram.snapshot()
+            merged.setdefault(name, HistogramSnapshot()).merge(total)
+            per_window = windowed.setdefault(name, {})
+            for window in WINDOWS:
+                per_window.setdefault(window, HistogramSnapshot()).merge(histogram.window(window))
+            histograms_snapshot.setdefault(name, []).append(
+                {
+                    "labels": dict(label_key),
+                    "count": total.count,
+                    "sum": total.total,
+                    "buckets": total.cumulative(),
                 }
+            )
+        timers_snapshot: dict[str, dict[str, Any]] = {}
+        for name, total in merged.items():
+            summary: dict[str, Any] = total.summary()
+            summary["windows"] = {
+                window: snapshot.summary() for window, snapshot in windowed[name].items()
+            }
+            timers_snapshot[name] = summary
 
         return {
             "system": system_snapshot,
             "counters": counters_snapshot,
             "gauges": gauges_snapshot,
             "timers": timers_snapshot,
+            "histograms": histograms_snapshot,
         }
 
     def reset_for_testing(self) -> None:
@@ -282,7 +358,14 @@ class MetricsCollector:
             self._system_metrics.clear()
             self._counters.clear()
             self._gauges.clear()
-            self._timers.clear()
+            self._histograms.clear()
+            self._label_set_counts.clear()
+
+
+def _label_key(labels: Mapping[str, str] | None) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted((str(key), str(value)) for key, value in labels.items()))
 
 
 class ObservabilityManager:
@@ -451,9 +534,21 @@ class ObservabilityManager:
     def get_logger(self, name: str) -> logging.Logger:
         return logging.getLogger(name)
 
-    def log_api_request(self, method: str, path: str, status_code: int, duration_ms: float) -> None:
+    def log_api_request(
+        self,
+        method: str,
+        path: str,
+        status_code: int,
+        duration_ms: float,
+        route: str | None = None,
+    ) -> None:
+        # Label by route template, never the raw path, to bound cardinality.
         self.metrics.increment_counter("api_requests")
-        self.metrics.record_timer("api_request_duration", duration_ms)
+        self.metrics.record_timer(
+            "api_request_duration",
+            duration_ms,
+            labels={"route": route or "unmatched", "method": method},
+        )
         if status_code >= 400:
             self.metrics.increment_counter("api_errors")
 
@@ -5,20 +5,44 @@ handling database schema creation, migrations, and basic CRUD operations for
 persistent data like job schedules, configuration, and telemetry history.
 """
 
+import asyncio
 import json
 import logging
 import os
+import queue
 import sqlite3
 import threading
-from collections.abc import Generator
+import time
+from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import Future
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from .callbacks import CallbackList
+from .run_summaries import SCHEMA_SQL as _RUN_SUMMARIES_SCHEMA_SQL
+from .run_summaries import RunSummaryStore
+from .timeseries import SCHEMA_SQL as _TIMESERIES_SCHEMA_SQL
+from .timeseries import TimeSeriesStore
+
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning. Connections are long-lived (writer thread and read
+# pool), so these are applied once rather than on every query.
+_STATEMENT_CACHE_SIZE = 256
+_MMAP_SIZE_BYTES = 64 * 1024 * 1024
+_CACHE_SIZE_KIB = 8 * 1024
+
+
+def _tune_connection(conn: sqlite3.Connection, *, synchronous: str | None = None) -> None:
+    conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE_BYTES}")
+    conn.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KIB}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    if synchronous is not None:
+        conn.execute(f"PRAGMA synchronous={synchronous}")
+
 
 @dataclass
 class Migration:
@@ -29,10 +53,308 @@ class Migration:
     sql: str
 
 
+@dataclass
+class _WriteOp:
+    sql: str
+    params: Sequence[Any] | Sequence[Sequence[Any]]
+    many: bool
+    future: Future = field(default_factory=Future)
+
+
+@dataclass
+class _Barrier:
+    durable: bool
+    future: Future = field(default_factory=Future)
+
+
+class WriteBehindQueue:
+    """Single long-lived writer connection with group commit.
+
+    Statements are queued from any thread and applied by one dedicated writer
+    thread, which commits them in batches of up to ``max_batch`` statements or
+    ``max_delay_s`` seconds, whichever comes first. The writer connection uses
+    ``synchronous=NORMAL``: a batch is atomic but not fsynced on commit. Callers
+    that need durability request a barrier with ``durable=True``, which commits
+    everything queued before it and fsyncs the WAL.
+
+    The queue is bounded; producers block once ``max_pending`` statements are
+    waiting, which applies backpressure instead of growing memory without bound.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        max_batch: int = 256,
+        max_delay_s: float = 0.05,
+        max_pending: int = 10_000,
+    ) -> None:
+        self._db_path = db_path
+        self._max_batch = max(1, max_batch)
+        self._max_delay_s = max(0.0, max_delay_s)
+        self._queue: queue.Queue[_WriteOp | _Barrier | None] = queue.Queue(maxsize=max_pending)
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def submit(
+        self,
+        sql: str,
+        params: Sequence[Any] | Sequence[Sequence[Any]] = (),
+        *,
+        many: bool = False,
+    ) -> Future:
+        """Queue one statement; the future resolves to its rowcount once committed."""
+        op = _WriteOp(sql=sql, params=params, many=many)
+        self._ensure_started()
+        self._queue.put(op)
+        return op.future
+
+    def barrier(self, durable: bool = False) -> Future:
+        """Return a future resolved once everything queued before it is committed."""
+        barrier = _Barrier(durable=durable)
+        self._ensure_started()
+        self._queue.put(barrier)
+        return barrier.future
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Commit outstanding writes and stop the writer thread."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+        with self._start_lock:
+            self._thread = None
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="persistence-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        conn = sqlite3.connect(
+            str(self._db_path),
+            timeout=30.0,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        try:
+            # Write-behind tables are non-critical; durable barriers fsync explicitly.
+            _tune_connection(conn, synchronous="NORMAL")
+            while True:
+                first = self._queue.get()
+                if first is None:
+                    return
+                batch, stop = self._collect_batch(first)
+                self._apply_batch(conn, batch)
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _collect_batch(
+        self, first: _WriteOp | _Barrier
+    ) -> tuple[list[_WriteOp | _Barrier], bool]:
+        batch: list[_WriteOp | _Barrier] = [first]
+        deadline = time.monotonic() + self._max_delay_s
+        # A barrier closes the batch so its waiter is released promptly.
+        while len(batch) < self._max_batch and not isinstance(batch[-1], _Barrier):
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _apply_batch(self, conn: sqlite3.Connection, batch: list[_WriteOp | _Barrier]) -> None:
+        results: list[tuple[Future, Any, BaseException | None]] = []
+        durable = False
+        try:
+            conn.execute("BEGIN")
+            for item in batch:
+                if isinstance(item, _Barrier):
+                    durable = durable or item.durable
+                    results.append((item.future, None, None))
+                    continue
+                try:
+                    if item.many:
+                        cursor = conn.executemany(item.sql, item.params)
+                    else:
+                        cursor = conn.execute(item.sql, item.params)
+                    results.append((item.future, cursor.rowcount, None))
+                except Exception as exc:
+                    # SQLite rolls back only the failing statement; the rest of
+                    # the batch still commits.
+                    logger.error("Write-behind statement failed: %s", exc)
+                    results.append((item.future, None, exc))
+            conn.execute("COMMIT")
+            if durable:
+                self._fsync_wal()
+        except Exception as exc:
+            logger.error("Write-behind batch commit failed: %s", exc)
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            results = [(future, None, exc) for future, _result, _err in results]
+        for future, result, error in results:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _fsync_wal(self) -> None:
+        wal_path = Path(f"{self._db_path}-wal")
+        try:
+            fd = os.open(wal_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class ReadConnectionPool:
+    """Bounded pool of long-lived, read-only connections.
+
+    In WAL mode readers never block the writer (or each other), so pooled
+    readers skip ``PersistenceLayer._lock`` entirely. Reusing connections keeps
+    their prepared-statement cache and page cache warm across queries. Time
+    spent waiting for a free connection is tracked for ``/metrics``.
+    """
+
+    def __init__(self, db_path: Path, *, max_size: int = 4, acquire_timeout_s: float = 30.0):
+        self._db_path = db_path
+        self._max_size = max(1, max_size)
+        self._acquire_timeout_s = acquire_timeout_s
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._created = 0
+        self._in_use = 0
+        self._acquired = 0
+        self._waits = 0
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+        self._state_lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection, None, None]:
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def stats(self) -> dict[str, Any]:
+        with self._state_lock:
+            return {
+                "size": self._created,
+                "max_size": self._max_size,
+                "in_use": self._in_use,
+                "acquired": self._acquired,
+                "waits": self._waits,
+                "wait_total_ms": self._wait_total_ms,
+                "wait_max_ms": self._wait_max_ms,
+            }
+
+    def close(self) -> None:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._state_lock:
+                self._created -= 1
+
+    def _acquire(self) -> sqlite3.Connection:
+        started = time.perf_counter()
+        waited = False
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._state_lock:
+                create = self._created < self._max_size
+                if create:
+                    self._created += 1
+            if create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._state_lock:
+                        self._created -= 1
+                    raise
+            else:
+                waited = True
+                try:
+                    conn = self._idle.get(timeout=self._acquire_timeout_s)
+                except queue.Empty as exc:
+                    raise sqlite3.OperationalError("read connection pool exhausted") from exc
+        wait_ms = (time.perf_counter() - started) * 1000.0
+        with self._state_lock:
+            self._in_use += 1
+            self._acquired += 1
+            if waited:
+                self._waits += 1
+                self._wait_total_ms += wait_ms
+                self._wait_max_ms = max(self._wait_max_ms, wait_ms)
+        return conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            with self._state_lock:
+                self._in_use -= 1
+                self._created -= 1
+            return
+        with self._state_lock:
+            self._in_use -= 1
+        self._idle.put(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self._db_path),
+            timeout=30.0,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        _tune_connection(conn)
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+
+
+def _numeric_leaves(data: Any, prefix: str) -> dict[str, float]:
+    """Flatten numeric leaves of nested dicts into ``prefix.a.b`` keys (bools excluded)."""
+    leaves: dict[str, float] = {}
+    if isinstance(data, dict):
+        for key, value in data.items():
+            leaves.update(_numeric_leaves(value, f"{prefix}.{key}"))
+    elif isinstance(data, int | float) and not isinstance(data, bool):
+        leaves[prefix] = float(data)
+    return leaves
+
+
 class PersistenceLayer:
     """SQLite-based persistence layer for LawnBerry Pi v2."""
 
-    SCHEMA_VERSION = 8
+    SCHEMA_VERSION = 11
 
     MIGRATIONS = [
         Migration(
@@ -233,6 +555,34 @@ class PersistenceLayer:
             INSERT OR REPLACE INTO schema_version (version) VALUES (8);
             """,
         ),
+        Migration(
+            version=9,
+            description="Add numeric time-series rollup tiers",
+            sql=_TIMESERIES_SCHEMA_SQL
+            + """
+            INSERT OR REPLACE INTO schema_version (version) VALUES (9);
+            """,
+        ),
+        Migration(
+            version=10,
+            description="Index telemetry streams for (timestamp, id) keyset cursors",
+            sql="""
+            CREATE INDEX IF NOT EXISTS idx_telemetry_ts_id
+                ON hardware_telemetry_streams(timestamp, id);
+            CREATE INDEX IF NOT EXISTS idx_telemetry_component_ts_id
+                ON hardware_telemetry_streams(component_id, timestamp, id);
+
+            INSERT OR REPLACE INTO schema_version (version) VALUES (10);
+            """,
+        ),
+        Migration(
+            version=11,
+            description="Add incrementally materialized mission run summaries",
+            sql=_RUN_SUMMARIES_SCHEMA_SQL
+            + """
+            INSERT OR REPLACE INTO schema_version (version) VALUES (11);
+            """,
+        ),
     ]
 
     def __init__(self, db_path: str = "data/lawnberry.db"):
@@ -240,6 +590,11 @@ class PersistenceLayer:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
         self._init_database()
+        self._writer = WriteBehindQueue(self.db_path)
+        self._readers = ReadConnectionPool(self.db_path)
+        self.timeseries = TimeSeriesStore(self)
+        self.run_summaries = RunSummaryStore(self)
+        self._planning_job_subscribers: CallbackList[str] = CallbackList("Planning job change")
 
     def _init_database(self):
         """Initialize database and run migrations."""
@@ -282,6 +637,45 @@ class PersistenceLayer:
         finally:
             conn.close()
 
+    def read_connection(self):
+        """Borrow a pooled read-only connection.
+
+        Use for pure queries; it does not take the write lock, so dashboard
+        reads are not queued behind inserts.
+        """
+        return self._readers.connection()
+
+    def read_pool_stats(self) -> dict[str, Any]:
+        return self._readers.stats()
+
+    # Write-behind queue
+    def enqueue_write(
+        self,
+        sql: str,
+        params: Sequence[Any] | Sequence[Sequence[Any]] = (),
+        *,
+        many: bool = False,
+    ) -> Future:
+        """Queue a write for the group-commit writer thread without waiting.
+
+        Async callers that need the outcome can ``await asyncio.wrap_future(...)``
+        on the returned future.
+        """
+        return self._writer.submit(sql, params, many=many)
+
+    def flush(self, durable: bool = False, timeout: float | None = 30.0) -> None:
+        """Block until every queued write is committed (and fsynced if *durable*)."""
+        self._writer.barrier(durable).result(timeout)
+
+    async def flush_async(self, durable: bool = False) -> None:
+        """Awaitable ``flush`` for code running on the event loop."""
+        await asyncio.wrap_future(self._writer.barrier(durable))
+
+    def close(self) -> None:
+        """Drain the write-behind queue, stop its writer and close pooled readers."""
+        self._writer.close()
+        self._readers.close()
+
     # System Configuration
     def save_system_config(self, config: dict[str, Any]) -> None:
         """Save system configuration to database."""
@@ -294,7 +688,7 @@ class PersistenceLayer:
 
     def load_system_config(self) -> dict[str, Any] | None:
         """Load system configuration from database."""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.execute("SELECT config_json FROM system_config WHERE id = 1")
             result = cursor.fetchone()
             if result:
@@ -302,6 +696,15 @@ class PersistenceLayer:
             return None
 
     # Planning Jobs
+    def subscribe_planning_jobs(self, callback: Callable[[str], None]) -> Callable[[], None]:
+        """Call *callback* with the job id after each planning job save or delete.
+
+        Returns an unsubscribe function. The callback runs synchronously in the
+        caller of ``save_planning_job``/``delete_planning_job`` once the change is
+        committed, which may be a worker thread rather than the event loop.
+        """
+        return self._planning_job_subscribers.add(callback)
+
     def save_planning_job(self, job_data: dict[str, Any]) -> None:
         """Save planning job to database."""
         pattern_params = job_data.get("pattern_params") or {}
@@ -346,6 +749,7 @@ class PersistenceLayer:
                 ),
             )
             conn.commit()
+        self._planning_job_subscribers.notify(str(job_data["id"]))
 
     @staticmethod
     def _decode_planning_occurrence(row: sqlite3.Row) -> dict[str, Any]:
@@ -446,7 +850,7 @@ class PersistenceLayer:
 
     def load_latest_planning_job_occurrence(self, job_id: str) -> dict[str, Any] | None:
         """Return the most recently updated occurrence for a planning job."""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             row = conn.execute(
                 """
                 SELECT * FROM planning_job_occurrences
@@ -459,7 +863,7 @@ class PersistenceLayer:
 
     def load_active_planning_job_occurrences(self) -> list[dict[str, Any]]:
         """Load non-terminal occurrences that require restart reconciliation."""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM planning_job_occurrences
@@ -471,7 +875,7 @@ class PersistenceLayer:
 
     def load_planning_jobs(self) -> list[dict[str, Any]]:
         """Load all planning jobs from database."""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.execute("SELECT * FROM planning_jobs ORDER BY created_at")
             jobs = []
             for row in cursor.fetchall():
@@ -503,7 +907,10 @@ class PersistenceLayer:
             conn.execute("DELETE FROM planning_job_occurrences WHERE job_id = ?", (job_id,))
             cursor = conn.execute("DELETE FROM planning_jobs WHERE id = ?", (job_id,))
             conn.commit()
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+        if deleted:
+            self._planning_job_subscribers.notify(job_id)
+        return deleted
 
     # Map Zones
     def save_map_zones(self, zones: list[dict[str, Any]]) -> None:
@@ -531,7 +938,7 @@ class PersistenceLayer:
 
     def load_map_zones(self) -> list[dict[str, Any]]:
         """Load map zones from database."""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.execute("SELECT * FROM map_zones ORDER BY priority DESC")
             zones = []
             for row in cursor.fetchall():
@@ -543,17 +950,22 @@ class PersistenceLayer:
 
     # Telemetry History
     def save_telemetry_snapshot(self, data: dict[str, Any]) -> None:
-        """Save telemetry snapshot for historical analysis."""
-        with self.get_connection() as conn:
-            conn.execute(
-                "INSERT INTO telemetry_snapshots (timestamp, data_json) VALUES (?, ?)",
-                (datetime.now(UTC), json.dumps(data)),
-            )
-            conn.commit()
+        """Queue a telemetry snapshot for historical analysis (write-behind).
+
+        Numeric leaves are also folded into the time-series rollups as
+        ``telemetry.<dotted.path>`` so charts never decode the JSON blobs.
+        """
+        now = datetime.now(UTC)
+        self.enqueue_write(
+            "INSERT INTO telemetry_snapshots (timestamp, data_json) VALUES (?, ?)",
+            (now.isoformat(sep=" "), json.dumps(data)),
+        )
+        self.timeseries.record(_numeric_leaves(data, "telemetry"), ts=now.timestamp())
 
     def load_telemetry_history(self, limit: int = 100) -> list[dict[str, Any]]:
         """Load recent telemetry history."""
-        with self.get_connection() as conn:
+        self.flush()
+        with self.read_connection() as conn:
             cursor = conn.execute(
                 "SELECT * FROM telemetry_snapshots ORDER BY timestamp DESC LIMIT ?", (limit,)
             )
@@ -568,15 +980,21 @@ class PersistenceLayer:
             return snapshots
 
     def cleanup_old_telemetry(self, days_to_keep: int = 7) -> int:
-        """Clean up old telemetry data to manage disk space."""
+        """Apply telemetry retention; returns the total number of rows removed.
+
+        Snapshot blobs older than *days_to_keep* are deleted. Rollup tiers follow
+        their own per-tier retention (see ``core.timeseries.TIERS``).
+        """
         cutoff = datetime.now(UTC).timestamp() - (days_to_keep * 24 * 3600)
+        self.flush()
         with self.get_connection() as conn:
             cursor = conn.execute(
                 "DELETE FROM telemetry_snapshots WHERE timestamp < datetime(?, 'unixepoch')",
                 (cutoff,),
             )
             conn.commit()
-            return cursor.rowcount
+            removed = cursor.rowcount
+        return removed + sum(self.timeseries.apply_retention().values())
 
     # Map Configuration
     async def save_map_configuration(self, config_id: str, config_json: str) -> None:
@@ -594,7 +1012,7 @@ class PersistenceLayer:
 
     async def load_map_configuration(self, config_id: str) -> str | None:
         """Load map configuration from database."""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.execute(
                 "SELECT config_json FROM map_config WHERE id = ?",
                 (config_id,),
@@ -641,15 +1059,17 @@ class PersistenceLayer:
         resource: str | None = None,
         details: dict[str, Any] | None = None,
     ) -> None:
-        with self.get_connection() as conn:
-            conn.execute(
-                "INSERT INTO audit_logs (client_id, action, resource, details_json) VALUES (?, ?, ?, ?)",
-                (client_id, action, resource, json.dumps(details or {})),
-            )
-            conn.commit()
+        """Append an audit record; returns only once it is durably on disk."""
+        future = self.enqueue_write(
+            "INSERT INTO audit_logs (client_id, action, resource, details_json) VALUES (?, ?, ?, ?)",
+            (client_id, action, resource, json.dumps(details or {})),
+        )
+        self.flush(durable=True)
+        future.result()
 
     def load_audit_logs(self, limit: int = 100) -> list[dict[str, Any]]:
-        with self.get_connection() as conn:
+        self.flush()
+        with self.read_connection() as conn:
             cursor = conn.execute(
                 "SELECT id, timestamp, client_id, action, resource, details_json FROM audit_logs ORDER BY id DESC LIMIT ?",
                 (limit,),
@@ -670,29 +1090,27 @@ class PersistenceLayer:
 
     # Hardware Telemetry Streams
     def save_telemetry_streams(self, streams: list[dict[str, Any]]) -> None:
-        """Save hardware telemetry streams to database."""
-        with self.get_connection() as conn:
-            for stream in streams:
-                try:
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO hardware_telemetry_streams
-                        (timestamp, component_id, value, status, latency_ms, stream_json, verification_artifact_id)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """Queue hardware telemetry streams for the write-behind writer."""
+        for stream in streams:
+            try:
+                self.enqueue_write(
+                    """
+                    INSERT OR REPLACE INTO hardware_telemetry_streams
+                    (timestamp, component_id, value, status, latency_ms, stream_json, verification_artifact_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                     """,
-                        (
-                            stream.get("timestamp"),
-                            stream.get("component_id"),
-                            str(stream.get("value", "")),
-                            stream.get("status"),
-                            stream.get("latency_ms", 0.0),
-                            json.dumps(stream),
-                            stream.get("verification_artifact_id"),
-                        ),
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to save telemetry stream: {e}")
-            conn.commit()
+                    (
+                        stream.get("timestamp"),
+                        stream.get("component_id"),
+                        str(stream.get("value", "")),
+                        stream.get("status"),
+                        stream.get("latency_ms", 0.0),
+                        json.dumps(stream),
+                        stream.get("verification_artifact_id"),
+                    ),
+                )
+            except Exception as e:
+                logger.error(f"Failed to save telemetry stream: {e}")
 
     def load_telemetry_streams(
         self,
@@ -702,7 +1120,8 @@ class PersistenceLayer:
         end_time: str | None = None,
     ) -> list[dict[str, Any]]:
         """Load hardware telemetry streams from database with optional filters."""
-        with self.get_connection() as conn:
+        self.flush()
+        with self.read_connection() as conn:
             query = "SELECT * FROM hardware_telemetry_streams WHERE 1=1"
             params = []
 
@@ -729,6 +1148,99 @@ class PersistenceLayer:
                 streams.append(stream)
             return streams
 
+    @staticmethod
+    def _telemetry_stream_filters(
+        component_id: str | None,
+        start_time: str | None,
+        end_time: str | None,
+        after: tuple[str, int | None] | None,
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if component_id:
+            clauses.append("component_id = ?")
+            params.append(component_id)
+        if start_time:
+            clauses.append("timestamp >= ?")
+            params.append(start_time)
+        if end_time:
+            clauses.append("timestamp <= ?")
+            params.append(end_time)
+        if after is not None:
+            after_ts, after_id = after
+            if after_id is None:
+                clauses.append("timestamp > ?")
+                params.append(after_ts)
+            else:
+                clauses.append("(timestamp, id) > (?, ?)")
+                params.extend((after_ts, after_id))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def iter_telemetry_stream_rows(
+        self,
+        component_id: str | None = None,
+        start_time: str | None = None,
+        end_time: str | None = None,
+        *,
+        after: tuple[str, int | None] | None = None,
+        columns: str = "id, timestamp, component_id, value, status, latency_ms",
+        batch_size: int = 500,
+    ) -> Generator[list[sqlite3.Row], None, None]:
+        """Yield matching stream rows in ``(timestamp, id)`` order, a batch at a time.
+
+        The query runs on one pooled read connection and is drained with
+        ``fetchmany``, so memory stays at one batch however long the range is.
+        ``after`` resumes strictly past a ``(timestamp, id)`` cursor, or past a
+        bare timestamp when the id is ``None``. Close the generator to release
+        the connection early.
+        """
+        self.flush()
+        where, params = self._telemetry_stream_filters(component_id, start_time, end_time, after)
+        with self.read_connection() as conn:
+            cursor = conn.execute(
+                f"SELECT {columns} FROM hardware_telemetry_streams{where}"
+                " ORDER BY timestamp, id",
+                params,
+            )
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    yield rows
+            finally:
+                cursor.close()
+
+    def load_telemetry_stream_page(
+        self,
+        limit: int,
+        *,
+        after: tuple[str, int | None] | None = None,
+        component_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """One page of streams for cursor polling.
+
+        With ``after`` the page holds the next ``limit`` rows past the cursor,
+        oldest first; without it, the newest ``limit`` rows, newest first. Each
+        stream dict carries ``db_id`` so callers can build the next cursor.
+        """
+        self.flush()
+        where, params = self._telemetry_stream_filters(component_id, None, None, after)
+        order = "ASC" if after is not None else "DESC"
+        with self.read_connection() as conn:
+            cursor = conn.execute(
+                f"SELECT id, timestamp, stream_json FROM hardware_telemetry_streams{where}"
+                f" ORDER BY timestamp {order}, id {order} LIMIT ?",
+                (*params, limit),
+            )
+            streams = []
+            for row in cursor.fetchall():
+                stream = json.loads(row["stream_json"])
+                stream["db_id"] = row["id"]
+                stream["timestamp"] = row["timestamp"]
+                streams.append(stream)
+            return streams
+
     def compute_telemetry_latency_stats(
         self,
         component_id: str | None = None,
@@ -736,7 +1248,8 @@ class PersistenceLayer:
         end_time: str | None = None,
     ) -> dict[str, Any]:
         """Compute latency statistics for telemetry streams."""
-        with self.get_connection() as conn:
+        self.flush()
+        with self.read_connection() as conn:
             query = """
                 SELECT 
                     COUNT(*) as count,
@@ -794,6 +1307,7 @@ class PersistenceLayer:
     def cleanup_old_telemetry_streams(self, days_to_keep: int = 7) -> int:
         """Clean up old telemetry stream data to manage disk space."""
         cutoff = datetime.now(UTC).timestamp() - (days_to_keep * 24 * 3600)
+        self.flush()
         with self.get_connection() as conn:
             cursor = conn.execute(
                 "DELETE FROM hardware_telemetry_streams WHERE timestamp < datetime(?, 'unixepoch')",
@@ -802,33 +1316,6 @@ class PersistenceLayer:
             conn.commit()
             return cursor.rowcount
 
-    def export_telemetry_diagnostic(
-        self,
-        component_id: str | None = None,
-        start_time: str | None = None,
-        end_time: str | None = None,
-    ) -> dict[str, Any]:
-        """Export telemetry diagnostic data including power metrics and status."""
-        streams = self.load_telemetry_streams(
-            limit=1000, component_id=component_id, start_time=start_time, end_time=end_time
-        )
-
-        stats = self.compute_telemetry_latency_stats(
-            component_id=component_id, start_time=start_time, end_time=end_time
-        )
-
-        return {
-            "export_timestamp": datetime.now(UTC).isoformat(),
-            "filters": {
-                "component_id": component_id,
-                "start_time": start_time,
-                "end_time": end_time,
-            },
-            "statistics": stats,
-            "stream_count": len(streams),
-            "streams": streams,
-        }
-
     # Test helper: seed minimal simulated streams when SIM_MODE enabled
     def seed_simulated_streams(self, count: int = 10) -> None:
         import os
@@ -0,0 +1,276 @@
+"""Incrementally materialized mission run summaries.
+
+Every persisted mission event is also folded into one ``run_summaries`` row
+per run: counters, distance, per-quality pose counts, per-interlock block
+counts and time spent in each mission phase. The updates are ``UPSERT``
+statements queued on the persistence write-behind queue right behind the
+event insert, so they are committed in the same group commit. Reading a
+summary is then a single primary-key lookup instead of loading and
+re-aggregating the run's events.
+
+Distance between consecutive poses needs the previous pose, which is kept in
+memory per run. After a process restart the first pose of a resumed run
+starts a new track, so the gap across the restart is not counted.
+
+``rebuild`` re-folds stored events, for runs recorded before this table
+existed (see ``scripts/backfill_run_summaries.py``).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .persistence import PersistenceLayer
+
+logger = logging.getLogger(__name__)
+
+_MAX_TRACKED_RUNS = 32
+_REBUILD_BATCH_ROWS = 1000
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS run_summaries (
+        run_id                      TEXT PRIMARY KEY,
+        mission_id                  TEXT,
+        event_count                 INTEGER NOT NULL DEFAULT 0,
+        first_event_at              TEXT,
+        last_event_at               TEXT,
+        total_distance_m            REAL    NOT NULL DEFAULT 0,
+        pose_count                  INTEGER NOT NULL DEFAULT 0,
+        pose_quality_counts_json    TEXT    NOT NULL DEFAULT '{}',
+        heading_alignment_samples   INTEGER NOT NULL DEFAULT 0,
+        blocked_command_count       INTEGER NOT NULL DEFAULT 0,
+        interlock_counts_json       TEXT    NOT NULL DEFAULT '{}',
+        motion_command_count        INTEGER NOT NULL DEFAULT 0,
+        stop_command_count          INTEGER NOT NULL DEFAULT 0,
+        waypoint_count              INTEGER NOT NULL DEFAULT 0,
+        approach_distance_sum_m     REAL    NOT NULL DEFAULT 0,
+        approach_distance_samples   INTEGER NOT NULL DEFAULT 0,
+        current_phase               TEXT,
+        phase_started_at            TEXT,
+        phase_durations_json        TEXT    NOT NULL DEFAULT '{}'
+    );
+"""
+
+_TOUCH_SQL = """
+    INSERT INTO run_summaries (run_id, mission_id, event_count, first_event_at, last_event_at)
+    VALUES (?, NULLIF(?, ''), 1, ?, ?)
+    ON CONFLICT (run_id) DO UPDATE SET
+        mission_id = COALESCE(mission_id, excluded.mission_id),
+        event_count = event_count + 1,
+        first_event_at = COALESCE(MIN(first_event_at, excluded.first_event_at),
+                                  excluded.first_event_at),
+        last_event_at = COALESCE(MAX(last_event_at, excluded.last_event_at),
+                                 excluded.last_event_at)
+"""
+
+_POSE_SQL = """
+    UPDATE run_summaries SET
+        total_distance_m = total_distance_m + ?,
+        pose_count = pose_count + 1,
+        pose_quality_counts_json = json_set(
+            pose_quality_counts_json, ?,
+            COALESCE(json_extract(pose_quality_counts_json, ?), 0) + 1)
+    WHERE run_id = ?
+"""
+
+_HEADING_SQL = """
+    UPDATE run_summaries SET heading_alignment_samples = heading_alignment_samples + ?
+    WHERE run_id = ?
+"""
+
+_MOTION_SQL = """
+    UPDATE run_summaries SET
+        motion_command_count = motion_command_count + 1,
+        stop_command_count = stop_command_count + ?
+    WHERE run_id = ?
+"""
+
+_WAYPOINT_SQL = """
+    UPDATE run_summaries SET
+        waypoint_count = waypoint_count + 1,
+        approach_distance_sum_m = approach_distance_sum_m + ?,
+        approach_distance_samples = approach_distance_samples + ?
+    WHERE run_id = ?
+"""
+
+# Time since the previous state change is credited to the phase it started;
+# julianday() keeps millisecond precision, hence the rounding.
+_PHASE_KEY = "'$.\"' || replace(current_phase, '\"', '') || '\"'"
+_STATE_SQL = f"""
+    UPDATE run_summaries SET
+        phase_durations_json = CASE
+            WHEN current_phase IS NULL OR phase_started_at IS NULL THEN phase_durations_json
+            ELSE json_set(
+                phase_durations_json, {_PHASE_KEY},
+                COALESCE(json_extract(phase_durations_json, {_PHASE_KEY}), 0)
+                + MAX(0.0, ROUND((julianday(?) - julianday(phase_started_at)) * 86400.0, 3)))
+        END,
+        current_phase = ?,
+        phase_started_at = ?
+    WHERE run_id = ?
+"""
+
+_SELECT_SQL = "SELECT * FROM run_summaries WHERE run_id = ?"
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    R = 6_371_000.0
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = math.radians(lat2 - lat1)
+    dlam = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
+    return 2 * R * math.asin(math.sqrt(a))
+
+
+def _json_key(key: Any) -> str:
+    return '$."' + str(key).replace('"', "") + '"'
+
+
+def _as_float(value: Any) -> float | None:
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return result if math.isfinite(result) else None
+
+
+class RunSummaryStore:
+    """Per-run aggregate rows on top of ``PersistenceLayer``."""
+
+    def __init__(self, persistence: PersistenceLayer) -> None:
+        self._persistence = persistence
+        self._last_pose: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def apply(
+        self,
+        run_id: str,
+        mission_id: str | None,
+        event_type: str,
+        payload: Mapping[str, Any],
+        timestamp: str | None,
+    ) -> list[Future]:
+        """Fold one persisted event into its run's summary row."""
+        if not run_id:
+            return []
+        enqueue = self._persistence.enqueue_write
+        futures = [enqueue(_TOUCH_SQL, (run_id, mission_id or "", timestamp, timestamp))]
+        update = self._update_for(run_id, event_type, payload, timestamp)
+        if update is not None:
+            futures.append(enqueue(*update))
+        return futures
+
+    def _update_for(
+        self,
+        run_id: str,
+        event_type: str,
+        payload: Mapping[str, Any],
+        timestamp: str | None,
+    ) -> tuple[str, tuple[Any, ...]] | None:
+        if event_type == "pose_updated":
+            quality = _json_key(payload.get("pose_quality", "unknown"))
+            return _POSE_SQL, (self._pose_step_m(run_id, payload), quality, quality, run_id)
+        if event_type == "heading_aligned":
+            try:
+                samples = int(payload.get("sample_count", 1))
+            except (TypeError, ValueError):
+                samples = 1
+            return _HEADING_SQL, (samples, run_id)
+        if event_type == "safety_gate_blocked":
+            interlocks = Counter(str(name) for name in payload.get("interlocks") or ())
+            pairs = "".join(
+                ", ?, COALESCE(json_extract(interlock_counts_json, ?), 0) + ?" for _ in interlocks
+            )
+            params: list[Any] = []
+            for name, count in interlocks.items():
+                params.extend((_json_key(name), _json_key(name), count))
+            counts_sql = f"json_set(interlock_counts_json{pairs})" if interlocks else (
+                "interlock_counts_json"
+            )
+            return (
+                "UPDATE run_summaries SET blocked_command_count = blocked_command_count + 1,"
+                f" interlock_counts_json = {counts_sql} WHERE run_id = ?",
+                (*params, run_id),
+            )
+        if event_type == "motion_command_issued":
+            stopped = _as_float(payload.get("left")) == 0.0 and _as_float(payload.get("right")) == 0.0
+            return _MOTION_SQL, (int(stopped), run_id)
+        if event_type == "waypoint_target_changed":
+            distance = _as_float(payload.get("distance_to_target_m"))
+            return _WAYPOINT_SQL, (distance or 0.0, int(distance is not None), run_id)
+        if event_type == "mission_state_changed":
+            new_state = payload.get("new_state")
+            return _STATE_SQL, (timestamp, new_state, timestamp, run_id)
+        return None
+
+    def _pose_step_m(self, run_id: str, payload: Mapping[str, Any]) -> float:
+        lat, lon = _as_float(payload.get("lat")), _as_float(payload.get("lon"))
+        if lat is None or lon is None:
+            return 0.0
+        previous = self._last_pose.pop(run_id, None)
+        self._last_pose[run_id] = (lat, lon)
+        if len(self._last_pose) > _MAX_TRACKED_RUNS:
+            self._last_pose.popitem(last=False)
+        if previous is None:
+            return 0.0
+        return haversine_m(previous[0], previous[1], lat, lon)
+
+    def rebuild(self, run_id: str | None = None) -> int:
+        """Recompute summaries from stored events; all runs when *run_id* is None.
+
+        Returns the number of events folded.
+        """
+        self._persistence.flush()
+        where, params = ("WHERE run_id = ?", (run_id,)) if run_id else ("", ())
+        self._persistence.enqueue_write(f"DELETE FROM run_summaries {where}", params)
+        if run_id:
+            self._last_pose.pop(run_id, None)
+        else:
+            self._last_pose.clear()
+        folded = 0
+        with self._persistence.read_connection() as conn:
+            cursor = conn.execute(
+                "SELECT run_id, mission_id, event_type, payload_json, timestamp"
+                f" FROM mission_events {where} ORDER BY run_id, id",
+                params,
+            )
+            while rows := cursor.fetchmany(_REBUILD_BATCH_ROWS):
+                for row in rows:
+                    try:
+                        payload = json.loads(row["payload_json"])
+                    except (TypeError, ValueError):
+                        payload = {}
+                    self.apply(
+                        row["run_id"], row["mission_id"], row["event_type"], payload, row["timestamp"]
+                    )
+                    folded += 1
+        self._persistence.flush()
+        if folded:
+            logger.info("Rebuilt run summaries from %d events", folded)
+        return folded
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def load(self, run_id: str) -> dict[str, Any] | None:
+        """The run's summary row with its JSON columns decoded, or None."""
+        self._persistence.flush()
+        with self._persistence.read_connection() as conn:
+            row = conn.execute(_SELECT_SQL, (run_id,)).fetchone()
+        if row is None:
+            return None
+        summary = dict(row)
+        for column in ("pose_quality_counts_json", "interlock_counts_json", "phase_durations_json"):
+            summary[column.removesuffix("_json")] = json.loads(summary.pop(column) or "{}")
+        return summary
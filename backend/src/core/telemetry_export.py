@@ -0,0 +1,315 @@
+"""Streaming telemetry export.
+
+Rows come from ``PersistenceLayer.iter_telemetry_stream_rows``, a SQLite
+cursor drained a batch at a time, and each batch is encoded as soon as it is
+fetched, so an export of any length holds one batch in memory. The query,
+encoding and optional gzip all run on one worker thread per export; the
+event loop only forwards finished chunks.
+
+Formats:
+
+* ``csv``: the diagnostic columns plus a ``cursor`` column;
+* ``ndjson``: one stored stream object per line, with its ``cursor``;
+* ``json``: the diagnostic document (filters, statistics, streams), written
+  incrementally;
+* ``columnar``: an Arrow IPC stream when ``pyarrow`` is installed, otherwise
+  the packed binary layout below.
+
+Every row carries a resumable cursor, ``<timestamp>~<id>``. Passing the last
+one received as ``since`` continues strictly after that row. A bare
+timestamp is accepted too and continues after that instant.
+
+Packed binary layout (little-endian)::
+
+    stream  "LBTS" | version u8 | pad u8[3] | batch* | u32 0
+    batch   rows u32 | id i64[rows] | latency_ms f64[rows]
+            | timestamp, component_id, value, status as:
+              offsets u32[rows + 1] | UTF-8 bytes
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import logging
+import struct
+import zlib
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from .persistence import PersistenceLayer
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401  (registers pa.ipc)
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CURSOR_SEPARATOR = "~"
+EXPORT_BATCH_ROWS = 500
+PACKED_MAGIC = b"LBTS"
+PACKED_VERSION = 1
+
+_ROW_COLUMNS = "id, timestamp, component_id, value, status, latency_ms"
+_DOCUMENT_COLUMNS = "id, timestamp, stream_json"
+CSV_FIELDS = (
+    "timestamp",
+    "component",
+    "value",
+    "status",
+    "latency_ms",
+    "battery_channel",
+    "solar_channel",
+    "cursor",
+)
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    name: str
+    media_type: str
+    extension: str
+
+
+def resolve_format(name: str) -> ExportFormat:
+    """Map a requested format name to what will actually be produced."""
+    name = (name or "csv").lower()
+    if name == "csv":
+        return ExportFormat("csv", "text/csv", "csv")
+    if name == "ndjson":
+        return ExportFormat("ndjson", "application/x-ndjson", "ndjson")
+    if name == "json":
+        return ExportFormat("json", "application/json", "json")
+    if name in {"columnar", "arrow", "binary"}:
+        if PYARROW_AVAILABLE and name != "binary":
+            return ExportFormat("arrow", "application/vnd.apache.arrow.stream", "arrows")
+        return ExportFormat("binary", "application/octet-stream", "lbts")
+    raise ValueError(f"Unsupported export format: {name}")
+
+
+def encode_cursor(timestamp: str, row_id: int) -> str:
+    return f"{timestamp}{CURSOR_SEPARATOR}{row_id}"
+
+
+def parse_cursor(value: str | None) -> tuple[str, int | None] | None:
+    """``<timestamp>~<id>`` -> ``(timestamp, id)``; a bare timestamp -> ``(timestamp, None)``."""
+    if not value:
+        return None
+    timestamp, sep, row_id = value.rpartition(CURSOR_SEPARATOR)
+    if sep and timestamp and row_id.isdigit():
+        return timestamp, int(row_id)
+    return value, None
+
+
+def _splice_first_key(raw: str, key: str, value: Any) -> str:
+    """Prepend ``key`` to a serialized JSON object without parsing it."""
+    head = f"{json.dumps(key)}: {json.dumps(value)}"
+    body = raw.strip()
+    if not body.startswith("{"):
+        return f"{{{head}, \"stream\": {body}}}"
+    rest = body[1:].lstrip()
+    return f"{{{head}}}" if rest.startswith("}") else f"{{{head}, {rest}"
+
+
+def _encode_csv(batches: Iterable[list[sqlite3.Row]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDS)
+    for rows in batches:
+        for row in rows:
+            writer.writerow(
+                (
+                    row["timestamp"],
+                    row["component_id"],
+                    row["value"],
+                    row["status"],
+                    row["latency_ms"],
+                    "ina3221_ch1",
+                    "ina3221_ch2",
+                    encode_cursor(row["timestamp"], row["id"]),
+                )
+            )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _encode_ndjson(batches: Iterable[list[sqlite3.Row]]) -> Iterator[bytes]:
+    for rows in batches:
+        yield "".join(
+            _splice_first_key(
+                row["stream_json"], "cursor", encode_cursor(row["timestamp"], row["id"])
+            )
+            + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+
+def _encode_json_document(
+    batches: Iterable[list[sqlite3.Row]], header: dict[str, Any]
+) -> Iterator[bytes]:
+    yield (json.dumps(header)[:-1] + ', "streams": [').encode("utf-8")
+    count = 0
+    for rows in batches:
+        parts = []
+        for row in rows:
+            if count:
+                parts.append(", ")
+            parts.append(_splice_first_key(row["stream_json"], "db_id", row["id"]))
+            count += 1
+        yield "".join(parts).encode("utf-8")
+    yield f'], "stream_count": {count}}}'.encode()
+
+
+def _pack_strings(values: list[str]) -> bytes:
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = [0]
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+    return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+
+
+def _encode_packed(batches: Iterable[list[sqlite3.Row]]) -> Iterator[bytes]:
+    yield PACKED_MAGIC + struct.pack("<B3x", PACKED_VERSION)
+    for rows in batches:
+        n = len(rows)
+        parts = [
+            struct.pack("<I", n),
+            struct.pack(f"<{n}q", *(row["id"] for row in rows)),
+            struct.pack(f"<{n}d", *(float(row["latency_ms"] or 0.0) for row in rows)),
+        ]
+        for column in ("timestamp", "component_id", "value", "status"):
+            parts.append(_pack_strings([str(row[column] or "") for row in rows]))
+        yield b"".join(parts)
+    yield struct.pack("<I", 0)
+
+
+def _encode_arrow(batches: Iterable[list[sqlite3.Row]]) -> Iterator[bytes]:
+    schema = pa.schema(
+        [
+            ("id", pa.int64()),
+            ("timestamp", pa.string()),
+            ("component_id", pa.string()),
+            ("value", pa.string()),
+            ("status", pa.string()),
+            ("latency_ms", pa.float64()),
+        ]
+    )
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, schema)
+
+    def drain() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    for rows in batches:
+        writer.write_batch(
+            pa.record_batch(
+                [
+                    pa.array([row["id"] for row in rows], pa.int64()),
+                    pa.array([row["timestamp"] for row in rows], pa.string()),
+                    pa.array([row["component_id"] for row in rows], pa.string()),
+                    pa.array([row["value"] for row in rows], pa.string()),
+                    pa.array([row["status"] for row in rows], pa.string()),
+                    pa.array([row["latency_ms"] for row in rows], pa.float64()),
+                ],
+                schema=schema,
+            )
+        )
+        yield drain()
+    writer.close()
+    yield drain()
+
+
+def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def iter_export(
+    persistence: PersistenceLayer,
+    export_format: ExportFormat,
+    *,
+    component_id: str | None = None,
+    start_time: str | None = None,
+    end_time: str | None = None,
+    since: str | None = None,
+    gzip: bool = False,
+    batch_size: int = EXPORT_BATCH_ROWS,
+) -> Iterator[bytes]:
+    """Encoded export chunks; blocking, so drive it from a worker thread."""
+    after = parse_cursor(since)
+    document = export_format.name in {"ndjson", "json"}
+    batches = persistence.iter_telemetry_stream_rows(
+        component_id,
+        start_time,
+        end_time,
+        after=after,
+        columns=_DOCUMENT_COLUMNS if document else _ROW_COLUMNS,
+        batch_size=batch_size,
+    )
+    if export_format.name == "csv":
+        chunks = _encode_csv(batches)
+    elif export_format.name == "ndjson":
+        chunks = _encode_ndjson(batches)
+    elif export_format.name == "json":
+        header = {
+            "export_timestamp": datetime.now(UTC).isoformat(),
+            "filters": {
+                "component_id": component_id,
+                "start_time": start_time,
+                "end_time": end_time,
+                "since": since,
+            },
+            "statistics": persistence.compute_telemetry_latency_stats(
+                component_id=component_id, start_time=start_time, end_time=end_time
+            ),
+        }
+        chunks = _encode_json_document(batches, header)
+    elif export_format.name == "arrow":
+        chunks = _encode_arrow(batches)
+    else:
+        chunks = _encode_packed(batches)
+    try:
+        yield from (_gzip(chunks) if gzip else chunks)
+    finally:
+        batches.close()
+
+
+async def stream_export(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """Pull *chunks* on a dedicated worker thread and hand them to the event loop."""
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telemetry-export")
+    try:
+        while True:
+            chunk = await loop.run_in_executor(executor, next, chunks, None)
+            if chunk is None:
+                return
+            if chunk:
+                yield chunk
+    finally:
+        # Queued behind any in-flight read, so the generator is never closed
+        # while it is executing; closing it releases the pooled connection.
+        executor.submit(chunks.close)
+        executor.shutdown(wait=False)
@@ -0,0 +1,301 @@
+"""Numeric time-series storage with continuous rollups.
+
+Samples are not stored as JSON blobs. Each value is folded into three rollup
+tiers (1 s, 1 min, 15 min) keyed by ``(series, bucket, tags)``. A tier keeps
+count/sum/min/max/last in typed REAL columns, so a bucket can be averaged
+exactly at any coarser resolution. Rollups are updated on insert with
+``INSERT ... ON CONFLICT DO UPDATE`` through the persistence write-behind
+queue. Charts therefore read one small tier instead of re-aggregating raw
+rows. Each tier has its own retention window.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .persistence import PersistenceLayer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RollupTier:
+    name: str
+    table: str
+    width_s: int
+    retention_s: float
+
+
+TIERS: tuple[RollupTier, ...] = (
+    RollupTier("1s", "timeseries_1s", 1, 2 * 86400.0),
+    RollupTier("1m", "timeseries_1m", 60, 30 * 86400.0),
+    RollupTier("15m", "timeseries_15m", 900, 400 * 86400.0),
+)
+
+SCHEMA_SQL = "\n".join(
+    f"""
+    CREATE TABLE IF NOT EXISTS {tier.table} (
+        series  TEXT    NOT NULL,
+        bucket  INTEGER NOT NULL,          -- bucket start, Unix epoch seconds
+        tags    TEXT    NOT NULL DEFAULT '',
+        n       INTEGER NOT NULL,
+        v_sum   REAL    NOT NULL,
+        v_min   REAL    NOT NULL,
+        v_max   REAL    NOT NULL,
+        last_ts REAL    NOT NULL,
+        v_last  REAL    NOT NULL,
+        PRIMARY KEY (series, bucket, tags)
+    ) WITHOUT ROWID;
+    """
+    for tier in TIERS
+)
+
+
+@dataclass(frozen=True)
+class RollupPoint:
+    """One aggregated bucket of a series, as returned by ``TimeSeriesStore.query``."""
+
+    series: str
+    tags: dict[str, str]
+    bucket_ts: float
+    count: int
+    mean: float
+    min: float
+    max: float
+    last: float
+
+
+def encode_tags(tags: Mapping[str, Any] | None) -> str:
+    """Canonical tag encoding: ``k=v`` pairs sorted by key, ``;``-separated."""
+    if not tags:
+        return ""
+    return ";".join(
+        f"{key}={'' if value is None else value}" for key, value in sorted(tags.items())
+    )
+
+
+def decode_tags(encoded: str) -> dict[str, str]:
+    if not encoded:
+        return {}
+    return dict(part.split("=", 1) for part in encoded.split(";"))
+
+
+def tier_for(bucket_s: float, since_ts: float | None = None, now: float | None = None) -> RollupTier:
+    """Pick the coarsest tier that evenly divides *bucket_s* and still covers *since_ts*."""
+    now = time.time() if now is None else now
+    candidates = [
+        tier
+        for tier in TIERS
+        if bucket_s >= tier.width_s and math.isclose(bucket_s % tier.width_s, 0.0, abs_tol=1e-9)
+    ] or [TIERS[0]]
+    if since_ts is not None:
+        covering = [tier for tier in candidates if now - tier.retention_s <= since_ts]
+        if covering:
+            return covering[-1]
+    return candidates[-1]
+
+
+class _Accumulator:
+    __slots__ = ("n", "total", "low", "high", "last_ts", "last")
+
+    def __init__(self, ts: float, value: float) -> None:
+        self.n = 1
+        self.total = value
+        self.low = value
+        self.high = value
+        self.last_ts = ts
+        self.last = value
+
+    def add(self, ts: float, value: float) -> None:
+        self.n += 1
+        self.total += value
+        self.low = min(self.low, value)
+        self.high = max(self.high, value)
+        if ts >= self.last_ts:
+            self.last_ts = ts
+            self.last = value
+
+
+class TimeSeriesStore:
+    """Rollup-tier time-series store on top of ``PersistenceLayer``."""
+
+    def __init__(self, persistence: PersistenceLayer) -> None:
+        self._persistence = persistence
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        values: Mapping[str, float | int | None],
+        *,
+        ts: float | None = None,
+        tags: Mapping[str, Any] | None = None,
+    ) -> list[Future]:
+        """Fold one sample of several series into every tier.
+
+        ``None`` and non-finite values are skipped, as ``AVG`` would skip NULLs.
+        """
+        ts = time.time() if ts is None else ts
+        return self.record_many((ts, series, value, tags) for series, value in values.items())
+
+    def record_many(
+        self, samples: Iterable[tuple[float, str, float | int | None, Mapping[str, Any] | None]]
+    ) -> list[Future]:
+        """Fold ``(ts, series, value, tags)`` samples into every tier.
+
+        Samples are pre-aggregated per bucket so each tier gets one upsert per
+        touched bucket; this is what makes bulk backfills cheap.
+        """
+        buckets: list[dict[tuple[str, int, str], _Accumulator]] = [{} for _ in TIERS]
+        for ts, series, value, tags in samples:
+            if value is None:
+                continue
+            value = float(value)
+            if not math.isfinite(value):
+                continue
+            encoded = encode_tags(tags)
+            for tier, acc in zip(TIERS, buckets, strict=True):
+                key = (series, int(ts // tier.width_s) * tier.width_s, encoded)
+                current = acc.get(key)
+                if current is None:
+                    acc[key] = _Accumulator(ts, value)
+                else:
+                    current.add(ts, value)
+
+        futures: list[Future] = []
+        for tier, acc in zip(TIERS, buckets, strict=True):
+            if not acc:
+                continue
+            rows = [
+                (series, bucket, encoded, a.n, a.total, a.low, a.high, a.last_ts, a.last)
+                for (series, bucket, encoded), a in acc.items()
+            ]
+            futures.append(
+                self._persistence.enqueue_write(_upsert_sql(tier), rows, many=True)
+            )
+        return futures
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        series: Sequence[str],
+        *,
+        since_ts: float,
+        until_ts: float | None = None,
+        bucket_s: float = 60.0,
+    ) -> list[RollupPoint]:
+        """Return buckets of width *bucket_s* for *series*, oldest first.
+
+        Served from the coarsest tier that evenly divides *bucket_s*, so the
+        window edges are aligned to that tier's buckets.
+        """
+        if not series:
+            return []
+        tier = tier_for(bucket_s, since_ts)
+        width = float(bucket_s)
+        placeholders = ",".join("?" for _ in series)
+        params: list[Any] = [*series, int(since_ts // tier.width_s) * tier.width_s]
+        until_clause = ""
+        if until_ts is not None:
+            until_clause = "AND bucket < ?"
+            params.append(until_ts)
+        sql = f"""
+            SELECT series, tags, bucket, n, v_sum, v_min, v_max, last_ts, v_last
+            FROM {tier.table}
+            WHERE series IN ({placeholders}) AND bucket >= ?
+            {until_clause}
+        """
+        self._persistence.flush()
+        with self._persistence.read_connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        # Tier rows are already aggregated, so merging them into wider buckets
+        # touches at most bucket_s / tier.width_s rows per output point.
+        merged: dict[tuple[float, str, str], list[Any]] = {}
+        for name, tags, bucket, n, total, low, high, last_ts, last in rows:
+            bucket_ts = math.floor(bucket / width) * width + width / 2
+            key = (bucket_ts, name, tags)
+            acc = merged.get(key)
+            if acc is None:
+                merged[key] = [n, total, low, high, last_ts, last]
+                continue
+            acc[0] += n
+            acc[1] += total
+            acc[2] = min(acc[2], low)
+            acc[3] = max(acc[3], high)
+            if last_ts >= acc[4]:
+                acc[4] = last_ts
+                acc[5] = last
+        return [
+            RollupPoint(
+                series=name,
+                tags=decode_tags(tags),
+                bucket_ts=bucket_ts,
+                count=n,
+                mean=total / n,
+                min=low,
+                max=high,
+                last=last,
+            )
+            for (bucket_ts, name, tags), (n, total, low, high, _last_ts, last) in sorted(
+                merged.items()
+            )
+        ]
+
+    def has_series(self, prefix: str) -> bool:
+        """True if any series starting with *prefix* has data in the coarsest tier."""
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        self._persistence.flush()
+        with self._persistence.read_connection() as conn:
+            row = conn.execute(
+                f"SELECT 1 FROM {TIERS[-1].table} WHERE series >= ? AND series < ? LIMIT 1",
+                (prefix, upper),
+            ).fetchone()
+        return row is not None
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def apply_retention(self, now: float | None = None) -> dict[str, int]:
+        """Drop buckets older than each tier's retention. Returns rows deleted per tier."""
+        now = time.time() if now is None else now
+        futures = {
+            tier.name: self._persistence.enqueue_write(
+                f"DELETE FROM {tier.table} WHERE bucket < ?",
+                (int(now - tier.retention_s),),
+            )
+            for tier in TIERS
+        }
+        self._persistence.flush()
+        deleted = {name: future.result() for name, future in futures.items()}
+        if any(deleted.values()):
+            logger.info("Time-series retention removed %s", deleted)
+        return deleted
+
+
+def _upsert_sql(tier: RollupTier) -> str:
+    return f"""
+        INSERT INTO {tier.table}
+            (series, bucket, tags, n, v_sum, v_min, v_max, last_ts, v_last)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (series, bucket, tags) DO UPDATE SET
+            n = n + excluded.n,
+            v_sum = v_sum + excluded.v_sum,
+            v_min = MIN(v_min, excluded.v_min),
+            v_max = MAX(v_max, excluded.v_max),
+            v_last = CASE WHEN excluded.last_ts >= last_ts THEN excluded.v_last ELSE v_last END,
+            last_ts = MAX(last_ts, excluded.last_ts)
+    """
@@ -33,6 +33,13 @@ accuracy: this driver uses the Game Rotation Vector (SHTP) or RVC, neither of
 which depends on the magnetometer, deliberately, so that motor-current magnetic
 interference cannot degrade heading or block calibration.
 
+## Streaming
+Once a transport opens, a dedicated reader thread owns it and parses frames
+continuously (``RvcStream.feed`` for RVC, report polling for SHTP), stamping
+each sample with its monotonic receive time into an ``ImuSampleRing``.
+``read_orientation`` is then a latest-sample lookup with no executor round
+trip, and ``samples_since`` hands consumers every sample at the native rate.
+
 Safety Requirement (FR-022): Tilt >30 degrees must trigger blade stop
 within 200ms.  Enforcement occurs in safety triggers (T051); this driver
 only supplies data.
@@ -46,6 +53,7 @@ import math
 import os
 import random
 import struct
+import threading
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
@@ -57,9 +65,9 @@ from ..base import HardwareDriver
 
 logger = logging.getLogger(__name__)
 
-# Dedicated thread pool for BNO085 SHTP reads.  A size of 2 gives one active
-# read plus one queued — enough headroom without ever exhausting the global
-# asyncio thread pool (which is shared with GPS, INA3221, VL53L0X, etc.).
+# Dedicated thread pool for BNO085 transport opens.  A size of 2 gives one
+# active open plus one queued — enough headroom without ever exhausting the
+# global asyncio thread pool (which is shared with GPS, INA3221, VL53L0X, etc.).
 _BNO085_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bno085")
 
 # SHTP calibration level → contract string
@@ -72,6 +80,20 @@ _SHTP_CAL_MAP: dict[int, str] = {
 
 # Maximum age (seconds) before a cached reading is downgraded to uncalibrated
 _MAX_STALE_AGE_S = 5.0
+# A streamed sample younger than this is served as a live (uncached) reading,
+# even if an earlier read already returned it.
+_FRESH_SAMPLE_S = 0.2
+
+# Streaming reader.  256 samples hold 2.5 s of the 100 Hz RVC stream.
+_SAMPLE_RING_SIZE = 256
+_RVC_PERIOD_S = 0.01
+# Stream uptime before heading is reported "fully_calibrated" (the gyro
+# integration settles in ~6 s, the old 30 frames at a 5 Hz poll).
+_STREAM_WARMUP_S = 6.0
+# Consecutive transport errors after which the reader gives up and the next
+# read re-initializes the sensor.
+_STREAM_ERROR_LIMIT = 10
+_STREAM_IDLE_WAIT_S = 0.005
 
 # ----------------------------------------------------------------------
 # UART-RVC framing (PS1 HIGH)
@@ -174,6 +196,149 @@ class RvcStream:
         return out
 
 
+class ImuSampleRing:
+    """The newest IMU samples, written by one reader thread and read lock-free.
+
+    The writer stores a sample into its slot before publishing the new write
+    count (a single attribute store), so readers never see a half-written slot.
+    A reader that falls more than ``capacity`` samples behind loses the oldest.
+    """
+
+    def __init__(self, capacity: int = _SAMPLE_RING_SIZE) -> None:
+        self.capacity = max(2, int(capacity))
+        self._slots: list[dict[str, Any] | None] = [None] * self.capacity
+        self._written = 0
+
+    @property
+    def written(self) -> int:
+        return self._written
+
+    def append(self, sample: dict[str, Any]) -> None:
+        index = self._written
+        self._slots[index % self.capacity] = sample
+        self._written = index + 1
+
+    def latest(self) -> dict[str, Any] | None:
+        written = self._written
+        if not written:
+            return None
+        return self._slots[(written - 1) % self.capacity]
+
+    def since(self, monotonic_s: float) -> list[dict[str, Any]]:
+        """Samples received strictly after *monotonic_s*, oldest first."""
+        written = self._written
+        # One slot of slack: the writer may be overwriting the oldest right now.
+        oldest = max(0, written - self.capacity + 1)
+        out: list[dict[str, Any]] = []
+        for index in range(written - 1, oldest - 1, -1):
+            sample = self._slots[index % self.capacity]
+            if sample is None or sample["monotonic_received_s"] <= monotonic_s:
+                break
+            out.append(sample)
+        out.reverse()
+        return out
+
+
+class _ImuStreamReader:
+    """Reader thread that owns one open transport and fills an ``ImuSampleRing``.
+
+    A reader belongs to exactly one transport session: closing the transport
+    stops it, and a re-open starts a fresh reader (and ring) under the new
+    ``imu_epoch_id``, so samples never cross sessions.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        handle: Any,
+        *,
+        epoch_id: str | None,
+        rvc_stream: RvcStream | None = None,
+        capacity: int = _SAMPLE_RING_SIZE,
+    ) -> None:
+        self.mode = mode
+        self.handle = handle
+        self.epoch_id = epoch_id
+        self.ring = ImuSampleRing(capacity)
+        self.first_sample = threading.Event()
+        self.frames = 0
+        self.consecutive_errors = 0
+        self.last_error: str | None = None
+        self.failed = False
+        self._rvc_stream = rvc_stream or RvcStream()
+        self._stop = threading.Event()
+        self._started = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, name=f"bno085-{mode}", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Signal the thread; closing the transport unblocks any pending read."""
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                got = self._pump_rvc() if self.mode == "rvc" else self._pump_shtp()
+            except Exception as exc:
+                if self._stop.is_set():
+                    return  # transport closed under us on shutdown/re-init
+                self.consecutive_errors += 1
+                self.last_error = str(exc)
+                if self.consecutive_errors == 1 or self.consecutive_errors % 5 == 0:
+                    logger.warning(
+                        "BNO085 %s stream error (%d consecutive): %s",
+                        self.mode.upper(),
+                        self.consecutive_errors,
+                        exc,
+                    )
+                if self.consecutive_errors >= _STREAM_ERROR_LIMIT:
+                    self.failed = True
+                    return
+                self._stop.wait(0.05)
+                continue
+            self.consecutive_errors = 0
+            if not got:
+                self._stop.wait(_STREAM_IDLE_WAIT_S)
+
+    def _pump_rvc(self) -> bool:
+        uart = self.handle
+        # Blocks for up to read_timeout when the line is idle.
+        chunk = uart.read(max(_RVC_FRAME_LEN, uart.in_waiting or 0))
+        frames = self._rvc_stream.feed(chunk or b"")
+        if not frames:
+            return bool(chunk)
+        received = time.monotonic()
+        # Frames drained together arrived 10 ms apart, the newest just now.
+        last = len(frames) - 1
+        for position, frame in enumerate(frames):
+            frame.pop("index", None)
+            self._publish(frame, received - (last - position) * _RVC_PERIOD_S)
+        return True
+
+    def _pump_shtp(self) -> bool:
+        orientation = _read_shtp_sync(self.handle, self.frames)
+        if orientation is None:
+            return False
+        self._publish(orientation, time.monotonic())
+        return True
+
+    def _publish(self, orientation: dict[str, Any], received: float) -> None:
+        # Both transports report calibration from stream uptime (see module doc).
+        warmed = received - self._started >= _STREAM_WARMUP_S
+        orientation["calibration_status"] = "fully_calibrated" if warmed else "calibrating"
+        orientation["monotonic_received_s"] = received
+        orientation["cached"] = False
+        orientation["imu_epoch_id"] = self.epoch_id
+        self.ring.append(orientation)
+        self.frames += 1
+        if self.frames == 1:
+            self.first_sample.set()
+
+
 @dataclass
 class BNO085DriverConfig:
     port: str = "/dev/ttyAMA4"
@@ -319,6 +484,8 @@ class BNO085Driver(HardwareDriver):
       ``baudrate``     : SHTP baud rate (default 3000000)
       ``rvc_baudrate`` : RVC baud rate (default 115200)
       ``read_timeout`` : serial timeout in seconds (default 1.0)
+      ``sample_buffer``: streamed samples retained for ``samples_since``
+                         (default 256, 2.5 s of RVC)
     """
 
     def __init__(self, config: dict[str, Any] | None = None):
@@ -337,6 +504,9 @@ class BNO085Driver(HardwareDriver):
         self._bno = None  # adafruit_bno08x BNO08X_UART instance
         self._rvc_serial = None  # pyserial handle when running in RVC mode
         self._rvc_stream = RvcStream()
+        self._stream: _ImuStreamReader | None = None
+        self._sample_buffer = int(cfg.get("sample_buffer", _SAMPLE_RING_SIZE))
+        self._last_sample: dict[str, Any] | None = None
         self._mode: str | None = None  # set once a transport opens successfully
         self._last_open_error: str | None = None
         self._last_reinit_attempt: float | None = None
@@ -414,6 +584,14 @@ class BNO085Driver(HardwareDriver):
             self._bno = handle
         self._mode = candidate
         self._imu_epoch_id = uuid.uuid4().hex
+        self._stream = _ImuStreamReader(
+            candidate,
+            handle,
+            epoch_id=self._imu_epoch_id,
+            rvc_stream=self._rvc_stream if candidate == "rvc" else None,
+            capacity=self._sample_buffer,
+        )
+        self._stream.start()
         logger.info(
             "BNO085 %s initialized on %s @ %d baud",
             candidate.upper(),
@@ -477,34 +655,11 @@ class BNO085Driver(HardwareDriver):
                 pass
             raise
 
-    def _read_rvc_sync(self, valid_frames: int = 0) -> dict[str, Any] | None:
-        """Drain buffered RVC frames and return the newest (blocking).
-
-        The sensor free-runs at 100 Hz while the sensor manager polls far more
-        slowly, so several frames are usually waiting.  Only the most recent is
-        returned — older ones are stale orientation by definition.  Returns
-        ``None`` when no complete valid frame is available.
-        """
-        uart = self._rvc_serial
-        if uart is None:
-            return None
-
-        chunk = uart.read(max(1, uart.in_waiting or _RVC_FRAME_LEN))
-        frames = self._rvc_stream.feed(chunk or b"")
-        if not frames:
-            return None
-
-        latest = frames[-1]
-        # RVC exposes no calibration registers, so status mirrors the SHTP path:
-        # derived from how long the stream has been running rather than from the
-        # magnetometer (which this driver deliberately ignores anyway).
-        return {
-            **{k: v for k, v in latest.items() if k != "index"},
-            "calibration_status": "fully_calibrated" if valid_frames >= 30 else "calibrating",
-        }
-
     def _close_transports(self) -> None:
-        """Close any open serial handles and drop protocol state."""
+        """Stop the stream reader, close any open serial handles and drop protocol state."""
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream = None
         for attr in ("_serial", "_rvc_serial"):
             handle = getattr(self, attr, None)
             if handle is not None:
@@ -572,6 +727,8 @@ class BNO085Driver(HardwareDriver):
             "shtp_connected": self._bno is not None,
             "valid_frames": self._valid_frames,
             "consecutive_errors": self._consecutive_errors,
+            "stream_frames": self._stream.frames if self._stream is not None else 0,
+            "stream_error": self._stream.last_error if self._stream is not None else None,
             "imu_epoch_id": self._imu_epoch_id,
             "last_orientation": self._last_orientation,
             "last_read_age_s": (time.time() - self._last_read_ts) if self._last_read_ts else None,
@@ -591,6 +748,24 @@ class BNO085Driver(HardwareDriver):
 
         return await self._hw_read()
 
+    def samples_since(self, monotonic_s: float) -> list[dict[str, Any]]:
+        """Every sample received after *monotonic_s* (monotonic clock), oldest first.
+
+        Non-blocking. Lets a consumer such as the pose filter apply the full
+        stream rather than one sample per poll; samples older than the ring
+        (``sample_buffer``) are gone. Simulation has no stream and returns at
+        most the last simulated reading.
+        """
+        if is_simulation_mode():
+            last = self._last_orientation
+            if last is not None and last["monotonic_received_s"] > monotonic_s:
+                return [last]
+            return []
+        stream = self._stream
+        if stream is None:
+            return []
+        return stream.ring.since(monotonic_s)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -623,10 +798,11 @@ class BNO085Driver(HardwareDriver):
         return self._last_orientation
 
     async def _hw_read(self) -> dict[str, Any] | None:
-        """Read SHTP reports from the BNO085 (serialized, non-blocking via thread).
+        """Return the newest streamed sample (or a stale/placeholder reading).
 
-        Uses the dedicated ``_BNO085_EXECUTOR`` so a slow/stuck read never
-        exhausts the global asyncio thread pool.
+        The reader thread does all transport I/O, so this is a lookup. The only
+        waits are a throttled (re)open and, right after an open, up to one
+        ``read_timeout`` for the stream's first frame.
         """
         async with self._lock:
             if self._mode is None:
@@ -637,66 +813,57 @@ class BNO085Driver(HardwareDriver):
                 if self._mode is None:
                     return self._stale_or_placeholder()
 
-            try:
+            stream = self._stream
+            if stream is None or stream.failed:
+                logger.warning(
+                    "BNO085: %s stream stopped after repeated errors (%s), attempting re-init",
+                    (self._mode or "none").upper(),
+                    stream.last_error if stream is not None else "no reader",
+                )
+                await self._attempt_reinit()
+                return self._stale_or_placeholder()
+
+            sample = stream.ring.latest()
+            if sample is None:
                 loop = asyncio.get_running_loop()
-                if self._mode == "rvc":
-                    result = await loop.run_in_executor(
-                        _BNO085_EXECUTOR, self._read_rvc_sync, self._valid_frames
-                    )
-                else:
-                    result = await loop.run_in_executor(
-                        _BNO085_EXECUTOR, _read_shtp_sync, self._bno, self._valid_frames
-                    )
-            except Exception as exc:
-                self._consecutive_errors += 1
-                if self._consecutive_errors == 1 or self._consecutive_errors % 30 == 0:
-                    logger.warning(
-                        "BNO085 %s read error (%d consecutive): %s",
+                await loop.run_in_executor(
+                    _BNO085_EXECUTOR, stream.first_sample.wait, self._cfg.read_timeout
+                )
+                sample = stream.ring.latest()
+
+        if sample is not None and time.monotonic() - sample["monotonic_received_s"] <= (
+            _FRESH_SAMPLE_S
+        ):
+            if sample is not self._last_sample:
+                if self._valid_frames == 0:
+                    logger.info(
+                        "BNO085 first %s frame on %s "
+                        "(yaw=%.1f° pitch=%.1f° roll=%.1f° cal=%s)",
                         (self._mode or "none").upper(),
-                        self._consecutive_errors,
-                        exc,
+                        self._cfg.port,
+                        sample["yaw"],
+                        sample["pitch"],
+                        sample["roll"],
+                        sample["calibration_status"],
                     )
-                # After many consecutive failures, attempt re-init
-                if self._consecutive_errors >= 10:
-                    logger.warning(
-                        "BNO085: %d consecutive errors, attempting re-init",
-                        self._consecutive_errors,
-                    )
-                    await self._attempt_reinit()
-                return self._stale_or_placeholder()
-
-        if result is not None:
-            if self._valid_frames == 0:
-                logger.info(
-                    "BNO085 first %s frame on %s (yaw=%.1f° pitch=%.1f° roll=%.1f° cal=%s)",
-                    (self._mode or "none").upper(),
-                    self._cfg.port,
-                    result["yaw"],
-                    result["pitch"],
-                    result["roll"],
-                    result["calibration_status"],
+                self._valid_frames += 1
+                self._last_sample = sample
+                self._last_orientation = sample
+                self._last_read_ts = time.time() - (
+                    time.monotonic() - sample["monotonic_received_s"]
                 )
             self._consecutive_errors = 0
-            self._valid_frames += 1
-            result = {
-                **result,
-                "monotonic_received_s": time.monotonic(),
-                "cached": False,
-                "imu_epoch_id": self._imu_epoch_id,
-            }
-            self._last_orientation = result
-            self._last_read_ts = time.time()
-            return result
-        else:
-            self._consecutive_errors += 1
-            if self._consecutive_errors == 30:
-                logger.warning(
-                    "BNO085 on %s: no %s data after %d read cycles. "
-                    "Check sensor power and UART4 wiring (GPIO12=TX, GPIO13=RX).",
-                    self._cfg.port,
-                    (self._mode or "none").upper(),
-                    self._consecutive_errors,
-                )
+            return sample
+
+        self._consecutive_errors += 1
+        if self._consecutive_errors == 30:
+            logger.warning(
+                "BNO085 on %s: no %s data after %d read cycles. "
+                "Check sensor power and UART4 wiring (GPIO12=TX, GPIO13=RX).",
+                self._cfg.port,
+                (self._mode or "none").upper(),
+                self._consecutive_errors,
+            )
         return self._stale_or_placeholder()
 
     def _stale_or_placeholder(self) -> dict[str, Any]:
@@ -729,6 +896,7 @@ class BNO085Driver(HardwareDriver):
     def _reset_imu_session(self) -> None:
         """Discard readings and identity from the previous physical IMU session."""
         self._last_orientation = None
+        self._last_sample = None
         self._last_read_ts = None
         self._valid_frames = 0
         self._consecutive_errors = 0
@@ -756,4 +924,4 @@ class BNO085Driver(HardwareDriver):
             )
 
 
-__all__ = ["BNO085Driver"]
+__all__ = ["BNO085Driver", "ImuSampleRing"]
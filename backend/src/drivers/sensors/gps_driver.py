@@ -1,7 +1,14 @@
 """GPS Driver (T058)
 
 Supports u-blox ZED-F9P via USB or UART and Neo-8M via UART. This driver follows the
-HardwareDriver lifecycle and returns GPS positions at ~1Hz when polled.
+HardwareDriver lifecycle.
+
+On hardware, ``start()`` launches one reader thread that owns the serial port.
+It frames the raw byte stream (NMEA sentences interleaved with UBX binary),
+groups the GGA/RMC/GST sentences of each navigation epoch by their shared UTC
+time, and publishes one ``GpsReading`` per epoch to subscribers as soon as the
+epoch is complete. ``read_position()`` then just returns the newest epoch, so
+the receiver's full 10-20 Hz rate is available instead of one sample per poll.
 
 SIM_MODE notes:
 - When SIM_MODE=1 (default in CI), returns deterministic positions without
@@ -23,9 +30,11 @@ import os
 import socket
 import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
+from ...core.callbacks import CallbackList
 from ...core.simulation import is_simulation_mode
 from ...models.sensor_data import GpsMode, GpsReading
 from ..base import HardwareDriver
@@ -91,6 +100,282 @@ def build_enable_gst_message(mode: GpsMode) -> bytes | None:
     return build_ubx_cfg_valset(key, value=1, layers=_UBX_LAYER_PERSIST)
 
 
+# --------------------------------------------------------------------------
+# Streaming reader
+# --------------------------------------------------------------------------
+# NMEA 0183 caps a sentence at 82 characters; u-blox PUBX sentences run longer.
+_NMEA_MAX_LEN = 120
+_UBX_SYNC = b"\xb5\x62"
+_UBX_MAX_PAYLOAD = 4096
+_FRAMER_MAX_BUFFER = 16384
+_UBX_ACK_CLASS = 0x05
+_UBX_CFG_VALSET_ID = bytes([0x06, 0x8A])
+_EPOCH_SENTENCES = ("GGA", "RMC", "GST")
+# Serial read timeout; also bounds how long a finished epoch without GST waits.
+_STREAM_READ_TIMEOUT_S = 0.25
+# Bytes without one valid frame before the port is treated as the wrong baud.
+_STREAM_GARBAGE_REOPEN_BYTES = 4096
+_STREAM_MAX_BACKOFF_S = 5.0
+
+
+def _nmea_checksum_ok(sentence: bytes) -> bool:
+    """True if *sentence* (``$...*HH``, no line ending) carries a valid checksum."""
+    star = sentence.rfind(b"*")
+    if star < 1 or len(sentence) - star != 3:
+        return False
+    checksum = 0
+    for byte in sentence[1:star]:
+        checksum ^= byte
+    try:
+        return checksum == int(sentence[star + 1 :], 16)
+    except ValueError:
+        return False
+
+
+def _ubx_checksum(body: bytes | bytearray) -> tuple[int, int]:
+    ck_a = ck_b = 0
+    for b in body:
+        ck_a = (ck_a + b) & 0xFF
+        ck_b = (ck_b + ck_a) & 0xFF
+    return ck_a, ck_b
+
+
+class NmeaUbxFramer:
+    """Incremental framer for a serial stream mixing NMEA sentences and UBX frames.
+
+    Reads split frames at arbitrary offsets, and UBX payloads may contain the
+    bytes ``$`` and ``\\n``, so line-based reading can glue binary onto a
+    sentence or lose one. The framer buffers raw bytes, hunts for either sync
+    marker, and only emits frames whose checksum verifies; on a bad frame it
+    steps past the marker alone so a real frame overlapping it is still found.
+
+    ``feed()`` returns ``("nmea", sentence)`` and ``("ubx", (cls, id, payload))``
+    tuples in stream order.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self.nmea_frames = 0
+        self.ubx_frames = 0
+        self.checksum_errors = 0
+        self.discarded_bytes = 0
+
+    def feed(self, data: bytes) -> list[tuple[str, Any]]:
+        if data:
+            self._buf.extend(data)
+        buf = self._buf
+        size = len(buf)
+        out: list[tuple[str, Any]] = []
+        pos = 0
+        while pos < size:
+            marker = buf[pos]
+            if marker == 0x24:  # "$"
+                end = buf.find(b"\n", pos, pos + _NMEA_MAX_LEN + 2)
+                if end < 0:
+                    if size - pos <= _NMEA_MAX_LEN + 1:
+                        break  # partial sentence; wait for the rest
+                    self.discarded_bytes += 1
+                    pos += 1
+                    continue
+                sentence = bytes(buf[pos:end]).rstrip(b"\r")
+                if _nmea_checksum_ok(sentence):
+                    out.append(("nmea", sentence.decode("ascii", errors="replace")))
+                    self.nmea_frames += 1
+                    pos = end + 1
+                else:
+                    self.checksum_errors += 1
+                    pos += 1
+                continue
+            if marker == 0xB5:
+                if size - pos < 6:
+                    break
+                if buf[pos + 1] != 0x62:
+                    self.discarded_bytes += 1
+                    pos += 1
+                    continue
+                length = buf[pos + 4] | (buf[pos + 5] << 8)
+                if length > _UBX_MAX_PAYLOAD:
+                    self.checksum_errors += 1
+                    pos += 1
+                    continue
+                stop = pos + 8 + length
+                if stop > size:
+                    break
+                if _ubx_checksum(buf[pos + 2 : stop - 2]) == (buf[stop - 2], buf[stop - 1]):
+                    payload = bytes(buf[pos + 6 : stop - 2])
+                    out.append(("ubx", (buf[pos + 2], buf[pos + 3], payload)))
+                    self.ubx_frames += 1
+                    pos = stop
+                else:
+                    self.checksum_errors += 1
+                    pos += 1
+                continue
+            # Skip to whichever sync marker comes first.
+            candidates = [i for i in (buf.find(b"$", pos), buf.find(0xB5, pos)) if i >= 0]
+            nxt = min(candidates) if candidates else size
+            self.discarded_bytes += nxt - pos
+            pos = nxt
+        if pos:
+            del buf[:pos]
+        if len(buf) > _FRAMER_MAX_BUFFER:
+            self.discarded_bytes += len(buf)
+            buf.clear()
+        return out
+
+
+class _NmeaEpoch:
+    """Parsed sentences of one navigation epoch, keyed by their UTC time field."""
+
+    __slots__ = ("utc", "received_s", "gga", "rmc", "rmc_valid", "gst")
+
+    def __init__(self, utc: str, received_s: float) -> None:
+        self.utc = utc
+        self.received_s = received_s
+        self.gga: tuple | None = None
+        self.rmc: tuple | None = None
+        self.rmc_valid = False
+        self.gst: float | None = None
+
+
+class _GpsStreamReader:
+    """Owner thread that keeps the receiver's serial port open and drained.
+
+    Opening, receiver configuration and stale-port recovery reuse the driver's
+    polled-path helpers. An epoch is published once its GGA, RMC and (when the
+    receiver emits it) GST have arrived, when a sentence from the next epoch
+    shows up, or when the line goes quiet between epochs.
+    """
+
+    def __init__(self, driver: GPSDriver) -> None:
+        self.driver = driver
+        self.framer = NmeaUbxFramer()
+        self.epochs = 0
+        self._epoch: _NmeaEpoch | None = None
+        # The driver enables GST on F9P receivers; an epoch that closes without
+        # one (older firmware, NAK) stops the reader from waiting for it.
+        self._expect_gst = build_enable_gst_message(driver.cfg.mode) is not None
+        self._idle_reads = 0
+        self._bytes_since_frame = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="gps-stream", daemon=True)
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive() and not self._stop.is_set()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Signal the thread; the caller closes the port to unblock a pending read."""
+        self._stop.set()
+
+    def join(self, timeout: float | None = None) -> None:
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        driver = self.driver
+        backoff = 0.5
+        while not self._stop.is_set():
+            if driver._serial is None:
+                if not driver._open_serial_blocking():
+                    fallback = driver._read_from_gpsd(timeout_sec=1.0)
+                    if fallback is not None:
+                        driver._publish_reading(
+                            fallback.model_copy(update={"monotonic_received_s": time.monotonic()})
+                        )
+                        continue
+                    self._stop.wait(backoff)
+                    backoff = min(_STREAM_MAX_BACKOFF_S, backoff * 2)
+                    continue
+                self._reset_stream()
+                if not driver._receiver_configured:
+                    driver._configure_receiver()
+                    driver._receiver_configured = True
+            try:
+                self._pump(driver._serial)
+                backoff = 0.5
+            except Exception as exc:
+                if self._stop.is_set():
+                    return  # port closed under us on shutdown
+                driver._close_serial_for_recovery(str(exc))
+                self._stop.wait(backoff)
+                backoff = min(_STREAM_MAX_BACKOFF_S, backoff * 2)
+
+    def _reset_stream(self) -> None:
+        self.framer = NmeaUbxFramer()
+        self._epoch = None
+        self._idle_reads = 0
+        self._bytes_since_frame = 0
+
+    def _pump(self, serial_handle: Any) -> None:
+        # Blocks for up to the port timeout when the line is idle.
+        chunk = serial_handle.read(max(1, getattr(serial_handle, "in_waiting", 0) or 0))
+        if not chunk:
+            # The line went quiet: whatever the epoch holds is all it will get.
+            self._flush_epoch()
+            self._idle_reads += 1
+            idle_s = self._idle_reads * _STREAM_READ_TIMEOUT_S
+            if idle_s >= self.driver.cfg.stale_reopen_s:
+                self.driver._close_serial_for_recovery(f"no GPS data for {idle_s:.1f}s")
+            return
+        self._idle_reads = 0
+        received = time.monotonic()
+        frames = self.framer.feed(chunk)
+        if not frames:
+            self._bytes_since_frame += len(chunk)
+            if self._bytes_since_frame >= _STREAM_GARBAGE_REOPEN_BYTES:
+                self.driver._close_serial_for_recovery("no valid NMEA/UBX frames")
+            return
+        self._bytes_since_frame = 0
+        for kind, frame in frames:
+            if kind == "nmea":
+                self._on_sentence(frame, received)
+            else:
+                self.driver._on_ubx_frame(*frame)
+
+    def _on_sentence(self, sentence: str, received: float) -> None:
+        kind = sentence[3:6]
+        if kind not in _EPOCH_SENTENCES:
+            return
+        self.driver._last_nmea[kind] = sentence
+        fields = sentence.split(",", 3)
+        utc = fields[1] if len(fields) > 1 else ""
+        epoch = self._epoch
+        if epoch is not None and epoch.utc != utc:
+            self._flush_epoch()
+            epoch = None
+        if epoch is None:
+            epoch = self._epoch = _NmeaEpoch(utc, received)
+        driver = self.driver
+        if kind == "GGA":
+            epoch.gga = driver._parse_gga(sentence)
+        elif kind == "RMC":
+            epoch.rmc = driver._parse_rmc(sentence)
+            epoch.rmc_valid = len(fields) > 2 and fields[2] == "A"
+        else:
+            epoch.gst = driver._parse_gst(sentence)
+            self._expect_gst = True
+        if (
+            epoch.gga is not None
+            and epoch.rmc is not None
+            and (epoch.gst is not None or not self._expect_gst)
+        ):
+            self._flush_epoch()
+
+    def _flush_epoch(self) -> None:
+        epoch, self._epoch = self._epoch, None
+        if epoch is None:
+            return
+        if epoch.gst is None:
+            self._expect_gst = False
+        reading = self.driver._reading_from_epoch(epoch)
+        if reading is not None:
+            self.epochs += 1
+            self.driver._publish_reading(reading)
+
+
 @dataclass
 class GPSDriverConfig:
     mode: GpsMode = GpsMode.F9P_USB
@@ -99,6 +384,8 @@ class GPSDriverConfig:
     uart_device: str = "/dev/ttyAMA0"  # common UART on Pi
     baudrate: int = 9600
     stale_reopen_s: float = 5.0
+    # Keep one reader thread on the port and publish every epoch (hardware only).
+    streaming: bool = True
 
 
 class GPSDriver(HardwareDriver):
@@ -106,6 +393,7 @@ class GPSDriver(HardwareDriver):
 
     Methods:
     - read_position() -> GpsReading | None
+    - subscribe(callback) -> unsubscribe callable
     """
 
     def __init__(self, config: dict[str, Any] | None = None):
@@ -117,6 +405,7 @@ class GPSDriver(HardwareDriver):
             uart_device=cfg.get("uart_device", "/dev/ttyAMA0"),
             baudrate=int(cfg.get("baudrate", 9600)),
             stale_reopen_s=max(1.0, float(cfg.get("stale_reopen_s", 5.0))),
+            streaming=bool(cfg.get("streaming", True)),
         )
         self._last_read: GpsReading | None = None
         self._last_read_ts: float | None = None
@@ -141,6 +430,10 @@ class GPSDriver(HardwareDriver):
         self._read_thread_lock = threading.Lock()
         # Last observed NMEA sentences (for diagnostics)
         self._last_nmea: dict[str, str] = {}
+        self._stream: _GpsStreamReader | None = None
+        self._subscribers: CallbackList[GpsReading] = CallbackList("GPS")
+        # Receiver's answer to the GST CFG-VALSET: "ack", "nak" or None (unseen).
+        self._receiver_ack: str | None = None
         # Cached baudrates to try for different modules
         self._baud_candidates = [self.cfg.baudrate]
         if self.cfg.mode in (GpsMode.F9P_USB, GpsMode.F9P_UART):
@@ -171,17 +464,41 @@ class GPSDriver(HardwareDriver):
     async def start(self) -> None:  # noqa: D401
         if not self.initialized:
             await self.initialize()
-        # In real mode, we could open serial here; keep it lazy to avoid CI issues
         self.running = True
+        if self.cfg.streaming and not is_simulation_mode():
+            try:
+                import serial  # type: ignore  # noqa: F401
+            except Exception:
+                return  # without pyserial only the gpsd fallback of the polled path works
+            self._start_stream()
 
     async def stop(self) -> None:  # noqa: D401
         self.running = False
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.stop()
         if self._serial is not None:
             try:
                 self._serial.close()
             except Exception:
                 pass
             self._serial = None
+        if stream is not None:
+            await asyncio.to_thread(stream.join, 2.0)
+
+    def _start_stream(self) -> None:
+        if self._stream is not None and self._stream.running:
+            return
+        self._stream = _GpsStreamReader(self)
+        self._stream.start()
+
+    def subscribe(self, callback: Callable[[GpsReading], None]) -> Callable[[], None]:
+        """Call *callback* with every streamed epoch; returns an unsubscribe function.
+
+        Callbacks run on the NMEA reader thread at the receiver's epoch rate, so
+        they must return quickly.
+        """
+        return self._subscribers.add(callback)
 
     # ------------------------------------------------------------------
     # Power-management suspend / resume
@@ -210,6 +527,7 @@ class GPSDriver(HardwareDriver):
         age_s = (time.time() - self._last_read_ts) if self._last_read_ts else None
         stale = age_s is None or age_s >= self.cfg.stale_reopen_s
         live_max_age_s = min(2.0, self.cfg.stale_reopen_s)
+        stream = self._stream
         return {
             "driver": "gps",
             "mode": self.cfg.mode.value,
@@ -232,6 +550,11 @@ class GPSDriver(HardwareDriver):
             "read_lock_contention_count": self._read_lock_contention_count,
             "open_attempt_count": self._open_attempt_count,
             "last_read_error": self._last_read_error,
+            "streaming": stream is not None and stream.running,
+            "stream_epochs": stream.epochs if stream is not None else 0,
+            "nmea_checksum_errors": stream.framer.checksum_errors if stream is not None else 0,
+            "ubx_frames": stream.framer.ubx_frames if stream is not None else 0,
+            "receiver_ack": self._receiver_ack,
             "simulation": is_simulation_mode(),
         }
 
@@ -284,7 +607,11 @@ class GPSDriver(HardwareDriver):
             self._last_read_ts = time.time()
             return reading
 
-        # Real hardware path — run in a thread so blocking serial I/O never stalls the event loop.
+        stream = self._stream
+        if stream is not None and stream.running:
+            return self._latest_streamed()
+
+        # Polled hardware path — a thread keeps blocking serial I/O off the event loop.
         try:
             return await asyncio.to_thread(self._read_hardware_blocking)
         except Exception:
@@ -299,6 +626,104 @@ class GPSDriver(HardwareDriver):
             return None
         return self._last_read.model_copy(update={"cached": True})
 
+    def _latest_streamed(self) -> GpsReading | None:
+        """Newest streamed epoch; marked cached once it is too old to count as live."""
+        reading = self._last_read
+        if reading is None or self._last_read_ts is None:
+            return None
+        if time.time() - self._last_read_ts < min(2.0, self.cfg.stale_reopen_s):
+            return reading
+        return reading.model_copy(update={"cached": True})
+
+    def _publish_reading(self, reading: GpsReading) -> None:
+        """Record a streamed reading and hand it to subscribers (reader thread)."""
+        if self._suspended:
+            return
+        reading = reading.model_copy(update={"sample_id": self._next_sample_id(), "cached": False})
+        self._last_read = reading
+        self._last_read_ts = time.time()
+        self._last_read_error = None
+        self._first_read_done = True
+        self._subscribers.notify(reading)
+
+    def _reading_from_epoch(self, epoch: _NmeaEpoch) -> GpsReading | None:
+        """Build one reading from an epoch's GGA/RMC/GST, or None without a fix."""
+        lat = lon = alt = hdop = acc = spd = hdg = None
+        sats: int | None = None
+        acc_source: str | None = None
+        rtk_status: str | None = None
+        if epoch.gga is not None:
+            g_lat, g_lon, alt, sats, hdop, fix_quality = epoch.gga
+            if fix_quality == 0:
+                return None
+            rtk_status = self._map_fix_quality(fix_quality)
+            lat, lon = g_lat, g_lon
+            if hdop is not None:
+                acc, acc_source = max(0.2, hdop), "hdop"
+        if epoch.rmc is not None and epoch.rmc_valid:
+            r_lat, r_lon, spd_knots, hdg = epoch.rmc
+            if lat is None or lon is None:
+                lat, lon = r_lat, r_lon
+            if spd_knots is not None:
+                spd = spd_knots * 0.514444  # knots -> m/s
+        if lat is None or lon is None:
+            return None
+        if epoch.gst is not None and (acc is None or epoch.gst < acc):
+            acc, acc_source = max(0.005, epoch.gst), "gst"
+        return GpsReading(
+            latitude=lat,
+            longitude=lon,
+            altitude=alt,
+            accuracy=self._settle_accuracy(acc, acc_source, hdop, rtk_status),
+            speed=spd,
+            heading=hdg,
+            satellites=sats,
+            mode=self.cfg.mode,
+            rtk_status=rtk_status,
+            hdop=hdop,
+            monotonic_received_s=epoch.received_s,
+        )
+
+    def _on_ubx_frame(self, msg_class: int, msg_id: int, payload: bytes) -> None:
+        """Record the receiver's ACK/NAK for the GST configuration message."""
+        if msg_class != _UBX_ACK_CLASS or payload[:2] != _UBX_CFG_VALSET_ID:
+            return
+        self._receiver_ack = "ack" if msg_id == 0x01 else "nak"
+        if self._receiver_ack == "nak":
+            logger.warning("GPS: receiver rejected the NMEA-GST configuration")
+
+    @staticmethod
+    def _settle_accuracy(
+        acc: float | None, acc_source: str | None, hdop: float | None, rtk_status: str | None
+    ) -> float | None:
+        """Apply fix-type heuristics to an HDOP/GST-derived accuracy.
+
+        If we have an RTK status but no explicit accuracy from GST/EHP, provide a
+        reasonable heuristic so the UI reflects the improved fix. Typical 1-sigma
+        horiz. accuracy: RTK_FIXED ~2-3cm, RTK_FLOAT ~10-30cm. An HDOP-derived (or
+        missing) value is tightened by RTK heuristics; GST values are never loosened.
+        """
+        if not rtk_status:
+            return acc
+        if rtk_status == "RTK_FIXED":
+            heuristic = 0.03  # 3 cm
+        elif rtk_status == "RTK_FLOAT":
+            heuristic = 0.20  # 20 cm
+        else:
+            heuristic = None
+        if heuristic is not None:
+            if acc is None:
+                return heuristic
+            if acc_source != "gst":
+                return min(acc, heuristic)
+        elif rtk_status in {"GPS_FIX", "DGPS"} and acc_source != "gst":
+            # Non-RTK fixes can report deceptively low HDOP despite metre-scale drift.
+            # Keep non-RTK accuracy conservative unless GST provides explicit uncertainty.
+            base = hdop if hdop is not None else (acc if acc is not None else 1.0)
+            conservative = max(1.5, min(5.0, base * 2.0))
+            return conservative if acc is None else max(acc, conservative)
+        return acc
+
     def _configure_receiver(self) -> None:
         """Enable NMEA-GST on the open receiver (best-effort, non-fatal).
 
@@ -350,6 +775,119 @@ class GPSDriver(HardwareDriver):
         )
         return True
 
+    def _open_serial_blocking(self) -> bool:
+        """Probe candidate ports and keep the first that streams NMEA (blocking).
+
+        Callers own the port: the polled path holds the read lock, the stream
+        reader is the only user while it runs.
+        """
+        import serial  # type: ignore
+
+        configured_candidates: list[str] = []
+        # Env overrides
+        env_dev = os.environ.get("GPS_DEVICE")
+        if env_dev:
+            configured_candidates.append(env_dev)
+        # Configured default
+        default_dev = (
+            self.cfg.usb_device
+            if self.cfg.mode == GpsMode.F9P_USB
+            else self.cfg.uart_device
+        )
+        if default_dev not in configured_candidates:
+            configured_candidates.append(default_dev)
+
+        # Exclude RoboHAT and other system ports before deciding whether
+        # a configured path is authoritative. The historical F9P default
+        # (/dev/ttyACM0) may be the excluded RoboHAT on this mower.
+        excluded = {"/dev/robohat", "/dev/ttyACM0"}  # hardcoded fallback
+        try:
+            from ..services.robohat_service import _known_excluded_devices
+            excluded |= _known_excluded_devices()
+        except (ImportError, ModuleNotFoundError, RuntimeError):
+            pass
+
+        eligible_configured = [
+            dev
+            for dev in configured_candidates
+            if dev not in excluded and os.path.realpath(dev) not in excluded
+        ]
+        explicit_candidates = [
+            dev for dev in eligible_configured if os.path.exists(dev)
+        ]
+        if explicit_candidates:
+            # A configured device is authoritative. Do not hold the owner
+            # lock while probing unrelated UART/USB devices after a brief
+            # NMEA gap.
+            candidates = explicit_candidates
+        else:
+            candidates = list(eligible_configured)
+            # Common fallbacks on Raspberry Pi when no configured path exists.
+            candidates.extend(
+                [
+                    "/dev/ttyACM0",
+                    "/dev/ttyACM1",
+                    "/dev/ttyUSB0",
+                    "/dev/ttyUSB1",
+                    "/dev/ttyAMA0",
+                    "/dev/ttyS0",
+                    "/dev/serial0",
+                ]
+            )
+            for pat in ("/dev/ttyACM*", "/dev/ttyUSB*"):
+                for p in glob.glob(pat):
+                    if p not in candidates:
+                        candidates.append(p)
+
+        candidates = [
+            c for c in candidates
+            if c not in excluded and os.path.realpath(c) not in excluded
+        ]
+
+        for dev in candidates:
+            for baud in self._baud_candidates:
+                try:
+                    self._open_attempt_count += 1
+                    ser = serial.Serial(dev, baud, timeout=0.25)  # type: ignore
+                    # Try a few reads to confirm NMEA stream presence
+                    has_nmea = False
+                    for _ in range(3):
+                        line = ser.readline()
+                        if not line:
+                            continue
+                        try:
+                            s = line.decode("ascii", errors="ignore")
+                        except Exception:
+                            s = ""
+                        if s.startswith("$"):
+                            has_nmea = True
+                            break
+                    retain_configured_usb = (
+                        self.cfg.mode == GpsMode.F9P_USB
+                        and dev in explicit_candidates
+                    )
+                    if has_nmea or retain_configured_usb:
+                        self._serial = ser
+                        self.cfg.baudrate = baud
+                        self._last_read_error = (
+                            None if has_nmea else "waiting_for_nmea"
+                        )
+                        break
+                    else:
+                        try:
+                            ser.close()
+                        except Exception:
+                            pass
+                except Exception:  # pragma: no cover - hardware dependent
+                    try:
+                        ser.close()  # type: ignore
+                    except Exception:
+                        pass
+                    continue
+            if self._serial is not None:
+                break
+        return self._serial is not None
+
     def _read_hardware_blocking(self) -> GpsReading | None:
         """Blocking hardware read — must only be called via asyncio.to_thread."""
         if not self._read_thread_lock.acquire(blocking=False):
@@ -368,116 +906,8 @@ class GPSDriver(HardwareDriver):
                 # Preserve the old sample identity and timestamp. The next poll by
                 # this same owner will reopen the configured device.
                 return self._cached_last_read()
-            if self._serial is None:
-                # Lazy open serial port based on mode with simple autodetect
-                import serial  # type: ignore
-
-                configured_candidates: list[str] = []
-                # Env overrides
-                env_dev = os.environ.get("GPS_DEVICE")
-                if env_dev:
-                    configured_candidates.append(env_dev)
-                # Configured default
-                default_dev = (
-                    self.cfg.usb_device
-                    if self.cfg.mode == GpsMode.F9P_USB
-                    else self.cfg.uart_device
-                )
-                if default_dev not in configured_candidates:
-                    configured_candidates.append(default_dev)
-
-                # Exclude RoboHAT and other system ports before deciding whether
-                # a configured path is authoritative. The historical F9P default
-                # (/dev/ttyACM0) may be the excluded RoboHAT on this mower.
-                excluded = {"/dev/robohat", "/dev/ttyACM0"}  # hardcoded fallback
-                try:
-                    from ..services.robohat_service import _known_excluded_devices
-                    excluded |= _known_excluded_devices()
-                except (ImportError, ModuleNotFoundError, RuntimeError):
-                    pass
-
-                eligible_configured = [
-                    dev
-                    for dev in configured_candidates
-                    if dev not in excluded and os.path.realpath(dev) not in excluded
-                ]
-                explicit_candidates = [
-                    dev for dev in eligible_configured if os.path.exists(dev)
-                ]
-                if explicit_candidates:
-                    # A configured device is authoritative. Do not hold the owner
-                    # lock while probing unrelated UART/USB devices after a brief
-                    # NMEA gap.
-                    candidates = explicit_candidates
-                else:
-                    candidates = list(eligible_configured)
-                    # Common fallbacks on Raspberry Pi when no configured path exists.
-                    candidates.extend(
-                        [
-                            "/dev/ttyACM0",
-                            "/dev/ttyACM1",
-                            "/dev/ttyUSB0",
-                            "/dev/ttyUSB1",
-                            "/dev/ttyAMA0",
-                            "/dev/ttyS0",
-                            "/dev/serial0",
-                        ]
-                    )
-                    for pat in ("/dev/ttyACM*", "/dev/ttyUSB*"):
-                        for p in glob.glob(pat):
-                            if p not in candidates:
-                                candidates.append(p)
-
-                candidates = [
-                    c for c in candidates
-                    if c not in excluded and os.path.realpath(c) not in excluded
-                ]
-
-                for dev in candidates:
-                    for baud in self._baud_candidates:
-                        try:
-                            self._open_attempt_count += 1
-                            ser = serial.Serial(dev, baud, timeout=0.25)  # type: ignore
-                            # Try a few reads to confirm NMEA stream presence
-                            has_nmea = False
-                            for _ in range(3):
-                                line = ser.readline()
-                                if not line:
-                                    continue
-                                try:
-                                    s = line.decode("ascii", errors="ignore")
-                                except Exception:
-                                    s = ""
-                                if s.startswith("$"):
-                                    has_nmea = True
-                                    break
-                            retain_configured_usb = (
-                                self.cfg.mode == GpsMode.F9P_USB
-                                and dev in explicit_candidates
-                            )
-                            if has_nmea or retain_configured_usb:
-                                self._serial = ser
-                                self.cfg.baudrate = baud
-                                self._last_read_error = (
-                                    None if has_nmea else "waiting_for_nmea"
-                                )
-                                break
-                            else:
-                                try:
-                                    ser.close()
-                                except Exception:
-                                    pass
-                        except Exception:  # pragma: no cover - hardware dependent
-                            try:
-                                ser.close()  # type: ignore
-                            except Exception:
-                                pass
-                            continue
-                    if self._serial is not None:
-                        break
-                # If not opened, keep last reading
-                if self._serial is None:
-                    return self._cached_last_read()
+            if self._serial is None and not self._open_serial_blocking():
+                return self._cached_last_read()
 
             # Enable NMEA-GST once per open so the receiver reports measured
             # position variance instead of a fix-type heuristic. Best-effort:
@@ -586,34 +1016,7 @@ class GPSDriver(HardwareDriver):
                     break
 
             if got_lat and got_lon:
-                # If we have an RTK status but no explicit accuracy from GST/EHP,
-                # provide a reasonable heuristic so the UI reflects the improved fix.
-                # Typical 1-sigma horiz. accuracy: RTK_FIXED ~2-3cm, RTK_FLOAT ~10-30cm.
-                # If our current accuracy is only HDOP-derived (or missing), tighten it using
-                # RTK heuristics. Never loosen values coming from GST.
-                if rtk_status:
-                    if rtk_status == "RTK_FIXED":
-                        heuristic = 0.03  # 3 cm
-                    elif rtk_status == "RTK_FLOAT":
-                        heuristic = 0.20  # 20 cm
-                    else:
-                        heuristic = None
-                    if heuristic is not None:
-                        if acc is None:
-                            acc = heuristic
-                            acc_source = "heuristic"
-                        elif acc_source != "gst":
-                            acc = min(acc, heuristic)
-                    elif rtk_status in {"GPS_FIX", "DGPS"} and acc_source != "gst":
-                        # Non-RTK fixes can report deceptively low HDOP despite metre-scale drift.
-                        # Keep non-RTK accuracy conservative unless GST provides explicit uncertainty.
-                        base = hdop_val if hdop_val is not None else (acc if acc is not None else 1.0)
-                        conservative = max(1.5, min(5.0, base * 2.0))
-                        if acc is None:
-                            acc = conservative
-                            acc_source = "non_rtk_floor"
-                        else:
-                            acc = max(acc, conservative)
+                acc = self._settle_accuracy(acc, acc_source, hdop_val, rtk_status)
                 reading = GpsReading(
                     latitude=lat,
                     longitude=lon,
@@ -831,4 +1234,4 @@ class GPSDriver(HardwareDriver):
             return None
 
 
-__all__ = ["GPSDriver", "GPSDriverConfig"]
+__all__ = ["GPSDriver", "GPSDriverConfig", "NmeaUbxFramer"]
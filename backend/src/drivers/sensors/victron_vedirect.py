@@ -1,10 +1,18 @@
 """Victron SmartSolar BLE driver via the `victron-ble` CLI.
 
-This driver shells out to the system `victron-ble` command to read the
+This driver runs the system `victron-ble` command to read the
 SmartSolar controller over BLE and converts the returned JSON-like frame
 into the same telemetry shape the INA3221 driver provides. Using the
 external CLI keeps the Python runtime free of complex BLE deps and
 matches the user's environment where only BLE connectivity is available.
+
+Once started, one long-lived ``victron-ble read`` child is kept running
+under supervision (``VictronBleReader``); it prints a JSON line per
+advertisement, which a reader thread parses into a latest-value cache. A
+power read is then a cache lookup; the CLI interpreter starts once, not
+once per sample. Without the persistent reader (``persistent: false``, or
+before ``start()``) the driver falls back to a one-shot CLI read per
+background refresh.
 """
 
 from __future__ import annotations
@@ -16,8 +24,10 @@ import logging
 import os
 import select
 import subprocess
+import threading
 import time
-from typing import Any
+from collections.abc import Callable
+from typing import IO, Any
 
 from ...core.simulation import is_simulation_mode
 from ..base import HardwareDriver
@@ -30,10 +40,175 @@ logger = logging.getLogger(__name__)
 _VICTRON_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
 
+# Restart back-off for the persistent CLI child, doubled after each run that
+# produced no frame (missing adapter, wrong key) and reset after a good run.
+_RESTART_BACKOFF_S = 1.0
+_RESTART_BACKOFF_MAX_S = 60.0
+
+
+def _spawn_cli(cmd: list[str]) -> subprocess.Popen[bytes]:
+    # stderr is folded into stdout: a long-lived child must never block on a
+    # full, unread stderr pipe, and its diagnostics are logged as non-JSON lines.
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+
+class VictronBleReader:
+    """Supervised long-lived ``victron-ble read`` child feeding a latest-value cache.
+
+    A daemon thread spawns the CLI, parses each JSON line of its stdout with
+    *convert*, and publishes ``(payload, wall_ts, monotonic_ts)`` as a single
+    attribute store, so readers need no lock. When the child exits it is
+    restarted with back-off until ``stop()``.
+    """
+
+    def __init__(
+        self,
+        cmd: list[str],
+        convert: Callable[[dict[str, Any]], dict[str, Any] | None],
+        *,
+        spawn: Callable[[list[str]], Any] | None = None,
+        backoff_s: float = _RESTART_BACKOFF_S,
+        max_backoff_s: float = _RESTART_BACKOFF_MAX_S,
+    ) -> None:
+        self._cmd = cmd
+        self._convert = convert
+        self._spawn = spawn if spawn is not None else _spawn_cli
+        self._backoff_s = backoff_s
+        self._max_backoff_s = max(backoff_s, max_backoff_s)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._proc: Any = None
+        self._last_activity = time.monotonic()
+        self.latest: tuple[dict[str, Any], float, float] | None = None
+        self.frames = 0
+        self.restarts = 0
+        self.last_error: str | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def age_s(self) -> float | None:
+        latest = self.latest
+        return None if latest is None else time.monotonic() - latest[2]
+
+    def idle_s(self) -> float:
+        """Seconds since the last frame or (re)spawn."""
+        return time.monotonic() - self._last_activity
+
+    def kick(self) -> None:
+        """Terminate a child that went silent; the supervisor respawns it."""
+        self._last_activity = time.monotonic()
+        self._terminate(self._proc)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="victron-ble", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Terminate the child and wait (bounded) for the reader thread to exit."""
+        self._stop.set()
+        self._terminate(self._proc)
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+
+    def consume(self, stream: IO[bytes]) -> int:
+        """Parse JSON lines from *stream* until EOF or stop; returns frames accepted."""
+        accepted = 0
+        for raw in iter(stream.readline, b""):
+            if self._stop.is_set():
+                break
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                frame = json.loads(line.decode("utf-8", errors="replace"))
+            except ValueError:
+                logger.debug("victron-ble: %s", line[:200].decode("utf-8", errors="replace"))
+                continue
+            payload = self._convert(frame) if isinstance(frame, dict) else None
+            if payload is None:
+                continue
+            now = time.monotonic()
+            self.latest = (payload, time.time(), now)
+            self._last_activity = now
+            self.frames += 1
+            accepted += 1
+        return accepted
+
+    def _run(self) -> None:
+        backoff = self._backoff_s
+        while not self._stop.is_set():
+            accepted = 0
+            try:
+                proc = self._spawn(self._cmd)
+            except FileNotFoundError:
+                self.last_error = f"victron-ble CLI not found at '{self._cmd[0]}'"
+                logger.error("%s", self.last_error)
+            except Exception as exc:  # pragma: no cover - defensive
+                self.last_error = f"failed to spawn victron-ble CLI: {exc}"
+                logger.error("%s", self.last_error)
+            else:
+                self._proc = proc
+                self._last_activity = time.monotonic()
+                try:
+                    if proc.stdout is not None:
+                        accepted = self.consume(proc.stdout)
+                except Exception as exc:
+                    self.last_error = str(exc)
+                    logger.debug("victron-ble reader error: %s", exc)
+                finally:
+                    self._terminate(proc)
+                    self._proc = None
+            if self._stop.is_set():
+                break
+            self.restarts += 1
+            backoff = self._backoff_s if accepted else min(backoff * 2, self._max_backoff_s)
+            self._stop.wait(backoff)
+
+    @staticmethod
+    def _terminate(proc: Any) -> None:
+        if proc is None:
+            return
+        if proc.poll() is None:
+            try:
+                proc.terminate()
+                proc.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                try:
+                    proc.kill()
+                    proc.wait(timeout=1.0)
+                except Exception:
+                    pass
+            except Exception:
+                pass
+        stdout = getattr(proc, "stdout", None)
+        if stdout is not None:
+            try:
+                stdout.close()
+            except Exception:
+                pass
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "frames": self.frames,
+            "restarts": self.restarts,
+            "last_frame_age_s": self.age_s(),
+            "last_error": self.last_error,
+        }
+
+
 class VictronVeDirectDriver(HardwareDriver):
-    """Victron SmartSolar reader that shells out to ``victron-ble read``.
+    """Victron SmartSolar reader backed by the ``victron-ble read`` CLI.
 
-    Only a single JSON frame is captured per poll before terminating the CLI
+    ``start()`` launches the persistent ``VictronBleReader``. The one-shot
+    fallback captures a single JSON frame per poll before terminating the CLI
     process so that concurrent BLE readers are not starved. Historic notes
     about VE.Direct serial access are retained in git history for reference.
     """
@@ -43,6 +218,9 @@ class VictronVeDirectDriver(HardwareDriver):
     # Victron SmartSolar BLE advertises roughly every 10–30 s. Refresh the
     # cache in the background on this interval so callers never block on BLE I/O.
     _DEFAULT_BG_REFRESH_INTERVAL_S = 30.0
+    # A persistent child that prints nothing for this long is assumed wedged
+    # (e.g. a stuck BLE adapter scan) and is restarted.
+    _DEFAULT_STALE_RESTART_S = 300.0
 
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         super().__init__(config=config)
@@ -65,13 +243,19 @@ class VictronVeDirectDriver(HardwareDriver):
         self._last_timestamp: float | None = None
         self._read_lock: asyncio.Lock | None = None
         self._refresh_task: asyncio.Task[None] | None = None
+        self._persistent = bool(cfg.get("persistent", True))
+        self._stale_restart_s = float(
+            cfg.get("stale_restart_s", self._DEFAULT_STALE_RESTART_S)
+        )
+        self._reader: VictronBleReader | None = None
 
     def set_refresh_interval(self, interval_s: float) -> None:
         """Dynamically adjust the BLE background-refresh cadence.
 
         Called by PowerManager to slow polling at night and speed it up during
         the day.  The new interval takes effect on the *next* cache-staleness
-        check in ``read_power()``.
+        check in ``read_power()``.  It paces the one-shot fallback only; the
+        persistent reader publishes every advertisement the CLI prints.
         """
         self._bg_refresh_interval_s = max(5.0, float(interval_s))
 
@@ -82,9 +266,32 @@ class VictronVeDirectDriver(HardwareDriver):
 
     async def start(self) -> None:
         self.running = True
+        if self._enabled and self._persistent and not is_simulation_mode():
+            self._start_reader()
+
+    def _start_reader(self) -> None:
+        if self._reader is not None and self._reader.running:
+            return
+        try:
+            cmd = self._build_cli_cmd()
+        except RuntimeError as exc:
+            logger.error("Victron BLE configuration error: %s", exc)
+            return
+        self._reader = VictronBleReader(cmd, self._convert_cached)
+        self._reader.start()
+
+    def _convert_cached(self, frame: dict[str, Any]) -> dict[str, Any] | None:
+        return self._convert_frame(
+            frame,
+            yield_today_unit=self._yield_today_unit,
+            solar_panel_max_wh=self._solar_panel_max_wh,
+        )
 
     async def stop(self) -> None:
         self.running = False
+        reader, self._reader = self._reader, None
+        if reader is not None:
+            await asyncio.to_thread(reader.stop)
         if self._refresh_task is not None and not self._refresh_task.done():
             self._refresh_task.cancel()
             try:
@@ -101,6 +308,7 @@ class VictronVeDirectDriver(HardwareDriver):
             "running": self.running,
             "last_timestamp": self._last_timestamp,
             "last_payload": self._last_payload,
+            "reader": self._reader.stats() if self._reader is not None else None,
         }
 
     async def read_power(self) -> dict[str, Any] | None:
@@ -122,6 +330,19 @@ class VictronVeDirectDriver(HardwareDriver):
             self._last_timestamp = now
             return payload
 
+        reader = self._reader
+        if reader is not None and reader.running:
+            if reader.idle_s() > self._stale_restart_s:
+                logger.warning(
+                    "Victron BLE reader silent for %.0fs; restarting victron-ble",
+                    reader.idle_s(),
+                )
+                reader.kick()
+            latest = reader.latest
+            if latest is not None:
+                self._last_payload, self._last_timestamp = latest[0], latest[1]
+            return self._last_payload
+
         # Lazy-create lock if initialize() was not awaited (defensive for tests).
         if self._read_lock is None:
             self._read_lock = asyncio.Lock()
@@ -152,11 +373,7 @@ class VictronVeDirectDriver(HardwareDriver):
             async with self._read_lock:
                 frame = await loop.run_in_executor(_VICTRON_EXECUTOR, self._read_victron_cli_frame)
             if frame:
-                parsed = self._convert_frame(
-                    frame,
-                    yield_today_unit=self._yield_today_unit,
-                    solar_panel_max_wh=self._solar_panel_max_wh,
-                )
+                parsed = self._convert_cached(frame)
                 if parsed:
                     self._last_payload = parsed
                     self._last_timestamp = time.time()
@@ -464,4 +681,4 @@ class VictronVeDirectDriver(HardwareDriver):
         return result
 
 
-__all__ = ["VictronVeDirectDriver"]
+__all__ = ["VictronBleReader", "VictronVeDirectDriver"]
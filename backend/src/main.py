@@ -49,13 +49,7 @@ from .core.build_info import APP_VERSION, get_build_info
 from .core.config_loader import get_config_loader
 from .core.env_validation import validate_environment
 from .core.state_manager import AppState
-from .middleware.api_key_auth import register_api_key_auth_middleware
-from .middleware.correlation import register_correlation_middleware
-from .middleware.deprecation import register_deprecation_middleware
-from .middleware.input_validation import register_input_validation_middleware
-from .middleware.rate_limiting import register_global_rate_limiter
-from .middleware.sanitization import register_sanitization_middleware
-from .middleware.security import register_security_middleware
+from .middleware.pipeline import register_request_pipeline
 from .safety.safety_monitor import get_safety_monitor
 from .safety.safety_triggers import set_safety_event_handler
 from .safety.safety_validator import validate_on_start
@@ -63,6 +57,7 @@ from .services.ai_service import get_ai_service
 from .services.camera_runtime import camera_service, sync_external_ai_owner_state
 from .services.jobs_service import jobs_service as _jobs_service_singleton
 from .services.mission_service import get_mission_service
+from .services.mjpeg_hub import mjpeg_hub
 from .services.navigation_service import NavigationService
 from .services.power_history_service import init_power_history_service
 from .services.power_manager import init_power_manager
@@ -199,6 +194,7 @@ async def lifespan(app: FastAPI):
             await websocket_hub.broadcast_to_topic(
                 "perception.results",
                 snapshot.model_dump(mode="json"),
+                coalesce=True,
             )
             return route_cost_count
 
@@ -665,6 +661,10 @@ async def lifespan(app: FastAPI):
             await sensor_manager.shutdown()
     except Exception:
         _log.exception("SensorManager shutdown failed")
+    try:
+        await mjpeg_hub.shutdown()
+    except Exception:
+        _log.exception("MJPEG hub shutdown failed")
     try:
         await camera_service.shutdown()
     except Exception:
@@ -673,6 +673,10 @@ async def lifespan(app: FastAPI):
         await shutdown_robohat_service()
     except Exception:
         pass
+    try:
+        await persistence.flush_async(durable=True)
+    except Exception:
+        _log.exception("Persistence write-behind flush failed")
 
 
 app = FastAPI(
@@ -691,14 +695,9 @@ try:
 except Exception:
     _log.exception("Environment validation crashed")
 
-# Middleware order: global limit -> input validation -> security -> API key -> correlation -> sanitization -> deprecation
-register_global_rate_limiter(app)
-register_input_validation_middleware(app)
-register_security_middleware(app)
-register_api_key_auth_middleware(app)
-register_correlation_middleware(app)
-register_sanitization_middleware(app)
-register_deprecation_middleware(app)
+# One pure-ASGI pipeline, outermost first: deprecation -> sanitization ->
+# correlation -> API key -> CORS -> security -> input validation -> global limit
+register_request_pipeline(app)
 
 app.include_router(rest_router, prefix="/api/v2")
 app.include_router(autonomy_router)
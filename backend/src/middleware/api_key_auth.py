@@ -16,42 +16,50 @@ from __future__ import annotations
 import os
 from collections.abc import Iterable
 
-from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse, Response
+from fastapi import FastAPI
+from starlette.datastructures import Headers
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..core.secrets_manager import SecretsManager
+from .pipeline import PathMatcher
 
 
-class APIKeyAuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: FastAPI, *, prefixes: Iterable[str], secret: str | None = None) -> None:
-        super().__init__(app)
+class APIKeyAuthMiddleware:
+    def __init__(self, app: ASGIApp, *, prefixes: Iterable[str], secret: str | None = None) -> None:
+        self.app = app
         self._prefixes = tuple(p.strip() for p in prefixes if p.strip())
+        self._protected = PathMatcher(self._prefixes)
         self._secret = secret
         self._secrets = SecretsManager()
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        path = request.url.path
-        if not any(path.startswith(p) for p in self._prefixes):
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._protected.matches(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
-        provided = self._extract_key(request)
+        provided = self._extract_key(Headers(scope=scope))
         expected = self._secret or self._secrets.get(
             "API_KEY_SECRET", default=None, purpose="api_key_auth"
         )
         if not expected:
-            return JSONResponse(status_code=503, content={"detail": "API key not configured"})
+            response = JSONResponse(status_code=503, content={"detail": "API key not configured"})
+            await response(scope, receive, send)
+            return
 
         if not provided or not self._constant_time_equals(provided, expected):
-            return JSONResponse(status_code=401, content={"detail": "Invalid API key"})
+            response = JSONResponse(status_code=401, content={"detail": "Invalid API key"})
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
-    def _extract_key(self, request: Request) -> str | None:
-        key = request.headers.get("X-API-Key")
+    def _extract_key(self, headers: Headers) -> str | None:
+        key = headers.get("X-API-Key")
         if key:
             return key.strip()
-        auth = request.headers.get("Authorization", "")
+        auth = headers.get("Authorization", "")
         if auth.lower().startswith("apikey "):
             return auth.split(" ", 1)[1].strip()
         return None
@@ -66,11 +74,18 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         return result == 0
 
 
-def register_api_key_auth_middleware(app: FastAPI) -> None:
+def api_key_auth_middleware() -> Middleware | None:
+    """Configured API key middleware, or None while enforcement is disabled."""
     if os.getenv("API_KEY_REQUIRED", "0") != "1":
-        return
+        return None
     prefixes = os.getenv("API_KEY_PATH_PREFIXES", "/api/v2/internal").split(",")
     secret = os.getenv("API_KEY_SECRET")
-    app.add_middleware(
+    return Middleware(
         APIKeyAuthMiddleware, prefixes=[p.strip() for p in prefixes if p.strip()], secret=secret
     )
+
+
+def register_api_key_auth_middleware(app: FastAPI) -> None:
+    spec = api_key_auth_middleware()
+    if spec is not None:
+        app.add_middleware(spec.cls, *spec.args, **spec.kwargs)
@@ -9,69 +9,97 @@ from __future__ import annotations
 
 import time
 import uuid
-from collections.abc import Callable
 
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware import Middleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..core.context import reset_correlation_id, set_correlation_id
 from ..core.observability import observability
 
+_CORRELATION_HEADERS = ("X-Correlation-ID", "X-Request-ID", "X-Amzn-Trace-Id")
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
+
+class CorrelationIdMiddleware:
     """Attach and propagate correlation IDs for every HTTP request."""
 
-    def __init__(self, app: FastAPI) -> None:
-        super().__init__(app)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
         self._logger = observability.get_logger("middleware.correlation")
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Response]
-    ) -> Response:
-        correlation_id = self._get_or_generate_correlation_id(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = self._get_or_generate_correlation_id(Headers(scope=scope))
         set_correlation_id(correlation_id)
-        request.state.correlation_id = correlation_id
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+        method = scope["method"]
+        path = scope["path"]
 
         start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Logged when the handler answers, as before: a long-lived
+                # streaming body does not hold the request metric back.
+                duration_ms = (time.perf_counter() - start) * 1000
+                observability.log_api_request(
+                    method,
+                    path,
+                    message["status"],
+                    duration_ms,
+                    route=_route_template(scope),
+                )
+                MutableHeaders(scope=message).setdefault("X-Correlation-ID", correlation_id)
+            await send(message)
+
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:  # pragma: no cover - re-raise after logging
             duration_ms = (time.perf_counter() - start) * 1000
             observability.record_error(
                 origin="http_request",
-                message=f"Unhandled exception processing {request.method} {request.url.path}",
+                message=f"Unhandled exception processing {method} {path}",
                 exception=exc,
                 metadata={
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
                     "duration_ms": duration_ms,
                 },
             )
             self._logger.exception(
                 "Unhandled request error",
-                extra={"method": request.method, "path": request.url.path},
+                extra={"method": method, "path": path},
             )
-            reset_correlation_id()
             raise
+        finally:
+            reset_correlation_id()
 
-        duration_ms = (time.perf_counter() - start) * 1000
-        observability.log_api_request(
-            request.method, request.url.path, response.status_code, duration_ms
-        )
-
-        response.headers.setdefault("X-Correlation-ID", correlation_id)
-        reset_correlation_id()
-        return response
-
-    def _get_or_generate_correlation_id(self, request: Request) -> str:
-        header_names = ("X-Correlation-ID", "X-Request-ID", "X-Amzn-Trace-Id")
-        for header in header_names:
-            value = request.headers.get(header)
+    def _get_or_generate_correlation_id(self, headers: Headers) -> str:
+        for header in _CORRELATION_HEADERS:
+            value = headers.get(header)
             if value:
                 return value
         return uuid.uuid4().hex
 
 
+def _route_template(scope: dict) -> str | None:
+    """Matched route template (``/api/v2/missions/{mission_id}``), if any.
+
+    The router records the match on the shared scope. Included routers keep
+    the prefixed template on FastAPI's effective route context.
+    """
+    context = (scope.get("fastapi") or {}).get("effective_route_context")
+    return getattr(context or scope.get("route"), "path", None)
+
+
+def correlation_middleware() -> Middleware:
+    return Middleware(CorrelationIdMiddleware)
+
+
 def register_correlation_middleware(app: FastAPI) -> None:
     """Attach the correlation ID middleware to the FastAPI application."""
     app.add_middleware(CorrelationIdMiddleware)
@@ -11,11 +11,12 @@ from __future__ import annotations
 
 import datetime
 import email.utils
-from collections.abc import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.middleware import Middleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .pipeline import PathMatcher
 
 # Routes that should carry deprecation headers.
 # Keys are path prefixes (startswith match). Values are (sunset_date, link_to_canonical).
@@ -62,29 +63,48 @@ def _deprecation_value(sunset_date: str) -> str:
     return _http_date(sunset_date)
 
 
-class DeprecationMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        path = request.url.path
-
-        sunset: str | None = None
-        link: str | None = None
-
-        if path in _EXACT_DEPRECATED:
-            sunset, link = _EXACT_DEPRECATED[path]
-        else:
-            for prefix, (sunset_value, successor_link) in _PREFIX_DEPRECATED.items():
-                if path.startswith(prefix):
-                    sunset, link = sunset_value, successor_link
-                    break
-
-        if sunset is not None:
-            response.headers["Deprecation"] = _deprecation_value(sunset)
-            response.headers["Sunset"] = _http_date(sunset)
-            if link:
-                response.headers["Link"] = f'<{link}>; rel="successor-version"'
-
-        return response
+def _deprecation_headers(sunset_date: str, link: str) -> tuple[tuple[str, str], ...]:
+    headers = [
+        ("Deprecation", _deprecation_value(sunset_date)),
+        ("Sunset", _http_date(sunset_date)),
+    ]
+    if link:
+        headers.append(("Link", f'<{link}>; rel="successor-version"'))
+    return tuple(headers)
+
+
+class DeprecationMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # Header values are rendered once; a request only pays for the lookup.
+        self._matcher = PathMatcher(
+            prefixes={
+                prefix: _deprecation_headers(*entry)
+                for prefix, entry in _PREFIX_DEPRECATED.items()
+            },
+            exact={
+                path: _deprecation_headers(*entry) for path, entry in _EXACT_DEPRECATED.items()
+            },
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers = self._matcher.lookup(scope["path"]) if scope["type"] == "http" else None
+        if headers is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in headers:
+                    response_headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def deprecation_middleware() -> Middleware:
+    return Middleware(DeprecationMiddleware)
 
 
 def register_deprecation_middleware(app) -> None:
@@ -14,63 +14,111 @@ import json
 import os
 from collections.abc import Iterable
 
-from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse, Response
+from fastapi import FastAPI
+from starlette.datastructures import Headers
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from .pipeline import PathMatcher
 
-class InputValidationMiddleware(BaseHTTPMiddleware):
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+
+class InputValidationMiddleware:
     def __init__(
         self,
-        app: FastAPI,
+        app: ASGIApp,
         *,
         max_body_bytes: int = 1_000_000,
         skip_prefixes: Iterable[str] | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._max_body = max(1024, int(max_body_bytes))
         self._skip = tuple(skip_prefixes or ("/health", "/metrics", "/docs", "/openapi.json"))
+        self._skip_matcher = PathMatcher(self._skip)
+        self._raw_body = PathMatcher(("/api/v2/ai/inference",))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in _BODY_METHODS
+            or self._skip_matcher.matches(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        allow_raw_body = self._raw_body.matches(scope["path"])
+        content_type = (Headers(scope=scope).get("Content-Type") or "").lower()
+        is_json = "application/json" in content_type
+
+        chunks: list[bytes] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return  # client went away before sending its body
+            chunk = message.get("body", b"")
+            if chunk:
+                chunks.append(chunk)
+                size += len(chunk)
+            more_body = message.get("more_body", False)
+            if size > self._max_body:
+                # Stop reading an oversized body; the type check still comes first.
+                reject = self._reject(415 if not allow_raw_body and not is_json else 413)
+                await reject(scope, receive, send)
+                return
+        body = b"".join(chunks)
+
+        if not allow_raw_body and body and not is_json:
+            await self._reject(415)(scope, receive, send)
+            return
+
+        if not allow_raw_body:
+            # Parse once to reject malformed JSON early; handlers get the original bytes.
+            try:
+                json.loads(body.decode("utf-8") if body else "null")
+            except Exception:
+                await self._reject(400)(scope, receive, send)
+                return
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        path = request.url.path
-        if any(path.startswith(p) for p in self._skip):
-            return await call_next(request)
-
-        allow_raw_body = path.startswith("/api/v2/ai/inference")
-
-        if request.method in {"POST", "PUT", "PATCH"}:
-            body = await request.body()
-            content_type = (request.headers.get("Content-Type") or "").lower()
-            if not allow_raw_body and body and "application/json" not in content_type:
-                return JSONResponse(
-                    status_code=415, content={"detail": "Content-Type must be application/json"}
-                )
-            if len(body) > self._max_body:
-                return JSONResponse(status_code=413, content={"detail": "Payload too large"})
+        await self.app(scope, _replay(body, receive), send)
 
-            if allow_raw_body:
-                return await call_next(request)
+    @staticmethod
+    def _reject(status_code: int) -> JSONResponse:
+        detail = {
+            400: "Invalid JSON payload",
+            413: "Payload too large",
+            415: "Content-Type must be application/json",
+        }[status_code]
+        return JSONResponse(status_code=status_code, content={"detail": detail})
 
-            # Parse JSON once and replace the stream for downstream handlers
-            try:
-                payload = json.loads(body.decode("utf-8") if body else "null")
-            except Exception:
-                return JSONResponse(status_code=400, content={"detail": "Invalid JSON payload"})
 
-            # Create a new receive that returns the parsed body
-            async def receive() -> dict:
-                return {"type": "http.request", "body": json.dumps(payload).encode("utf-8")}
+def _replay(body: bytes, receive: Receive) -> Receive:
+    """Hand the already-read body downstream once, then defer to the server."""
+    sent = False
 
-            request._receive = receive  # type: ignore[attr-defined]
+    async def replay() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
 
-        return await call_next(request)
+    return replay
 
 
-def register_input_validation_middleware(app: FastAPI) -> None:
+def input_validation_middleware() -> Middleware:
     max_body = int(os.getenv("INPUT_MAX_BODY_BYTES", "1000000"))
     skip = os.getenv("INPUT_VALIDATION_SKIP", "/health,/metrics,/docs,/openapi.json")
-    app.add_middleware(
+    return Middleware(
         InputValidationMiddleware,
         max_body_bytes=max_body,
         skip_prefixes=[s.strip() for s in skip.split(",") if s.strip()],
     )
+
+
+def register_input_validation_middleware(app: FastAPI) -> None:
+    spec = input_validation_middleware()
+    app.add_middleware(spec.cls, *spec.args, **spec.kwargs)
@@ -0,0 +1,203 @@
+"""Single pure-ASGI request pipeline.
+
+Every HTTP middleware in the backend is a plain ASGI callable, so chaining
+them costs one coroutine call per stage: no per-request anyio task and no
+body-streaming wrapper as with ``BaseHTTPMiddleware``. ``RequestPipeline``
+composes the stages in one ``add_middleware`` entry and times each one.
+
+Timing is self time: every stage records how long the request spent inside
+it and everything below it, and the pipeline subtracts the next stage's
+figure when the request finishes. The innermost entry, ``app``, is the
+router and handler. Counters are exported on ``/metrics``.
+
+``PathMatcher`` is the precompiled exact/prefix matcher the stages use for
+their route tables.
+"""
+
+from __future__ import annotations
+
+import time
+import weakref
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from fastapi import FastAPI
+from starlette.middleware import Middleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_MATCH_CACHE_SIZE = 1024
+_TIMING_KEY = "lawnberry.pipeline_timing"
+APP_STAGE = "app"
+
+# Live pipelines, for /metrics; the Starlette middleware stack owns them.
+_pipelines: weakref.WeakSet[RequestPipeline] = weakref.WeakSet()
+
+
+class PathMatcher:
+    """Exact paths and prefixes compiled once; each path's answer is memoized.
+
+    Entries may carry a value (pass a mapping) or just mark membership (pass
+    an iterable). ``lookup`` prefers an exact match, then the longest prefix.
+    """
+
+    def __init__(
+        self,
+        prefixes: Iterable[str] | Mapping[str, Any] = (),
+        exact: Iterable[str] | Mapping[str, Any] = (),
+        *,
+        strip_trailing_slash: bool = False,
+    ) -> None:
+        self._strip = strip_trailing_slash
+        self._exact = {
+            self._normalize(path): value for path, value in _entries(exact) if path
+        }
+        self._prefixes = sorted(
+            ((prefix, value) for prefix, value in _entries(prefixes) if prefix),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._any_prefix = tuple(prefix for prefix, _value in self._prefixes)
+        self._cache: dict[str, Any] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._exact or self._prefixes)
+
+    def matches(self, path: str) -> bool:
+        return self.lookup(path) is not None
+
+    def lookup(self, path: str) -> Any:
+        cache = self._cache
+        if path in cache:
+            return cache[path]
+        value = self._exact.get(self._normalize(path)) if self._exact else None
+        if value is None and self._any_prefix and path.startswith(self._any_prefix):
+            for prefix, prefix_value in self._prefixes:
+                if path.startswith(prefix):
+                    value = prefix_value
+                    break
+        if len(cache) >= _MATCH_CACHE_SIZE:
+            # Paths with IDs in them must not grow the memo without bound.
+            del cache[next(iter(cache))]
+        cache[path] = value
+        return value
+
+    def _normalize(self, path: str) -> str:
+        return path.rstrip("/") if self._strip else path
+
+
+def _entries(source: Iterable[str] | Mapping[str, Any]) -> Iterable[tuple[str, Any]]:
+    if isinstance(source, Mapping):
+        return source.items()
+    return ((item, True) for item in source)
+
+
+class _StageTimer:
+    """Records the time a request spends in one stage and everything below it."""
+
+    __slots__ = ("app", "index")
+
+    def __init__(self, app: ASGIApp, index: int) -> None:
+        self.app = app
+        self.index = index
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        timings = scope.get(_TIMING_KEY)
+        if timings is None:
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            timings[self.index] = time.perf_counter() - start
+
+
+class RequestPipeline:
+    """Runs the configured middleware stages, outermost first, with timing."""
+
+    def __init__(self, app: ASGIApp, *, stages: Sequence[tuple[str, Middleware]]) -> None:
+        self.stage_names = tuple(name for name, _spec in stages) + (APP_STAGE,)
+        inner: ASGIApp = _StageTimer(app, len(stages))
+        for index in range(len(stages) - 1, -1, -1):
+            cls, args, kwargs = stages[index][1]
+            inner = _StageTimer(cls(inner, *args, **kwargs), index)
+        self.app = inner
+        self.requests = {name: 0 for name in self.stage_names}
+        self.total_s = {name: 0.0 for name in self.stage_names}
+        self.max_s = {name: 0.0 for name in self.stage_names}
+        _pipelines.add(self)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings = [0.0] * len(self.stage_names)
+        scope[_TIMING_KEY] = timings
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._record(timings)
+
+    def _record(self, timings: list[float]) -> None:
+        names = self.stage_names
+        last = len(names) - 1
+        for index, name in enumerate(names):
+            inclusive = timings[index]
+            if inclusive <= 0.0:
+                break  # an outer stage answered without calling further in
+            own = inclusive - timings[index + 1] if index < last else inclusive
+            own = max(0.0, own)
+            self.requests[name] += 1
+            self.total_s[name] += own
+            if own > self.max_s[name]:
+                self.max_s[name] = own
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        return {
+            name: {
+                "requests": self.requests[name],
+                "total_s": self.total_s[name],
+                "max_ms": self.max_s[name] * 1000.0,
+            }
+            for name in self.stage_names
+        }
+
+
+def pipeline_stats() -> dict[str, dict[str, float]] | None:
+    """Per-stage counters of the live pipeline(s), merged; None before one is built."""
+    pipelines = list(_pipelines)
+    if not pipelines:
+        return None
+    merged: dict[str, dict[str, float]] = {}
+    for pipeline in pipelines:
+        for name, counts in pipeline.stats().items():
+            target = merged.setdefault(name, {"requests": 0, "total_s": 0.0, "max_ms": 0.0})
+            target["requests"] += counts["requests"]
+            target["total_s"] += counts["total_s"]
+            target["max_ms"] = max(target["max_ms"], counts["max_ms"])
+    return merged
+
+
+def register_request_pipeline(app: FastAPI) -> None:
+    """Register every HTTP middleware stage as one pipeline, outermost first."""
+    from .api_key_auth import api_key_auth_middleware
+    from .correlation import correlation_middleware
+    from .deprecation import deprecation_middleware
+    from .input_validation import input_validation_middleware
+    from .rate_limiting import global_rate_limiter_middleware
+    from .sanitization import sanitization_middleware
+    from .security import cors_middleware, security_middleware
+
+    stages = [
+        ("deprecation", deprecation_middleware()),
+        ("sanitization", sanitization_middleware()),
+        ("correlation", correlation_middleware()),
+        ("api_key", api_key_auth_middleware()),
+        ("cors", cors_middleware()),
+        ("security", security_middleware()),
+        ("input_validation", input_validation_middleware()),
+        ("rate_limit", global_rate_limiter_middleware()),
+    ]
+    app.add_middleware(
+        RequestPipeline, stages=[(name, spec) for name, spec in stages if spec is not None]
+    )
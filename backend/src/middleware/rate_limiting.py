@@ -7,85 +7,187 @@ code changes.
 
 Notes:
 - In-memory store suitable for single-process deployment on Pi.
+- Pure ASGI: no per-request task or response wrapping, unlike
+  ``BaseHTTPMiddleware``.
+- Exemptions and overrides are compiled into one prefix trie; a path's
+  decision is memoized, so dashboard polling costs one dict lookup.
+- Buckets are touched only from the event loop and never across an
+  ``await``, so they need no lock.
+- Buckets are kept in LRU order. One that has been idle long enough to
+  refill is indistinguishable from a fresh bucket and is evicted; a hard
+  cap bounds memory when many clients are seen.
 - Hooks defined to plug a distributed backend (e.g., Redis) if needed.
 """
 
 from __future__ import annotations
 
-import asyncio
 import os
 import time
+import weakref
+from collections import OrderedDict
 from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
 
-from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse, Response
+from fastapi import FastAPI
+from starlette.middleware import Middleware
+from starlette.requests import HTTPConnection
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..core.client_identity import client_ip
 
+DEFAULT_POLICY = "default"
+_ROUTE_CACHE_SIZE = 1024
+_EVICT_PER_REQUEST = 8
 
-@dataclass
+# Live limiters, for /metrics. Starlette builds the middleware stack lazily,
+# so the app holds the only strong reference.
+_limiters: weakref.WeakSet[GlobalRateLimiter] = weakref.WeakSet()
+
+
+@dataclass(slots=True)
 class Bucket:
     tokens: float
     last_refill: float
+    # Monotonic time at which the bucket is back to full burst.
+    full_at: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class RatePolicy:
+    key: str
+    rate: float
+    burst: int
+
+
+class _TrieNode:
+    __slots__ = ("children", "exempt", "policy")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.exempt = False
+        self.policy: RatePolicy | None = None
 
 
-class GlobalRateLimiter(BaseHTTPMiddleware):
+class _PrefixTrie:
+    """Character trie over exempt and override prefixes.
+
+    One walk answers both questions the limiter asks: is any exempt prefix
+    a prefix of the path, and which override prefix is the longest match.
+    """
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+
+    def insert(self, prefix: str, *, exempt: bool = False, policy: RatePolicy | None = None):
+        node = self._root
+        for ch in prefix:
+            node = node.children.setdefault(ch, _TrieNode())
+        if exempt:
+            node.exempt = True
+        if policy is not None:
+            node.policy = policy
+
+    def match(self, path: str) -> tuple[bool, RatePolicy | None]:
+        node = self._root
+        exempt = node.exempt
+        policy = node.policy
+        for ch in path:
+            node = node.children.get(ch)
+            if node is None:
+                break
+            exempt = exempt or node.exempt
+            if node.policy is not None:
+                policy = node.policy
+        return exempt, policy
+
+
+class GlobalRateLimiter:
     def __init__(
         self,
-        app: FastAPI,
+        app: ASGIApp,
         *,
         refill_rate_per_sec: float = 2.0,  # tokens per second
         burst: int = 20,
         exempt_prefixes: Sequence[str] | None = None,
         strict_prefix_overrides: Sequence[tuple[str, float, int]] | None = None,
+        max_buckets: int = 4096,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._rate = max(0.1, float(refill_rate_per_sec))
         self._burst = max(1, int(burst))
+        self._default = RatePolicy(DEFAULT_POLICY, self._rate, self._burst)
         self._exempt = tuple(exempt_prefixes or ("/health", "/metrics", "/docs", "/openapi.json"))
         # List of (prefix, rate, burst) to override defaults per path
         self._overrides = tuple(strict_prefix_overrides or ())
-        self._buckets: dict[str, Bucket] = {}
-        self._lock: asyncio.Lock | None = None
-
-    async def dispatch(self, request: Request, call_next) -> Response:
-        path = request.url.path
-        if self._is_exempt(path):
-            return await call_next(request)
+        self._trie = _PrefixTrie()
+        for prefix in self._exempt:
+            self._trie.insert(prefix, exempt=True)
+        for prefix, rate, burst_override in self._overrides:
+            self._trie.insert(
+                prefix,
+                policy=RatePolicy(prefix, max(0.1, float(rate)), max(1, int(burst_override))),
+            )
+        self._route_cache: dict[str, tuple[bool, RatePolicy | None]] = {}
+        self._buckets: OrderedDict[str, Bucket] = OrderedDict()
+        self._max_buckets = max(1, int(max_buckets))
+        self._clock = time.monotonic
+        self.allowed: dict[str, int] = {}
+        self.denied: dict[str, int] = {}
+        self.exempted = 0
+        self.evicted = 0
+        _limiters.add(self)
 
-        client_key = self._client_key(request)
-        rate, burst = self._rate, self._burst
-        override = self._match_override(path)
-        policy_key = "default"
-        if override is not None:
-            policy_key, rate, burst = override
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        exempt, override = self._route(scope["path"])
+        if exempt:
+            self.exempted += 1
+            await self.app(scope, receive, send)
+            return
 
+        policy = override or self._default
+        client_key = self._client_key(HTTPConnection(scope))
         # A strict endpoint override is a distinct policy, not a mutation of a
         # client's global bucket. Otherwise one Cloudflare bootstrap request
         # can shrink the same bucket used by every ordinary API route.
-        bucket_key = f"{client_key}|policy:{policy_key}"
-        allowed, retry_after = await self._consume_token(bucket_key, rate, burst)
+        bucket_key = f"{client_key}|policy:{policy.key}"
+        allowed, retry_after = self._consume_token(bucket_key, policy.rate, policy.burst)
         if not allowed:
-            return JSONResponse(
+            self.denied[policy.key] = self.denied.get(policy.key, 0) + 1
+            response = JSONResponse(
                 status_code=429,
                 content={"detail": "Too many requests"},
                 headers={"Retry-After": str(retry_after)},
             )
-        return await call_next(request)
+            await response(scope, receive, send)
+            return
+        self.allowed[policy.key] = self.allowed.get(policy.key, 0) + 1
+        await self.app(scope, receive, send)
+
+    def _route(self, path: str) -> tuple[bool, RatePolicy | None]:
+        cached = self._route_cache.get(path)
+        if cached is None:
+            cached = self._trie.match(path)
+            if len(self._route_cache) >= _ROUTE_CACHE_SIZE:
+                # Paths with IDs in them must not grow the memo without bound.
+                del self._route_cache[next(iter(self._route_cache))]
+            self._route_cache[path] = cached
+        return cached
 
     def _is_exempt(self, path: str) -> bool:
-        return any(path.startswith(p) for p in self._exempt)
+        return self._route(path)[0]
 
     def _match_override(self, path: str) -> tuple[str, float, int] | None:
-        matches = [override for override in self._overrides if path.startswith(override[0])]
-        if not matches:
+        policy = self._route(path)[1]
+        if policy is None:
             return None
-        prefix, rate, burst = max(matches, key=lambda override: len(override[0]))
-        return (prefix, max(0.1, float(rate)), max(1, int(burst)))
+        return (policy.key, policy.rate, policy.burst)
 
-    def _client_key(self, request: Request) -> str:
+    def _client_key(self, request: Any) -> str:
         # Browser client IDs are useful for isolated SIM/CI traffic but are
         # attacker-controlled and cannot key production quotas.
         if os.getenv("SIM_MODE", "0") == "1":
@@ -97,34 +199,84 @@ class GlobalRateLimiter(BaseHTTPMiddleware):
             return f"ip:{address}"
         return "anon"
 
-    async def _consume_token(self, key: str, rate: float, burst: int) -> tuple[bool, int]:
-        now = time.time()
-        if self._lock is None:
-            self._lock = asyncio.Lock()
-        async with self._lock:
-            bucket = self._buckets.get(key)
-            if bucket is None:
-                bucket = Bucket(tokens=float(burst), last_refill=now)
-                self._buckets[key] = bucket
+    def _consume_token(self, key: str, rate: float, burst: int) -> tuple[bool, int]:
+        now = self._clock()
+        buckets = self._buckets
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = Bucket(tokens=float(burst), last_refill=now)
+            buckets[key] = bucket
+        else:
+            buckets.move_to_end(key)
+        self._evict_idle(now)
 
-            # Refill
-            elapsed = now - bucket.last_refill
-            if elapsed > 0:
-                bucket.tokens = min(float(burst), bucket.tokens + elapsed * rate)
-                bucket.last_refill = now
+        # Refill
+        elapsed = now - bucket.last_refill
+        if elapsed > 0:
+            bucket.tokens = min(float(burst), bucket.tokens + elapsed * rate)
+            bucket.last_refill = now
 
-            if bucket.tokens >= 1.0:
-                bucket.tokens -= 1.0
-                return True, 0
+        if bucket.tokens >= 1.0:
+            bucket.tokens -= 1.0
+            bucket.full_at = now + (burst - bucket.tokens) / rate
+            return True, 0
 
-            # Compute Retry-After seconds
-            needed = 1.0 - bucket.tokens
-            retry_after = int(max(1, needed / rate))
-            return False, retry_after
+        bucket.full_at = now + (burst - bucket.tokens) / rate
+        # Compute Retry-After seconds
+        needed = 1.0 - bucket.tokens
+        retry_after = int(max(1, needed / rate))
+        return False, retry_after
 
+    def _evict_idle(self, now: float) -> None:
+        """Drop least-recently-used buckets that have refilled (or exceed the cap).
 
-def register_global_rate_limiter(app: FastAPI) -> None:
-    """Register the global rate limiter middleware with env-based config."""
+        Bounded work per request keeps the cost O(1) amortized.
+        """
+        buckets = self._buckets
+        for _ in range(_EVICT_PER_REQUEST):
+            if len(buckets) <= 1:
+                return
+            key, oldest = next(iter(buckets.items()))
+            if oldest.full_at > now and len(buckets) <= self._max_buckets:
+                return
+            del buckets[key]
+            self.evicted += 1
+
+    def stats(self) -> dict[str, Any]:
+        policies = sorted(set(self.allowed) | set(self.denied))
+        return {
+            "buckets": len(self._buckets),
+            "evicted": self.evicted,
+            "exempted": self.exempted,
+            "policies": {
+                policy: {
+                    "allowed": self.allowed.get(policy, 0),
+                    "denied": self.denied.get(policy, 0),
+                }
+                for policy in policies
+            },
+        }
+
+
+def rate_limiter_stats() -> dict[str, Any] | None:
+    """Counters of the live limiter(s), merged; None before the first is built."""
+    limiters = list(_limiters)
+    if not limiters:
+        return None
+    merged: dict[str, Any] = {"buckets": 0, "evicted": 0, "exempted": 0, "policies": {}}
+    for limiter in limiters:
+        stats = limiter.stats()
+        for field in ("buckets", "evicted", "exempted"):
+            merged[field] += stats[field]
+        for policy, counts in stats["policies"].items():
+            target = merged["policies"].setdefault(policy, {"allowed": 0, "denied": 0})
+            target["allowed"] += counts["allowed"]
+            target["denied"] += counts["denied"]
+    return merged
+
+
+def global_rate_limiter_middleware() -> Middleware:
+    """The global rate limiter configured from the environment."""
     rate = float(os.getenv("GLOBAL_RATE_LIMIT_RATE", "10"))
     burst = int(os.getenv("GLOBAL_RATE_LIMIT_BURST", "60"))
     # Exempt core health/docs, read-only polling endpoints, and streaming endpoints.
@@ -183,10 +335,16 @@ def register_global_rate_limiter(app: FastAPI) -> None:
         # for recovery while bounding signature/JWKS work at the origin.
         overrides.append(("/api/v2/auth/cloudflare", 1.0, 6))
 
-    app.add_middleware(
+    return Middleware(
         GlobalRateLimiter,
         refill_rate_per_sec=rate,
         burst=burst,
         exempt_prefixes=[s for s in (e.strip() for e in exempt) if s],
         strict_prefix_overrides=overrides,
     )
+
+
+def register_global_rate_limiter(app: FastAPI) -> None:
+    """Register the global rate limiter middleware with env-based config."""
+    spec = global_rate_limiter_middleware()
+    app.add_middleware(spec.cls, *spec.args, **spec.kwargs)
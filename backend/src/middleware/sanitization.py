@@ -3,6 +3,10 @@
 Redacts sensitive fields in JSON bodies for responses and prevents
 accidental echoing of secrets. Also adds standard security headers
 on all responses as a backstop.
+
+Only JSON responses on redacted routes are buffered. Every other response
+streams through untouched, as does a JSON body that turns out to be too
+large, malformed, or free of sensitive keys (its original bytes are sent).
 """
 
 from __future__ import annotations
@@ -11,9 +15,13 @@ import json
 import logging
 from typing import Any
 
-from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse, Response
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .pipeline import PathMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -50,25 +58,20 @@ def _redact(obj: Any, *, allowed_sensitive_keys: frozenset[str] = frozenset()) -
     return obj
 
 
-def _strip_framing_headers(headers: dict[str, str]) -> dict[str, str]:
+def _strip_framing_headers(headers: MutableHeaders) -> MutableHeaders:
     """Remove headers that must be recomputed when body content changes."""
-    for key in (
-        "content-length",
-        "Content-Length",
-        "transfer-encoding",
-        "Transfer-Encoding",
-        "content-type",
-        "Content-Type",
-    ):
-        headers.pop(key, None)
+    for key in ("content-length", "transfer-encoding"):
+        if key in headers:
+            del headers[key]
     return headers
 
 
-class SanitizationMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: FastAPI, *, max_process_bytes: int = 256_000) -> None:
-        super().__init__(app)
+class SanitizationMiddleware:
+    def __init__(self, app: ASGIApp, *, max_process_bytes: int = 256_000) -> None:
+        self.app = app
         self._max = max(1024, int(max_process_bytes))
         self._skip_response_redaction = ("/api/v2/settings/maps",)
+        self._skip_matcher = PathMatcher(self._skip_response_redaction)
         self._intentional_sensitive_response_keys = {
             ("POST", "/api/v2/auth/login"): frozenset({"token", "access_token"}),
             ("POST", "/api/v2/auth/cloudflare"): frozenset({"token", "access_token"}),
@@ -79,83 +82,81 @@ class SanitizationMiddleware(BaseHTTPMiddleware):
             ): frozenset({"permit_token"}),
         }
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response = await call_next(request)
-
-        # Apply security headers if missing
-        response.headers.setdefault("X-Content-Type-Options", "nosniff")
-        response.headers.setdefault("X-Frame-Options", "DENY")
-
-        if any(request.url.path.startswith(prefix) for prefix in self._skip_response_redaction):
-            return response
-
-        # Redact JSON bodies up to a reasonable size to avoid overhead.
-        ctype = (response.headers.get("Content-Type") or "").lower()
-        if "application/json" not in ctype:
-            return response
-
-        # --- Drain the body so we can inspect / redact it. ---
-        # Starlette's _StreamingResponse (returned by call_next) does NOT
-        # set a 'body' attribute — its body lives only in body_iterator.
-        # Reading body_iterator exhausts it, so we MUST never return the
-        # original _StreamingResponse after draining; we always reconstruct.
-        raw: bytes | None = None
-        body_was_drained = False
-
-        body_attr = getattr(response, "body", None)
-        if isinstance(body_attr, (bytes, bytearray)) and body_attr:
-            # Direct body attribute present (e.g. pre-rendered Response subclass).
-            raw = bytes(body_attr)
-        elif getattr(response, "body_iterator", None) is not None:
-            chunks: list[bytes] = []
-            try:
-                async for chunk in response.body_iterator:  # type: ignore[attr-defined]
-                    chunks.append(chunk)
-            except Exception as exc:
-                logger.debug("SanitizationMiddleware: body drain interrupted: %s", exc)
-            raw = b"".join(chunks)
-            body_was_drained = True
-
-        # --- Try JSON redaction ---
-        if raw is not None and len(raw) <= self._max:
-            try:
-                parsed = json.loads(raw.decode("utf-8") if raw else "null")
-                redacted = _redact(
-                    parsed,
-                    allowed_sensitive_keys=self._intentional_sensitive_response_keys.get(
-                        (request.method.upper(), request.url.path), frozenset()
-                    ),
-                )
-                headers = _strip_framing_headers(dict(response.headers))
-                # Build a fresh JSONResponse — init_headers recalculates
-                # Content-Length from the new body, preventing any mismatch.
-                return JSONResponse(
-                    content=redacted,
-                    status_code=response.status_code,
-                    headers=headers,
-                    media_type=response.media_type or "application/json",
-                    background=getattr(response, "background", None),
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        redact = not self._skip_matcher.matches(scope["path"])
+        allowed = self._intentional_sensitive_response_keys.get(
+            (scope["method"].upper(), scope["path"]), frozenset()
+        )
+        start: Message | None = None
+        chunks: list[bytes] = []
+        size = 0
+        buffering = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, size, buffering
+            kind = message["type"]
+            if kind == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                # Apply security headers if missing
+                headers.setdefault("X-Content-Type-Options", "nosniff")
+                headers.setdefault("X-Frame-Options", "DENY")
+                content_type = (headers.get("Content-Type") or "").lower()
+                if redact and "application/json" in content_type:
+                    start, buffering = message, True
+                    return
+                await send(message)
+                return
+            if not buffering or kind != "http.response.body":
+                await send(message)
+                return
+
+            chunk = message.get("body", b"")
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self._max:
+                # Too large to redact cheaply: release what is held, stream the rest.
+                buffering = False
+                await send(start)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": b"".join(chunks),
+                        "more_body": message.get("more_body", False),
+                    }
                 )
-            except Exception as exc:
-                logger.debug("SanitizationMiddleware: JSON redaction failed: %s", exc)
-
-        # --- Fallback: body too large or JSON processing failed. ---
-        # If we drained body_iterator the original _StreamingResponse is now
-        # exhausted.  Returning it would cause a Content-Length mismatch at
-        # the ASGI layer (uvicorn raises "shorter/longer than Content-Length").
-        # Reconstruct a plain Response from the drained bytes instead.
-        if body_was_drained and raw is not None:
-            headers = _strip_framing_headers(dict(response.headers))
-            return Response(
-                content=raw,
-                status_code=response.status_code,
-                headers=headers,
-                media_type=response.media_type,
-                background=getattr(response, "background", None),
-            )
-
-        # Non-streaming body that we couldn't redact — return unchanged.
-        return response
+                return
+            if message.get("more_body", False):
+                return
+            buffering = False
+            await self._send_redacted(start, b"".join(chunks), allowed, send)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _send_redacted(
+        self, start: Message, raw: bytes, allowed: frozenset[str], send: Send
+    ) -> None:
+        body = raw
+        try:
+            parsed = json.loads(raw.decode("utf-8") if raw else "null")
+            redacted = _redact(parsed, allowed_sensitive_keys=allowed)
+            if redacted != parsed:
+                body = JSONResponse(content=redacted).body
+        except Exception as exc:
+            # Malformed or undecodable JSON is passed through verbatim.
+            logger.debug("SanitizationMiddleware: JSON redaction failed: %s", exc)
+        if body is not raw:
+            headers = MutableHeaders(scope=start)
+            _strip_framing_headers(headers)
+            headers["Content-Length"] = str(len(body))
+        await send(start)
+        await send({"type": "http.response.body", "body": body, "more_body": False})
+
+
+def sanitization_middleware() -> Middleware:
+    return Middleware(SanitizationMiddleware)
 
 
 def register_sanitization_middleware(app: FastAPI) -> None:
@@ -14,21 +14,38 @@ import uuid
 from collections import deque
 from collections.abc import Iterable, Sequence
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.middleware import Middleware
+from starlette.requests import HTTPConnection
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..core.client_identity import client_ip
 from ..core.context import set_correlation_id
-
-
-class SecurityMiddleware(BaseHTTPMiddleware):
+from .pipeline import PathMatcher
+
+_SECURITY_HEADERS = (
+    ("Strict-Transport-Security", "max-age=63072000; includeSubDomains; preload"),
+    (
+        "Content-Security-Policy",
+        "default-src 'self'; frame-ancestors 'none'; object-src 'none'; base-uri 'self'",
+    ),
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("Referrer-Policy", "no-referrer"),
+    ("Permissions-Policy", "camera=(), microphone=(), geolocation=()"),
+    ("X-XSS-Protection", "1; mode=block"),
+)
+
+
+class SecurityMiddleware:
     """Apply security headers, correlation IDs, and auth rate limiting."""
 
     def __init__(
         self,
-        app: FastAPI,
+        app: ASGIApp,
         *,
         rate_limit_window_seconds: int = 60,
         rate_limit_max_attempts: int = 3,
@@ -36,7 +53,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         lockout_seconds: int = 60,
         protected_prefixes: Sequence[str] | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._window = max(1, rate_limit_window_seconds)
         self._max_attempts = max(1, rate_limit_max_attempts)
         self._lockout_failures = max(1, lockout_failures)
@@ -45,54 +62,62 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             protected_prefixes
             or ("/api/v2/auth/login", "/api/v1/auth/login")
         )
+        # Despite the name these are exact paths, compared without a trailing slash.
+        self._protected = PathMatcher(exact=self._protected_prefixes, strip_trailing_slash=True)
 
         self._attempts: dict[str, deque[float]] = {}
         self._failures: dict[str, int] = {}
         self._lockout_until: dict[str, float] = {}
         self._lock = asyncio.Lock()
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        correlation_id = getattr(request.state, "correlation_id", None)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        connection = HTTPConnection(scope)
+        state = scope.setdefault("state", {})
+        correlation_id = state.get("correlation_id")
         if not correlation_id:
-            correlation_id = self._extract_correlation_id(request)
-            request.state.correlation_id = correlation_id
+            correlation_id = self._extract_correlation_id(connection)
+            state["correlation_id"] = correlation_id
         set_correlation_id(correlation_id)
 
-        is_protected = self._is_protected_path(request.url.path)
-        client_token = self._client_identifier(request)
-
-        if is_protected:
-            limited_response = await self._preprocess_rate_limit(client_token)
-            if limited_response is not None:
-                limited_response.headers.setdefault("X-Correlation-ID", correlation_id)
-                self._apply_security_headers(limited_response)
-                return limited_response
-
-        try:
-            validation_response = None
-            if is_protected and request.method in {"POST", "PUT", "PATCH"}:
-                validation_response = self._validate_request_content(request)
-            if validation_response is not None:
-                validation_response.headers.setdefault("X-Correlation-ID", correlation_id)
-                self._apply_security_headers(validation_response)
-                return validation_response
-
-            response = await call_next(request)
-        except Exception:
-            raise
-
-        try:
-            if is_protected:
-                await self._postprocess_rate_limit(client_token, response.status_code)
-
-            self._apply_security_headers(response)
-            response.headers.setdefault("X-Correlation-ID", correlation_id)
-        finally:
-            pass
-
-        return response
-
-    def _extract_correlation_id(self, request: Request) -> str:
+        is_protected = self._is_protected_path(scope["path"])
+        if not is_protected:
+            await self.app(scope, receive, self._header_sender(send, correlation_id))
+            return
+
+        client_token = self._client_identifier(connection)
+        rejection = await self._preprocess_rate_limit(client_token)
+        if rejection is None and scope["method"] in {"POST", "PUT", "PATCH"}:
+            rejection = self._validate_request_content(connection)
+        if rejection is not None:
+            rejection.headers.setdefault("X-Correlation-ID", correlation_id)
+            self._apply_security_headers(rejection.headers)
+            await rejection(scope, receive, send)
+            return
+
+        status: list[int] = []
+        await self.app(scope, receive, self._header_sender(send, correlation_id, status))
+        if status:
+            await self._postprocess_rate_limit(client_token, status[0])
+
+    def _header_sender(
+        self, send: Send, correlation_id: str, status: list[int] | None = None
+    ) -> Send:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                if status is not None:
+                    status.append(message["status"])
+                headers = MutableHeaders(scope=message)
+                self._apply_security_headers(headers)
+                headers.setdefault("X-Correlation-ID", correlation_id)
+            await send(message)
+
+        return send_wrapper
+
+    def _extract_correlation_id(self, request: HTTPConnection) -> str:
         header_names = ("X-Correlation-ID", "X-Request-ID", "X-Amzn-Trace-Id")
         for name in header_names:
             value = request.headers.get(name)
@@ -100,7 +125,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
                 return value
         return uuid.uuid4().hex
 
-    def _client_identifier(self, request: Request) -> str:
+    def _client_identifier(self, request: HTTPConnection) -> str:
         if os.getenv("SIM_MODE", "0") == "1":
             header_client = request.headers.get("X-Client-Id")
             if header_client:
@@ -115,8 +140,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         return f"anon:{uuid.uuid4().hex}"
 
     def _is_protected_path(self, path: str) -> bool:
-        normalized = path.rstrip("/")
-        return any(normalized == candidate.rstrip("/") for candidate in self._protected_prefixes)
+        return self._protected.matches(path)
 
     async def _preprocess_rate_limit(self, client_token: str) -> Response | None:
         now = time.time()
@@ -174,7 +198,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
                 self._lockout_until.pop(client_token, None)
                 self._attempts.pop(client_token, None)
 
-    def _validate_request_content(self, request: Request) -> Response | None:
+    def _validate_request_content(self, request: HTTPConnection) -> Response | None:
         content_type = request.headers.get("Content-Type", "").lower()
         if request.headers.get("Content-Length") in {None, "0"} and not content_type:
             return None
@@ -184,18 +208,9 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             )
         return None
 
-    def _apply_security_headers(self, response: Response) -> None:
-        security_headers = {
-            "Strict-Transport-Security": "max-age=63072000; includeSubDomains; preload",
-            "Content-Security-Policy": "default-src 'self'; frame-ancestors 'none'; object-src 'none'; base-uri 'self'",
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "Referrer-Policy": "no-referrer",
-            "Permissions-Policy": "camera=(), microphone=(), geolocation=()",
-            "X-XSS-Protection": "1; mode=block",
-        }
-        for header, value in security_headers.items():
-            response.headers.setdefault(header, value)
+    def _apply_security_headers(self, headers: MutableHeaders) -> None:
+        for header, value in _SECURITY_HEADERS:
+            headers.setdefault(header, value)
 
 
 def _default_allowed_origins() -> list[str]:
@@ -209,19 +224,19 @@ def _default_allowed_origins() -> list[str]:
     ]
 
 
-def register_security_middleware(
-    app: FastAPI, *, allowed_origins: Iterable[str] | None = None
-) -> None:
-    """Attach security middleware stack to the FastAPI application."""
-    origins = list(allowed_origins or _default_allowed_origins())
-    app.add_middleware(
+def security_middleware() -> Middleware:
+    return Middleware(
         SecurityMiddleware,
         rate_limit_window_seconds=int(os.getenv("AUTH_RATE_LIMIT_WINDOW", "45")),
         rate_limit_max_attempts=int(os.getenv("AUTH_RATE_LIMIT_MAX_ATTEMPTS", "6")),
         lockout_failures=int(os.getenv("AUTH_LOCKOUT_FAILURES", "5")),
         lockout_seconds=int(os.getenv("AUTH_LOCKOUT_SECONDS", "30")),
     )
-    app.add_middleware(
+
+
+def cors_middleware(allowed_origins: Iterable[str] | None = None) -> Middleware:
+    origins = list(allowed_origins or _default_allowed_origins())
+    return Middleware(
         CORSMiddleware,
         allow_origins=origins,
         allow_credentials=True,
@@ -236,3 +251,11 @@ def register_security_middleware(
         expose_headers=["X-Correlation-ID"],
         max_age=86400,
     )
+
+
+def register_security_middleware(
+    app: FastAPI, *, allowed_origins: Iterable[str] | None = None
+) -> None:
+    """Attach security middleware stack to the FastAPI application."""
+    for spec in (security_middleware(), cors_middleware(allowed_origins)):
+        app.add_middleware(spec.cls, *spec.args, **spec.kwargs)
@@ -8,7 +8,14 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_serializer,
+    field_validator,
+)
 
 
 class CameraMode(str, Enum):
@@ -96,14 +103,37 @@ class CameraFrame(BaseModel):
     checksum: str | None = None
 
     _raw_cache: bytes | None = PrivateAttr(default=None)
+    _raw_image: Any = PrivateAttr(default=None)
+    _color_order: str = PrivateAttr(default="RGB")
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     def set_frame_data(self, frame_bytes: bytes):
         """Set frame data from raw bytes"""
-        self._raw_cache = bytes(frame_bytes)
-        self.data = base64.b64encode(frame_bytes).decode("utf-8")
+        self.attach_frame_data(bytes(frame_bytes))
         self.metadata.size_bytes = len(frame_bytes)
 
+    def attach_frame_data(self, frame_bytes: bytes) -> None:
+        """Hold raw bytes without encoding; ``data`` is base64-encoded only on dump"""
+        self._raw_cache = frame_bytes
+        self.data = None
+
+    @field_serializer("data")
+    def _serialize_data(self, value: str | None) -> str | None:
+        if value is None and self._raw_cache is not None:
+            return base64.b64encode(self._raw_cache).decode("utf-8")
+        return value
+
+    def attach_raw_image(self, image: Any, color_order: str = "RGB") -> None:
+        """Keep the capture-side pixel array (owner process only, never serialized)"""
+        self._raw_image = image
+        self._color_order = color_order
+
+    def get_raw_image(self) -> tuple[Any, str] | None:
+        """Return ``(array, color_order)`` if the capture array is still attached"""
+        if self._raw_image is None:
+            return None
+        return self._raw_image, self._color_order
+
     def get_frame_data(self) -> bytes | None:
         """Get frame data as raw bytes"""
         if self._raw_cache is not None:
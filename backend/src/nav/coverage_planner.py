@@ -6,24 +6,35 @@ Generates parallel scanlines across the boundary polygon and subtracts
 exclusion polygons. Returns a serpentine polyline path for visualization
 or basic movement testing.
 
-No heavy geometry deps; uses horizontal line intersection against polygon
-edges and interval subtraction to avoid holes.
+Scanlines are computed by a vectorized engine: every polygon edge is
+expanded into the rows it spans in one NumPy pass, so the cost scales with
+the number of crossings rather than rows x vertices. Only the 1-D interval
+subtraction and serpentine assembly remain per row, and they touch only the
+holes that actually cross that row.
 
 Angle support is implemented by converting all coordinates to a local ENU
 (East-North-Up) Cartesian frame, rotating them so that the desired pass
-direction aligns with the scanline axis (east), running the existing
-horizontal scanline algorithm in ENU space, and then un-rotating and
-converting back to lat/lng.
+direction aligns with the scanline axis (east), running the horizontal
+scanline algorithm in ENU space, and then un-rotating and converting back
+to lat/lng.
 """
 
-from collections.abc import Iterable
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 
-from .geoutils import enu_to_latlon, haversine_m, latlon_to_enu, rotate_enu
+import numpy as np
+
+from .geoutils import METERS_PER_DEGREE_LATITUDE
 
 LatLng = tuple[float, float]
 Interval = tuple[float, float]
 
+_EARTH_RADIUS_M = 6371000.0
+_FREE_SPACE_CACHE_SIZE = 8
+
 
 @dataclass(frozen=True)
 class CoverageSegment:
@@ -33,40 +44,129 @@ class CoverageSegment:
     end: LatLng
 
 
-def _horizontal_intersections(polygon: Iterable[LatLng], y: float) -> list[float]:
-    """Compute longitudes where a horizontal scanline at latitude y intersects the polygon.
+@dataclass(frozen=True)
+class CoverageAngleScore:
+    """Cost of covering the free space with passes at one ``angle_deg``."""
+
+    angle_deg: float
+    segment_count: int
+    row_count: int
+    turns: int
+    mow_length_m: float
+    transit_length_m: float
+    cost_m: float
+
+
+@dataclass(frozen=True)
+class CoverageSweep:
+    """Result of :func:`sweep_coverage_angles`; ``scores`` are in sweep order."""
 
-    Uses half-open edge inclusion to avoid double counting at vertices.
+    best_angle_deg: float
+    best: CoverageAngleScore
+    scores: list[CoverageAngleScore]
+
+
+def _ring_array(ring: Iterable[tuple[float, float]]) -> np.ndarray:
+    return np.asarray(list(ring), dtype=float).reshape(-1, 2)
+
+
+def _row_values(y_min: float, y_max: float, dy: float, eps: float, max_rows: int) -> np.ndarray:
+    """Scanline ordinates ``y_min, y_min + dy, ...`` up to ``y_max + eps``.
+
+    Built with a sequential accumulate so every row lands on exactly the
+    value repeated ``y += dy`` would produce.
+    """
+    if max_rows <= 0:
+        return np.empty(0)
+    n = min(max_rows, int((y_max - y_min) / dy) + 2)
+    steps = np.full(n, dy)
+    steps[0] = y_min
+    ys = np.add.accumulate(steps)
+    return ys[ys <= y_max + eps]
+
+
+def _scanline_intervals(rings: Sequence[np.ndarray], ys: np.ndarray) -> list[list[Interval]]:
+    """Inside intervals of ``rings[0]`` minus ``rings[1:]`` for every row in *ys*.
+
+    Rings hold ``(y, x)`` vertices. Each non-horizontal edge contributes a
+    crossing to the rows in its half-open span ``[min(y), max(y))``, which
+    avoids double counting at vertices. Crossings are sorted per (row, ring)
+    and paired into intervals, all without a Python loop over edges.
     """
-    pts = list(polygon)
-    n = len(pts)
-    xs: list[float] = []
-    for i in range(n):
-        (y1, x1) = pts[i]
-        (y2, x2) = pts[(i + 1) % n]
-        # Skip horizontal edges
-        if y1 == y2:
+    n_rows = len(ys)
+    rows_out: list[list[Interval]] = [[] for _ in range(n_rows)]
+    if n_rows == 0 or not rings:
+        return rows_out
+
+    parts = []
+    for ring_id, ring in enumerate(rings):
+        if len(ring) < 2:
             continue
-        # Check if scanline crosses the edge in half-open sense [min, max)
-        ymin = min(y1, y2)
-        ymax = max(y1, y2)
-        if not (y >= ymin and y < ymax):
+        nxt = np.roll(ring, -1, axis=0)
+        keep = ring[:, 0] != nxt[:, 0]
+        if not keep.any():
             continue
-        t = (y - y1) / (y2 - y1)
-        x = x1 + t * (x2 - x1)
-        xs.append(x)
-    xs.sort()
-    return xs
-
-
-def _intervals_from_intersections(xs: list[float]) -> list[Interval]:
-    """Pair sorted intersections into inside intervals along scanline."""
-    intervals: list[Interval] = []
-    for i in range(0, len(xs) - 1, 2):
-        a, b = xs[i], xs[i + 1]
-        if b > a:
-            intervals.append((a, b))
-    return intervals
+        edges = np.empty((int(keep.sum()), 5))
+        edges[:, 0] = ring_id
+        edges[:, 1:3] = ring[keep]
+        edges[:, 3:5] = nxt[keep]
+        parts.append(edges)
+    if not parts:
+        return rows_out
+    edges = np.concatenate(parts)
+    ring_ids, y1, x1, y2, x2 = edges.T
+
+    first = np.searchsorted(ys, np.minimum(y1, y2), side="left")
+    stop = np.searchsorted(ys, np.maximum(y1, y2), side="left")
+    counts = np.maximum(stop - first, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return rows_out
+
+    edge_idx = np.repeat(np.arange(len(edges)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    row = np.repeat(first, counts) + offsets
+    y = ys[row]
+    ey1 = y1[edge_idx]
+    ex1 = x1[edge_idx]
+    t = (y - ey1) / (y2[edge_idx] - ey1)
+    x = ex1 + t * (x2[edge_idx] - ex1)
+    ring = ring_ids[edge_idx].astype(np.int64)
+
+    order = np.lexsort((x, ring, row))
+    row, ring, x = row[order], ring[order], x[order]
+
+    # Pair crossings 0-1, 2-3, ... within each (row, ring) group; an odd
+    # trailing crossing is dropped.
+    group = row * len(rings) + ring
+    starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+    sizes = np.diff(np.r_[starts, total])
+    position = np.arange(total) - np.repeat(starts, sizes)
+    lead = np.flatnonzero((position % 2 == 0) & (position + 1 < np.repeat(sizes, sizes)))
+    a = x[lead]
+    b = x[lead + 1]
+    inside = b > a
+    lead = lead[inside]
+
+    has_holes = len(rings) > 1
+    pending: dict[int, tuple[list[Interval], dict[int, list[Interval]]]] = {}
+    for r, k, lo, hi in zip(
+        row[lead].tolist(), ring[lead].tolist(), a[inside].tolist(), b[inside].tolist(), strict=True
+    ):
+        if not has_holes:
+            rows_out[r].append((lo, hi))
+            continue
+        source, holes = pending.setdefault(r, ([], {}))
+        if k == 0:
+            source.append((lo, hi))
+        else:
+            holes.setdefault(k, []).append((lo, hi))
+    for r, (source, holes) in pending.items():
+        if source:
+            rows_out[r] = _subtract_intervals(
+                source, [holes[k] for k in sorted(holes)] if holes else [[]]
+            )
+    return rows_out
 
 
 def _subtract_intervals(source: list[Interval], holes: list[list[Interval]]) -> list[Interval]:
@@ -113,6 +213,43 @@ def _subtract_intervals(source: list[Interval], holes: list[list[Interval]]) ->
     return result
 
 
+def _serpentine(
+    ys: np.ndarray, intervals: list[list[Interval]]
+) -> tuple[list[tuple[float, float]], np.ndarray]:
+    """Join per-row intervals into one boustrophedon polyline.
+
+    Returns the ``(y, x)`` path and an ``(n, 4)`` array of the mowed
+    ``(ya, xa, yb, xb)`` segments in travel order.
+    """
+    path: list[tuple[float, float]] = []
+    segments: list[tuple[float, float, float, float]] = []
+    for row_idx, (y, row) in enumerate(zip(ys.tolist(), intervals, strict=True)):
+        if not row:
+            continue
+        ordered = row if row_idx % 2 == 0 else [(b, a) for a, b in reversed(row)]
+        for xa, xb in ordered:
+            a = (y, xa)
+            if not path or path[-1] != a:
+                path.append(a)
+            path.append((y, xb))
+            segments.append((y, xa, y, xb))
+    return path, np.asarray(segments, dtype=float).reshape(-1, 4)
+
+
+def _haversine_total(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> float:
+    """Sum of great-circle distances in metres; vectorized ``haversine_m``."""
+    if len(lat1) == 0:
+        return 0.0
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dphi = np.radians(lat2 - lat1)
+    dlambda = np.radians(lon2 - lon1)
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    a = np.clip(a, 0.0, 1.0)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return float(np.sum(_EARTH_RADIUS_M * c))
+
+
 def _polygon_centroid_latlon(boundary: list[LatLng]) -> LatLng:
     """Return the arithmetic centroid (lat, lon) of a polygon's vertices."""
     lat = sum(p[0] for p in boundary) / len(boundary)
@@ -120,68 +257,47 @@ def _polygon_centroid_latlon(boundary: list[LatLng]) -> LatLng:
     return lat, lon
 
 
-def _run_scanline(
-    boundary_enu: list[tuple[float, float]],
-    exclusion_enus: list[list[tuple[float, float]]],
-    spacing_m: float,
-    max_rows: int,
-) -> tuple[list[tuple[float, float]], int, float]:
-    """Run the horizontal scanline algorithm in ENU (meters) space.
+def _meters_per_deg_lon(origin_lat: float) -> float:
+    return METERS_PER_DEGREE_LATITUDE * math.cos(math.radians(origin_lat))
 
-    Parameters are in ENU coordinates where axis-0 is "north" (y) and
-    axis-1 is "east" (x).  Points here are represented as (y_m, x_m)
-    — the same layout as (lat, lon) in the original algorithm — so all
-    helper functions (_horizontal_intersections, etc.) work unchanged.
 
-    Returns (enu_path, row_count, length_m).
-    """
-    ys = [p[0] for p in boundary_enu]
-    y_min, y_max = min(ys), max(ys)
+def _to_enu(points: np.ndarray, origin: LatLng) -> np.ndarray:
+    """(lat, lon) rows to (east, north) metres; vectorized ``latlon_to_enu``."""
+    origin_lat, origin_lon = origin
+    enu = np.empty_like(points)
+    enu[:, 0] = (points[:, 1] - origin_lon) * _meters_per_deg_lon(origin_lat)
+    enu[:, 1] = (points[:, 0] - origin_lat) * METERS_PER_DEGREE_LATITUDE
+    return enu
 
-    dy = spacing_m
-    if dy <= 0:
-        dy = 0.6
 
-    path: list[tuple[float, float]] = []
-    row_idx = 0
-    length_m = 0.0
+def _from_enu(east: np.ndarray, north: np.ndarray, origin: LatLng) -> np.ndarray:
+    """(east, north) metres to (lat, lon) rows; vectorized ``enu_to_latlon``."""
+    origin_lat, origin_lon = origin
+    per_lon = _meters_per_deg_lon(origin_lat)
+    out = np.empty((len(east), 2))
+    out[:, 0] = origin_lat + north / METERS_PER_DEGREE_LATITUDE
+    out[:, 1] = origin_lon + (east / per_lon if abs(per_lon) > 1.0 else 0.0)
+    return out
 
-    y = y_min
-    while y <= y_max + 1e-9 and row_idx < max_rows:
-        bxs = _horizontal_intersections(boundary_enu, y)
-        b_intervals = _intervals_from_intersections(bxs)
 
-        hole_intervals: list[list[Interval]] = []
-        for hole in exclusion_enus:
-            hxs = _horizontal_intersections(hole, y)
-            hole_intervals.append(_intervals_from_intersections(hxs))
+def _rotate(east: np.ndarray, north: np.ndarray, angle_deg: float) -> tuple[np.ndarray, np.ndarray]:
+    """Counter-clockwise rotation in the ENU plane; vectorized ``rotate_enu``."""
+    theta = math.radians(angle_deg)
+    cos_t = math.cos(theta)
+    sin_t = math.sin(theta)
+    return east * cos_t - north * sin_t, east * sin_t + north * cos_t
 
-        intervals = (
-            _subtract_intervals(b_intervals, hole_intervals) if hole_intervals else b_intervals
-        )
 
-        if row_idx % 2 == 0:
-            for xa, xb in intervals:
-                a = (y, xa)
-                b = (y, xb)
-                if not path or path[-1] != a:
-                    path.append(a)
-                path.append(b)
-                # In ENU space, distance is just Euclidean (meters)
-                length_m += ((b[0] - a[0]) ** 2 + (b[1] - a[1]) ** 2) ** 0.5
-        else:
-            for xa, xb in reversed(intervals):
-                a = (y, xb)
-                b = (y, xa)
-                if not path or path[-1] != a:
-                    path.append(a)
-                path.append(b)
-                length_m += ((b[0] - a[0]) ** 2 + (b[1] - a[1]) ** 2) ** 0.5
+def _scan_frame(enu: np.ndarray, angle_deg: float) -> np.ndarray:
+    """ENU ring rotated by ``-angle_deg`` into ``(y, x)`` scanline layout."""
+    rotated_east, rotated_north = _rotate(enu[:, 0], enu[:, 1], -angle_deg)
+    return np.column_stack((rotated_north, rotated_east))
 
-        row_idx += 1
-        y += dy
 
-    return path, row_idx, length_m
+def _scan_to_latlng(points: np.ndarray, angle_deg: float, origin: LatLng) -> np.ndarray:
+    """Inverse of :func:`_scan_frame` followed by ENU -> (lat, lon)."""
+    east, north = _rotate(points[:, 1], points[:, 0], angle_deg)
+    return _from_enu(east, north, origin)
 
 
 def plan_coverage(
@@ -206,86 +322,160 @@ def plan_coverage(
     if spacing_m <= 0:
         spacing_m = 0.6
 
-    # --- fast path for angle=0: use the original lat/lng based algorithm ---
+    boundary_arr = _ring_array(boundary)
+    exclusion_arrs = [_ring_array(poly) for poly in (exclusion_polys or [])]
+
+    # --- fast path for angle=0: scan directly in lat/lng degrees ---
     if abs(angle_deg) < 1e-6:
-        ys = [p[0] for p in boundary]
-        y_min, y_max = min(ys), max(ys)
-        dy = spacing_m / 111320.0
-        if dy <= 0:
-            dy = 0.000005
-
-        path: list[LatLng] = []
-        row_idx = 0
-        length_m = 0.0
-        y = y_min
-        while y <= y_max + 1e-12 and row_idx < max_rows:
-            bxs = _horizontal_intersections(boundary, y)
-            b_intervals = _intervals_from_intersections(bxs)
-
-            hole_intervals: list[list[Interval]] = []
-            if exclusion_polys:
-                for hole in exclusion_polys:
-                    hxs = _horizontal_intersections(hole, y)
-                    hole_intervals.append(_intervals_from_intersections(hxs))
-
-            intervals = (
-                _subtract_intervals(b_intervals, hole_intervals) if hole_intervals else b_intervals
-            )
-            if row_idx % 2 == 0:
-                for xa, xb in intervals:
-                    a = (y, xa)
-                    b = (y, xb)
-                    if not path or path[-1] != a:
-                        path.append(a)
-                    path.append(b)
-                    length_m += haversine_m(a[0], a[1], b[0], b[1])
-            else:
-                for xa, xb in reversed(intervals):
-                    a = (y, xb)
-                    b = (y, xa)
-                    if not path or path[-1] != a:
-                        path.append(a)
-                    path.append(b)
-                    length_m += haversine_m(a[0], a[1], b[0], b[1])
+        dy = spacing_m / METERS_PER_DEGREE_LATITUDE
+        ys = _row_values(
+            float(boundary_arr[:, 0].min()), float(boundary_arr[:, 0].max()), dy, 1e-12, max_rows
+        )
+        path, segments = _serpentine(ys, _scanline_intervals([boundary_arr, *exclusion_arrs], ys))
+        length_m = _haversine_total(segments[:, 0], segments[:, 1], segments[:, 2], segments[:, 3])
+        return (path, len(ys), length_m)
 
-            row_idx += 1
-            y += dy
+    # --- arbitrary angle: ENU + rotation pipeline ---
+    # Rotating by -angle_deg makes the desired bearing the scanline (east) axis.
+    origin = _polygon_centroid_latlon(boundary)
+    boundary_scan = _scan_frame(_to_enu(boundary_arr, origin), angle_deg)
+    exclusion_scans = [_scan_frame(_to_enu(poly, origin), angle_deg) for poly in exclusion_arrs]
+
+    ys = _row_values(
+        float(boundary_scan[:, 0].min()), float(boundary_scan[:, 0].max()), spacing_m, 1e-9, max_rows
+    )
+    scan_path, segments = _serpentine(
+        ys, _scanline_intervals([boundary_scan, *exclusion_scans], ys)
+    )
+    # Rows are horizontal in the scan frame, so each pass is |xb - xa| metres.
+    length_m = float(np.abs(segments[:, 3] - segments[:, 1]).sum())
+    if not scan_path:
+        return ([], len(ys), length_m)
+    geo = _scan_to_latlng(np.asarray(scan_path, dtype=float), angle_deg, origin)
+    return ([(lat, lon) for lat, lon in geo.tolist()], len(ys), length_m)
 
-        return (path, row_idx, length_m)
 
-    # --- arbitrary angle: ENU + rotation pipeline ---
-    origin_lat, origin_lon = _polygon_centroid_latlon(boundary)
-
-    def to_rotated_enu(latlng_poly: list[LatLng], rot_deg: float) -> list[tuple[float, float]]:
-        """Convert lat/lon polygon to ENU (meters) then rotate by rot_deg."""
-        result: list[tuple[float, float]] = []
-        for lat, lon in latlng_poly:
-            east_m, north_m = latlon_to_enu(lat, lon, origin_lat, origin_lon)
-            # Rotate: positive angle_deg means CW from east in compass terms.
-            # We rotate by -angle_deg so scanlines (which scan along "east" in
-            # the rotated frame) align with the desired bearing.
-            re, rn = rotate_enu(east_m, north_m, rot_deg)
-            # Represent as (y, x) = (north, east) so _horizontal_intersections works.
-            result.append((rn, re))
-        return result
-
-    # Rotate boundary and exclusions by -angle_deg
-    boundary_enu = to_rotated_enu(boundary, -angle_deg)
-    exclusion_enus = [to_rotated_enu(ep, -angle_deg) for ep in (exclusion_polys or [])]
-
-    enu_path, row_count, length_m = _run_scanline(
-        boundary_enu, exclusion_enus, spacing_m, max_rows
+# ---------------------------------------------------------------------------
+# Footprint-eroded segments and angle sweep
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _FreeSpace:
+    """Eroded free space in unrotated ENU metres, reusable for every angle."""
+
+    origin: LatLng
+    # One entry per polygon: (exterior, interiors) as (east, north) arrays.
+    polygons: tuple[tuple[np.ndarray, tuple[np.ndarray, ...]], ...]
+    areas: tuple[float, ...]
+
+
+_free_space_cache: OrderedDict[tuple, _FreeSpace] = OrderedDict()
+_free_space_cache_lock = threading.Lock()
+
+
+def _free_space(
+    boundary: list[LatLng], exclusion_polys: list[list[LatLng]] | None, clearance_m: float
+) -> _FreeSpace:
+    """Return the cached eroded free space for this geometry, building it on first use.
+
+    The mitred inward buffer commutes with rotation, so it is computed once
+    in the unrotated frame and shared by every ``angle_deg``.
+    """
+    key = (
+        tuple((float(lat), float(lon)) for lat, lon in boundary),
+        tuple(
+            tuple((float(lat), float(lon)) for lat, lon in poly) for poly in (exclusion_polys or [])
+        ),
+        float(clearance_m),
     )
+    with _free_space_cache_lock:
+        cached = _free_space_cache.get(key)
+        if cached is not None:
+            _free_space_cache.move_to_end(key)
+            return cached
 
-    # Un-rotate and convert back to lat/lon
-    geo_path: list[LatLng] = []
-    for north_m_rot, east_m_rot in enu_path:
-        # enu_path stores (north, east) — swap back to (east, north) for rotate
-        ue, un = rotate_enu(east_m_rot, north_m_rot, +angle_deg)
-        lat, lon = enu_to_latlon(ue, un, origin_lat, origin_lon)
-        geo_path.append((lat, lon))
+    from shapely.geometry import Polygon
+    from shapely.ops import unary_union
 
-    return (geo_path, row_count, length_m)
+    origin = _polygon_centroid_latlon(boundary)
+
+    def to_polygon(poly: list[LatLng]) -> Polygon:
+        polygon = Polygon(_to_enu(_ring_array(poly), origin))
+        return polygon if polygon.is_valid else polygon.buffer(0)
+
+    outer = to_polygon(boundary)
+    holes = [
+        polygon
+        for polygon in (to_polygon(ex) for ex in (exclusion_polys or []) if len(ex) >= 3)
+        if not polygon.is_empty
+    ]
+    free = outer.difference(unary_union(holes)) if holes else outer
+    if clearance_m > 0:
+        free = free.buffer(-float(clearance_m), join_style=2)
+
+    if free.is_empty:
+        polygons = []
+    elif isinstance(free, Polygon):
+        polygons = [free]
+    else:
+        polygons = [
+            geometry
+            for geometry in getattr(free, "geoms", ())
+            if isinstance(geometry, Polygon) and not geometry.is_empty
+        ]
+    result = _FreeSpace(
+        origin=origin,
+        polygons=tuple(
+            (
+                np.asarray(polygon.exterior.coords, dtype=float)[:-1],
+                tuple(np.asarray(ring.coords, dtype=float)[:-1] for ring in polygon.interiors),
+            )
+            for polygon in polygons
+        ),
+        areas=tuple(float(polygon.area) for polygon in polygons),
+    )
+    with _free_space_cache_lock:
+        _free_space_cache[key] = result
+        while len(_free_space_cache) > _FREE_SPACE_CACHE_SIZE:
+            _free_space_cache.popitem(last=False)
+    return result
+
+
+def _segments_in_scan_frame(
+    free: _FreeSpace, angle_deg: float, spacing: float, max_rows: int
+) -> tuple[np.ndarray, int]:
+    """Mow segments ``(ya, xa, yb, xb)`` in the rotated frame, plus rows scanned."""
+    frames = []
+    for (exterior, interiors), area in zip(free.polygons, free.areas, strict=True):
+        outer = _scan_frame(exterior, angle_deg)
+        bounds = (*outer.min(axis=0).tolist(), *outer.max(axis=0).tolist())
+        frames.append(((-area, bounds), outer, [_scan_frame(ring, angle_deg) for ring in interiors]))
+    frames.sort(key=lambda item: item[0])
+
+    chunks: list[np.ndarray] = []
+    row_count = 0
+    direction_forward = True
+    for _key, outer, interiors in frames:
+        ys = _row_values(
+            float(outer[:, 0].min()), float(outer[:, 0].max()), spacing, 1e-9, max_rows - row_count
+        )
+        row_count += len(ys)
+        for y, intervals in zip(ys.tolist(), _scanline_intervals([outer, *interiors], ys), strict=True):
+            if not intervals:
+                continue
+            row = np.asarray(intervals, dtype=float)
+            seg = np.empty((len(row), 4))
+            seg[:, 0] = y
+            seg[:, 2] = y
+            if direction_forward:
+                seg[:, 1], seg[:, 3] = row[:, 0], row[:, 1]
+            else:
+                seg[:, 1], seg[:, 3] = row[::-1, 1], row[::-1, 0]
+            chunks.append(seg)
+            direction_forward = not direction_forward
+    segments = np.concatenate(chunks) if chunks else np.empty((0, 4))
+    return segments, row_count
 
 
 def plan_coverage_segments(
@@ -306,87 +496,76 @@ def plan_coverage_segments(
     if len(boundary) < 3:
         return [], 0, 0.0
 
-    from shapely.geometry import Polygon
-    from shapely.ops import unary_union
-
-    origin_lat, origin_lon = _polygon_centroid_latlon(boundary)
-
-    def to_rotated(poly: list[LatLng]) -> list[tuple[float, float]]:
-        converted: list[tuple[float, float]] = []
-        for lat, lon in poly:
-            east_m, north_m = latlon_to_enu(lat, lon, origin_lat, origin_lon)
-            rotated_east, rotated_north = rotate_enu(east_m, north_m, -angle_deg)
-            converted.append((rotated_north, rotated_east))
-        return converted
-
-    outer = Polygon(to_rotated(boundary))
-    if not outer.is_valid:
-        outer = outer.buffer(0)
-    holes = []
-    for exclusion in exclusion_polys or []:
-        if len(exclusion) < 3:
-            continue
-        polygon = Polygon(to_rotated(exclusion))
-        if not polygon.is_valid:
-            polygon = polygon.buffer(0)
-        if not polygon.is_empty:
-            holes.append(polygon)
-    free_space = outer.difference(unary_union(holes)) if holes else outer
-    if clearance_m > 0:
-        free_space = free_space.buffer(-float(clearance_m), join_style=2)
-    if free_space.is_empty:
+    free = _free_space(boundary, exclusion_polys, clearance_m)
+    if not free.polygons:
         return [], 0, 0.0
+    spacing = spacing_m if spacing_m > 0 else 0.6
+    raw, row_count = _segments_in_scan_frame(free, angle_deg, spacing, max_rows)
+    if len(raw) == 0:
+        return [], row_count, 0.0
+
+    starts = _scan_to_latlng(raw[:, 0:2], angle_deg, free.origin)
+    ends = _scan_to_latlng(raw[:, 2:4], angle_deg, free.origin)
+    segments = [
+        CoverageSegment(start=(a[0], a[1]), end=(b[0], b[1]))
+        for a, b in zip(starts.tolist(), ends.tolist(), strict=True)
+    ]
+    mow_length_m = _haversine_total(starts[:, 0], starts[:, 1], ends[:, 0], ends[:, 1])
+    return segments, row_count, mow_length_m
 
-    if isinstance(free_space, Polygon):
-        polygons = [free_space]
-    else:
-        polygons = [
-            geometry
-            for geometry in getattr(free_space, "geoms", ())
-            if isinstance(geometry, Polygon) and not geometry.is_empty
-        ]
-    if not polygons:
-        return [], 0, 0.0
-    raw_segments: list[tuple[tuple[float, float], tuple[float, float]]] = []
-    row_count = 0
-    direction_forward = True
+
+def sweep_coverage_angles(
+    boundary: list[LatLng],
+    exclusion_polys: list[list[LatLng]] | None = None,
+    *,
+    spacing_m: float = 0.6,
+    clearance_m: float = 0.0,
+    angles: Iterable[float] | None = None,
+    step_deg: float = 5.0,
+    turn_cost_m: float = 1.0,
+    max_rows: int = 2000,
+) -> CoverageSweep | None:
+    """Score ``plan_coverage_segments`` over candidate angles and pick the cheapest.
+
+    Passes are symmetric under a 180° turn, so the default candidates are
+    ``0, step_deg, ...`` below 180°. Each angle is scored in metres as mow
+    length plus straight-line transit between consecutive segments plus
+    ``turn_cost_m`` per segment change; ties go to the earlier angle. The
+    eroded free space is built once and only the rotation is redone per
+    angle, so a sweep costs a few scanline passes rather than full plans.
+
+    Returns ``None`` when the area collapses after clearance.
+    """
+    if len(boundary) < 3:
+        return None
+    free = _free_space(boundary, exclusion_polys, clearance_m)
+    if not free.polygons:
+        return None
+    if angles is None:
+        step = step_deg if step_deg > 0 else 5.0
+        angles = np.arange(0.0, 180.0, step).tolist()
     spacing = spacing_m if spacing_m > 0 else 0.6
 
-    for polygon in sorted(polygons, key=lambda item: (-item.area, item.bounds)):
-        exterior = [(float(x), float(y)) for x, y in polygon.exterior.coords[:-1]]
-        interiors = [
-            [(float(x), float(y)) for x, y in ring.coords[:-1]]
-            for ring in polygon.interiors
-        ]
-        ys = [point[0] for point in exterior]
-        y = min(ys)
-        y_max = max(ys)
-        while y <= y_max + 1e-9 and row_count < max_rows:
-            source = _intervals_from_intersections(_horizontal_intersections(exterior, y))
-            hole_intervals = [
-                _intervals_from_intersections(_horizontal_intersections(interior, y))
-                for interior in interiors
-            ]
-            intervals = _subtract_intervals(source, hole_intervals) if hole_intervals else source
-            ordered = intervals if direction_forward else list(reversed(intervals))
-            for start_x, end_x in ordered:
-                if direction_forward:
-                    raw_segments.append(((y, start_x), (y, end_x)))
-                else:
-                    raw_segments.append(((y, end_x), (y, start_x)))
-            if intervals:
-                direction_forward = not direction_forward
-            row_count += 1
-            y += spacing
-
-    def to_latlng(point: tuple[float, float]) -> LatLng:
-        north_rotated, east_rotated = point
-        east_m, north_m = rotate_enu(east_rotated, north_rotated, angle_deg)
-        return enu_to_latlon(east_m, north_m, origin_lat, origin_lon)
-
-    segments = [CoverageSegment(start=to_latlng(a), end=to_latlng(b)) for a, b in raw_segments]
-    mow_length_m = sum(
-        haversine_m(segment.start[0], segment.start[1], segment.end[0], segment.end[1])
-        for segment in segments
-    )
-    return segments, row_count, mow_length_m
+    scores: list[CoverageAngleScore] = []
+    for angle in angles:
+        raw, row_count = _segments_in_scan_frame(free, float(angle), spacing, max_rows)
+        # Rotation preserves distance, so score directly in the scan frame.
+        mow = float(np.abs(raw[:, 3] - raw[:, 1]).sum())
+        gaps = raw[1:, 0:2] - raw[:-1, 2:4]
+        transit = float(np.hypot(gaps[:, 0], gaps[:, 1]).sum())
+        turns = max(len(raw) - 1, 0)
+        scores.append(
+            CoverageAngleScore(
+                angle_deg=float(angle),
+                segment_count=len(raw),
+                row_count=row_count,
+                turns=turns,
+                mow_length_m=mow,
+                transit_length_m=transit,
+                cost_m=mow + transit + turn_cost_m * turns,
+            )
+        )
+    if not scores:
+        return None
+    best = min(scores, key=lambda score: score.cost_m)
+    return CoverageSweep(best_angle_deg=best.angle_deg, best=best, scores=scores)
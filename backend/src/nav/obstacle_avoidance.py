@@ -1,21 +1,26 @@
 """Obstacle avoidance path planner using grid-based A* within a polygon.
 
-The planner operates in a local metric frame anchored to the start point's
-latitude/longitude. Obstacles and boundary are provided as Position lists.
+The planner operates in a local metric frame anchored to the boundary
+centroid. Obstacles and boundary are provided as Position lists.
+
+Free space (boundary minus static exclusions, eroded by the boundary margin)
+is rasterized once into a NumPy occupancy grid and cached per boundary
+revision. Dynamic obstacles are stamped onto that grid incrementally: only
+obstacles that appeared or disappeared since the last plan are rasterized.
+A* then runs over integer cell indices with a capped distance-transform
+clearance cost, and the cell path is shortened by line-of-sight smoothing.
 """
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from heapq import heappop, heappush
-from math import hypot
+from math import ceil, floor, sqrt
 
-# Lazy import shapely to avoid import-time errors when not installed
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:  # pragma: no cover
-    from shapely.geometry import Polygon  # type: ignore
+import numpy as np
 
 from ..models import Position, Waypoint
 from .geoutils import enu_to_latlon, latlon_to_enu
@@ -26,7 +31,24 @@ class AStarConfig:
     grid_resolution_m: float = 0.25
     safety_margin_m: float = 0.1  # Inflate obstacles by this margin
     boundary_margin_m: float = 0.0  # Erode driveable area by mower/uncertainty radius
-    max_expansions: int = 20000
+    max_expansions: int = 250_000
+    clearance_cap_m: float = 0.75  # Cells nearer than this to anything blocked cost extra
+    clearance_weight: float = 1.0  # Extra step cost at zero clearance (0 disables)
+
+
+_SQRT2 = sqrt(2.0)
+# (d_row, d_col, step length in cells)
+_MOVES: tuple[tuple[int, int, float], ...] = (
+    (0, 1, 1.0),
+    (0, -1, 1.0),
+    (1, 0, 1.0),
+    (-1, 0, 1.0),
+    (1, 1, _SQRT2),
+    (1, -1, _SQRT2),
+    (-1, 1, _SQRT2),
+    (-1, -1, _SQRT2),
+)
+_GRID_CACHE_SIZE = 4
 
 
 def _to_xy(lat: float, lon: float, olat: float, olon: float) -> tuple[float, float]:
@@ -51,25 +73,431 @@ def _poly_from_positions(boundary: Sequence[Position], olat: float, olon: float)
     return poly
 
 
-def _obstacles_union(
-    obstacles: Iterable[Sequence[Position]] | None, olat: float, olon: float, inflate: float
-):
-    from shapely.ops import unary_union  # type: ignore
-
-    if not obstacles:
-        return None
-    polys: list[Polygon] = []
-    for obs in obstacles:
-        if len(obs) < 3:
-            continue
-        poly = _poly_from_positions(obs, olat, olon)
-        if inflate > 0:
-            poly = poly.buffer(inflate)
-        if poly.is_valid and poly.area > 0:
-            polys.append(poly)
-    if not polys:
+def _polygon_key(points: Sequence[Position]) -> tuple[tuple[float, float], ...]:
+    return tuple((round(p.latitude, 9), round(p.longitude, 9)) for p in points)
+
+
+def _capped_distance(blocked: np.ndarray, resolution_m: float, cap_m: float) -> np.ndarray:
+    """Chamfer distance (metres) from each cell to the nearest blocked cell, capped at *cap_m*.
+
+    Only distances up to the cap matter for the cost layer, so a handful of
+    vectorized 8-neighbour relaxation sweeps replace a full distance transform.
+    """
+    dist = np.where(blocked, 0.0, np.inf)
+    rows, cols = dist.shape
+    for _ in range(int(ceil(cap_m / resolution_m)) + 1):
+        before = dist.copy()
+        for dr, dc, step in _MOVES:
+            dst = dist[max(dr, 0) : rows + min(dr, 0), max(dc, 0) : cols + min(dc, 0)]
+            src = dist[max(-dr, 0) : rows + min(-dr, 0), max(-dc, 0) : cols + min(-dc, 0)]
+            np.minimum(dst, src + step * resolution_m, out=dst)
+        if np.array_equal(dist, before):
+            break
+    return np.minimum(dist, cap_m)
+
+
+class OccupancyGrid:
+    """Rasterized free space for one boundary revision, plus dynamic obstacles.
+
+    Row ``r``/column ``c`` is the cell centred on
+    ``(x0 + (c + 0.5) * res, y0 + (r + 0.5) * res)`` in the local ENU frame.
+    The outermost ring of cells is always blocked, so neighbour lookups never
+    need bounds checks.
+    """
+
+    def __init__(
+        self,
+        boundary: Sequence[Position],
+        *,
+        exclusions: Iterable[Sequence[Position]] | None = None,
+        resolution_m: float = 0.25,
+        boundary_margin_m: float = 0.0,
+    ) -> None:
+        import shapely  # type: ignore
+        from shapely.ops import unary_union  # type: ignore
+
+        if len(boundary) < 3:
+            raise ValueError("boundary must have at least 3 vertices")
+        self.resolution_m = float(resolution_m)
+        self.origin_lat = sum(p.latitude for p in boundary) / len(boundary)
+        self.origin_lon = sum(p.longitude for p in boundary) / len(boundary)
+        area = _poly_from_positions(boundary, self.origin_lat, self.origin_lon)
+        keep_out = [
+            _poly_from_positions(points, self.origin_lat, self.origin_lon)
+            for points in (exclusions or ())
+            if len(points) >= 3
+        ]
+        if keep_out:
+            area = area.difference(unary_union(keep_out))
+        if boundary_margin_m > 0 and not area.is_empty:
+            area = area.buffer(-boundary_margin_m, join_style=2)
+        self.area = area
+        shapely.prepare(area)
+
+        res = self.resolution_m
+        if area.is_empty:
+            minx = miny = maxx = maxy = 0.0
+        else:
+            minx, miny, maxx, maxy = area.bounds
+        self.x0 = minx - res
+        self.y0 = miny - res
+        self.cols = int(ceil((maxx - minx) / res)) + 3
+        self.rows = int(ceil((maxy - miny) / res)) + 3
+        xs = self.x0 + (np.arange(self.cols) + 0.5) * res
+        ys = self.y0 + (np.arange(self.rows) + 0.5) * res
+        xx, yy = np.meshgrid(xs, ys)
+        static_free = np.zeros((self.rows, self.cols), dtype=bool)
+        if not area.is_empty:
+            static_free = shapely.contains_xy(area, xx, yy)
+        static_free[0, :] = static_free[-1, :] = False
+        static_free[:, 0] = static_free[:, -1] = False
+        self._static_free = static_free
+        self._hits = np.zeros((self.rows, self.cols), dtype=np.int32)
+        self._obstacles: dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+        self._inflate_m: float | None = None
+        self._dirty: list[tuple[np.ndarray, np.ndarray]] = []
+        self._derived_key: tuple[float, float] | None = None
+        self._free: list[bool] = []
+        self._clearance: list[float] = []
+        self._cost: list[float] = []
+        self.lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Dynamic obstacles
+    # ------------------------------------------------------------------
+
+    def set_obstacles(
+        self, obstacles: Iterable[Sequence[Position]] | None, inflate_m: float
+    ) -> bool:
+        """Make the stamped obstacle set equal *obstacles*; returns True if anything changed."""
+        wanted = {
+            _polygon_key(points): points for points in (obstacles or ()) if len(points) >= 3
+        }
+        if inflate_m != self._inflate_m:
+            self._hits[:] = 0
+            self._obstacles.clear()
+            self._inflate_m = inflate_m
+            self._derived_key = None
+        removed = [key for key in self._obstacles if key not in wanted]
+        added = [key for key in wanted if key not in self._obstacles]
+        for key in removed:
+            rows, cols = self._obstacles.pop(key)
+            self._hits[rows, cols] -= 1
+            self._dirty.append((rows, cols))
+        for key in added:
+            rows, cols = self._rasterize_obstacle(wanted[key], inflate_m)
+            self._hits[rows, cols] += 1
+            self._obstacles[key] = (rows, cols)
+            self._dirty.append((rows, cols))
+        return bool(removed or added)
+
+    def _rasterize_obstacle(
+        self, points: Sequence[Position], inflate_m: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        import shapely  # type: ignore
+
+        poly = _poly_from_positions(points, self.origin_lat, self.origin_lon)
+        if inflate_m > 0:
+            poly = poly.buffer(inflate_m)
+        empty = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp))
+        if poly.is_empty:
+            return empty
+        minx, miny, maxx, maxy = poly.bounds
+        res = self.resolution_m
+        c0 = max(0, int(floor((minx - self.x0) / res)))
+        c1 = min(self.cols, int(ceil((maxx - self.x0) / res)) + 1)
+        r0 = max(0, int(floor((miny - self.y0) / res)))
+        r1 = min(self.rows, int(ceil((maxy - self.y0) / res)) + 1)
+        if c0 >= c1 or r0 >= r1:
+            return empty
+        xs = self.x0 + (np.arange(c0, c1) + 0.5) * res
+        ys = self.y0 + (np.arange(r0, r1) + 0.5) * res
+        xx, yy = np.meshgrid(xs, ys)
+        inside = shapely.intersects_xy(poly, xx, yy)
+        rows, cols = np.nonzero(inside)
+        return rows + r0, cols + c0
+
+    # ------------------------------------------------------------------
+    # Derived layers
+    # ------------------------------------------------------------------
+
+    def _refresh(self, cap_m: float, weight: float) -> None:
+        """Bring the free/clearance/cost layers up to date with the stamped obstacles.
+
+        Obstacle changes only affect cells within the clearance cap of the
+        changed cells, so only that window is recomputed.
+        """
+        if self._derived_key != (cap_m, weight):
+            self._dirty.clear()
+            self._recompute(0, self.rows, 0, self.cols, cap_m, weight)
+            self._derived_key = (cap_m, weight)
+            return
+        if not self._dirty:
+            return
+        dirty = [(rows, cols) for rows, cols in self._dirty if rows.size]
+        self._dirty.clear()
+        if not dirty:
+            return
+        reach = int(ceil(cap_m / self.resolution_m)) + 1
+        r0 = max(0, min(int(rows.min()) for rows, _ in dirty) - reach)
+        r1 = min(self.rows, max(int(rows.max()) for rows, _ in dirty) + reach + 1)
+        c0 = max(0, min(int(cols.min()) for _, cols in dirty) - reach)
+        c1 = min(self.cols, max(int(cols.max()) for _, cols in dirty) + reach + 1)
+        self._recompute(r0, r1, c0, c1, cap_m, weight)
+
+    def _recompute(self, r0: int, r1: int, c0: int, c1: int, cap_m: float, weight: float) -> None:
+        reach = int(ceil(cap_m / self.resolution_m)) + 1
+        # Pad the window so clearance at its edge still sees nearby blocked cells.
+        pr0, pr1 = max(0, r0 - reach), min(self.rows, r1 + reach)
+        pc0, pc1 = max(0, c0 - reach), min(self.cols, c1 + reach)
+        blocked = ~self._static_free[pr0:pr1, pc0:pc1] | (self._hits[pr0:pr1, pc0:pc1] > 0)
+        clearance = _capped_distance(blocked, self.resolution_m, cap_m)
+        inner = (slice(r0 - pr0, r1 - pr0), slice(c0 - pc0, c1 - pc0))
+        blocked = blocked[inner]
+        clearance = clearance[inner]
+        if cap_m > 0:
+            cost = 1.0 + weight * (1.0 - clearance / cap_m)
+        else:
+            cost = np.ones_like(clearance)
+        if r0 == 0 and r1 == self.rows and c0 == 0 and c1 == self.cols:
+            # Python lists index faster than NumPy scalars inside the search loop.
+            self._free = (~blocked).ravel().tolist()
+            self._clearance = clearance.ravel().tolist()
+            self._cost = cost.ravel().tolist()
+            return
+        free_rows = (~blocked).tolist()
+        clear_rows = clearance.tolist()
+        cost_rows = cost.tolist()
+        for k, row in enumerate(range(r0, r1)):
+            lo = row * self.cols + c0
+            hi = lo + (c1 - c0)
+            self._free[lo:hi] = free_rows[k]
+            self._clearance[lo:hi] = clear_rows[k]
+            self._cost[lo:hi] = cost_rows[k]
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def cell_of(self, x: float, y: float) -> int | None:
+        col = int(floor((x - self.x0) / self.resolution_m))
+        row = int(floor((y - self.y0) / self.resolution_m))
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row * self.cols + col
         return None
-    return unary_union(polys)
+
+    def cell_center(self, index: int) -> tuple[float, float]:
+        row, col = divmod(index, self.cols)
+        res = self.resolution_m
+        return self.x0 + (col + 0.5) * res, self.y0 + (row + 0.5) * res
+
+    def _nearest_free(self, index: int | None) -> int | None:
+        """The cell itself if free, else its closest free 8-neighbour."""
+        if index is None:
+            return None
+        if self._free[index]:
+            return index
+        cols = self.cols
+        best: tuple[float, int] | None = None
+        for dr, dc, step in _MOVES:
+            n = index + dr * cols + dc
+            if 0 <= n < len(self._free) and self._free[n] and (best is None or step < best[0]):
+                best = (step, n)
+        return best[1] if best else None
+
+    def search(self, start: int, goal: int, max_expansions: int) -> list[int]:
+        """Integer-indexed A* (octile heuristic, no corner cutting). Returns cells or []."""
+        free = self._free
+        cost = self._cost
+        cols = self.cols
+        moves = [
+            (dr * cols + dc, step, dc if dr and dc else 0, dr * cols if dr and dc else 0)
+            for dr, dc, step in _MOVES
+        ]
+        goal_row, goal_col = divmod(goal, cols)
+        diag = _SQRT2 - 2.0
+
+        g = [float("inf")] * len(free)
+        g[start] = 0.0
+        parent: dict[int, int] = {}
+        closed = bytearray(len(free))
+        heap: list[tuple[float, float, int]] = [(0.0, 0.0, start)]
+        expansions = 0
+        while heap and expansions < max_expansions:
+            _, g_cur, cur = heappop(heap)
+            if closed[cur]:
+                continue
+            closed[cur] = 1
+            expansions += 1
+            if cur == goal:
+                path = [cur]
+                while cur in parent:
+                    cur = parent[cur]
+                    path.append(cur)
+                path.reverse()
+                return path
+            cost_cur = cost[cur]
+            for offset, step, side_a, side_b in moves:
+                n = cur + offset
+                if closed[n] or not free[n]:
+                    continue
+                if side_a and not (free[cur + side_a] and free[cur + side_b]):
+                    continue
+                g_new = g_cur + step * 0.5 * (cost_cur + cost[n])
+                if g_new < g[n]:
+                    g[n] = g_new
+                    parent[n] = cur
+                    # Octile distance to the goal, in cells.
+                    row, col = divmod(n, cols)
+                    dx = col - goal_col if col > goal_col else goal_col - col
+                    dy = row - goal_row if row > goal_row else goal_row - row
+                    h = dx + dy + diag * (dx if dx < dy else dy)
+                    heappush(heap, (g_new + h, g_new, n))
+        return []
+
+    def _line_clearance(self, a: int, b: int) -> float:
+        """Minimum clearance along the straight segment between two cell centres (-1 if blocked)."""
+        cols = self.cols
+        ra, ca = divmod(a, cols)
+        rb, cb = divmod(b, cols)
+        steps = 2 * max(abs(rb - ra), abs(cb - ca))
+        if steps == 0:
+            return self._clearance[a]
+        free = self._free
+        clearance = self._clearance
+        lowest = float("inf")
+        # Sample at half-cell spacing. A sample that lands exactly between two
+        # rows (or columns) checks both, so diagonal slips between blocked
+        # cells are caught.
+        for k in range(steps + 1):
+            r = ra + (rb - ra) * k / steps
+            c = ca + (cb - ca) * k / steps
+            rr = int(r + 0.5)
+            cc = int(c + 0.5)
+            rows = (rr, rr - 1) if rr - r == 0.5 else (rr,)
+            cells = (cc, cc - 1) if cc - c == 0.5 else (cc,)
+            for row in rows:
+                base = row * cols
+                for col in cells:
+                    value = clearance[base + col]
+                    if not free[base + col]:
+                        return -1.0
+                    if value < lowest:
+                        lowest = value
+        return lowest
+
+    def smooth(self, cells: list[int]) -> list[int]:
+        """Line-of-sight shortening that never trades away clearance.
+
+        From each anchor, the farthest visible path cell is found by galloping
+        then bisecting, so long straight runs cost O(log n) sight checks.
+        """
+        if len(cells) <= 2:
+            return list(cells)
+        last = len(cells) - 1
+        path_clearance = [self._clearance[index] for index in cells]
+
+        def visible(i: int, j: int) -> bool:
+            needed = min(path_clearance[i : j + 1])
+            return self._line_clearance(cells[i], cells[j]) >= needed - 1e-9
+
+        out = [cells[0]]
+        i = 0
+        while i < last:
+            ok, bad, stride = i + 1, None, 1
+            while ok < last:
+                j = min(last, ok + stride)
+                if not visible(i, j):
+                    bad = j
+                    break
+                ok, stride = j, stride * 2
+            while bad is not None and bad - ok > 1:
+                mid = (ok + bad) // 2
+                if visible(i, mid):
+                    ok = mid
+                else:
+                    bad = mid
+            out.append(cells[ok])
+            i = ok
+        return out
+
+    def plan(
+        self,
+        start: Position,
+        goal: Position,
+        *,
+        obstacles: Iterable[Sequence[Position]] | None = None,
+        config: AStarConfig | None = None,
+    ) -> list[Waypoint]:
+        from shapely.geometry import Point as SPoint  # type: ignore
+
+        cfg = config or AStarConfig()
+        if self.area.is_empty:
+            return []
+        sx, sy = _to_xy(start.latitude, start.longitude, self.origin_lat, self.origin_lon)
+        gx, gy = _to_xy(goal.latitude, goal.longitude, self.origin_lat, self.origin_lon)
+        if not self.area.covers(SPoint(sx, sy)) or not self.area.covers(SPoint(gx, gy)):
+            return []
+        with self.lock:
+            self.set_obstacles(obstacles, cfg.safety_margin_m)
+            self._refresh(cfg.clearance_cap_m, cfg.clearance_weight)
+            start_cell = self._nearest_free(self.cell_of(sx, sy))
+            goal_cell = self._nearest_free(self.cell_of(gx, gy))
+            if start_cell is None or goal_cell is None:
+                return []
+            cells = self.search(start_cell, goal_cell, cfg.max_expansions)
+            if not cells:
+                return []
+            cells = self.smooth(cells)
+            interior = [self.cell_center(index) for index in cells[1:-1]]
+
+        wps = [Waypoint(position=start)]
+        for x, y in interior:
+            lat, lon = _to_ll(x, y, self.origin_lat, self.origin_lon)
+            wps.append(Waypoint(position=Position(latitude=lat, longitude=lon)))
+        wps.append(Waypoint(position=goal))
+        return wps
+
+
+_grid_cache: OrderedDict[tuple, OccupancyGrid] = OrderedDict()
+_grid_cache_lock = threading.Lock()
+
+
+def occupancy_grid_for(
+    boundary: Sequence[Position],
+    *,
+    exclusions: Iterable[Sequence[Position]] | None = None,
+    resolution_m: float = 0.25,
+    boundary_margin_m: float = 0.0,
+) -> OccupancyGrid:
+    """Return the cached grid for this boundary revision, building it on first use.
+
+    The key is the boundary/exclusion geometry itself, so any operating-area
+    revision (hashed or not) gets its own raster.
+    """
+    exclusion_list = [list(points) for points in (exclusions or ())]
+    key = (
+        _polygon_key(boundary),
+        tuple(_polygon_key(points) for points in exclusion_list),
+        float(resolution_m),
+        float(boundary_margin_m),
+    )
+    with _grid_cache_lock:
+        grid = _grid_cache.get(key)
+        if grid is not None:
+            _grid_cache.move_to_end(key)
+            return grid
+    grid = OccupancyGrid(
+        boundary,
+        exclusions=exclusion_list,
+        resolution_m=resolution_m,
+        boundary_margin_m=boundary_margin_m,
+    )
+    with _grid_cache_lock:
+        _grid_cache[key] = grid
+        while len(_grid_cache) > _GRID_CACHE_SIZE:
+            _grid_cache.popitem(last=False)
+    return grid
 
 
 def plan_path_astar(
@@ -78,99 +506,17 @@ def plan_path_astar(
     boundary: Sequence[Position],
     *,
     obstacles: Iterable[Sequence[Position]] | None = None,
+    exclusions: Iterable[Sequence[Position]] | None = None,
     config: AStarConfig | None = None,
 ) -> list[Waypoint]:
-    from shapely.geometry import LineString
-    from shapely.geometry import Point as SPoint  # type: ignore
-    from shapely.prepared import prep  # type: ignore
-
     cfg = config or AStarConfig()
-    olat = start.latitude
-    olon = start.longitude
+    grid = occupancy_grid_for(
+        boundary,
+        exclusions=exclusions,
+        resolution_m=cfg.grid_resolution_m,
+        boundary_margin_m=cfg.boundary_margin_m,
+    )
+    return grid.plan(start, goal, obstacles=obstacles, config=cfg)
 
-    area = _poly_from_positions(boundary, olat, olon)
-    if cfg.boundary_margin_m > 0:
-        area = area.buffer(-cfg.boundary_margin_m, join_style=2)
-        if area.is_empty:
-            return []
-    inflated_obs = _obstacles_union(obstacles, olat, olon, cfg.safety_margin_m)
-    if inflated_obs is not None:
-        free = area.difference(inflated_obs)
-        if free.is_empty:
-            return []
-        area = free
-
-    prepared_area = prep(area)
 
-    sx, sy = _to_xy(start.latitude, start.longitude, olat, olon)
-    gx, gy = _to_xy(goal.latitude, goal.longitude, olat, olon)
-    if not area.covers(SPoint(sx, sy)) or not area.covers(SPoint(gx, gy)):
-        return []
-
-    step = cfg.grid_resolution_m
-
-    def nbrs(nx: float, ny: float) -> list[tuple[float, float]]:
-        # 8-connected grid
-        dirs = [
-            (step, 0),
-            (-step, 0),
-            (0, step),
-            (0, -step),
-            (step, step),
-            (step, -step),
-            (-step, step),
-            (-step, -step),
-        ]
-        res: list[tuple[float, float]] = []
-        for dx, dy in dirs:
-            x2, y2 = nx + dx, ny + dy
-            if prepared_area.covers(SPoint(x2, y2)):
-                res.append((x2, y2))
-        return res
-
-    # A* search
-    open_heap: list[tuple[float, tuple[float, float]]] = []
-    heappush(open_heap, (0.0, (sx, sy)))
-    g: dict[tuple[float, float], float] = {(sx, sy): 0.0}
-    parent: dict[tuple[float, float], tuple[float, float]] = {}
-
-    def h(x: float, y: float) -> float:
-        return hypot(x - gx, y - gy)
-
-    visited = 0
-    closed: set[tuple[float, float]] = set()
-
-    while open_heap and visited < cfg.max_expansions:
-        _, (cx, cy) = heappop(open_heap)
-        if (cx, cy) in closed:
-            continue
-        closed.add((cx, cy))
-        visited += 1
-        if hypot(cx - gx, cy - gy) <= step and area.covers(
-            LineString([(cx, cy), (gx, gy)])
-        ):
-            # reconstruct
-            path: list[tuple[float, float]] = [(cx, cy)]
-            while (cx, cy) in parent:
-                cx, cy = parent[(cx, cy)]
-                path.append((cx, cy))
-            path.reverse()
-            # Convert to waypoints in lat/lon
-            wps: list[Waypoint] = []
-            for x, y in path:
-                lat, lon = _to_ll(x, y, olat, olon)
-                wps.append(Waypoint(position=Position(latitude=lat, longitude=lon)))
-            if not wps or wps[-1].position != goal:
-                wps.append(Waypoint(position=goal))
-            return wps
-        for nx, ny in nbrs(cx, cy):
-            tentative = g[(cx, cy)] + hypot(nx - cx, ny - cy)
-            if (nx, ny) not in g or tentative < g[(nx, ny)]:
-                g[(nx, ny)] = tentative
-                parent[(nx, ny)] = (cx, cy)
-                heappush(open_heap, (tentative + h(nx, ny), (nx, ny)))
-
-    return []
-
-
-__all__ = ["AStarConfig", "plan_path_astar"]
+__all__ = ["AStarConfig", "OccupancyGrid", "occupancy_grid_for", "plan_path_astar"]
@@ -68,6 +68,7 @@ class PathPlanner:
         boundary: Sequence[Position],
         *,
         obstacles: Iterable[Sequence[Position]] | None = None,
+        exclusions: Iterable[Sequence[Position]] | None = None,
         grid_resolution_m: float = 0.25,
         safety_margin_m: float = 0.1,
         boundary_margin_m: float = 0.0,
@@ -77,7 +78,9 @@ class PathPlanner:
             safety_margin_m=safety_margin_m,
             boundary_margin_m=boundary_margin_m,
         )
-        return plan_path_astar(start, goal, boundary, obstacles=obstacles, config=cfg)
+        return plan_path_astar(
+            start, goal, boundary, obstacles=obstacles, exclusions=exclusions, config=cfg
+        )
 
     # Return-to-base helper
     @staticmethod
@@ -13,6 +13,7 @@ HEADING_EMA_ALPHA_IMU = 0.3        # responsive when IMU is the source
 HEADING_EMA_ALPHA_GPS = 0.12       # ~5-tick window @ 5 Hz when only GPS COG
 HEADING_SLEW_DEG_PER_TICK_IMU = 30.0   # essentially uncapped
 HEADING_SLEW_DEG_PER_TICK_GPS = 8.0    # caps a 30° COG jump to 8°/200 ms
+HEADING_FILTER_REFERENCE_PERIOD_S = 0.2  # tick period the constants above were tuned at
 
 
 def smooth_heading(
@@ -35,6 +36,22 @@ def smooth_heading(
     return (prev + step) % 360.0
 
 
+def heading_filter_for_period(
+    alpha: float,
+    max_step_deg: float,
+    period_s: float,
+    *,
+    reference_period_s: float = HEADING_FILTER_REFERENCE_PERIOD_S,
+) -> tuple[float, float]:
+    """Rescale per-tick EMA alpha and slew cap to another tick period.
+
+    Returns ``(alpha, max_step_deg)`` with the same time response as the
+    inputs had at *reference_period_s*.
+    """
+    ratio = period_s / reference_period_s
+    return 1.0 - (1.0 - alpha) ** ratio, max_step_deg * ratio
+
+
 def heading_error(target: float, current: float) -> float:
     """Return the signed shortest heading delta from *current* to *target* (degrees).
 
@@ -51,16 +51,21 @@ class EventStore:
         mission_id = payload.pop("mission_id", "")
         event_type = payload.pop("event_type", event.event_type)
 
-        with self._persistence.get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO mission_events
-                    (run_id, mission_id, event_type, payload_json, timestamp)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (run_id, mission_id, event_type, json.dumps(payload), timestamp),
-            )
-            conn.commit()
+        # Write-behind: bursts of mission events are group-committed by the
+        # persistence writer thread instead of blocking the caller on fsync.
+        self._persistence.enqueue_write(
+            """
+            INSERT INTO mission_events
+                (run_id, mission_id, event_type, payload_json, timestamp)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (run_id, mission_id, event_type, json.dumps(payload), timestamp),
+        )
+        # Queued right behind the insert, so the run's summary row is
+        # committed in the same group commit as the event it counts.
+        summaries = getattr(self._persistence, "run_summaries", None)
+        if summaries is not None:
+            summaries.apply(run_id, mission_id, event_type, payload, timestamp)
 
     def load_events(
         self,
@@ -71,7 +76,8 @@ class EventStore:
         """Return stored events for a run, optionally filtered by event_type."""
         if self._persistence is None:
             return []
-        with self._persistence.get_connection() as conn:
+        self._persistence.flush()
+        with self._persistence.read_connection() as conn:
             if event_type:
                 cursor = conn.execute(
                     """
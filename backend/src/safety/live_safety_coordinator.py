@@ -17,6 +17,7 @@ from typing import Any
 from ..control.commands import BladeCommand, DriveCommand, EmergencyTrigger
 from ..models.sensor_data import SensorData
 from ..nav.obstacle_clearance import required_obstacle_clearance_m
+from ..services.sensor_scheduler import DeadlineTicker
 from .safety_triggers import get_safety_trigger_manager
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,8 @@ class LiveSafetyStatus:
     tof_right_window_samples: int = 0
     active_faults: set[str] = field(default_factory=set)
     last_fault_reason: str | None = None
+    fast_loop_overruns: int = 0
+    slow_loop_overruns: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         now = time.monotonic()
@@ -62,6 +65,8 @@ class LiveSafetyStatus:
             "tof_right_window_samples": self.tof_right_window_samples,
             "active_faults": sorted(self.active_faults),
             "last_fault_reason": self.last_fault_reason,
+            "fast_loop_overruns": self.fast_loop_overruns,
+            "slow_loop_overruns": self.slow_loop_overruns,
         }
 
 
@@ -108,6 +113,7 @@ class LiveSafetyCoordinator:
         self._slow_task = None
 
     async def _fast_loop(self) -> None:
+        ticker = DeadlineTicker(self.FAST_PERIOD_S)
         while self._status.running:
             try:
                 manager = getattr(self._runtime, "sensor_manager", None)
@@ -141,9 +147,11 @@ class LiveSafetyCoordinator:
             except Exception as exc:
                 logger.warning("Live safety fast loop failed: %s", exc)
                 self._status.last_fault_reason = "LIVE_SAFETY_LOOP_ERROR"
-            await asyncio.sleep(self.FAST_PERIOD_S)
+            await ticker.wait()
+            self._status.fast_loop_overruns = ticker.overruns
 
     async def _slow_loop(self) -> None:
+        ticker = DeadlineTicker(self.SLOW_PERIOD_S)
         while self._status.running:
             try:
                 manager = getattr(self._runtime, "sensor_manager", None)
@@ -160,7 +168,8 @@ class LiveSafetyCoordinator:
             except Exception as exc:
                 logger.warning("Live safety slow loop failed: %s", exc)
                 self._status.last_fault_reason = "LIVE_SAFETY_LOOP_ERROR"
-            await asyncio.sleep(self.SLOW_PERIOD_S)
+            await ticker.wait()
+            self._status.slow_loop_overruns = ticker.overruns
 
     def _actuator_active(self) -> bool:
         try:
@@ -66,6 +66,17 @@ CameraFrameProvider = Callable[[], Awaitable[Any | None]]
 PerceptionResultConsumer = Callable[[InferenceResult], Any]
 
 
+def _as_three_channel(image: np.ndarray) -> np.ndarray:
+    """Return a uint8 HxWx3 view of a capture array (dropping alpha/padding)."""
+    if image.dtype != np.uint8:
+        raise AIInferenceInputError(f"Image array must be uint8, got {image.dtype}")
+    if image.ndim == 2:
+        return np.repeat(image[:, :, None], 3, axis=2)
+    if image.ndim != 3 or image.shape[2] < 3 or image.shape[0] == 0 or image.shape[1] == 0:
+        raise AIInferenceInputError(f"Unsupported image array shape: {image.shape}")
+    return image[:, :, :3]
+
+
 class AIService:
     """AI processing service"""
 
@@ -223,16 +234,62 @@ class AIService:
         """Run inference on uploaded image bytes."""
         if not image_bytes:
             raise AIInferenceInputError("Image payload is empty")
+        return await self._run_detached_inference(
+            image_bytes,
+            task=task,
+            frame_id=frame_id,
+            source_frame_timestamp=source_frame_timestamp,
+            confidence_threshold=confidence_threshold,
+        )
 
+    async def infer_image_array(
+        self,
+        image: np.ndarray,
+        *,
+        color_order: str = "RGB",
+        task: InferenceTask = InferenceTask.OBSTACLE_DETECTION,
+        frame_id: str | None = None,
+        source_frame_timestamp: datetime | None = None,
+        confidence_threshold: float | None = None,
+    ) -> InferenceResult:
+        """Run inference on a capture-side uint8 frame without a JPEG round trip.
+
+        *image* is HxWx3 (or HxWx4 / HxW) in ``color_order`` ("RGB" or "BGR");
+        it may be a view into a shared buffer and is not modified.
+        """
+        if color_order not in ("RGB", "BGR"):
+            raise AIInferenceInputError(f"Unsupported color order: {color_order}")
+        if not isinstance(image, np.ndarray) or image.size == 0:
+            raise AIInferenceInputError("Image array is empty")
+        return await self._run_detached_inference(
+            image,
+            task=task,
+            frame_id=frame_id,
+            source_frame_timestamp=source_frame_timestamp,
+            confidence_threshold=confidence_threshold,
+            color_order=color_order,
+        )
+
+    async def _run_detached_inference(
+        self,
+        image: bytes | np.ndarray,
+        *,
+        task: InferenceTask,
+        frame_id: str | None,
+        source_frame_timestamp: datetime | None,
+        confidence_threshold: float | None,
+        color_order: str = "RGB",
+    ) -> InferenceResult:
         worker_started = asyncio.Event()
         inference_task = asyncio.create_task(
             self._infer_image_bytes_serialized(
-                image_bytes,
+                image,
                 task=task,
                 frame_id=frame_id,
                 source_frame_timestamp=source_frame_timestamp,
                 confidence_threshold=confidence_threshold,
                 worker_started=worker_started,
+                color_order=color_order,
             ),
             name=f"ai-inference-{frame_id or 'upload'}",
         )
@@ -253,13 +310,14 @@ class AIService:
 
     async def _infer_image_bytes_serialized(
         self,
-        image_bytes: bytes,
+        image_bytes: bytes | np.ndarray,
         *,
         task: InferenceTask,
         frame_id: str | None,
         source_frame_timestamp: datetime | None,
         confidence_threshold: float | None,
         worker_started: asyncio.Event,
+        color_order: str = "RGB",
     ) -> InferenceResult:
         """Serialize inference while preserving the lock across caller cancellation."""
         async with self._inference_lock:
@@ -270,6 +328,7 @@ class AIService:
                 else self.ai_processing.confidence_threshold
             )
             worker_started.set()
+            extra: dict[str, Any] = {} if color_order == "RGB" else {"color_order": color_order}
             try:
                 result = await asyncio.to_thread(
                     self._infer_image_bytes_sync,
@@ -278,6 +337,7 @@ class AIService:
                     frame_id=frame_id,
                     source_frame_timestamp=source_frame_timestamp,
                     confidence_threshold=threshold,
+                    **extra,
                 )
             except Exception as exc:
                 self.ai_processing.failed_inferences += 1
@@ -304,32 +364,53 @@ class AIService:
 
     def _infer_image_bytes_sync(
         self,
-        image_bytes: bytes,
+        image_bytes: bytes | np.ndarray,
         *,
         task: InferenceTask,
         frame_id: str | None,
         source_frame_timestamp: datetime | None,
         confidence_threshold: float,
+        color_order: str = "RGB",
     ) -> InferenceResult:
-        """Decode and infer one image in a worker thread."""
+        """Decode (or adopt) and infer one image in a worker thread.
+
+        Encoded payloads are decoded with PIL. Capture arrays skip decoding;
+        when the runtime supports it they are resized straight into its input
+        tensor, and that step is what ``preprocessing_time_ms`` measures.
+        """
         runtime = self._detector_runtime
         if runtime is None or not runtime.ready:
             raise AIModelNotReadyError("Detector runtime is not ready")
         started = time.perf_counter()
 
-        try:
-            preprocess_start = time.perf_counter()
-            image = Image.open(BytesIO(image_bytes)).convert("RGB")
-            original_width, original_height = image.size
-            rgb = np.asarray(image, dtype=np.uint8)
+        preprocess_start = time.perf_counter()
+        if isinstance(image_bytes, np.ndarray):
+            pixels = _as_three_channel(image_bytes)
+            swap_rb = color_order == "BGR"
+        else:
+            try:
+                image = Image.open(BytesIO(image_bytes)).convert("RGB")
+                pixels = np.asarray(image, dtype=np.uint8)
+            except UnidentifiedImageError as exc:
+                raise AIInferenceInputError(f"Unsupported image payload: {exc}") from exc
+            except Exception as exc:
+                raise AIInferenceInputError(f"Unable to decode image payload: {exc}") from exc
+            swap_rb = False
+        original_height, original_width = pixels.shape[:2]
+
+        prepare_input = getattr(runtime, "prepare_input", None)
+        infer_prepared = getattr(runtime, "infer_prepared", None)
+        if callable(prepare_input) and callable(infer_prepared):
+            input_tensor = prepare_input(pixels, swap_rb=swap_rb)
             preprocessing_time_ms = (time.perf_counter() - preprocess_start) * 1000.0
-        except UnidentifiedImageError as exc:
-            raise AIInferenceInputError(f"Unsupported image payload: {exc}") from exc
-        except Exception as exc:
-            raise AIInferenceInputError(f"Unable to decode image payload: {exc}") from exc
-
-        inference_start = time.perf_counter()
-        runtime_detections = runtime.infer(rgb, confidence_threshold)
+            inference_start = time.perf_counter()
+            runtime_detections = infer_prepared(input_tensor, confidence_threshold)
+        else:
+            if swap_rb:
+                pixels = pixels[:, :, ::-1]
+            preprocessing_time_ms = (time.perf_counter() - preprocess_start) * 1000.0
+            inference_start = time.perf_counter()
+            runtime_detections = runtime.infer(pixels, confidence_threshold)
         inference_time_ms = (time.perf_counter() - inference_start) * 1000.0
 
         postprocess_start = time.perf_counter()
@@ -402,12 +483,17 @@ class AIService:
 
     async def infer_camera_frame(
         self,
-        image_bytes: bytes,
+        image_bytes: bytes | np.ndarray,
         *,
         frame_id: str,
         source_frame_timestamp: datetime | None = None,
+        color_order: str = "RGB",
     ) -> InferenceResult | None:
-        """Best-effort sampled-camera inference with explicit unavailable semantics."""
+        """Best-effort sampled-camera inference with explicit unavailable semantics.
+
+        The camera owner passes its raw capture array when it has one, so
+        sampled frames are never JPEG-encoded just to be decoded again here.
+        """
         if not self.initialized:
             await self.initialize()
         if (
@@ -419,6 +505,13 @@ class AIService:
             return None
 
         try:
+            if isinstance(image_bytes, np.ndarray):
+                return await self.infer_image_array(
+                    image_bytes,
+                    color_order=color_order,
+                    frame_id=frame_id,
+                    source_frame_timestamp=source_frame_timestamp,
+                )
             return await self.infer_image_bytes(
                 image_bytes,
                 frame_id=frame_id,
@@ -444,6 +537,18 @@ class AIService:
         if frame is None:
             raise AINoFrameAvailableError("No camera frame available for inference")
 
+        captured = frame.get_raw_image() if hasattr(frame, "get_raw_image") else None
+        if captured is not None:
+            image, color_order = captured
+            return await self.infer_image_array(
+                image,
+                color_order=color_order,
+                task=task,
+                frame_id=getattr(frame.metadata, "frame_id", None),
+                source_frame_timestamp=getattr(frame.metadata, "timestamp", None),
+                confidence_threshold=confidence_threshold,
+            )
+
         frame_bytes: bytes | None = None
         if hasattr(frame, "get_frame_data"):
             frame_bytes = frame.get_frame_data()
@@ -9,11 +9,16 @@ higher-level auth API. The facade methods adapt to the underlying
 AuthService implementation where possible.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
 import os
 import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -40,6 +45,17 @@ from ..models.auth_security_config import (
 
 logger = logging.getLogger(__name__)
 
+# bcrypt at 12 rounds costs ~250 ms of CPU on a Pi 4. Running it here keeps
+# logins from stalling the event loop (telemetry, manual drive); two workers
+# bound the CPU a login storm can take, and extra attempts simply queue.
+_CREDENTIAL_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="auth-hash")
+
+
+async def run_credential_work(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking password-hash call on the bounded credential pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_CREDENTIAL_EXECUTOR, func, *args)
+
 
 class AuthStatePersistenceError(RuntimeError):
     """Raised when durable authentication revocation state cannot be committed."""
@@ -83,6 +99,77 @@ class PasswordManager:
         except ValueError:
             return False
 
+    async def hash_password_async(self, password: str) -> str:
+        return await run_credential_work(self.hash_password, password)
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        return await run_credential_work(self.verify_password, plain_password, hashed_password)
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of JWTs whose signature and expiry have already been checked.
+
+    Keyed by the raw token, so a hit skips the HMAC verification and claim
+    parsing on every authenticated request. An entry expires at the token's
+    ``exp`` or after ``ttl_seconds``, whichever comes first, and only matches
+    the signing key it was verified with. Revocation drops a session's
+    entries via ``discard_session``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[dict[str, Any], str, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str, signing_key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(token)
+        if entry is None:
+            self.misses += 1
+            return None
+        payload, key, valid_until = entry
+        if key != signing_key or self._clock() >= valid_until:
+            del self._entries[token]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return payload
+
+    def put(self, token: str, signing_key: str, payload: dict[str, Any]) -> None:
+        try:
+            expires = float(payload["exp"])
+        except (KeyError, TypeError, ValueError):
+            return
+        valid_until = min(expires, self._clock() + self.ttl_seconds)
+        self._entries[token] = (payload, signing_key, valid_until)
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard_session(self, session_id: str) -> int:
+        stale = [
+            token for token, (payload, _, _) in self._entries.items()
+            if payload.get("sid") == session_id
+        ]
+        for token in stale:
+            del self._entries[token]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class JWTConfigurationError(RuntimeError):
     """Raised when JWT signing cannot operate with a safe configured secret."""
@@ -262,6 +349,7 @@ class AuthService:
         self.password_manager = PasswordManager()
         self.jwt_manager = JWTManager()
         self.rate_limiter = RateLimiter(failure_limit=5, lockout_seconds=30)
+        self._verified_tokens = VerifiedTokenCache()
 
         # Single shared operator credential (per constitutional requirement)
         self._simulation_mode = os.getenv("SIM_MODE", "0") == "1"
@@ -436,6 +524,7 @@ class AuthService:
         )
 
     def _revoke_session_id(self, session_id: str, expires_at: datetime) -> None:
+        self._verified_tokens.discard_session(session_id)
         expiry = self._revocation_high_water(expires_at)
         if expiry <= datetime.now(UTC):
             return
@@ -470,10 +559,12 @@ class AuthService:
             return f"ip:{client_ip}"
         return "anon"
 
-    def _validate_credential(self, credential: str) -> bool:
+    async def _validate_credential(self, credential: str) -> bool:
         if self._simulation_mode:
             return bool(credential)
-        return self.password_manager.verify_password(credential, self.operator_credential_hash)
+        return await self.password_manager.verify_password_async(
+            credential, self.operator_credential_hash
+        )
 
     def _issue_token_for_session(self, session: UserSession) -> AuthResult:
         self._require_revocation_store()
@@ -550,7 +641,7 @@ class AuthService:
                 retry_after=retry_after,
             )
 
-        if not self._validate_credential(credential):
+        if not await self._validate_credential(credential):
             retry_after = self.rate_limiter.record_failure(key)
             logger.warning(
                 "auth.login.failure",
@@ -680,9 +771,13 @@ class AuthService:
         if not self._revocation_store_healthy:
             logger.error("Rejected JWT because durable revocation state is unavailable")
             return None
-        payload = self.jwt_manager.verify_token(token)
-        if not payload:
-            return None
+        signing_key = self.jwt_manager.secret_key
+        payload = self._verified_tokens.get(token, signing_key)
+        cached = payload is not None
+        if payload is None:
+            payload = self.jwt_manager.verify_token(token)
+            if not payload:
+                return None
 
         session_id = payload.get("sid")
         if not session_id:
@@ -694,6 +789,8 @@ class AuthService:
                 extra={"correlation_id": get_correlation_id(), "session_id": session_id},
             )
             return None
+        if not cached:
+            self._verified_tokens.put(token, signing_key, payload)
 
         session = self.active_sessions.get(session_id)
         if session is None:
@@ -881,14 +978,16 @@ class AuthService:
     ) -> bool:
         """Update the operator credential"""
         # Verify current credential
-        if not self.password_manager.verify_password(
+        if not await self.password_manager.verify_password_async(
             current_credential, self.operator_credential_hash
         ):
             logger.warning("Failed attempt to update operator credential")
             return False
 
         # Update credential
-        self.operator_credential_hash = self._hash_credential(new_credential)
+        self.operator_credential_hash = await self.password_manager.hash_password_async(
+            new_credential
+        )
 
         # Invalidate all active sessions (force re-authentication)
         session_ids = list(self.active_sessions.keys())
@@ -958,6 +1057,7 @@ class AuthService:
             "rate_limit_failure_threshold": self.rate_limiter.failure_limit,
             "rate_limit_lockout_seconds": self.rate_limiter.lockout_seconds,
             "audit_logging_enabled": self.audit_logging_enabled,
+            "verified_token_cache_entries": len(self._verified_tokens),
         }
 
     async def generate_api_key(self, session_id: str, description: str = "") -> str | None:
@@ -1032,7 +1132,11 @@ class AuthService:
         if not self.config.password_hash:
             raise AuthenticationError("Invalid credentials")
         ok = bool(
-            bcrypt.checkpw(password.encode("utf-8"), self.config.password_hash.encode("utf-8"))
+            await run_credential_work(
+                bcrypt.checkpw,
+                password.encode("utf-8"),
+                self.config.password_hash.encode("utf-8"),
+            )
         )
         if not ok:
             retry_after = self.rate_limiter.record_failure(key)
@@ -1070,7 +1174,11 @@ class AuthService:
         # Then perform password check if configured
         if self.config.password_hash:
             ok = bool(
-                bcrypt.checkpw(password.encode("utf-8"), self.config.password_hash.encode("utf-8"))
+                await run_credential_work(
+                    bcrypt.checkpw,
+                    password.encode("utf-8"),
+                    self.config.password_hash.encode("utf-8"),
+                )
             )
             if not ok:
                 raise AuthenticationError("Invalid credentials")
@@ -1155,7 +1263,11 @@ class _AuthServiceFacade:
         if not self.config.password_hash:
             raise AuthenticationError("Invalid credentials")
         ok = bool(
-            bcrypt.checkpw(password.encode("utf-8"), self.config.password_hash.encode("utf-8"))
+            await run_credential_work(
+                bcrypt.checkpw,
+                password.encode("utf-8"),
+                self.config.password_hash.encode("utf-8"),
+            )
         )
         if not ok:
             self._failed_attempts[username] = attempts + 1
@@ -1201,7 +1313,11 @@ class _AuthServiceFacade:
         # Then perform password check if configured
         if self.config.password_hash:
             ok = bool(
-                bcrypt.checkpw(password.encode("utf-8"), self.config.password_hash.encode("utf-8"))
+                await run_credential_work(
+                    bcrypt.checkpw,
+                    password.encode("utf-8"),
+                    self.config.password_hash.encode("utf-8"),
+                )
             )
             if not ok:
                 raise AuthenticationError("Invalid credentials")
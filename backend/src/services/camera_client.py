@@ -17,6 +17,7 @@ from typing import Any
 
 from ..models.ai_processing import InferenceResult
 from ..models.camera_stream import CameraFrame, CameraStream, StreamStatistics
+from .camera_frame_ring import FrameRingReader
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +27,12 @@ class CameraClientError(RuntimeError):
 
 
 class CameraClient:
-    """Async facade over the camera owner's newline-delimited JSON protocol."""
+    """Async facade over the camera owner's newline-delimited JSON protocol.
+
+    Frames are read from the owner's shared-memory ring when it advertises
+    one; otherwise they are requested over the socket as a JSON header line
+    followed by the raw JPEG bytes.
+    """
 
     def __init__(
         self,
@@ -72,6 +78,7 @@ class CameraClient:
         self._writer: asyncio.StreamWriter | None = None
         self._request_lock = asyncio.Lock()
         self._last_activity_monotonic: float | None = None
+        self._frame_ring: FrameRingReader | None = None
 
     async def initialize(self) -> bool:
         """Wait briefly for the systemd owner and load its current state."""
@@ -109,15 +116,22 @@ class CameraClient:
     async def get_current_frame(self) -> CameraFrame | None:
         """Fetch the latest frame, including exact-frame AI annotations."""
         self.record_activity()
+        if self._frame_ring is not None:
+            frame = self._frame_ring.latest()
+            if frame is not None:
+                return frame
         try:
-            payload = await self._request("get_frame")
+            payload, raw = await self._exchange("get_frame", encoding="binary")
         except CameraClientError as exc:
             if "No frame available" in str(exc):
                 return None
             raise
         if payload is None:
             return None
-        return CameraFrame.model_validate(payload)
+        frame = CameraFrame.model_validate(payload)
+        if raw is not None:
+            frame.attach_frame_data(raw)
+        return frame
 
     async def get_latest_perception(self) -> InferenceResult | None:
         """Fetch the camera owner's latest full typed inference result."""
@@ -173,6 +187,9 @@ class CameraClient:
     async def shutdown(self) -> None:
         """Close only this client connection; systemd owns service shutdown."""
         await self._close_connection()
+        if self._frame_ring is not None:
+            self._frame_ring.close()
+            self._frame_ring = None
         self.running = False
         self.initialized = False
         # Locks and streams are event-loop bound; a later app lifespan gets a
@@ -219,11 +236,24 @@ class CameraClient:
         self.ai_model_sha256 = (
             reported_model_sha256 if isinstance(reported_model_sha256, str) else None
         )
+        self._use_frame_ring(payload.get("frame_ring_path"))
         self.stream = CameraStream.model_validate(payload)
         self.camera_stream = self.stream
         self.running = True
 
+    def _use_frame_ring(self, path: Any) -> None:
+        if self._frame_ring is not None and self._frame_ring.path == path:
+            return
+        if self._frame_ring is not None:
+            self._frame_ring.close()
+        self._frame_ring = FrameRingReader(path) if isinstance(path, str) and path else None
+
     async def _request(self, command: str, **payload: Any) -> Any:
+        data, _raw = await self._exchange(command, **payload)
+        return data
+
+    async def _exchange(self, command: str, **payload: Any) -> tuple[Any, bytes | None]:
+        """Send one command; return its ``data`` and any raw bytes that followed it."""
         request_id = uuid.uuid4().hex
         message = {"command": command, "request_id": request_id, **payload}
         async with self._request_lock:
@@ -257,14 +287,27 @@ class CameraClient:
                         raise CameraClientError(
                             str(response.get("error") or response.get("message") or command)
                         )
-                    return response.get("data")
+                    raw_bytes: bytes | None = None
+                    payload_bytes = response.get("payload_bytes")
+                    if isinstance(payload_bytes, int) and payload_bytes >= 0:
+                        raw_bytes = await asyncio.wait_for(
+                            self._reader.readexactly(payload_bytes),
+                            timeout=self.request_timeout_seconds,
+                        )
+                    return response.get("data"), raw_bytes
                 except asyncio.CancelledError:
                     # Once a command is written, its response may still arrive.
                     # Retire this stream before releasing the shared request lock
                     # so the next command cannot consume that late response.
                     await asyncio.shield(self._close_connection())
                     raise
-                except (OSError, TimeoutError, json.JSONDecodeError, CameraClientError):
+                except (
+                    OSError,
+                    TimeoutError,
+                    json.JSONDecodeError,
+                    asyncio.IncompleteReadError,
+                    CameraClientError,
+                ):
                     await self._close_connection()
                     if attempt == 1:
                         raise
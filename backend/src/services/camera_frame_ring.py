@@ -0,0 +1,242 @@
+"""Memory-mapped ring of the latest camera frames, shared by owner and clients.
+
+The camera owner writes each processed frame into one of ``slots`` fixed-size
+slots of a file under the runtime directory (tmpfs on the Pi). API-side
+clients map the same file read-only and read the newest frame directly, so a
+frame is never base64-encoded, JSON-wrapped or pushed through the IPC socket.
+
+Layout (little-endian)::
+
+    header  magic "LBFR" | version u16 | pad u16 | slots u32 | slot_bytes u32
+            | writer_pid u32 | closed u32 | latest_seq u64          (32 bytes)
+    slot i  generation u64 | seq u64 | meta_len u32 | payload_len u32
+            | meta JSON | JPEG payload                 (24 + slot_bytes)
+
+Each slot is guarded by a seqlock: the writer makes ``generation`` odd while
+it copies, even when done. A reader copies the slot and accepts it only if
+the generation was even and unchanged across the copy.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from ..models.camera_stream import CameraFrame
+
+_MAGIC = b"LBFR"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIIIIQ")
+_SLOT_HEADER = struct.Struct("<QQII")
+_LATEST_OFFSET = _HEADER.size - 8
+_CLOSED_OFFSET = _LATEST_OFFSET - 4
+_READ_ATTEMPTS = 4
+
+DEFAULT_SLOTS = 4
+DEFAULT_SLOT_BYTES = 2 * 1024 * 1024
+
+
+def frame_ring_path_for(socket_path: str) -> str:
+    """The ring lives next to the owner's IPC socket, in the same runtime directory."""
+    return str(Path(socket_path).with_suffix(".frames"))
+
+
+class FrameRingWriter:
+    """Single-writer side of the ring; owned by the camera service."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        slots: int = DEFAULT_SLOTS,
+        slot_bytes: int = DEFAULT_SLOT_BYTES,
+    ) -> None:
+        self.path = path
+        self.slots = max(2, int(slots))
+        self.slot_bytes = max(4096, int(slot_bytes))
+        self._stride = _SLOT_HEADER.size + self.slot_bytes
+        self._seq = 0
+        self._mm: mmap.mmap | None = None
+        self.frames_published = 0
+        self.frames_oversize = 0
+
+        size = _HEADER.size + self.slots * self._stride
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Build the new ring under a temporary name and rename it into place,
+        # so a reader never maps a half-initialised file.
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.ftruncate(fd, size)
+            self._mm = mmap.mmap(fd, size)
+            self._inode = os.fstat(fd).st_ino
+        finally:
+            os.close(fd)
+        _HEADER.pack_into(
+            self._mm, 0, _MAGIC, _VERSION, 0, self.slots, self.slot_bytes, os.getpid(), 0, 0
+        )
+        os.replace(tmp_path, path)
+
+    def publish(self, frame: CameraFrame) -> bool:
+        """Copy *frame* into the next slot. Returns False if it did not fit.
+
+        An oversize frame still advances ``latest_seq`` with an empty payload,
+        so readers fall back to the socket instead of serving an older frame.
+        Frames the owner did not JPEG-encode (no viewer demand) are published
+        the same way; the socket request then encodes on demand.
+        """
+        mm = self._mm
+        if mm is None:
+            return False
+        payload = frame.get_frame_data() or b""
+        meta = frame.model_dump_json(exclude={"data"}).encode("utf-8")
+        fits = len(meta) + len(payload) <= self.slot_bytes
+        if not fits:
+            payload = b""
+            self.frames_oversize += 1
+            if len(meta) > self.slot_bytes:
+                meta = b""
+
+        self._seq += 1
+        offset = _HEADER.size + (self._seq % self.slots) * self._stride
+        generation = struct.unpack_from("<Q", mm, offset)[0]
+        struct.pack_into("<Q", mm, offset, generation + 1)
+        struct.pack_into("<QII", mm, offset + 8, self._seq, len(meta), len(payload))
+        start = offset + _SLOT_HEADER.size
+        mm[start : start + len(meta)] = meta
+        start += len(meta)
+        mm[start : start + len(payload)] = payload
+        struct.pack_into("<Q", mm, offset, generation + 2)
+        struct.pack_into("<Q", mm, _LATEST_OFFSET, self._seq)
+        if fits:
+            self.frames_published += 1
+        return fits
+
+    def stats(self) -> dict[str, int | str]:
+        return {
+            "path": self.path,
+            "slots": self.slots,
+            "slot_bytes": self.slot_bytes,
+            "latest_seq": self._seq,
+            "frames_published": self.frames_published,
+            "frames_oversize": self.frames_oversize,
+        }
+
+    def close(self) -> None:
+        """Mark the ring closed for readers, then unlink it."""
+        mm, self._mm = self._mm, None
+        if mm is None:
+            return
+        struct.pack_into("<I", mm, _CLOSED_OFFSET, 1)
+        mm.close()
+        try:
+            # Only remove the file if it is still ours; a restarted owner may
+            # already have replaced it.
+            if os.stat(self.path).st_ino == self._inode:
+                os.unlink(self.path)
+        except OSError:
+            pass
+
+
+class FrameRingReader:
+    """Read-only view of an owner's ring, reopened if the owner restarts."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._mm: mmap.mmap | None = None
+        self._inode: int | None = None
+        self._slots = 0
+        self._stride = 0
+        self._writer_pid = 0
+        self._cached_seq = 0
+        self._cached: CameraFrame | None = None
+        self.reads = 0
+        self.retries = 0
+
+    def latest(self) -> CameraFrame | None:
+        """Return the newest complete frame, or None if the ring cannot serve one.
+
+        The same ``CameraFrame`` object is returned until the owner publishes a
+        newer frame, so polling viewers cost one header read per call.
+        """
+        mm = self._mapped()
+        if mm is None:
+            return None
+        for _ in range(_READ_ATTEMPTS):
+            seq = struct.unpack_from("<Q", mm, _LATEST_OFFSET)[0]
+            if seq == 0:
+                return None
+            if seq == self._cached_seq:
+                return self._cached
+            offset = _HEADER.size + (seq % self._slots) * self._stride
+            before, slot_seq, meta_len, payload_len = _SLOT_HEADER.unpack_from(mm, offset)
+            if before % 2 or slot_seq != seq:
+                self.retries += 1
+                continue
+            start = offset + _SLOT_HEADER.size
+            meta = mm[start : start + meta_len]
+            payload = mm[start + meta_len : start + meta_len + payload_len]
+            if struct.unpack_from("<Q", mm, offset)[0] != before:
+                self.retries += 1
+                continue
+            self.reads += 1
+            frame: CameraFrame | None = None
+            if payload_len and meta_len:
+                frame = CameraFrame.model_validate_json(meta)
+                frame.attach_frame_data(payload)
+            self._cached_seq, self._cached = seq, frame
+            return frame
+        return None
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+        self._mm = None
+        self._inode = None
+        self._cached_seq, self._cached = 0, None
+
+    def _mapped(self) -> mmap.mmap | None:
+        mm = self._mm
+        if mm is not None and not self._stale(mm):
+            return mm
+        self.close()
+        try:
+            with open(self.path, "rb") as handle:
+                inode = os.fstat(handle.fileno()).st_ino
+                mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(mm) < _HEADER.size:
+            mm.close()
+            return None
+        magic, version, _pad, slots, slot_bytes, pid, closed, _latest = _HEADER.unpack_from(mm, 0)
+        stride = _SLOT_HEADER.size + slot_bytes
+        if (
+            magic != _MAGIC
+            or version != _VERSION
+            or closed
+            or slots <= 0
+            or len(mm) < _HEADER.size + slots * stride
+        ):
+            mm.close()
+            return None
+        self._mm, self._inode = mm, inode
+        self._slots, self._stride, self._writer_pid = slots, stride, pid
+        return mm
+
+    def _stale(self, mm: mmap.mmap) -> bool:
+        if struct.unpack_from("<I", mm, _CLOSED_OFFSET)[0]:
+            return True
+        try:
+            if os.stat(self.path).st_ino != self._inode:
+                return True
+            os.kill(self._writer_pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+        except OSError:
+            return True
+        return False
@@ -4,6 +4,7 @@ Manages camera capture, streaming, and IPC communication
 """
 
 import asyncio
+import functools
 import io
 import json
 import logging
@@ -30,6 +31,12 @@ from ..models.camera_stream import (
     StreamQuality,
     StreamStatistics,
 )
+from .camera_frame_ring import (
+    DEFAULT_SLOT_BYTES,
+    DEFAULT_SLOTS,
+    FrameRingWriter,
+    frame_ring_path_for,
+)
 
 # Try to import camera libraries with fallbacks for SIM_MODE
 
@@ -69,10 +76,11 @@ class AIFrameProcessor(Protocol):
 
     def __call__(
         self,
-        image_bytes: bytes,
+        image_bytes: Any,
         *,
         frame_id: str,
         source_frame_timestamp: datetime | None = None,
+        color_order: str = "RGB",
     ) -> Awaitable[InferenceResult | None]: ...
 
 
@@ -96,6 +104,17 @@ class CameraStreamService:
         )
         self.stream.service_endpoint = f"unix://{self.socket_path}"
         self._frame_clients: set[asyncio.StreamWriter] = set()
+        # Subset of _frame_clients that asked for header-line + raw JPEG frames.
+        self._binary_frame_clients: set[asyncio.StreamWriter] = set()
+        self._frame_ring: FrameRingWriter | None = None
+        try:
+            self._frame_ring_slots = int(os.getenv("CAMERA_FRAME_RING_SLOTS", str(DEFAULT_SLOTS)))
+            self._frame_ring_slot_bytes = int(
+                os.getenv("CAMERA_FRAME_RING_SLOT_BYTES", str(DEFAULT_SLOT_BYTES))
+            )
+        except ValueError:
+            self._frame_ring_slots = DEFAULT_SLOTS
+            self._frame_ring_slot_bytes = DEFAULT_SLOT_BYTES
         self.frame_callbacks: list[Callable[[CameraFrame], None]] = []
 
         # Threading for camera capture
@@ -155,6 +174,13 @@ class CameraStreamService:
         self._client_drain_timeout = max(0.05, min(timeout_raw, 5.0))
         self._enqueue_timeout = 1.0
         self._last_activity_monotonic: float | None = None
+        # Hardware frames are JPEG-encoded only while someone is watching:
+        # subscribers, callbacks, auto-save, or a frame request this recently.
+        try:
+            demand_raw = float(os.getenv("CAMERA_VIEWER_DEMAND_SECONDS", "5.0"))
+        except ValueError:
+            demand_raw = 5.0
+        self._viewer_demand_seconds = max(0.5, demand_raw)
 
     async def initialize(self) -> bool:
         """Initialize camera service and IPC."""
@@ -378,11 +404,28 @@ class CameraStreamService:
             os.chmod(self.socket_path, 0o600)
 
             logger.info(f"IPC server listening on {self.socket_path}")
+            self._open_frame_ring()
 
         except Exception as e:
             logger.error(f"Failed to setup IPC server: {e}")
             raise
 
+    def _open_frame_ring(self) -> None:
+        """Create the shared frame ring next to the socket; clients fall back to IPC without it."""
+        if self._frame_ring is not None:
+            self._frame_ring.close()
+            self._frame_ring = None
+        if self._frame_ring_slots <= 0:
+            return
+        try:
+            self._frame_ring = FrameRingWriter(
+                frame_ring_path_for(self.socket_path),
+                slots=self._frame_ring_slots,
+                slot_bytes=self._frame_ring_slot_bytes,
+            )
+        except OSError as exc:
+            logger.warning(f"Shared frame ring unavailable; clients will use IPC frames: {exc}")
+
     async def _handle_client_connection(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ):
@@ -404,7 +447,9 @@ class CameraStreamService:
                     message = json.loads(data.decode())
                     if message.get("command") == "unsubscribe_frames":
                         self._frame_clients.discard(writer)
+                        self._binary_frame_clients.discard(writer)
                     response = await self._handle_client_message(message)
+                    payload = response.pop("_payload", None)
                     request_id = message.get("request_id")
                     if request_id is not None:
                         response["request_id"] = request_id
@@ -413,6 +458,10 @@ class CameraStreamService:
                     # Send response
                     response_data = json.dumps(response).encode() + b"\n"
                     writer.write(response_data)
+                    if payload is not None:
+                        # Binary frames: the header line announces payload_bytes
+                        # raw bytes that follow it.
+                        writer.write(payload)
                     await writer.drain()
                     if message.get("command") == "subscribe_frames" and response.get(
                         "status"
@@ -420,6 +469,8 @@ class CameraStreamService:
                         # Subscribe only after the acknowledgement is flushed,
                         # so a frame can never precede the command response.
                         self._frame_clients.add(writer)
+                        if message.get("encoding") == "binary":
+                            self._binary_frame_clients.add(writer)
 
                 except json.JSONDecodeError:
                     logger.warning(f"Invalid JSON from client: {data}")
@@ -432,6 +483,7 @@ class CameraStreamService:
             logger.error(f"Client connection error: {e}")
         finally:
             self._frame_clients.discard(writer)
+            self._binary_frame_clients.discard(writer)
             self.clients.discard(writer)
             self.stream.client_count = len(self.clients)
             writer.close()
@@ -461,6 +513,7 @@ class CameraStreamService:
                     "ai_runtime_ready": self.is_ai_runtime_ready(),
                     "ai_runtime_error": self.ai_runtime_error,
                     "ai_model_sha256": self.ai_model_sha256,
+                    "frame_ring_path": self._frame_ring.path if self._frame_ring else None,
                 }
             )
             return {
@@ -471,6 +524,14 @@ class CameraStreamService:
         elif command == "get_frame":
             frame = await self.get_current_frame()
             if frame:
+                raw = frame.get_frame_data() if message.get("encoding") == "binary" else None
+                if raw:
+                    return {
+                        "status": "success",
+                        "data": frame.model_dump(mode="json", exclude={"data"}),
+                        "payload_bytes": len(raw),
+                        "_payload": raw,
+                    }
                 return {"status": "success", "data": frame.model_dump(mode="json")}
             else:
                 return {"status": "error", "error": "No frame available"}
@@ -606,13 +667,12 @@ class CameraStreamService:
 
                 if self.sim_mode:
                     # In simulation mode, generate frames; in real mode, never simulate
-                    frame_payload = self._generate_simulated_frame()
+                    frame_data, dimensions = self._generate_simulated_frame()
+                    frame = self._create_frame_object(frame_data, dimensions)
                 else:
-                    frame_payload = self._capture_real_frame()
+                    frame = self._capture_real_frame_object()
 
-                if frame_payload:
-                    frame_data, dimensions = frame_payload
-                    frame = self._create_frame_object(frame_data, dimensions)
+                if frame is not None:
                     self._schedule_frame_enqueue(frame)
 
                 # Control frame rate
@@ -768,39 +828,20 @@ class CameraStreamService:
             logger.error("Fallback JPEG encoding failed: %s", exc)
             return None
 
-    def _capture_real_frame(self) -> tuple[bytes, tuple[int, int]] | None:
-        """Capture frame from real camera."""
+    def _capture_real_image(self) -> tuple[Any, str] | None:
+        """Capture one pixel array from the real camera as ``(array, color_order)``."""
         try:
             if PICAMERA_AVAILABLE and isinstance(self.camera, Picamera2):
                 frame = self.camera.capture_array("main")
                 if frame is None:
                     return None
-
-                height, width = frame.shape[:2]
-                encoded = self._encode_numpy_frame_to_jpeg(frame, color_space="RGB")
-                if encoded:
-                    return encoded, (width, height)
-
-                # Fallback to slower capture_file path if encoding failed
-                buffer = io.BytesIO()
-                self.camera.capture_file(buffer, format="jpeg")
-                return buffer.getvalue(), (
-                    self.stream.configuration.width,
-                    self.stream.configuration.height,
-                )
+                return frame, "RGB"
 
             elif OPENCV_AVAILABLE and isinstance(self.camera, cv2.VideoCapture):
                 # Capture with OpenCV
                 ret, frame = self.camera.read()
-
                 if ret:
-                    height, width = frame.shape[:2]
-                    success, buffer = cv2.imencode(
-                        ".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self._resolve_jpeg_quality()]
-                    )
-
-                    if success:
-                        return buffer.tobytes(), (width, height)
+                    return frame, "BGR"
 
             return None
 
@@ -808,6 +849,52 @@ class CameraStreamService:
             logger.error(f"Real frame capture error: {e}")
             return None
 
+    def _capture_real_frame_object(self) -> CameraFrame | None:
+        """Capture a hardware frame, JPEG-encoding it only when a viewer wants it.
+
+        The capture array stays attached to the frame so AI inference can use
+        it directly; frames nobody is watching never touch the encoder.
+        """
+        captured = self._capture_real_image()
+        if captured is None:
+            return None
+        frame_array, color_order = captured
+        height, width = frame_array.shape[:2]
+        frame_data = None
+        if self._viewer_demand():
+            frame_data = self._encode_numpy_frame_to_jpeg(frame_array, color_space=color_order)
+        return self._create_frame_object(
+            frame_data, (width, height), raw_image=frame_array, color_order=color_order
+        )
+
+    def _viewer_demand(self) -> bool:
+        """True when captured frames will be shown, saved or sent somewhere as JPEG."""
+        return bool(
+            self._frame_clients
+            or self.frame_callbacks
+            or self.stream.auto_save_frames
+            or self.has_recent_activity(self._viewer_demand_seconds)
+        )
+
+    async def _ensure_jpeg(self, frame: CameraFrame) -> bool:
+        """Encode a frame's attached capture array on demand; False if impossible."""
+        if frame.get_frame_data() is not None:
+            return True
+        captured = frame.get_raw_image()
+        if captured is None or self._executor_shutdown:
+            return False
+        frame_array, color_order = captured
+        encoded = await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            functools.partial(
+                self._encode_numpy_frame_to_jpeg, frame_array, color_space=color_order
+            ),
+        )
+        if not encoded:
+            return False
+        frame.set_frame_data(encoded)
+        return True
+
     def _discover_opencv_device(self) -> tuple[str, str | None] | None:
         """Identify a usable V4L2 device for OpenCV capture."""
         # Honor explicit request first.
@@ -913,9 +1000,14 @@ class CameraStreamService:
             return minimal, (1, 1)
 
     def _create_frame_object(
-        self, frame_data: bytes, dimensions: tuple[int, int] | None = None
+        self,
+        frame_data: bytes | None,
+        dimensions: tuple[int, int] | None = None,
+        *,
+        raw_image: Any = None,
+        color_order: str = "RGB",
     ) -> CameraFrame:
-        """Create CameraFrame object from raw frame data."""
+        """Create CameraFrame object from JPEG data and/or the capture array."""
         frame_id = f"frame_{self.stream.statistics.frames_captured:06d}"
 
         if dimensions:
@@ -931,11 +1023,14 @@ class CameraStreamService:
             width=width,
             height=height,
             format=FrameFormat.JPEG,
-            size_bytes=len(frame_data),
+            size_bytes=len(frame_data) if frame_data else 0,
         )
 
         frame = CameraFrame(metadata=metadata)
-        frame.set_frame_data(frame_data)
+        if frame_data is not None:
+            frame.set_frame_data(frame_data)
+        if raw_image is not None:
+            frame.attach_raw_image(raw_image, color_order)
 
         return frame
 
@@ -992,7 +1087,11 @@ class CameraStreamService:
             if self.stream.ai_processing_enabled:
                 await self._process_frame_for_ai(frame)
 
-            # Broadcast to connected clients
+            # Shared-memory readers first, then socket subscribers. A frame
+            # captured before anyone subscribed is encoded here on demand.
+            if self._frame_clients:
+                await self._ensure_jpeg(frame)
+            self._publish_frame_to_ring(frame)
             await self._broadcast_frame_to_clients(frame)
 
         except Exception as e:
@@ -1024,18 +1123,28 @@ class CameraStreamService:
         ):
             return
 
-        frame_bytes = frame.get_frame_data()
-        if not frame_bytes:
-            return
+        # Prefer the capture array: the detector resizes it straight into its
+        # input tensor instead of decoding a JPEG made only for viewers.
+        extra: dict[str, Any] = {}
+        captured = frame.get_raw_image()
+        if captured is not None:
+            frame_input, color_order = captured
+            if color_order != "RGB":
+                extra["color_order"] = color_order
+        else:
+            frame_input = frame.get_frame_data()
+            if not frame_input:
+                return
 
         # Count attempts, including failures/unavailable results, so a broken
         # model cannot turn the camera loop into an unbounded retry loop.
         self._last_ai_inference_monotonic = now
         inference_task = asyncio.create_task(
             processor(
-                frame_bytes,
+                frame_input,
                 frame_id=frame.metadata.frame_id,
                 source_frame_timestamp=frame.metadata.timestamp,
+                **extra,
             ),
             name=f"camera-ai-{frame.metadata.frame_id}",
         )
@@ -1184,21 +1293,49 @@ class CameraStreamService:
         self._last_ai_warning_monotonic = now
         logger.warning(message, *args)
 
+    def _publish_frame_to_ring(self, frame: CameraFrame) -> None:
+        ring = self._frame_ring
+        if ring is None:
+            return
+        try:
+            if not ring.publish(frame):
+                self.stream.statistics.buffer_overruns += 1
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Shared frame ring publish failed; disabling ring: {exc}")
+            ring.close()
+            self._frame_ring = None
+
     async def _broadcast_frame_to_clients(self, frame: CameraFrame):
         """Broadcast frame to connected clients."""
         if not self._frame_clients:
             return
 
         try:
-            # Create frame message
-            message = {"type": "frame", "data": frame.model_dump(mode="json")}
-            message_data = json.dumps(message).encode() + b"\n"
+            # Each encoding is built at most once per frame and shared by all
+            # subscribers that asked for it.
+            json_data: bytes | None = None
+            binary_data: bytes | None = None
 
             # Send to all clients
             disconnected_clients = set()
 
             for client in list(self._frame_clients):
                 try:
+                    if client in self._binary_frame_clients and frame.get_frame_data():
+                        if binary_data is None:
+                            raw = frame.get_frame_data() or b""
+                            header = {
+                                "type": "frame",
+                                "data": frame.model_dump(mode="json", exclude={"data"}),
+                                "payload_bytes": len(raw),
+                            }
+                            binary_data = json.dumps(header).encode() + b"\n" + raw
+                        message_data = binary_data
+                    else:
+                        if json_data is None:
+                            message = {"type": "frame", "data": frame.model_dump(mode="json")}
+                            json_data = json.dumps(message).encode() + b"\n"
+                        message_data = json_data
                     client.write(message_data)
                     await asyncio.wait_for(client.drain(), timeout=self._client_drain_timeout)
                     self.stream.statistics.bytes_transmitted += len(message_data)
@@ -1216,6 +1353,7 @@ class CameraStreamService:
             # Clean up disconnected clients
             for client in disconnected_clients:
                 self._frame_clients.discard(client)
+                self._binary_frame_clients.discard(client)
                 self.clients.discard(client)
                 self.stream.client_count = len(self.clients)
                 client.close()
@@ -1236,6 +1374,7 @@ class CameraStreamService:
             filename = f"frame_{timestamp}_{frame.metadata.frame_id}.jpg"
             file_path = self.storage_dir / filename
 
+            await self._ensure_jpeg(frame)
             frame_data = frame.get_frame_data()
             if frame_data:
                 await asyncio.get_event_loop().run_in_executor(
@@ -1253,7 +1392,10 @@ class CameraStreamService:
     async def get_current_frame(self) -> CameraFrame | None:
         """Get the most recent frame."""
         self.record_activity()
-        return self.stream.current_frame
+        frame = self.stream.current_frame
+        if frame is not None:
+            await self._ensure_jpeg(frame)
+        return frame
 
     def record_activity(self) -> None:
         """Record frame demand so idle power policy cannot interrupt a viewer."""
@@ -1520,8 +1662,13 @@ class CameraStreamService:
             )
         self.clients.clear()
         self._frame_clients.clear()
+        self._binary_frame_clients.clear()
         self.stream.client_count = 0
 
+        if self._frame_ring is not None:
+            self._frame_ring.close()
+            self._frame_ring = None
+
         # Clean up socket
         if os.path.exists(self.socket_path):
             os.unlink(self.socket_path)
@@ -0,0 +1,207 @@
+"""Fixed-rate control loop runner for waypoint pursuit.
+
+``ControlLoopRunner`` paces one control tick per period on a
+``DeadlineTicker`` deadline, so the rate does not drift with how long each
+tick took. With ``wake_on_pose`` a new pose sample starts the next tick
+early instead of waiting out the period, but never sooner than
+``1 / MAX_RATE_HZ`` after the previous tick started.
+
+Each tick can be split into named stages (``with runner.stage("steering")``).
+Tick duration, start jitter against the deadline and per-stage durations are
+kept in ``stats()`` and recorded as observability timers
+(``mission_control_tick_duration``, ``mission_control_tick_jitter`` and
+``mission_control_stage_duration{stage=...}``).
+
+A tick that ends without ``wait()`` (a hold that sleeps on its own, or a
+``continue`` straight into the next target) re-anchors the schedule, so a
+long hold is not reported as an overrun.
+
+``tick_interval_s`` is the time the current tick stands for. It is the
+nominal period unless pose wakes are on, in which case it is the measured
+gap since the previous tick start, clamped to ``[1 / MAX_RATE_HZ, period]``.
+Per-tick filters and counters should scale by it rather than by the period.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from ..core.observability import observability
+from .sensor_scheduler import DeadlineTicker
+
+DEFAULT_RATE_HZ = 10.0
+MIN_RATE_HZ = 5.0
+MAX_RATE_HZ = 20.0
+
+TICK_TIMER = "mission_control_tick_duration"
+JITTER_TIMER = "mission_control_tick_jitter"
+STAGE_TIMER = "mission_control_stage_duration"
+
+
+def clamp_rate_hz(rate_hz: float | None) -> float:
+    try:
+        rate = float(rate_hz) if rate_hz is not None else DEFAULT_RATE_HZ
+    except (TypeError, ValueError):
+        rate = DEFAULT_RATE_HZ
+    if not math.isfinite(rate):
+        rate = DEFAULT_RATE_HZ
+    return max(MIN_RATE_HZ, min(MAX_RATE_HZ, rate))
+
+
+@dataclass
+class _DurationStats:
+    count: int = 0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+    total_ms: float = 0.0
+
+    def add(self, value_ms: float) -> None:
+        self.count += 1
+        self.last_ms = value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+        self.total_ms += value_ms
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "last_ms": round(self.last_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class ControlLoopRunner:
+    """Deadline pacing, optional wake-on-pose and per-tick timing for one loop."""
+
+    def __init__(
+        self,
+        rate_hz: float = DEFAULT_RATE_HZ,
+        *,
+        wake_on_pose: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate_hz = clamp_rate_hz(rate_hz)
+        self.period_s = 1.0 / self.rate_hz
+        self.min_interval_s = 1.0 / MAX_RATE_HZ
+        self.wake_on_pose = bool(wake_on_pose)
+        self._clock = clock
+        self._ticker = DeadlineTicker(self.period_s, clock=clock)
+        self._wake: asyncio.Event | None = None
+        self._tick_open = False
+        self._tick_started = 0.0
+        self._tick_started_at = 0.0
+        self._deadline: float | None = None
+        self.tick_interval_s = self.period_s
+        self.pose_wakes = 0
+        self.reanchors = 0
+        self._tick = _DurationStats()
+        self._jitter = _DurationStats()
+        self._stages: dict[str, _DurationStats] = {}
+
+    @property
+    def ticks(self) -> int:
+        return self._tick.count
+
+    def start(self) -> None:
+        """Begin a fresh schedule; call from the loop that will ``wait()``."""
+        self._ticker.reset()
+        self._tick_open = False
+        self._deadline = None
+        self.tick_interval_s = self.period_s
+        self._wake = asyncio.Event() if self.wake_on_pose else None
+
+    def notify_pose_sample(self) -> None:
+        """A new pose is available; wakes a pending ``wait()`` early."""
+        if self._wake is not None:
+            self._wake.set()
+
+    def begin_tick(self) -> None:
+        now = self._clock()
+        resumed = self._tick_open or self._ticker.next_due is None
+        if self._tick_open:
+            # The previous tick never reached wait(); its deadline is stale.
+            self._ticker.reset()
+            self.reanchors += 1
+        elif self._deadline is not None:
+            jitter_ms = abs(now - self._deadline) * 1000.0
+            self._jitter.add(jitter_ms)
+            observability.metrics.record_timer(JITTER_TIMER, jitter_ms)
+        if self.wake_on_pose:
+            measured = self.period_s if resumed else now - self._tick_started_at
+            self.tick_interval_s = min(self.period_s, max(self.min_interval_s, measured))
+        if self._ticker.next_due is None:
+            # Anchor a fresh schedule at this tick's start, not at its wait().
+            self._ticker.next_due = now
+        self._deadline = None
+        self._tick_open = True
+        self._tick_started_at = now
+        self._tick_started = time.perf_counter()
+        if self._wake is not None:
+            self._wake.clear()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000.0
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = _DurationStats()
+            stats.add(duration_ms)
+            observability.metrics.record_timer(STAGE_TIMER, duration_ms, labels={"stage": name})
+
+    def stage_ms(self, name: str) -> float | None:
+        stats = self._stages.get(name)
+        return stats.last_ms if stats is not None else None
+
+    async def wait(self) -> None:
+        """End the current tick and sleep until the next one is due."""
+        if self._tick_open:
+            duration_ms = (time.perf_counter() - self._tick_started) * 1000.0
+            self._tick.add(duration_ms)
+            observability.metrics.record_timer(TICK_TIMER, duration_ms)
+        self._tick_open = False
+        delay = self._ticker.next_delay()
+        self._deadline = self._ticker.next_due
+        if self._wake is None:
+            await asyncio.sleep(delay)
+            return
+        # Wake on a pose sample, but keep at least min_interval_s between tick starts.
+        floor = self._tick_started_at + self.min_interval_s - self._clock()
+        if floor > 0.0:
+            await asyncio.sleep(min(floor, delay))
+        remaining = (self._deadline or 0.0) - self._clock()
+        if remaining <= 0.0:
+            return
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=remaining)
+        except TimeoutError:
+            return
+        # Early tick: the schedule continues one period from now.
+        self.pose_wakes += 1
+        self._deadline = None
+        self._ticker.next_due = self._clock()
+
+    def stats(self) -> dict[str, Any]:
+        ticker = self._ticker.stats()
+        return {
+            "rate_hz": self.rate_hz,
+            "wake_on_pose": self.wake_on_pose,
+            "ticks": self._tick.count,
+            "overruns": ticker["overruns"],
+            "missed_slots": ticker["missed_slots"],
+            "max_lateness_ms": round(ticker["max_lateness_s"] * 1000.0, 3),
+            "pose_wakes": self.pose_wakes,
+            "reanchors": self.reanchors,
+            "tick": self._tick.as_dict(),
+            "jitter": self._jitter.as_dict(),
+            "stages": {name: stats.as_dict() for name, stats in self._stages.items()},
+        }
@@ -90,6 +90,16 @@ class DetectorRuntime(Protocol):
     def infer(self, rgb_image: np.ndarray, confidence_threshold: float) -> list[RuntimeDetection]: ...
 
 
+class PreparedDetectorRuntime(DetectorRuntime, Protocol):
+    """Runtime that can build its input tensor separately from the forward pass."""
+
+    def prepare_input(self, image: np.ndarray, *, swap_rb: bool = False) -> np.ndarray: ...
+
+    def infer_prepared(
+        self, input_tensor: np.ndarray, confidence_threshold: float
+    ) -> list[RuntimeDetection]: ...
+
+
 def _box_iou(box: np.ndarray, boxes: np.ndarray) -> np.ndarray:
     x1 = np.maximum(box[0], boxes[:, 0])
     y1 = np.maximum(box[1], boxes[:, 1])
@@ -283,17 +293,31 @@ class OpenCVDnnDetectorRuntime:
             raise DetectorRuntimeError(f"Failed to validate ONNX detector: {exc}") from exc
 
     def infer(self, rgb_image: np.ndarray, confidence_threshold: float) -> list[RuntimeDetection]:
+        return self.infer_prepared(self.prepare_input(rgb_image), confidence_threshold)
+
+    def prepare_input(self, image: np.ndarray, *, swap_rb: bool = False) -> np.ndarray:
+        """Resize a uint8 HxWx3 frame straight into the NCHW float input tensor.
+
+        ``swap_rb`` lets BGR capture buffers be used as-is; the channel swap
+        happens inside the same pass.
+        """
         if not self.ready or self._network is None or self._cv2 is None:
             raise DetectorRuntimeError("Detector runtime is not ready")
-        blob = self._cv2.dnn.blobFromImage(
-            rgb_image,
+        return self._cv2.dnn.blobFromImage(
+            image,
             scalefactor=1.0 / 255.0,
             size=(self.manifest.input_width, self.manifest.input_height),
             mean=(0.0, 0.0, 0.0),
-            swapRB=False,
+            swapRB=swap_rb,
             crop=False,
         )
-        self._network.setInput(blob)
+
+    def infer_prepared(
+        self, input_tensor: np.ndarray, confidence_threshold: float
+    ) -> list[RuntimeDetection]:
+        if not self.ready or self._network is None or self._cv2 is None:
+            raise DetectorRuntimeError("Detector runtime is not ready")
+        self._network.setInput(input_tensor)
         output = self._network.forward()
         return parse_detector_output(
             output,
@@ -308,6 +332,7 @@ __all__ = [
     "DetectorRuntime",
     "DetectorRuntimeError",
     "OpenCVDnnDetectorRuntime",
+    "PreparedDetectorRuntime",
     "RuntimeDetection",
     "parse_detector_output",
 ]
@@ -1,6 +1,9 @@
 import asyncio
+import heapq
+import itertools
 import uuid
 import zoneinfo
+from collections import deque
 from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
@@ -22,6 +25,64 @@ class _JobAdmissionBlocked(RuntimeError):
 
 
 _MISSION_JOB_TYPES = {JobType.SCHEDULED_MOW, JobType.MANUAL_MOW}
+_TERMINAL_JOB_STATUSES = {JobStatus.COMPLETED, JobStatus.CANCELLED, JobStatus.FAILED}
+_JOB_RETENTION = timedelta(days=30)
+# Upper bound on one scheduler sleep. Due times are wall-clock, and the wall
+# clock can step (NTP sync after boot without an RTC); the re-check is in-memory.
+_MAX_SCHEDULER_SLEEP_S = 60.0
+
+_TimerKey = tuple[str, str]  # ("job" | "planning", job id)
+
+
+class _TimerQueue:
+    """Min-heap of wall-clock due times keyed by job.
+
+    Re-arming or cancelling a key leaves its old heap entry behind; stale
+    entries are skipped when they reach the top.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[datetime, int, _TimerKey]] = []
+        self._due: dict[_TimerKey, datetime] = {}
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, key: _TimerKey) -> bool:
+        return key in self._due
+
+    def due_at(self, key: _TimerKey) -> datetime | None:
+        return self._due.get(key)
+
+    def keys(self, kind: str) -> set[_TimerKey]:
+        return {key for key in self._due if key[0] == kind}
+
+    def arm(self, key: _TimerKey, due: datetime) -> None:
+        if self._due.get(key) == due:
+            return
+        self._due[key] = due
+        heapq.heappush(self._heap, (due, next(self._seq), key))
+
+    def cancel(self, key: _TimerKey) -> None:
+        self._due.pop(key, None)
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._due.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> datetime | None:
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[_TimerKey]:
+        """Remove and return every key due at or before *now*, earliest first."""
+        due: list[_TimerKey] = []
+        while (next_due := self.next_due()) is not None and next_due <= now:
+            _due, _seq, key = heapq.heappop(self._heap)
+            del self._due[key]
+            due.append(key)
+        return due
 
 
 class JobsService:
@@ -40,6 +101,15 @@ class JobsService:
         self._mission_service: MissionService | None = None
         self._websocket_hub: WebSocketHub | None = None
         self._qualification_service: Any | None = None
+        # Scheduler state: next wake-up per job, plus change flags set by
+        # job mutations and persistence notifications between passes.
+        self._timers = _TimerQueue()
+        self._planning_jobs: dict[str, dict[str, Any]] = {}
+        self._dirty_jobs: set[str] = set()
+        self._planning_dirty = False
+        self._scheduler_wake: asyncio.Event | None = None
+        self._scheduler_event_loop: asyncio.AbstractEventLoop | None = None
+        self._unsubscribe_planning_jobs: Callable[[], None] | None = None
 
     # ------------------------------------------------------------------
     # Dependency injection setters
@@ -74,6 +144,7 @@ class JobsService:
         )
 
         self.jobs[job_id] = job
+        self._invalidate_job(job_id)
         return job
 
     def get_job(self, job_id: str) -> Job | None:
@@ -93,7 +164,7 @@ class JobsService:
             jobs = [job for job in jobs if job.job_type == job_type]
 
         # Sort by priority (high to low) then by created_at
-        jobs.sort(key=lambda j: (-j.priority.value, j.created_at))
+        jobs.sort(key=lambda j: (-int(j.priority), j.created_at))
         return jobs
 
     def update_job(self, job_id: str, **updates) -> Job | None:
@@ -106,6 +177,7 @@ class JobsService:
             if hasattr(job, key):
                 setattr(job, key, value)
 
+        self._invalidate_job(job_id)
         return job
 
     def delete_job(self, job_id: str) -> bool:
@@ -119,6 +191,7 @@ class JobsService:
             return False
         if job.status not in {JobStatus.RUNNING, JobStatus.PAUSED}:
             del self.jobs[job_id]
+            self._invalidate_job(job_id)
             return True
         if job.status in {JobStatus.RUNNING, JobStatus.PAUSED}:
             if job.mission_id and self._mission_service is None:
@@ -151,6 +224,7 @@ class JobsService:
         if self.jobs.get(job_id) is not job:
             return False
         del self.jobs[job_id]
+        self._invalidate_job(job_id)
         return True
 
     def start_job(self, job_id: str) -> bool:
@@ -170,6 +244,7 @@ class JobsService:
         job.progress = JobProgress()
         job.result_message = None
         job.error_message = None
+        self._invalidate_job(job.id)
 
         task = loop.create_task(self._execute_job(job), name=f"job-execute:{job.id}")
         self._running_tasks.add(task)
@@ -411,7 +486,7 @@ class JobsService:
         ]
 
         # Sort by priority then scheduled time
-        scheduled_jobs.sort(key=lambda j: (-j.priority.value, j.scheduled_for))
+        scheduled_jobs.sort(key=lambda j: (-int(j.priority), j.scheduled_for))
         return scheduled_jobs[:limit]
 
     async def start_scheduler(self):
@@ -419,13 +494,26 @@ class JobsService:
         if self.scheduler_running:
             return
 
+        from ..core.persistence import persistence
+
         await self._recover_planning_occurrences()
+        self._scheduler_event_loop = asyncio.get_running_loop()
+        self._scheduler_wake = asyncio.Event()
+        self._unsubscribe_planning_jobs = persistence.subscribe_planning_jobs(
+            self._on_planning_job_changed
+        )
+        # First pass loads planning jobs once and arms a timer for every job.
+        self._planning_dirty = True
+        self._dirty_jobs.update(self.jobs)
         self.scheduler_running = True
         self._scheduler_task = asyncio.create_task(self._scheduler_loop())
 
     async def stop_scheduler(self):
         """Stop the job scheduler."""
         self.scheduler_running = False
+        if self._unsubscribe_planning_jobs is not None:
+            self._unsubscribe_planning_jobs()
+            self._unsubscribe_planning_jobs = None
         if self._scheduler_task:
             self._scheduler_task.cancel()
             try:
@@ -459,25 +547,30 @@ class JobsService:
         self._planning_occurrence_tasks.clear()
 
     async def _scheduler_loop(self):
-        """Main scheduler loop."""
+        """Main scheduler loop.
+
+        Sleeps until the earliest job timer is due or a job changes, instead of
+        polling. Planning jobs are read from SQLite only at startup and when
+        persistence reports a planning job save or delete.
+        """
+        wake = self._scheduler_wake
         while self.scheduler_running:
             try:
-                # Check for jobs to start
-                jobs_to_start = self.get_next_scheduled_jobs(5)
-                for job in jobs_to_start:
-                    self.start_job(job.id)
-
-                # Update recurring job schedules
-                self._update_recurring_schedules()
-
-                # Clean up old completed jobs
-                self._cleanup_old_jobs()
-
-                # Dispatch planning jobs from persistence whose next_run has arrived.
-                await self._check_and_dispatch_planning_jobs()
-
-                # Wait before next check
-                await asyncio.sleep(30)  # Check every 30 seconds
+                if wake is not None:
+                    wake.clear()
+                await self._run_scheduler_pass()
+
+                next_due = self._timers.next_due()
+                delay = _MAX_SCHEDULER_SLEEP_S
+                if next_due is not None:
+                    delay = min(delay, (next_due - datetime.now(UTC)).total_seconds())
+                if wake is None:
+                    await asyncio.sleep(max(0.0, delay))
+                    continue
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=max(0.0, delay))
+                except TimeoutError:
+                    pass
 
             except asyncio.CancelledError:
                 break
@@ -493,10 +586,147 @@ class JobsService:
                     exception=e,
                     metadata={"context": "_scheduler_loop"},
                 )
+                self._planning_dirty = True
                 await asyncio.sleep(60)
 
+    # ------------------------------------------------------------------
+    # Scheduler timers
+    # ------------------------------------------------------------------
+
+    def _wake_scheduler(self) -> None:
+        loop, wake = self._scheduler_event_loop, self._scheduler_wake
+        if loop is None or wake is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(wake.set)
+
+    def _invalidate_job(self, job_id: str) -> None:
+        """Re-arm *job_id*'s timer on the scheduler's next pass."""
+        self._dirty_jobs.add(job_id)
+        self._wake_scheduler()
+
+    def _on_planning_job_changed(self, job_id: str) -> None:
+        """Persistence callback; may run on a worker thread."""
+        self._planning_dirty = True
+        self._wake_scheduler()
+
+    async def _run_scheduler_pass(self) -> None:
+        """Re-arm changed jobs, then run every timer that is due."""
+        if self._planning_dirty:
+            self._planning_dirty = False
+            await self._check_and_dispatch_planning_jobs()
+
+        now = datetime.now(UTC)
+        while self._dirty_jobs:
+            self._arm_job_timer(self._dirty_jobs.pop(), now)
+
+        jobs_to_start: list[Job] = []
+        due = deque(self._timers.pop_due(now))
+        try:
+            while due:
+                kind, job_id = due.popleft()
+                if kind == "planning":
+                    job_data = self._planning_jobs.get(job_id)
+                    if job_data is None:
+                        continue
+                    try:
+                        await self._dispatch_planning_job_if_due(job_data, now)
+                    finally:
+                        self._arm_planning_timer(job_data, datetime.now(UTC))
+                    continue
+
+                job = self.jobs.get(job_id)
+                if job is None:
+                    continue
+                if self._recurrence_due(job):
+                    self._advance_recurring_schedule(job, now)
+                elif (
+                    job.status in _TERMINAL_JOB_STATUSES
+                    and job.completed_at
+                    and job.completed_at + _JOB_RETENTION <= now
+                ):
+                    del self.jobs[job_id]
+                    continue
+                if self._start_due(job, now):
+                    jobs_to_start.append(job)
+                self._arm_job_timer(job_id, now)
+        finally:
+            # A failing dispatch must not lose the timers popped after it;
+            # they are still due and are handled on the next pass.
+            for key in due:
+                self._timers.arm(key, now)
+
+        # Same order as get_next_scheduled_jobs(): priority, then scheduled time.
+        jobs_to_start.sort(key=lambda j: (-int(j.priority), j.scheduled_for))
+        for job in jobs_to_start:
+            self.start_job(job.id)
+
+    @staticmethod
+    def _start_due(job: Job, now: datetime) -> bool:
+        return bool(
+            job.status == JobStatus.PENDING
+            and job.enabled
+            and job.scheduled_for
+            and job.scheduled_for <= now
+        )
+
+    @staticmethod
+    def _recurrence_due(job: Job) -> bool:
+        # Without a start_time there is no next run; such a job only ages out.
+        return bool(
+            job.schedule
+            and job.schedule.enabled
+            and job.schedule.start_time
+            and job.status == JobStatus.COMPLETED
+            and job.enabled
+        )
+
+    def _job_timer_due(self, job: Job, now: datetime) -> datetime | None:
+        """When the scheduler next has to look at *job*, if ever."""
+        if job.status == JobStatus.PENDING:
+            return job.scheduled_for if job.enabled and job.scheduled_for else None
+        if self._recurrence_due(job):
+            return job.completed_at or now
+        if job.status in _TERMINAL_JOB_STATUSES and job.completed_at:
+            return job.completed_at + _JOB_RETENTION
+        return None
+
+    def _arm_job_timer(self, job_id: str, now: datetime) -> None:
+        key = ("job", job_id)
+        job = self.jobs.get(job_id)
+        due = self._job_timer_due(job, now) if job is not None else None
+        if due is None:
+            self._timers.cancel(key)
+        else:
+            self._timers.arm(key, due)
+
+    def _planning_next_run(self, job: dict[str, Any], now: datetime) -> datetime | None:
+        if not job.get("enabled", True) or not job.get("schedule"):
+            return None
+        try:
+            next_run = self._calculate_next_run(self._planning_schedule_job(job), now)
+        except Exception as exc:
+            logger.warning(
+                "Planning job %r: cannot compute next run from schedule %r: %s",
+                job.get("id"),
+                job.get("schedule"),
+                exc,
+            )
+            return None
+        return next_run.astimezone(UTC) if next_run is not None else None
+
+    def _arm_planning_timer(self, job: dict[str, Any], now: datetime) -> None:
+        key = ("planning", str(job.get("id")))
+        next_run = self._planning_next_run(job, now)
+        if next_run is None:
+            self._timers.cancel(key)
+        else:
+            self._timers.arm(key, next_run)
+
     async def _check_and_dispatch_planning_jobs(self) -> None:
-        """Load planning jobs from persistence and fire any whose next_run has passed.
+        """Load planning jobs from persistence, fire any that are due and re-arm their timers.
+
+        The scheduler runs this at startup and after every planning job save or
+        delete; between those it only wakes at the next computed occurrence.
 
         ``next_run`` is computed dynamically from the stored ``schedule`` field
         rather than read from the DB (the DB has no ``next_run`` column).  This
@@ -518,92 +748,98 @@ class JobsService:
             logger.warning("Could not load planning jobs for dispatch: %s", exc)
             return
 
+        self._planning_jobs = {str(job.get("id")): job for job in planning_jobs}
+        for key in self._timers.keys("planning"):
+            if key[1] not in self._planning_jobs:
+                self._timers.cancel(key)
+
         now = datetime.now(UTC)
         for job in planning_jobs:
-            if not job.get("enabled", True):
-                continue
+            try:
+                await self._dispatch_planning_job_if_due(job, now)
+            finally:
+                self._arm_planning_timer(job, datetime.now(UTC))
 
-            schedule_raw = job.get("schedule")
-            if not schedule_raw:
-                continue
+    @staticmethod
+    def _planning_schedule_job(job: dict[str, Any]) -> Job:
+        """Build a minimal Job carrying a persisted planning job's schedule."""
+        import json as _json
+
+        from ..models.job import SchedulePattern
 
-            # --- Compute next_run dynamically from the schedule field ---
+        schedule_raw = job.get("schedule")
+        # The schedule column may hold a JSON SchedulePattern or a bare "HH:MM" string.
+        if isinstance(schedule_raw, dict):
+            schedule_dict = schedule_raw
+        else:
             try:
-                import json as _json
+                schedule_dict = _json.loads(schedule_raw)
+            except (ValueError, TypeError):
+                # Treat as plain "HH:MM" string
+                schedule_dict = {"start_time": str(schedule_raw).strip()}
 
-                from ..models.job import Job as JobModel
-                from ..models.job import SchedulePattern
+        schedule = SchedulePattern.model_validate(schedule_dict)
+        return Job(id=job.get("id", "tmp"), name=job.get("name", ""), schedule=schedule)
 
-                # The schedule column may hold a JSON SchedulePattern or a bare "HH:MM" string.
-                if isinstance(schedule_raw, dict):
-                    schedule_dict = schedule_raw
-                else:
-                    try:
-                        schedule_dict = _json.loads(schedule_raw)
-                    except (ValueError, TypeError):
-                        # Treat as plain "HH:MM" string
-                        schedule_dict = {"start_time": str(schedule_raw).strip()}
-
-                schedule = SchedulePattern.model_validate(schedule_dict)
-                # Build a minimal Job-like object for schedule calculations.
-                job_obj = JobModel(
-                    id=job.get("id", "tmp"), name=job.get("name", ""), schedule=schedule
-                )
-                due_occurrence = self._calculate_due_occurrence(job_obj, from_time=now)
-            except Exception as exc:
-                logger.warning(
-                    "Planning job %r: failed to compute next_run from schedule %r — skipping. Error: %s",
-                    job.get("id"),
-                    schedule_raw,
-                    exc,
-                )
-                continue
+    async def _dispatch_planning_job_if_due(self, job: dict[str, Any], now: datetime) -> None:
+        """Dispatch the most recent due occurrence of *job* unless it already ran."""
+        if not job.get("enabled", True):
+            return
 
-            if due_occurrence is None:
-                continue
+        schedule_raw = job.get("schedule")
+        if not schedule_raw:
+            return
 
-            # Don't re-fire if we already successfully started this occurrence.
-            last_run_raw = job.get("last_run")
-            if last_run_raw:
-                try:
-                    last_run = datetime.fromisoformat(last_run_raw)
-                    if last_run.tzinfo is None:
-                        last_run = last_run.replace(tzinfo=UTC)
-                    if last_run >= due_occurrence:
-                        continue
-                except (ValueError, TypeError):
-                    pass  # Unparseable last_run — treat as never run
+        # --- Compute next_run dynamically from the schedule field ---
+        try:
+            due_occurrence = self._calculate_due_occurrence(
+                self._planning_schedule_job(job), from_time=now
+            )
+        except Exception as exc:
+            logger.warning(
+                "Planning job %r: failed to compute next_run from schedule %r — skipping. Error: %s",
+                job.get("id"),
+                schedule_raw,
+                exc,
+            )
+            return
 
+        if due_occurrence is None:
+            return
+
+        # Don't re-fire if we already successfully started this occurrence.
+        last_run_raw = job.get("last_run")
+        if last_run_raw:
             try:
-                await self._dispatch_scheduled_job(job, due_occurrence=due_occurrence)
-            except RuntimeError:
-                # MissionService guard — should not happen since we check above
-                raise
-            except Exception as exc:
-                logger.error(
-                    "Unhandled error dispatching planning job %r: %s",
-                    job.get("id"),
-                    exc,
-                    exc_info=True,
-                )
+                last_run = datetime.fromisoformat(last_run_raw)
+                if last_run.tzinfo is None:
+                    last_run = last_run.replace(tzinfo=UTC)
+                if last_run >= due_occurrence:
+                    return
+            except (ValueError, TypeError):
+                pass  # Unparseable last_run — treat as never run
 
-    def _update_recurring_schedules(self):
-        """Update next_run times for recurring jobs."""
-        now = datetime.now(UTC)
+        try:
+            await self._dispatch_scheduled_job(job, due_occurrence=due_occurrence)
+        except RuntimeError:
+            # MissionService guard — should not happen since we check above
+            raise
+        except Exception as exc:
+            logger.error(
+                "Unhandled error dispatching planning job %r: %s",
+                job.get("id"),
+                exc,
+                exc_info=True,
+            )
 
-        for job in self.jobs.values():
-            if (
-                job.schedule
-                and job.schedule.enabled
-                and job.status == JobStatus.COMPLETED
-                and job.enabled
-            ):
-                # Calculate next run time based on schedule
-                next_run = self._calculate_next_run(job, now)
-                if next_run:
-                    job.next_run = next_run
-                    job.scheduled_for = next_run
-                    job.status = JobStatus.PENDING
+    def _advance_recurring_schedule(self, job: Job, now: datetime) -> None:
+        """Move a completed recurring job to its next run."""
+        # Calculate next run time based on schedule
+        next_run = self._calculate_next_run(job, now)
+        if next_run:
+            job.next_run = next_run
+            job.scheduled_for = next_run
+            job.status = JobStatus.PENDING
 
     @staticmethod
     def _resolve_dst_gap(candidate: datetime, tz: zoneinfo.ZoneInfo) -> datetime:
@@ -689,21 +925,6 @@ class JobsService:
                 return candidate.astimezone(UTC)
         return None
 
-    def _cleanup_old_jobs(self):
-        """Remove old completed jobs."""
-        cutoff_date = datetime.now(UTC) - timedelta(days=30)
-
-        jobs_to_remove = [
-            job_id
-            for job_id, job in self.jobs.items()
-            if job.status in [JobStatus.COMPLETED, JobStatus.CANCELLED, JobStatus.FAILED]
-            and job.completed_at
-            and job.completed_at < cutoff_date
-        ]
-
-        for job_id in jobs_to_remove:
-            del self.jobs[job_id]
-
     async def _admit_job_mission(
         self,
         *,
@@ -1498,6 +1719,7 @@ class JobsService:
         job.completed_at = datetime.now(UTC)
         job.execution_logs.append(job.result_message)
         self._update_job_runtime(job)
+        self._invalidate_job(job.id)
 
     def _finalize_cancelled(self, job: Job, detail: str) -> None:
         job.status = JobStatus.CANCELLED
@@ -1506,6 +1728,7 @@ class JobsService:
         job.error_message = None
         job.execution_logs.append(detail)
         self._update_job_runtime(job)
+        self._invalidate_job(job.id)
 
     def _finalize_failed(self, job: Job, detail: str) -> None:
         job.status = JobStatus.FAILED
@@ -1514,6 +1737,7 @@ class JobsService:
         job.error_message = detail
         job.execution_logs.append(f"Job failed: {detail}")
         self._update_job_runtime(job)
+        self._invalidate_job(job.id)
 
     @staticmethod
     def _update_job_runtime(job: Job) -> None:
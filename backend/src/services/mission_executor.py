@@ -11,6 +11,7 @@ import inspect
 import logging
 import math
 import time
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -26,10 +27,12 @@ from ..nav.waypoint_geometry import (
     compute_tank_speeds,
     cross_track_error,
     heading_error,
+    heading_filter_for_period,
     is_in_tank_mode,
     smooth_heading,
     stanley_steer,
 )
+from .control_loop import DEFAULT_RATE_HZ, ControlLoopRunner
 
 if TYPE_CHECKING:
     from ..models.mission import Mission, MissionWaypoint
@@ -38,6 +41,103 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _LegState:
+    """Mutable per-leg state carried between control ticks of ``go_to_waypoint``."""
+
+    # Stanley path-tracking state
+    # path_a: start of the current path segment (previous waypoint, or mower
+    #   start position captured at the first valid GPS tick on leg 0).
+    # path_bearing: bearing A→B, cached once and constant for the whole leg.
+    # heading_ema: exponential moving average of IMU heading for noise reduction.
+    path_a_lat: float | None = None
+    path_a_lon: float | None = None
+    path_bearing: float | None = None
+    heading_ema: float | None = None
+    # Per-tick EMA alpha and slew cap at HEADING_FILTER_REFERENCE_PERIOD_S;
+    # rescaled to each tick's actual interval when applied.
+    ema_alpha: float = HEADING_EMA_ALPHA_GPS
+    ema_slew: float = HEADING_SLEW_DEG_PER_TICK_GPS
+    heading_wait_start: float | None = None
+    last_nav_log: float = 0.0
+    pre_rotating: bool = False
+    pre_rotation_initialized: bool = False
+
+    # Heading stall detection + escape ladder
+    stall_start: float | None = None
+    stall_heading: float | None = None
+    stall_escape_stage: str | None = None
+
+    # GPS position stall detection
+    gps_stall_ref_lat: float | None = None
+    gps_stall_ref_lon: float | None = None
+    gps_stall_ref_time: float | None = None
+    gps_stall_escape_start: float | None = None
+    gps_stall_escape_phase: str | None = None  # None | "pivot" | "forward" | "recheck"
+    gps_stall_pivot_dir: float = 1.0   # +1 pivot right, -1 pivot left
+
+    # Encoder-aware stuck detectors
+    motor_stall_start: float | None = None
+    wheel_spin_ref_lat: float | None = None
+    wheel_spin_ref_lon: float | None = None
+    wheel_spin_ref_time: float | None = None
+    enc_asym_start: float | None = None
+    encoder_drop_ticks: int = 0
+    encoder_drop_s: float = 0.0
+    encoder_had_activity: bool = False
+
+    # Tank-turn hysteresis and dead-reckoned heading
+    in_tank_mode: bool = False
+    tank_turn_start: float | None = None
+    tank_dr_heading: float | None = None
+    tank_dr_last_t: float | None = None
+    prev_left_speed: float = 0.0
+    prev_right_speed: float = 0.0
+
+    # Position-hold diagnostic
+    pos_hold_start: float | None = None
+    pos_hold_log_last: float = -5.0
+
+    def reanchor(self, position: Position) -> None:
+        """Start a new path segment at *position* (detour point or next target)."""
+        self.path_a_lat = position.latitude
+        self.path_a_lon = position.longitude
+        self.path_bearing = None
+        self.heading_ema = None
+
+
+@dataclass
+class _HeadingEstimate:
+    target: float
+    current: float
+    imu: float
+    err: float
+    raw_abs_err: float
+    bootstrap: bool
+
+
+@dataclass
+class _EscapeCommands:
+    """Escape overrides raised by the stall stages for this tick's steering."""
+
+    stall_active: bool = False
+    stall_boost: float = 0.0
+    force_tank_escape: bool = False
+    force_reverse_escape: bool = False
+    force_gps_pivot: bool = False
+    force_gps_forward: bool = False
+
+
+@dataclass
+class _DriveCommand:
+    left: float
+    right: float
+    base_speed: float
+    steer: float | None = None
+    cte: float | None = None
+    velocity: float | None = None
+
+
 class MissionExecutor:
     """Owns mission lifecycle traversal and waypoint-to-motion conversion.
 
@@ -55,6 +155,9 @@ class MissionExecutor:
         max_waypoint_accuracy_m: GPS accuracy floor in metres (default 5.0).
         position_verification_timeout_seconds: Abort timeout (default 30.0).
         docking_confirmed_provider: Cached dock/charge truth provider used only after a dock leg.
+        control_rate_hz: Waypoint control loop rate, clamped to 5–20 Hz (default 10).
+        wake_on_pose: Start the next control tick as soon as ``notify_pose_sample()``
+            reports a new pose instead of waiting out the period (default False).
     """
 
     def __init__(
@@ -79,6 +182,8 @@ class MissionExecutor:
         max_waypoint_accuracy_m: float = 5.0,
         position_verification_timeout_seconds: float = 30.0,
         max_operational_cross_track_error_m: float = 1.5,
+        control_rate_hz: float = DEFAULT_RATE_HZ,
+        wake_on_pose: bool = False,
     ) -> None:
         self._loc = localization
         self._gw = gateway
@@ -109,6 +214,7 @@ class MissionExecutor:
             from .traction_control_service import get_traction_control_service
             self._tc = get_traction_control_service()
         self._path_planner = PathPlanner()
+        self._control = ControlLoopRunner(control_rate_hz, wake_on_pose=wake_on_pose)
         # Mutable mission state — reset by execute_mission()
         self.current_waypoint_index: int = 0
         self._active: bool = False
@@ -387,6 +493,69 @@ class MissionExecutor:
     # Waypoint pursuit loop (Task 6)
     # ------------------------------------------------------------------
 
+    # GPS position stall detection — fires when mower stops physically moving
+    # while motors are running, independent of heading error.
+    _GPS_STALL_ARM_S: float = 8.0       # seconds without movement → trigger escape
+    _GPS_STALL_MIN_M: float = 0.15      # meters needed to reset the stall timer
+    _GPS_STALL_PIVOT_S: float = 2.0     # pivot phase duration (s)
+    _GPS_STALL_FWD_S: float = 2.5       # forward drive phase duration (s)
+    _GPS_STALL_RECHECK_S: float = 10.0  # recheck window after escape (s)
+
+    # Encoder-aware stuck detectors (Part 3)
+    # Trigger A — motor stall: wheels commanded but not turning
+    _MOTOR_STALL_ARM_S: float = 3.0    # seconds of RPM≈0 with command > threshold
+    _MOTOR_STALL_ABORT_S: float = 6.0  # abort after this long without recovery
+    _MOTOR_STALL_RPM_THRESHOLD: float = 2.0   # RPM below this = stall
+    _MOTOR_STALL_CMD_THRESHOLD: float = 0.2   # min command to arm
+
+    # Trigger B — wheel spin: wheels turning but GPS not moving
+    _WHEEL_SPIN_ARM_S: float = 5.0     # seconds of high-RPM + no-GPS-movement
+    _WHEEL_SPIN_RPM_THRESHOLD: float = 10.0  # RPM above this = wheels turning
+    _WHEEL_SPIN_MIN_M: float = 0.15    # GPS must move this far to reset
+
+    # Trigger C — encoder asymmetry: one wheel significantly faster than the other
+    # during commanded equal-speed driving (shaft slip or mechanical fault indicator).
+    _ENC_ASYM_RATIO: float = 1.5      # flag when faster/slower RPM ratio >= this
+    _ENC_ASYM_MIN_RPM: float = 5.0    # minimum RPM on both wheels to bother checking
+    _ENC_ASYM_CMD_THRESHOLD: float = 0.3  # min equal-speed command to arm (avoids turns)
+    _ENC_ASYM_ARM_S: float = 3.0      # consecutive seconds before logging warning
+
+    # Encoder continuity watchdog: both encoders at 0 RPM under command for this
+    # long (two ticks at the original 5 Hz loop) means a cable is gone.  Time is
+    # summed over tick intervals, so early pose-woken ticks do not shorten it.
+    _ENCODER_DROP_WINDOW_S: float = 0.4
+
+    _TANK_TURN_TIMEOUT_S: float = 25.0
+    # Dead-reckoning heading for tank turns.
+    # GPS COG tracks the antenna's arc (~90° offset from mower heading during a pivot),
+    # so we integrate (left - right) / wheelbase instead while spinning.
+    _TANK_WHEELBASE_M: float = 0.30  # match odometry.py
+
+    def notify_pose_sample(self) -> None:
+        """Wake the control loop early for a fresh pose (when wake-on-pose is on)."""
+        self._control.notify_pose_sample()
+
+    def control_loop_stats(self) -> dict[str, Any]:
+        """Rate, overrun, jitter and per-stage timing of the waypoint control loop."""
+        return self._control.stats()
+
+    def _new_leg_state(self, previous_position: Position | None) -> _LegState:
+        # Detect once per leg whether we are GPS-only (no IMU) for EMA tuning
+        _loc_state_init = getattr(self._loc, "state", None)
+        _imu_valid_for_leg = bool(
+            getattr(self._loc, "imu_valid", getattr(_loc_state_init, "imu_valid", False))
+        )
+        if _imu_valid_for_leg:
+            ema_alpha, ema_slew = HEADING_EMA_ALPHA_IMU, HEADING_SLEW_DEG_PER_TICK_IMU
+        else:
+            ema_alpha, ema_slew = HEADING_EMA_ALPHA_GPS, HEADING_SLEW_DEG_PER_TICK_GPS
+        return _LegState(
+            path_a_lat=previous_position.latitude if previous_position is not None else None,
+            path_a_lon=previous_position.longitude if previous_position is not None else None,
+            ema_alpha=ema_alpha,
+            ema_slew=ema_slew,
+        )
+
     async def go_to_waypoint(
         self,
         mission: Mission,
@@ -400,6 +569,10 @@ class MissionExecutor:
         Returns True when the waypoint is reached, False when interrupted.
         Raises RuntimeError for unrecoverable navigation failures.
 
+        Control ticks are paced by ``ControlLoopRunner`` at ``control_rate_hz``;
+        each tick runs the heading, stall-detector, steering and dispatch
+        stages, timed individually (see ``control_loop_stats()``).
+
         Args:
             previous_position: Position of the previous waypoint (or None for
                 the first leg). Used to define the path line A→B for the Stanley
@@ -420,102 +593,12 @@ class MissionExecutor:
 
         planner = self._path_planner
         verification_wait_start = time.monotonic()
-        heading_wait_start: float | None = None
-        _last_nav_log: float = 0.0
-
-        # Heading stall detection + escape ladder
-        _stall_start: float | None = None
-        _stall_heading: float | None = None
-        _stall_escape_stage: str | None = None
-
-        # GPS position stall detection — fires when mower stops physically moving
-        # while motors are running, independent of heading error.
-        _GPS_STALL_ARM_S: float = 8.0       # seconds without movement → trigger escape
-        _GPS_STALL_MIN_M: float = 0.15      # meters needed to reset the stall timer
-        _GPS_STALL_PIVOT_S: float = 2.0     # pivot phase duration (s)
-        _GPS_STALL_FWD_S: float = 2.5       # forward drive phase duration (s)
-        _GPS_STALL_RECHECK_S: float = 10.0  # recheck window after escape (s)
-        _gps_stall_ref_lat: float | None = None
-        _gps_stall_ref_lon: float | None = None
-        _gps_stall_ref_time: float | None = None
-        _gps_stall_escape_start: float | None = None
-        _gps_stall_escape_phase: str | None = None  # None | "pivot" | "forward" | "recheck"
-        _gps_stall_pivot_dir: float = 1.0   # +1 pivot right, -1 pivot left
-
-        # Encoder-aware stuck detectors (Part 3)
-        # Trigger A — motor stall: wheels commanded but not turning
-        _motor_stall_start: float | None = None
-        _MOTOR_STALL_ARM_S: float = 3.0    # seconds of RPM≈0 with command > threshold
-        _MOTOR_STALL_ABORT_S: float = 6.0  # abort after this long without recovery
-        _MOTOR_STALL_RPM_THRESHOLD: float = 2.0   # RPM below this = stall
-        _MOTOR_STALL_CMD_THRESHOLD: float = 0.2   # min command to arm
-
-        # Trigger B — wheel spin: wheels turning but GPS not moving
-        _wheel_spin_ref_lat: float | None = None
-        _wheel_spin_ref_lon: float | None = None
-        _wheel_spin_ref_time: float | None = None
-        _WHEEL_SPIN_ARM_S: float = 5.0     # seconds of high-RPM + no-GPS-movement
-        _WHEEL_SPIN_RPM_THRESHOLD: float = 10.0  # RPM above this = wheels turning
-        _WHEEL_SPIN_MIN_M: float = 0.15    # GPS must move this far to reset
-
-        # Trigger C — encoder asymmetry: one wheel significantly faster than the other
-        # during commanded equal-speed driving (shaft slip or mechanical fault indicator).
-        _ENC_ASYM_RATIO: float = 1.5      # flag when faster/slower RPM ratio >= this
-        _ENC_ASYM_MIN_RPM: float = 5.0    # minimum RPM on both wheels to bother checking
-        _ENC_ASYM_CMD_THRESHOLD: float = 0.3  # min equal-speed command to arm (avoids turns)
-        _ENC_ASYM_ARM_S: float = 3.0      # consecutive seconds before logging warning
-        _enc_asym_start: float | None = None
-        _encoder_drop_ticks: int = 0
-        _encoder_had_activity: bool = False
-
-        # Tank-turn hysteresis state
-        _in_tank_mode: bool = False
-        _TANK_TURN_TIMEOUT_S: float = 25.0
-        _tank_turn_start: float | None = None
-
-        # Dead-reckoning heading for tank turns.
-        # GPS COG tracks the antenna's arc (~90° offset from mower heading during a pivot),
-        # so we integrate (left - right) / wheelbase instead while spinning.
-        _TANK_WHEELBASE_M: float = 0.30  # match odometry.py
-        _tank_dr_heading: float | None = None
-        _tank_dr_last_t: float | None = None
-        _prev_left_speed: float = 0.0
-        _prev_right_speed: float = 0.0
-
-        # Position-hold diagnostic
-        _pos_hold_start: float | None = None
-        _pos_hold_log_last: float = -5.0
-
-        # Stanley path-tracking state (per-leg)
-        # _path_a: start of the current path segment (previous waypoint, or mower
-        #   start position captured at the first valid GPS tick on leg 0).
-        # _path_bearing: bearing A→B, cached once and constant for the whole leg.
-        # _heading_ema: exponential moving average of IMU heading for noise reduction.
-        _path_a_lat: float | None = (
-            previous_position.latitude if previous_position is not None else None
-        )
-        _path_a_lon: float | None = (
-            previous_position.longitude if previous_position is not None else None
-        )
-        _path_bearing: float | None = None
-        _heading_ema: float | None = None
-        # Detect once per leg whether we are GPS-only (no IMU) for EMA tuning
-        _loc_state_init = getattr(self._loc, "state", None)
-        _imu_valid_for_leg = bool(
-            getattr(self._loc, "imu_valid", getattr(_loc_state_init, "imu_valid", False))
-        )
-        _ema_alpha = HEADING_EMA_ALPHA_IMU if _imu_valid_for_leg else HEADING_EMA_ALPHA_GPS
-        _ema_slew = HEADING_SLEW_DEG_PER_TICK_IMU if _imu_valid_for_leg else HEADING_SLEW_DEG_PER_TICK_GPS
-
-        _pre_rotating: bool = False
-        _pre_rotation_initialized: bool = False
+        leg = self._new_leg_state(previous_position)
+        control = self._control
+        control.start()
 
         while True:
-            # Per-tick locals — reset so debug snapshot never reads stale Stanley values
-            _cte: float | None = None
-            _steer: float | None = None
-            _enc_rpm_a: float = 0.0
-            _enc_rpm_b: float = 0.0
+            control.begin_tick()
 
             status = mission_service.mission_statuses.get(mission.id)
             if not status:
@@ -578,7 +661,7 @@ class MissionExecutor:
                         f"GPS_DEGRADATION_TERMINAL: {getattr(degradation, 'reason', None)}"
                     )
                 if state_value != "nominal":
-                    heading_wait_start = None
+                    leg.heading_wait_start = None
                     await self._enter_safety_hold(
                         reason=f"GPS degradation hold:{state_value}"
                     )
@@ -587,7 +670,7 @@ class MissionExecutor:
 
             current_position = self._loc.current_position
             if current_position is None:
-                heading_wait_start = None
+                leg.heading_wait_start = None
                 await self._enter_safety_hold(reason="missing position hold")
                 if (
                     time.monotonic() - verification_wait_start
@@ -599,16 +682,16 @@ class MissionExecutor:
 
             _confidence = self._position_confidence()
             if _confidence != "full":
-                heading_wait_start = None
+                leg.heading_wait_start = None
                 await self._enter_safety_hold(
                     reason=f"position verification hold:{_confidence}"
                 )
                 _now_mono = time.monotonic()
-                if _pos_hold_start is None:
-                    _pos_hold_start = _now_mono
-                if _now_mono - _pos_hold_log_last >= 5.0:
-                    _pos_hold_log_last = _now_mono
-                    _elapsed = _now_mono - _pos_hold_start
+                if leg.pos_hold_start is None:
+                    leg.pos_hold_start = _now_mono
+                if _now_mono - leg.pos_hold_log_last >= 5.0:
+                    leg.pos_hold_log_last = _now_mono
+                    _elapsed = _now_mono - leg.pos_hold_start
                     logger.info(
                         "Position verification hold active for %.0f s",
                         _elapsed,
@@ -622,8 +705,8 @@ class MissionExecutor:
                 continue
 
             verification_wait_start = time.monotonic()
-            _pos_hold_start = None
-            _pos_hold_log_last = -5.0
+            leg.pos_hold_start = None
+            leg.pos_hold_log_last = -5.0
 
             if await self._obstacle_is_active():
                 if obstacle_hold_started is None:
@@ -658,10 +741,7 @@ class MissionExecutor:
                 obstacle_replans += 1
                 obstacle_was_seen = False
                 obstacle_hold_started = None
-                _path_a_lat = current_position.latitude
-                _path_a_lon = current_position.longitude
-                _path_bearing = None
-                _heading_ema = None
+                leg.reanchor(current_position)
                 logger.info(
                     "Obstacle cleared; following %d blade-off detour points (replan %d/%d)",
                     len(dynamic_targets),
@@ -698,26 +778,23 @@ class MissionExecutor:
                 if len(dynamic_targets) > 1:
                     dynamic_targets.pop(0)
                     target_pos = dynamic_targets[0]
-                    _path_a_lat = current_position.latitude
-                    _path_a_lon = current_position.longitude
-                    _path_bearing = None
-                    _heading_ema = None
+                    leg.reanchor(current_position)
                     continue
                 return True
 
             # --- Stanley path anchor: capture leg-start on first valid GPS tick ---
-            if _path_a_lat is None:
-                _path_a_lat = current_position.latitude
-                _path_a_lon = current_position.longitude
-            if _path_bearing is None:
-                _path_bearing = planner.calculate_bearing(
-                    Position(latitude=_path_a_lat, longitude=_path_a_lon),
+            if leg.path_a_lat is None:
+                leg.path_a_lat = current_position.latitude
+                leg.path_a_lon = current_position.longitude
+            if leg.path_bearing is None:
+                leg.path_bearing = planner.calculate_bearing(
+                    Position(latitude=leg.path_a_lat, longitude=leg.path_a_lon),
                     target_pos,
                 )
 
             _along_track_m, _segment_len_m, _progress_cte = along_track_progress(
                 (current_position.latitude, current_position.longitude),
-                (_path_a_lat, _path_a_lon),
+                (leg.path_a_lat, leg.path_a_lon),
                 (target_pos.latitude, target_pos.longitude),
             )
             if _segment_len_m > 0 and _along_track_m >= _segment_len_m:
@@ -740,10 +817,7 @@ class MissionExecutor:
                     if len(dynamic_targets) > 1:
                         dynamic_targets.pop(0)
                         target_pos = dynamic_targets[0]
-                        _path_a_lat = current_position.latitude
-                        _path_a_lon = current_position.longitude
-                        _path_bearing = None
-                        _heading_ema = None
+                        leg.reanchor(current_position)
                         continue
                     return True
                 if _along_track_m > _segment_len_m + _effective_tol:
@@ -752,760 +826,859 @@ class MissionExecutor:
                         "Waypoint overshoot with excessive cross-track error; revalidation required"
                     )
 
-            # --- Heading and motor calculation ---
-            # Use the cached path bearing (A→B constant for this leg) to avoid
-            # GPS-jitter from recomputing bearing from the current position each tick.
-            heading_to_target = _path_bearing
-            raw_heading = self._loc.heading
-            _in_heading_bootstrap = raw_heading is None
-
-            # Update EMA-filtered heading using smooth_heading() which applies
-            # a shortest-arc EMA with a per-tick slew cap.  GPS-only legs use
-            # tighter alpha/slew to suppress noisy COG jumps.
-            if raw_heading is not None:
-                _heading_ema = smooth_heading(
-                    _heading_ema, raw_heading, alpha=_ema_alpha, max_step_deg=_ema_slew
+            # Snapshot before the pre-rotation gate can clear the stall timer.
+            escape = _EscapeCommands(stall_active=leg.stall_start is not None)
+            with control.stage("heading"):
+                heading = await self._heading_stage(leg)
+            with control.stage("gps_stall"):
+                await self._gps_stall_stage(leg, current_position, heading, escape)
+            with control.stage("encoder_stall"):
+                _enc_rpm_a, _enc_rpm_b = await self._encoder_stall_stage(
+                    leg, current_position, heading, escape
                 )
+            with control.stage("heading_stall"):
+                await self._heading_stall_stage(leg, heading, escape)
+            with control.stage("steering"):
+                command = await self._steering_stage(
+                    leg, waypoint, current_position, target_pos, distance_to_target,
+                    heading, escape,
+                )
+            with control.stage("dispatch"):
+                await self._dispatch_drive_command(command.left, command.right)
 
-            if raw_heading is None:
-                if heading_wait_start is None:
-                    heading_wait_start = time.monotonic()
-                    logger.warning(
-                        "No heading data available; assuming bearing %.1f° to bootstrap motion.",
-                        heading_to_target,
-                    )
-                if (
-                    time.monotonic() - heading_wait_start
-                ) >= self.position_verification_timeout_seconds:
-                    await self._enter_safety_hold(reason="heading unavailable — mission aborted")
-                    raise RuntimeError(
-                        "Heading unavailable while navigating waypoint; mission aborted"
-                    )
-                current_heading = heading_to_target
-                _tank_dr_heading = None
-            elif _in_tank_mode:
-                # During a tank turn the GPS antenna traces an arc (~90° offset from the
-                # mower's actual facing direction), so GPS COG is unreliable.  Dead-reckon
-                # heading from commanded wheel speeds instead.
-                _now_dr = time.monotonic()
-                if _tank_dr_heading is None:
-                    _tank_dr_heading = raw_heading
-                    _tank_dr_last_t = _now_dr
-                else:
-                    _dt_dr = _now_dr - (_tank_dr_last_t or _now_dr)
-                    if _dt_dr > 0 and (_prev_left_speed != 0.0 or _prev_right_speed != 0.0):
-                        _angular_rad_s = (_prev_left_speed - _prev_right_speed) / _TANK_WHEELBASE_M
-                        _tank_dr_heading = (
-                            _tank_dr_heading + _angular_rad_s * _dt_dr * (180.0 / math.pi)
-                        ) % 360.0
-                    _tank_dr_last_t = _now_dr
-                current_heading = _tank_dr_heading
-                heading_wait_start = None
-            else:
-                _tank_dr_heading = None
-                current_heading = raw_heading
-                heading_wait_start = None
+            # Store for next-iteration dead-reckoning
+            leg.prev_left_speed = command.left
+            leg.prev_right_speed = command.right
 
-            control_heading = _heading_ema if _heading_ema is not None else current_heading
-            err = heading_error(target=heading_to_target, current=control_heading)
-            abs_err = abs(err)
+            # Update per-tick debug snapshot (read by NavigationService → telemetry.nav_debug)
+            _tc_boost = self._tc.state.underpower_boost if self._tc is not None else 0.0
+            _k_cte_now, _db_now = self._tiered_stanley_params()
+            _control_stats = control.stats()
+            self._debug_state = {
+                "mode": "tank" if leg.in_tank_mode else ("pre_rotate" if leg.pre_rotating else "blend"),
+                "heading_error_deg": round(heading.err, 1),
+                "raw_heading_error_deg": round(heading.raw_abs_err, 1),
+                "cross_track_error_m": round(command.cte, 3) if command.cte is not None else None,
+                "along_track_progress_m": round(_along_track_m, 3),
+                "path_segment_length_m": round(_segment_len_m, 3),
+                "steer_deg": round(command.steer, 1) if command.steer is not None else None,
+                "path_bearing_deg": round(leg.path_bearing, 1) if leg.path_bearing is not None else None,
+                "velocity_mps": round(command.velocity, 3) if command.velocity is not None else None,
+                "heading_source": getattr(self._loc, "heading_source", None),
+                "pose_quality": getattr(self._loc, "quality", None),
+                "stanley_k_cte": _k_cte_now,
+                "stanley_dead_band_m": _db_now,
+                "distance_to_waypoint_m": round(distance_to_target, 2),
+                "left_speed_cmd": round(command.left, 3),
+                "right_speed_cmd": round(command.right, 3),
+                "base_speed": round(command.base_speed, 3),
+                "stall_boost": round(escape.stall_boost, 2),
+                "traction_boost": round(_tc_boost, 2),
+                "enc_rpm_a": round(_enc_rpm_a, 1),
+                "enc_rpm_b": round(_enc_rpm_b, 1),
+                "pre_rotating": leg.pre_rotating,
+                "in_tank_mode": leg.in_tank_mode,
+                "gps_accuracy_m": round(current_position.accuracy, 3)
+                    if current_position.accuracy is not None
+                    else None,
+                # Control loop timing; tick/jitter figures are for the previous tick.
+                "control_rate_hz": _control_stats["rate_hz"],
+                "control_tick_ms": _control_stats["tick"]["last_ms"],
+                "control_jitter_ms": _control_stats["jitter"]["last_ms"],
+                "control_overruns": _control_stats["overruns"],
+            }
 
-            _now = time.monotonic()
-            if _now - _last_nav_log > 2.0:
-                logger.debug(
-                    "NAV_CONTROL: path_bearing=%.1f° heading=%.1f° ema=%.1f° err=%.1f° tank=%s",
+            await control.wait()
+
+    # ------------------------------------------------------------------
+    # Per-tick control stages
+    # ------------------------------------------------------------------
+
+    async def _heading_stage(self, leg: _LegState) -> _HeadingEstimate:
+        """Filtered heading, heading error to the path bearing and the pre-rotation gate."""
+        # --- Heading and motor calculation ---
+        # Use the cached path bearing (A→B constant for this leg) to avoid
+        # GPS-jitter from recomputing bearing from the current position each tick.
+        heading_to_target = leg.path_bearing
+        raw_heading = self._loc.heading
+        _in_heading_bootstrap = raw_heading is None
+
+        # Update EMA-filtered heading using smooth_heading() which applies
+        # a shortest-arc EMA with a per-tick slew cap.  GPS-only legs use
+        # tighter alpha/slew to suppress noisy COG jumps.  Both are per tick, so
+        # they are rescaled to this tick's interval to keep the tuned time
+        # response at any rate and across early pose wakes.
+        if raw_heading is not None:
+            ema_alpha, ema_slew = heading_filter_for_period(
+                leg.ema_alpha, leg.ema_slew, self._control.tick_interval_s
+            )
+            leg.heading_ema = smooth_heading(
+                leg.heading_ema, raw_heading, alpha=ema_alpha, max_step_deg=ema_slew
+            )
+
+        if raw_heading is None:
+            if leg.heading_wait_start is None:
+                leg.heading_wait_start = time.monotonic()
+                logger.warning(
+                    "No heading data available; assuming bearing %.1f° to bootstrap motion.",
                     heading_to_target,
-                    current_heading,
-                    _heading_ema if _heading_ema is not None else current_heading,
-                    err,
-                    _in_tank_mode,
                 )
-                _last_nav_log = _now
-
-            # Heading stall detection + staged escape ladder.
-            # ALL arm/clear decisions use raw IMU heading (never dead-reckoned).
-            # When Stage B forces _in_tank_mode=True, current_heading switches to
-            # _tank_dr_heading, which has a very high angular rate model and laps
-            # the compass in seconds — causing abs_err to hit 0° spuriously and
-            # falsely clearing the stall.  _raw_abs_err is always from IMU.
-            _stall_boost = 0.0
-            _force_tank_escape = False
-            _force_reverse_escape = False
-            _force_gps_pivot = False
-            _force_gps_forward = False
-            _stall_active = _stall_start is not None
-            _imu_heading = raw_heading if raw_heading is not None else current_heading
-            _raw_abs_err = abs(heading_error(target=heading_to_target, current=_imu_heading))
-
-            # Pre-rotation gate: initialize on first tick with a known bearing.
-            # _path_bearing is set on the same tick as _raw_abs_err is first valid,
-            # so the gate initializes on the first tick with a real bearing.
-            if not _pre_rotation_initialized and _path_bearing is not None:
-                _pre_rotation_initialized = True
-                if _raw_abs_err > self._PRE_ROTATION_ACTIVATE_DEG:
-                    _pre_rotating = True
-                    logger.info(
-                        "Pre-rotation gate active: initial heading error %.1f° > %.0f°",
-                        _raw_abs_err,
-                        self._PRE_ROTATION_ACTIVATE_DEG,
-                    )
-                if _raw_abs_err > 30.0:
-                    logger.warning(
-                        "Bootstrap heading uncertain — first-leg error exceeds 30° (%.1f°); "
-                        "check imu_alignment.json",
-                        _raw_abs_err,
-                    )
-            elif _pre_rotating and _raw_abs_err < self._PRE_ROTATION_CLEAR_DEG:
-                _pre_rotating = False
-                _stall_start = None  # prevent stall timer inheriting pre-rotation time
-                logger.info(
-                    "Pre-rotation gate cleared: heading error %.1f° < %.0f°",
-                    _raw_abs_err,
-                    self._PRE_ROTATION_CLEAR_DEG,
+            if (
+                time.monotonic() - leg.heading_wait_start
+            ) >= self.position_verification_timeout_seconds:
+                await self._enter_safety_hold(reason="heading unavailable — mission aborted")
+                raise RuntimeError(
+                    "Heading unavailable while navigating waypoint; mission aborted"
                 )
-
-            # --- GPS position stall detection ---
-            # Tracks whether the mower is physically moving while motors run.
-            # Operates independently of heading error — catches the case where
-            # heading is aligned but the mower is spinning in place or blocked.
-            if _prev_left_speed == 0.0 and _prev_right_speed == 0.0:
-                # Motors were stopped last iteration; reset the reference so the
-                # stall timer starts fresh when motors restart (avoids false stall
-                # accumulation across position-hold pauses).
-                if _gps_stall_escape_phase is None:
-                    _gps_stall_ref_lat = None
-                    _gps_stall_ref_lon = None
-                    _gps_stall_ref_time = None
-                # NEW: reset encoder-aware detectors when stopped
-                _motor_stall_start = None
-                _wheel_spin_ref_lat = None
-                _wheel_spin_ref_lon = None
-                _wheel_spin_ref_time = None
+            current_heading = heading_to_target
+            leg.tank_dr_heading = None
+        elif leg.in_tank_mode:
+            # During a tank turn the GPS antenna traces an arc (~90° offset from the
+            # mower's actual facing direction), so GPS COG is unreliable.  Dead-reckon
+            # heading from commanded wheel speeds instead.
+            _now_dr = time.monotonic()
+            if leg.tank_dr_heading is None:
+                leg.tank_dr_heading = raw_heading
+                leg.tank_dr_last_t = _now_dr
             else:
-                # Motors were running — track GPS displacement.
-                _cur_lat = current_position.latitude
-                _cur_lon = current_position.longitude
-                if _gps_stall_ref_lat is None:
-                    _gps_stall_ref_lat = _cur_lat
-                    _gps_stall_ref_lon = _cur_lon
-                    _gps_stall_ref_time = time.monotonic()
-                else:
-                    _gps_moved_m = planner.calculate_distance(
-                        Position(latitude=_gps_stall_ref_lat, longitude=_gps_stall_ref_lon),
-                        Position(latitude=_cur_lat, longitude=_cur_lon),
-                    )
-                    if _gps_moved_m >= _GPS_STALL_MIN_M:
-                        # Moved enough — reset reference and clear any escape.
-                        _gps_stall_ref_lat = _cur_lat
-                        _gps_stall_ref_lon = _cur_lon
-                        _gps_stall_ref_time = time.monotonic()
-                        if _gps_stall_escape_phase == "recheck":
-                            logger.info(
-                                "GPS stall: movement detected (%.2f m) after escape — "
-                                "resuming normal navigation",
-                                _gps_moved_m,
-                            )
-                        _gps_stall_escape_phase = None
-                        _gps_stall_escape_start = None
-                        # GPS confirms physical movement — reset encoder stall timer
-                        # so broken/disconnected encoders don't trigger a false abort.
-                        _motor_stall_start = None
-                    else:
-                        _gps_no_move_s = time.monotonic() - (
-                            _gps_stall_ref_time or time.monotonic()
-                        )
-                        if _gps_stall_escape_phase is None:
-                            if _gps_no_move_s >= _GPS_STALL_ARM_S:
-                                # Suppress escape when GPS is unreliable: dead-reckoning
-                                # active or accuracy too coarse to detect the stall threshold.
-                                _cur_acc = getattr(current_position, "accuracy", None)
-                                _dr_active = getattr(self._loc, "dead_reckoning_active", False)
-                                _acc_too_coarse = (
-                                    _cur_acc is not None and _cur_acc >= _GPS_STALL_MIN_M * 4
-                                )
-                                if _dr_active or _acc_too_coarse:
-                                    _gps_stall_ref_lat = _cur_lat
-                                    _gps_stall_ref_lon = _cur_lon
-                                    _gps_stall_ref_time = time.monotonic()
-                                    logger.debug(
-                                        "GPS stall suppressed: dr_active=%s acc=%.2f m",
-                                        _dr_active, _cur_acc or 0.0,
-                                    )
-                                else:
-                                    _gps_stall_escape_start = time.monotonic()
-                                    _gps_stall_escape_phase = "pivot"
-                                    # Pivot opposite to heading error: try to get different wheel
-                                    # contact before retrying the original direction.
-                                    _gps_stall_pivot_dir = -1.0 if err >= 0 else 1.0
-                                    logger.warning(
-                                        "GPS position stall: no movement (%.2f m) in %.1f s — "
-                                        "escape pivot starting (dir=%+.0f, hdg=%.1f°)",
-                                        _gps_moved_m,
-                                        _gps_no_move_s,
-                                        _gps_stall_pivot_dir,
-                                        _imu_heading,
-                                    )
-                        elif _gps_stall_escape_phase == "pivot":
-                            _esc_t = time.monotonic() - (
-                                _gps_stall_escape_start or time.monotonic()
-                            )
-                            if _esc_t < _GPS_STALL_PIVOT_S:
-                                _force_gps_pivot = True
-                            else:
-                                _gps_stall_escape_phase = "forward"
-                                logger.info(
-                                    "GPS stall escape: pivot complete (%.1f s), "
-                                    "switching to forward drive",
-                                    _esc_t,
-                                )
-                                _force_gps_forward = True
-                        elif _gps_stall_escape_phase == "forward":
-                            _esc_t = time.monotonic() - (
-                                _gps_stall_escape_start or time.monotonic()
-                            )
-                            if _esc_t < _GPS_STALL_PIVOT_S + _GPS_STALL_FWD_S:
-                                _force_gps_forward = True
-                            else:
-                                _gps_stall_escape_phase = "recheck"
-                                _gps_stall_ref_lat = _cur_lat
-                                _gps_stall_ref_lon = _cur_lon
-                                _gps_stall_ref_time = time.monotonic()
-                                logger.info(
-                                    "GPS stall escape: forward drive complete — "
-                                    "rechecking for %.0f s",
-                                    _GPS_STALL_RECHECK_S,
-                                )
-                        elif _gps_stall_escape_phase == "recheck":
-                            _recheck_s = time.monotonic() - (
-                                _gps_stall_ref_time or time.monotonic()
-                            )
-                            if _recheck_s >= _GPS_STALL_RECHECK_S:
-                                logger.error(
-                                    "GPS position stall: no movement (%.2f m) in %.1f s "
-                                    "after escape maneuver — stopping mission",
-                                    _gps_moved_m,
-                                    _recheck_s,
-                                )
-                                await self._enter_safety_hold(
-                                    reason="GPS position stall after escape"
-                                )
-                                raise RuntimeError(
-                                    "Mower physically stuck: GPS position did not change "
-                                    "after escape maneuver"
-                                )
-
-            # --- Encoder-aware stuck detectors ---
-            # Get encoder RPM for this tick (0.0 if provider unavailable)
-            _enc_rpm_a, _enc_rpm_b = (
-                self._encoder_rpm_provider()
-                if self._encoder_rpm_provider is not None
-                else (0.0, 0.0)
+                _dt_dr = _now_dr - (leg.tank_dr_last_t or _now_dr)
+                if _dt_dr > 0 and (leg.prev_left_speed != 0.0 or leg.prev_right_speed != 0.0):
+                    _angular_rad_s = (
+                        leg.prev_left_speed - leg.prev_right_speed
+                    ) / self._TANK_WHEELBASE_M
+                    leg.tank_dr_heading = (
+                        leg.tank_dr_heading + _angular_rad_s * _dt_dr * (180.0 / math.pi)
+                    ) % 360.0
+                leg.tank_dr_last_t = _now_dr
+            current_heading = leg.tank_dr_heading
+            leg.heading_wait_start = None
+        else:
+            leg.tank_dr_heading = None
+            current_heading = raw_heading
+            leg.heading_wait_start = None
+
+        control_heading = leg.heading_ema if leg.heading_ema is not None else current_heading
+        err = heading_error(target=heading_to_target, current=control_heading)
+
+        _now = time.monotonic()
+        if _now - leg.last_nav_log > 2.0:
+            logger.debug(
+                "NAV_CONTROL: path_bearing=%.1f° heading=%.1f° ema=%.1f° err=%.1f° tank=%s",
+                heading_to_target,
+                current_heading,
+                leg.heading_ema if leg.heading_ema is not None else current_heading,
+                err,
+                leg.in_tank_mode,
             )
-            _max_enc_rpm = max(abs(_enc_rpm_a), abs(_enc_rpm_b))
-            _max_cmd = max(abs(_prev_left_speed), abs(_prev_right_speed))
-            if _max_enc_rpm > 0.0:
-                _encoder_had_activity = True
-
-            # Trigger A: motor stall — commanded but not turning.
-            # Only arm when encoder_active_provider confirms sensors have ever
-            # incremented; if sensors are unconnected/broken they always read 0
-            # and would produce a permanent false positive.
-            _enc_active = (
-                self._encoder_active_provider()
-                if self._encoder_active_provider is not None
-                else True
+            leg.last_nav_log = _now
+
+        # ALL stall arm/clear decisions use raw IMU heading (never dead-reckoned).
+        # When Stage B forces in_tank_mode=True, current_heading switches to
+        # tank_dr_heading, which has a very high angular rate model and laps
+        # the compass in seconds — causing abs_err to hit 0° spuriously and
+        # falsely clearing the stall.  raw_abs_err is always from IMU.
+        _imu_heading = raw_heading if raw_heading is not None else current_heading
+        _raw_abs_err = abs(heading_error(target=heading_to_target, current=_imu_heading))
+
+        # Pre-rotation gate: initialize on first tick with a known bearing.
+        # path_bearing is set on the same tick as raw_abs_err is first valid,
+        # so the gate initializes on the first tick with a real bearing.
+        if not leg.pre_rotation_initialized and leg.path_bearing is not None:
+            leg.pre_rotation_initialized = True
+            if _raw_abs_err > self._PRE_ROTATION_ACTIVATE_DEG:
+                leg.pre_rotating = True
+                logger.info(
+                    "Pre-rotation gate active: initial heading error %.1f° > %.0f°",
+                    _raw_abs_err,
+                    self._PRE_ROTATION_ACTIVATE_DEG,
+                )
+            if _raw_abs_err > 30.0:
+                logger.warning(
+                    "Bootstrap heading uncertain — first-leg error exceeds 30° (%.1f°); "
+                    "check imu_alignment.json",
+                    _raw_abs_err,
+                )
+        elif leg.pre_rotating and _raw_abs_err < self._PRE_ROTATION_CLEAR_DEG:
+            leg.pre_rotating = False
+            leg.stall_start = None  # prevent stall timer inheriting pre-rotation time
+            logger.info(
+                "Pre-rotation gate cleared: heading error %.1f° < %.0f°",
+                _raw_abs_err,
+                self._PRE_ROTATION_CLEAR_DEG,
             )
 
-            # High-Frequency Encoder Continuity Watchdog (Finding C)
-            if _enc_active and _encoder_had_activity and _max_cmd > 0.3:
-                if _enc_rpm_a == 0.0 and _enc_rpm_b == 0.0:
-                    _encoder_drop_ticks += 1
-                    if _encoder_drop_ticks >= 2:
-                        logger.error(
-                            "Encoder continuity watchdog: RPM fell to 0.0 with cmd=%.2f "
-                            "for %d consecutive ticks - possible wire snap/cable disconnect!",
-                            _max_cmd, _encoder_drop_ticks
-                        )
-                        await self._enter_safety_hold(
-                            reason="encoder continuity fault / wire snap"
-                        )
-                        raise RuntimeError("encoder continuity fault / wire snap")
-                else:
-                    _encoder_drop_ticks = 0
-            else:
-                _encoder_drop_ticks = 0
-            if (
-                _enc_active
-                and _max_cmd > _MOTOR_STALL_CMD_THRESHOLD
-                and _max_enc_rpm < _MOTOR_STALL_RPM_THRESHOLD
-                and not _force_gps_pivot
-                and not _force_gps_forward
-                and not _force_reverse_escape
-                and not _stall_active
-                and _gps_stall_escape_phase is None
-            ):
-                if _motor_stall_start is None:
-                    _motor_stall_start = time.monotonic()
+        return _HeadingEstimate(
+            target=heading_to_target,
+            current=current_heading,
+            imu=_imu_heading,
+            err=err,
+            raw_abs_err=_raw_abs_err,
+            bootstrap=_in_heading_bootstrap,
+        )
+
+    async def _gps_stall_stage(
+        self,
+        leg: _LegState,
+        current_position: Position,
+        heading: _HeadingEstimate,
+        escape: _EscapeCommands,
+    ) -> None:
+        """GPS position stall detection and its pivot → forward → recheck escape."""
+        # Tracks whether the mower is physically moving while motors run.
+        # Operates independently of heading error — catches the case where
+        # heading is aligned but the mower is spinning in place or blocked.
+        planner = self._path_planner
+        if leg.prev_left_speed == 0.0 and leg.prev_right_speed == 0.0:
+            # Motors were stopped last iteration; reset the reference so the
+            # stall timer starts fresh when motors restart (avoids false stall
+            # accumulation across position-hold pauses).
+            if leg.gps_stall_escape_phase is None:
+                leg.gps_stall_ref_lat = None
+                leg.gps_stall_ref_lon = None
+                leg.gps_stall_ref_time = None
+            # NEW: reset encoder-aware detectors when stopped
+            leg.motor_stall_start = None
+            leg.wheel_spin_ref_lat = None
+            leg.wheel_spin_ref_lon = None
+            leg.wheel_spin_ref_time = None
+            return
+
+        # Motors were running — track GPS displacement.
+        _cur_lat = current_position.latitude
+        _cur_lon = current_position.longitude
+        if leg.gps_stall_ref_lat is None:
+            leg.gps_stall_ref_lat = _cur_lat
+            leg.gps_stall_ref_lon = _cur_lon
+            leg.gps_stall_ref_time = time.monotonic()
+            return
+
+        _gps_moved_m = planner.calculate_distance(
+            Position(latitude=leg.gps_stall_ref_lat, longitude=leg.gps_stall_ref_lon),
+            Position(latitude=_cur_lat, longitude=_cur_lon),
+        )
+        if _gps_moved_m >= self._GPS_STALL_MIN_M:
+            # Moved enough — reset reference and clear any escape.
+            leg.gps_stall_ref_lat = _cur_lat
+            leg.gps_stall_ref_lon = _cur_lon
+            leg.gps_stall_ref_time = time.monotonic()
+            if leg.gps_stall_escape_phase == "recheck":
+                logger.info(
+                    "GPS stall: movement detected (%.2f m) after escape — "
+                    "resuming normal navigation",
+                    _gps_moved_m,
+                )
+            leg.gps_stall_escape_phase = None
+            leg.gps_stall_escape_start = None
+            # GPS confirms physical movement — reset encoder stall timer
+            # so broken/disconnected encoders don't trigger a false abort.
+            leg.motor_stall_start = None
+            return
+
+        _gps_no_move_s = time.monotonic() - (leg.gps_stall_ref_time or time.monotonic())
+        if leg.gps_stall_escape_phase is None:
+            if _gps_no_move_s >= self._GPS_STALL_ARM_S:
+                # Suppress escape when GPS is unreliable: dead-reckoning
+                # active or accuracy too coarse to detect the stall threshold.
+                _cur_acc = getattr(current_position, "accuracy", None)
+                _dr_active = getattr(self._loc, "dead_reckoning_active", False)
+                _acc_too_coarse = (
+                    _cur_acc is not None and _cur_acc >= self._GPS_STALL_MIN_M * 4
+                )
+                if _dr_active or _acc_too_coarse:
+                    leg.gps_stall_ref_lat = _cur_lat
+                    leg.gps_stall_ref_lon = _cur_lon
+                    leg.gps_stall_ref_time = time.monotonic()
                     logger.debug(
-                        "Motor-stall detector armed: cmd=%.2f rpm=%.1f",
-                        _max_cmd, _max_enc_rpm,
+                        "GPS stall suppressed: dr_active=%s acc=%.2f m",
+                        _dr_active, _cur_acc or 0.0,
                     )
                 else:
-                    _stall_elapsed = time.monotonic() - _motor_stall_start
-                    if _stall_elapsed >= _MOTOR_STALL_ABORT_S:
-                        logger.error(
-                            "Motor stall: RPM≈0 for %.1f s with cmd=%.2f — aborting",
-                            _stall_elapsed, _max_cmd,
-                        )
-                        await self._enter_safety_hold(reason="motor stall abort")
-                        raise RuntimeError(
-                            "Motor stall: encoder RPM ~0 with active command"
-                        )
-                    elif _stall_elapsed >= _MOTOR_STALL_ARM_S:
-                        if not _force_reverse_escape and not _stall_active:
-                            _force_reverse_escape = True
-                            logger.warning(
-                                "Motor-stall escape: RPM≈0 for %.1f s — "
-                                "triggering reverse kick (cmd=%.2f)",
-                                _stall_elapsed, _max_cmd,
-                            )
-            else:
-                # Clear when RPM exceeds 2× stall threshold (4.0 RPM) or command drops to zero.
-                # 5× was too aggressive: slow mowing/turning RPM (3-8) never cleared the timer.
-                if _max_enc_rpm >= _MOTOR_STALL_RPM_THRESHOLD * 2.0 or _max_cmd <= _MOTOR_STALL_CMD_THRESHOLD:
-                    _motor_stall_start = None
-
-            # Trigger B: wheel spin — turning but not moving
-            if (
-                _max_enc_rpm > _WHEEL_SPIN_RPM_THRESHOLD
-                and _max_cmd > _MOTOR_STALL_CMD_THRESHOLD
-                and not _force_gps_pivot
-                and not _force_gps_forward
-                and not _stall_active
-                and _gps_stall_escape_phase is None
-            ):
-                _cur_lat = current_position.latitude
-                _cur_lon = current_position.longitude
-                if _wheel_spin_ref_lat is None:
-                    _wheel_spin_ref_lat = _cur_lat
-                    _wheel_spin_ref_lon = _cur_lon
-                    _wheel_spin_ref_time = time.monotonic()
-                else:
-                    _spin_moved_m = planner.calculate_distance(
-                        Position(latitude=_wheel_spin_ref_lat, longitude=_wheel_spin_ref_lon),
-                        Position(latitude=_cur_lat, longitude=_cur_lon),
-                    )
-                    if _spin_moved_m >= _WHEEL_SPIN_MIN_M:
-                        _wheel_spin_ref_lat = _cur_lat
-                        _wheel_spin_ref_lon = _cur_lon
-                        _wheel_spin_ref_time = time.monotonic()
-                    else:
-                        _spin_no_move_s = time.monotonic() - (
-                            _wheel_spin_ref_time or time.monotonic()
-                        )
-                        if _spin_no_move_s >= _WHEEL_SPIN_ARM_S and _gps_stall_escape_phase is None:
-                            _gps_stall_escape_start = time.monotonic()
-                            _gps_stall_escape_phase = "pivot"
-                            _gps_stall_pivot_dir = -1.0 if err >= 0 else 1.0
-                            logger.warning(
-                                "Wheel-spin stall: RPM=%.1f but only %.3f m in %.1f s — "
-                                "triggering pivot escape",
-                                _max_enc_rpm, _spin_moved_m, _spin_no_move_s,
-                            )
-            # Trigger C — encoder asymmetry during straight-line driving
-            _left_cmd = _prev_left_speed
-            _right_cmd = _prev_right_speed
-            _cmd_symmetric = (
-                abs(_left_cmd - _right_cmd) < 0.05
-                and min(abs(_left_cmd), abs(_right_cmd)) >= _ENC_ASYM_CMD_THRESHOLD
-            )
-            if (
-                _enc_active
-                and _cmd_symmetric
-                and abs(_enc_rpm_a) >= _ENC_ASYM_MIN_RPM
-                and abs(_enc_rpm_b) >= _ENC_ASYM_MIN_RPM
-                and max(abs(_enc_rpm_a), abs(_enc_rpm_b)) > 0
-                and min(abs(_enc_rpm_a), abs(_enc_rpm_b)) > 0
-                and (max(abs(_enc_rpm_a), abs(_enc_rpm_b)) / min(abs(_enc_rpm_a), abs(_enc_rpm_b))) >= _ENC_ASYM_RATIO
-            ):
-                if _enc_asym_start is None:
-                    _enc_asym_start = time.monotonic()
-                elif time.monotonic() - _enc_asym_start >= _ENC_ASYM_ARM_S:
+                    leg.gps_stall_escape_start = time.monotonic()
+                    leg.gps_stall_escape_phase = "pivot"
+                    # Pivot opposite to heading error: try to get different wheel
+                    # contact before retrying the original direction.
+                    leg.gps_stall_pivot_dir = -1.0 if heading.err >= 0 else 1.0
                     logger.warning(
-                        "Encoder asymmetry: rpm_a=%.1f rpm_b=%.1f ratio=%.2f "
-                        "during equal-speed cmd=%.2f — possible shaft slip",
-                        _enc_rpm_a, _enc_rpm_b,
-                        max(abs(_enc_rpm_a), abs(_enc_rpm_b)) / max(min(abs(_enc_rpm_a), abs(_enc_rpm_b)), 0.01),
-                        _left_cmd,
+                        "GPS position stall: no movement (%.2f m) in %.1f s — "
+                        "escape pivot starting (dir=%+.0f, hdg=%.1f°)",
+                        _gps_moved_m,
+                        _gps_no_move_s,
+                        leg.gps_stall_pivot_dir,
+                        heading.imu,
                     )
-                    _enc_asym_start = time.monotonic()  # rate-limit to 1/arm_period
+        elif leg.gps_stall_escape_phase == "pivot":
+            _esc_t = time.monotonic() - (leg.gps_stall_escape_start or time.monotonic())
+            if _esc_t < self._GPS_STALL_PIVOT_S:
+                escape.force_gps_pivot = True
+            else:
+                leg.gps_stall_escape_phase = "forward"
+                logger.info(
+                    "GPS stall escape: pivot complete (%.1f s), "
+                    "switching to forward drive",
+                    _esc_t,
+                )
+                escape.force_gps_forward = True
+        elif leg.gps_stall_escape_phase == "forward":
+            _esc_t = time.monotonic() - (leg.gps_stall_escape_start or time.monotonic())
+            if _esc_t < self._GPS_STALL_PIVOT_S + self._GPS_STALL_FWD_S:
+                escape.force_gps_forward = True
             else:
-                _enc_asym_start = None
+                leg.gps_stall_escape_phase = "recheck"
+                leg.gps_stall_ref_lat = _cur_lat
+                leg.gps_stall_ref_lon = _cur_lon
+                leg.gps_stall_ref_time = time.monotonic()
+                logger.info(
+                    "GPS stall escape: forward drive complete — "
+                    "rechecking for %.0f s",
+                    self._GPS_STALL_RECHECK_S,
+                )
+        elif leg.gps_stall_escape_phase == "recheck":
+            _recheck_s = time.monotonic() - (leg.gps_stall_ref_time or time.monotonic())
+            if _recheck_s >= self._GPS_STALL_RECHECK_S:
+                logger.error(
+                    "GPS position stall: no movement (%.2f m) in %.1f s "
+                    "after escape maneuver — stopping mission",
+                    _gps_moved_m,
+                    _recheck_s,
+                )
+                await self._enter_safety_hold(reason="GPS position stall after escape")
+                raise RuntimeError(
+                    "Mower physically stuck: GPS position did not change "
+                    "after escape maneuver"
+                )
 
-            if _raw_abs_err > 20 and (not _in_tank_mode or _stall_active) and not _pre_rotating:
-                if _stall_start is None:
-                    _stall_start = time.monotonic()
-                    _stall_heading = _imu_heading
-                    _stall_escape_stage = None
-                    logger.debug(
-                        "Stall detector armed: err=%.1f° hdg=%.1f°",
-                        err, _imu_heading,
+    async def _encoder_stall_stage(
+        self,
+        leg: _LegState,
+        current_position: Position,
+        heading: _HeadingEstimate,
+        escape: _EscapeCommands,
+    ) -> tuple[float, float]:
+        """Encoder-aware stuck detectors; returns this tick's encoder RPMs."""
+        planner = self._path_planner
+        # Get encoder RPM for this tick (0.0 if provider unavailable)
+        _enc_rpm_a, _enc_rpm_b = (
+            self._encoder_rpm_provider()
+            if self._encoder_rpm_provider is not None
+            else (0.0, 0.0)
+        )
+        _max_enc_rpm = max(abs(_enc_rpm_a), abs(_enc_rpm_b))
+        _max_cmd = max(abs(leg.prev_left_speed), abs(leg.prev_right_speed))
+        if _max_enc_rpm > 0.0:
+            leg.encoder_had_activity = True
+
+        # Trigger A: motor stall — commanded but not turning.
+        # Only arm when encoder_active_provider confirms sensors have ever
+        # incremented; if sensors are unconnected/broken they always read 0
+        # and would produce a permanent false positive.
+        _enc_active = (
+            self._encoder_active_provider()
+            if self._encoder_active_provider is not None
+            else True
+        )
+
+        # High-Frequency Encoder Continuity Watchdog (Finding C)
+        if _enc_active and leg.encoder_had_activity and _max_cmd > 0.3:
+            if _enc_rpm_a == 0.0 and _enc_rpm_b == 0.0:
+                leg.encoder_drop_ticks += 1
+                leg.encoder_drop_s += self._control.tick_interval_s
+                if leg.encoder_drop_s >= self._ENCODER_DROP_WINDOW_S - 1e-6:
+                    logger.error(
+                        "Encoder continuity watchdog: RPM fell to 0.0 with cmd=%.2f "
+                        "for %d consecutive ticks - possible wire snap/cable disconnect!",
+                        _max_cmd, leg.encoder_drop_ticks
                     )
-                else:
-                    _hdg_delta = abs(
-                        heading_error(target=_imu_heading, current=(_stall_heading or 0.0))
+                    await self._enter_safety_hold(
+                        reason="encoder continuity fault / wire snap"
                     )
-                    if _raw_abs_err < 12.0:
-                        # Error converged — mower is aligned, clear completely.
-                        logger.debug(
-                            "Stall cleared: raw_err=%.1f° converged (stage=%s)",
-                            _raw_abs_err, _stall_escape_stage,
-                        )
-                        _stall_start = None
-                        _stall_heading = None
-                        _stall_escape_stage = None
-                    elif _stall_escape_stage is None and _hdg_delta >= 5.0:
-                        # Pre-escape: heading IS moving, just slowly.  Reset the
-                        # clock from the new position so boost never fires during
-                        # active turning.  Only escalate after 4 s with <5° movement.
-                        _stall_start = time.monotonic()
-                        _stall_heading = _imu_heading
-                        logger.debug(
-                            "Stall timer reset: IMU moved %.1f° (raw_err=%.1f°)",
-                            _hdg_delta, _raw_abs_err,
-                        )
-                    elif _stall_escape_stage is not None and _hdg_delta >= 15.0:
-                        # Active escape stage: large rotation means mower broke free.
-                        logger.debug(
-                            "Stall cleared during escape: IMU moved %.1f° (stage=%s)",
-                            _hdg_delta, _stall_escape_stage,
-                        )
-                        _stall_start = None
-                        _stall_heading = None
-                        _stall_escape_stage = None
-                    else:
-                        _elapsed = time.monotonic() - _stall_start
-                        if _elapsed < 4.0:
-                            # Stage A: ramp boost from 0 → 0.6 over 4 s.
-                            # With stall_boost now wired into compute_blend_speeds,
-                            # this actually amplifies commanded wheel speeds.
-                            _stall_boost = min(0.6, _elapsed * 0.15)
-                            if _stall_escape_stage != "A":
-                                _stall_escape_stage = "A"
-                                logger.info(
-                                    "Stall escape A: ramping blend boost "
-                                    "(err=%.1f°, hdg=%.1f°)",
-                                    err, _imu_heading,
-                                )
-                        elif _elapsed < 7.0:
-                            # Stage B: force counter-rotating tank pivot for 3 s.
-                            # Mechanically cleaner than blend on grass; the inner-wheel
-                            # stiction anchor is eliminated.
-                            _stall_boost = 0.6
-                            _force_tank_escape = True
-                            if _stall_escape_stage != "B":
-                                _stall_escape_stage = "B"
-                                logger.info(
-                                    "Stall escape B: forcing tank pivot "
-                                    "(elapsed=%.1fs, err=%.1f°, hdg=%.1f°)",
-                                    _elapsed, err, _imu_heading,
-                                )
-                        elif _elapsed < 7.5:
-                            # Stage C: brief reverse kick (~0.5 s) to break ground-contact
-                            # lock and change wheel loading before retrying pivot.
-                            _force_reverse_escape = True
-                            if _stall_escape_stage != "C":
-                                _stall_escape_stage = "C"
-                                logger.info(
-                                    "Stall escape C: reverse kick "
-                                    "(elapsed=%.1fs, err=%.1f°, hdg=%.1f°)",
-                                    _elapsed, err, _imu_heading,
-                                )
-                        elif _elapsed < 10.0:
-                            # Stage D: second tank pivot attempt after reverse kick.
-                            _stall_boost = 0.6
-                            _force_tank_escape = True
-                            if _stall_escape_stage != "D":
-                                _stall_escape_stage = "D"
-                                logger.info(
-                                    "Stall escape D: tank pivot retry "
-                                    "(elapsed=%.1fs, err=%.1f°, hdg=%.1f°)",
-                                    _elapsed, err, _imu_heading,
-                                )
-                        else:
-                            logger.error(
-                                "Mower physically stuck: all escape stages exhausted after "
-                                "%.1f s (err=%.1f°, hdg=%.1f°) — stopping mission",
-                                _elapsed, err, current_heading,
-                            )
-                            await self._enter_safety_hold(reason="physically stuck")
-                            raise RuntimeError(
-                                "Mower appears physically stuck: heading did not change "
-                                "after staged escape attempts (A→B→C→D)"
-                            )
+                    raise RuntimeError("encoder continuity fault / wire snap")
             else:
-                _stall_start = None
-                _stall_heading = None
-                _stall_escape_stage = None
-
-            # Waypoint base speed
-            base_speed = self.cruise_speed
-            try:
-                if hasattr(waypoint, "speed") and isinstance(waypoint.speed, int):
-                    base_speed = max(
-                        0.1, min(self.max_speed, (waypoint.speed / 100.0) * self.max_speed)
-                    )
-            except Exception:
-                base_speed = self.cruise_speed
-
-            # Deceleration taper: reduce speed linearly when within 3× waypoint_tolerance
-            base_speed = self._apply_decel_taper(base_speed, distance_to_target)
-            # Pre-rotation cap overrides taper when active (most restrictive wins)
-            base_speed = self._apply_heading_gate(base_speed, _raw_abs_err, _pre_rotating)
-
-            # Tank/blend mode selection with hysteresis.
-            # _force_tank_escape and _force_reverse_escape override normal mode selection
-            # during escape stages B–D; the tank-turn watchdog is suppressed for those
-            # iterations so the 25 s timer doesn't accumulate against escape attempts.
-            _in_tank_mode = is_in_tank_mode(abs_error=abs_err, currently_in_tank=_in_tank_mode)
-            if _force_tank_escape:
-                _in_tank_mode = True
-
-            if _force_gps_pivot:
-                # GPS stall escape phase 1: tank pivot to break contact and get new traction.
-                _pivot_spd = self.max_speed * 0.5
-                left_speed = _pivot_spd * _gps_stall_pivot_dir
-                right_speed = -_pivot_spd * _gps_stall_pivot_dir
-                _tank_turn_start = None
-                logger.debug(
-                    "GPS stall escape: pivot dir=%+.0f spd=%.2f hdg=%.1f°",
-                    _gps_stall_pivot_dir, _pivot_spd, current_heading,
-                )
-            elif _force_gps_forward:
-                # GPS stall escape phase 2: straight forward to move to new ground.
-                left_speed = self.cruise_speed
-                right_speed = self.cruise_speed
-                _tank_turn_start = None
+                leg.encoder_drop_ticks = 0
+                leg.encoder_drop_s = 0.0
+        else:
+            leg.encoder_drop_ticks = 0
+            leg.encoder_drop_s = 0.0
+        if (
+            _enc_active
+            and _max_cmd > self._MOTOR_STALL_CMD_THRESHOLD
+            and _max_enc_rpm < self._MOTOR_STALL_RPM_THRESHOLD
+            and not escape.force_gps_pivot
+            and not escape.force_gps_forward
+            and not escape.force_reverse_escape
+            and not escape.stall_active
+            and leg.gps_stall_escape_phase is None
+        ):
+            if leg.motor_stall_start is None:
+                leg.motor_stall_start = time.monotonic()
                 logger.debug(
-                    "GPS stall escape: forward drive spd=%.2f hdg=%.1f°",
-                    self.cruise_speed, current_heading,
+                    "Motor-stall detector armed: cmd=%.2f rpm=%.1f",
+                    _max_cmd, _max_enc_rpm,
                 )
-            elif _force_reverse_escape:
-                # Stage C: straight reverse to change ground contact
-                left_speed, right_speed = -0.35, -0.35
-                _tank_turn_start = None
-                logger.debug(
-                    "Escape C: dispatching reverse (%.2f, %.2f) hdg=%.1f°",
-                    left_speed, right_speed, current_heading,
+            else:
+                _stall_elapsed = time.monotonic() - leg.motor_stall_start
+                if _stall_elapsed >= self._MOTOR_STALL_ABORT_S:
+                    logger.error(
+                        "Motor stall: RPM≈0 for %.1f s with cmd=%.2f — aborting",
+                        _stall_elapsed, _max_cmd,
+                    )
+                    await self._enter_safety_hold(reason="motor stall abort")
+                    raise RuntimeError(
+                        "Motor stall: encoder RPM ~0 with active command"
+                    )
+                elif _stall_elapsed >= self._MOTOR_STALL_ARM_S:
+                    if not escape.force_reverse_escape and not escape.stall_active:
+                        escape.force_reverse_escape = True
+                        logger.warning(
+                            "Motor-stall escape: RPM≈0 for %.1f s — "
+                            "triggering reverse kick (cmd=%.2f)",
+                            _stall_elapsed, _max_cmd,
+                        )
+        else:
+            # Clear when RPM exceeds 2× stall threshold (4.0 RPM) or command drops to zero.
+            # 5× was too aggressive: slow mowing/turning RPM (3-8) never cleared the timer.
+            if (
+                _max_enc_rpm >= self._MOTOR_STALL_RPM_THRESHOLD * 2.0
+                or _max_cmd <= self._MOTOR_STALL_CMD_THRESHOLD
+            ):
+                leg.motor_stall_start = None
+
+        # Trigger B: wheel spin — turning but not moving
+        if (
+            _max_enc_rpm > self._WHEEL_SPIN_RPM_THRESHOLD
+            and _max_cmd > self._MOTOR_STALL_CMD_THRESHOLD
+            and not escape.force_gps_pivot
+            and not escape.force_gps_forward
+            and not escape.stall_active
+            and leg.gps_stall_escape_phase is None
+        ):
+            _cur_lat = current_position.latitude
+            _cur_lon = current_position.longitude
+            if leg.wheel_spin_ref_lat is None:
+                leg.wheel_spin_ref_lat = _cur_lat
+                leg.wheel_spin_ref_lon = _cur_lon
+                leg.wheel_spin_ref_time = time.monotonic()
+            else:
+                _spin_moved_m = planner.calculate_distance(
+                    Position(latitude=leg.wheel_spin_ref_lat, longitude=leg.wheel_spin_ref_lon),
+                    Position(latitude=_cur_lat, longitude=_cur_lon),
                 )
-            elif _in_tank_mode:
-                if _force_tank_escape:
-                    # Don't tick the watchdog during escape; reset it so normal
-                    # tank turns get a clean 25 s window after escape succeeds.
-                    _tank_turn_start = None
+                if _spin_moved_m >= self._WHEEL_SPIN_MIN_M:
+                    leg.wheel_spin_ref_lat = _cur_lat
+                    leg.wheel_spin_ref_lon = _cur_lon
+                    leg.wheel_spin_ref_time = time.monotonic()
                 else:
-                    if _tank_turn_start is None:
-                        _tank_turn_start = time.monotonic()
-                    elif (time.monotonic() - _tank_turn_start) > _TANK_TURN_TIMEOUT_S:
-                        logger.error(
-                            "Tank-turn watchdog: heading not converging after %.0f s "
-                            "(last err=%.1f°, hdg=%.1f°) — aborting waypoint",
-                            _TANK_TURN_TIMEOUT_S,
-                            err,
-                            current_heading,
-                        )
-                        await self._enter_safety_hold(reason="tank-turn timeout")
-                        raise RuntimeError(
-                            f"Tank-turn timed out after {_TANK_TURN_TIMEOUT_S:.0f} s "
-                            "without heading convergence"
+                    _spin_no_move_s = time.monotonic() - (
+                        leg.wheel_spin_ref_time or time.monotonic()
+                    )
+                    if (
+                        _spin_no_move_s >= self._WHEEL_SPIN_ARM_S
+                        and leg.gps_stall_escape_phase is None
+                    ):
+                        leg.gps_stall_escape_start = time.monotonic()
+                        leg.gps_stall_escape_phase = "pivot"
+                        leg.gps_stall_pivot_dir = -1.0 if heading.err >= 0 else 1.0
+                        logger.warning(
+                            "Wheel-spin stall: RPM=%.1f but only %.3f m in %.1f s — "
+                            "triggering pivot escape",
+                            _max_enc_rpm, _spin_moved_m, _spin_no_move_s,
                         )
-                left_speed, right_speed = compute_tank_speeds(
-                    err, max_speed=self.max_speed, stall_boost=_stall_boost
+        # Trigger C — encoder asymmetry during straight-line driving
+        _left_cmd = leg.prev_left_speed
+        _right_cmd = leg.prev_right_speed
+        _cmd_symmetric = (
+            abs(_left_cmd - _right_cmd) < 0.05
+            and min(abs(_left_cmd), abs(_right_cmd)) >= self._ENC_ASYM_CMD_THRESHOLD
+        )
+        _rpm_hi = max(abs(_enc_rpm_a), abs(_enc_rpm_b))
+        _rpm_lo = min(abs(_enc_rpm_a), abs(_enc_rpm_b))
+        if (
+            _enc_active
+            and _cmd_symmetric
+            and _rpm_lo >= self._ENC_ASYM_MIN_RPM
+            and (_rpm_hi / _rpm_lo) >= self._ENC_ASYM_RATIO
+        ):
+            if leg.enc_asym_start is None:
+                leg.enc_asym_start = time.monotonic()
+            elif time.monotonic() - leg.enc_asym_start >= self._ENC_ASYM_ARM_S:
+                logger.warning(
+                    "Encoder asymmetry: rpm_a=%.1f rpm_b=%.1f ratio=%.2f "
+                    "during equal-speed cmd=%.2f — possible shaft slip",
+                    _enc_rpm_a, _enc_rpm_b,
+                    _rpm_hi / max(_rpm_lo, 0.01),
+                    _left_cmd,
                 )
-            else:
-                _tank_turn_start = None
-
-                # Stanley path-tracker: combine filtered heading error with
-                # cross-track-error correction.  Falls back to raw heading error
-                # during bootstrap (no IMU) or before path anchor is established.
-                _steer = err
-                _loc_state = getattr(self._loc, "state", None)
-                _loc_vel = (
-                    getattr(self._loc, "velocity", None)
-                    if getattr(self._loc, "velocity", None) is not None
-                    else (getattr(_loc_state, "velocity", None) if _loc_state is not None else None)
-                ) or 0.0
-                if (
-                    not _in_heading_bootstrap
-                    and _path_a_lat is not None
-                    and _heading_ema is not None
-                ):
-                    _cte = cross_track_error(
-                        (current_position.latitude, current_position.longitude),
-                        (_path_a_lat, _path_a_lon),
-                        (target_pos.latitude, target_pos.longitude),
+                leg.enc_asym_start = time.monotonic()  # rate-limit to 1/arm_period
+        else:
+            leg.enc_asym_start = None
+        return _enc_rpm_a, _enc_rpm_b
+
+    async def _heading_stall_stage(
+        self,
+        leg: _LegState,
+        heading: _HeadingEstimate,
+        escape: _EscapeCommands,
+    ) -> None:
+        """Heading stall detection + staged escape ladder (A boost → B tank → C reverse → D tank)."""
+        err = heading.err
+        _raw_abs_err = heading.raw_abs_err
+        _imu_heading = heading.imu
+        if not (
+            _raw_abs_err > 20
+            and (not leg.in_tank_mode or escape.stall_active)
+            and not leg.pre_rotating
+        ):
+            leg.stall_start = None
+            leg.stall_heading = None
+            leg.stall_escape_stage = None
+            return
+        if leg.stall_start is None:
+            leg.stall_start = time.monotonic()
+            leg.stall_heading = _imu_heading
+            leg.stall_escape_stage = None
+            logger.debug(
+                "Stall detector armed: err=%.1f° hdg=%.1f°",
+                err, _imu_heading,
+            )
+            return
+        _hdg_delta = abs(
+            heading_error(target=_imu_heading, current=(leg.stall_heading or 0.0))
+        )
+        if _raw_abs_err < 12.0:
+            # Error converged — mower is aligned, clear completely.
+            logger.debug(
+                "Stall cleared: raw_err=%.1f° converged (stage=%s)",
+                _raw_abs_err, leg.stall_escape_stage,
+            )
+            leg.stall_start = None
+            leg.stall_heading = None
+            leg.stall_escape_stage = None
+        elif leg.stall_escape_stage is None and _hdg_delta >= 5.0:
+            # Pre-escape: heading IS moving, just slowly.  Reset the
+            # clock from the new position so boost never fires during
+            # active turning.  Only escalate after 4 s with <5° movement.
+            leg.stall_start = time.monotonic()
+            leg.stall_heading = _imu_heading
+            logger.debug(
+                "Stall timer reset: IMU moved %.1f° (raw_err=%.1f°)",
+                _hdg_delta, _raw_abs_err,
+            )
+        elif leg.stall_escape_stage is not None and _hdg_delta >= 15.0:
+            # Active escape stage: large rotation means mower broke free.
+            logger.debug(
+                "Stall cleared during escape: IMU moved %.1f° (stage=%s)",
+                _hdg_delta, leg.stall_escape_stage,
+            )
+            leg.stall_start = None
+            leg.stall_heading = None
+            leg.stall_escape_stage = None
+        else:
+            _elapsed = time.monotonic() - leg.stall_start
+            if _elapsed < 4.0:
+                # Stage A: ramp boost from 0 → 0.6 over 4 s.
+                # With stall_boost now wired into compute_blend_speeds,
+                # this actually amplifies commanded wheel speeds.
+                escape.stall_boost = min(0.6, _elapsed * 0.15)
+                if leg.stall_escape_stage != "A":
+                    leg.stall_escape_stage = "A"
+                    logger.info(
+                        "Stall escape A: ramping blend boost "
+                        "(err=%.1f°, hdg=%.1f°)",
+                        err, _imu_heading,
                     )
-                    _heading_err_path = heading_error(
-                        target=heading_to_target, current=_heading_ema
+            elif _elapsed < 7.0:
+                # Stage B: force counter-rotating tank pivot for 3 s.
+                # Mechanically cleaner than blend on grass; the inner-wheel
+                # stiction anchor is eliminated.
+                escape.stall_boost = 0.6
+                escape.force_tank_escape = True
+                if leg.stall_escape_stage != "B":
+                    leg.stall_escape_stage = "B"
+                    logger.info(
+                        "Stall escape B: forcing tank pivot "
+                        "(elapsed=%.1fs, err=%.1f°, hdg=%.1f°)",
+                        _elapsed, err, _imu_heading,
                     )
-                    _s_k_cte, _s_dead_band = self._tiered_stanley_params()
-                    _steer = stanley_steer(
-                        _heading_err_path, _cte, _loc_vel,
-                        k_cte=_s_k_cte, dead_band_m=_s_dead_band,
+            elif _elapsed < 7.5:
+                # Stage C: brief reverse kick (~0.5 s) to break ground-contact
+                # lock and change wheel loading before retrying pivot.
+                escape.force_reverse_escape = True
+                if leg.stall_escape_stage != "C":
+                    leg.stall_escape_stage = "C"
+                    logger.info(
+                        "Stall escape C: reverse kick "
+                        "(elapsed=%.1fs, err=%.1f°, hdg=%.1f°)",
+                        _elapsed, err, _imu_heading,
                     )
-                    logger.debug(
-                        "STANLEY: path_bearing=%.1f° ema_hdg=%.1f° err=%.1f° "
-                        "cte=%.3fm steer=%.1f° k_cte=%.2f db=%.2fm",
-                        heading_to_target,
-                        _heading_ema,
-                        _heading_err_path,
-                        _cte,
-                        _steer,
-                        _s_k_cte,
-                        _s_dead_band,
+            elif _elapsed < 10.0:
+                # Stage D: second tank pivot attempt after reverse kick.
+                escape.stall_boost = 0.6
+                escape.force_tank_escape = True
+                if leg.stall_escape_stage != "D":
+                    leg.stall_escape_stage = "D"
+                    logger.info(
+                        "Stall escape D: tank pivot retry "
+                        "(elapsed=%.1fs, err=%.1f°, hdg=%.1f°)",
+                        _elapsed, err, _imu_heading,
                     )
-                    if abs(_cte) > self.max_operational_cross_track_error_m:
-                        await self._enter_safety_hold(reason="cross-track error limit")
-                        raise RuntimeError(
-                            "Maximum operational cross-track error exceeded; revalidation required"
-                        )
+            else:
+                logger.error(
+                    "Mower physically stuck: all escape stages exhausted after "
+                    "%.1f s (err=%.1f°, hdg=%.1f°) — stopping mission",
+                    _elapsed, err, heading.current,
+                )
+                await self._enter_safety_hold(reason="physically stuck")
+                raise RuntimeError(
+                    "Mower appears physically stuck: heading did not change "
+                    "after staged escape attempts (A→B→C→D)"
+                )
 
-                left_speed, right_speed = compute_blend_speeds(
-                    _steer,
-                    base_speed=base_speed,
-                    stall_boost=_stall_boost,
-                    max_speed=self.max_speed,
-                    in_heading_bootstrap=_in_heading_bootstrap,
+    async def _steering_stage(
+        self,
+        leg: _LegState,
+        waypoint: MissionWaypoint,
+        current_position: Position,
+        target_pos: Position,
+        distance_to_target: float,
+        heading: _HeadingEstimate,
+        escape: _EscapeCommands,
+    ) -> _DriveCommand:
+        """Speed shaping, tank/blend mode selection, Stanley steering and traction boost."""
+        err = heading.err
+        current_heading = heading.current
+        _cte: float | None = None
+        _steer: float | None = None
+        _loc_vel: float | None = None
+
+        # Waypoint base speed
+        base_speed = self.cruise_speed
+        try:
+            if hasattr(waypoint, "speed") and isinstance(waypoint.speed, int):
+                base_speed = max(
+                    0.1, min(self.max_speed, (waypoint.speed / 100.0) * self.max_speed)
                 )
+        except Exception:
+            base_speed = self.cruise_speed
 
-            # Adaptive traction boost — suppressed during any escape phase or existing stall boost
+        # Deceleration taper: reduce speed linearly when within 3× waypoint_tolerance
+        base_speed = self._apply_decel_taper(base_speed, distance_to_target)
+        # Pre-rotation cap overrides taper when active (most restrictive wins)
+        base_speed = self._apply_heading_gate(base_speed, heading.raw_abs_err, leg.pre_rotating)
+
+        # Tank/blend mode selection with hysteresis.
+        # force_tank_escape and force_reverse_escape override normal mode selection
+        # during escape stages B–D; the tank-turn watchdog is suppressed for those
+        # iterations so the 25 s timer doesn't accumulate against escape attempts.
+        leg.in_tank_mode = is_in_tank_mode(abs_error=abs(err), currently_in_tank=leg.in_tank_mode)
+        if escape.force_tank_escape:
+            leg.in_tank_mode = True
+
+        if escape.force_gps_pivot:
+            # GPS stall escape phase 1: tank pivot to break contact and get new traction.
+            _pivot_spd = self.max_speed * 0.5
+            left_speed = _pivot_spd * leg.gps_stall_pivot_dir
+            right_speed = -_pivot_spd * leg.gps_stall_pivot_dir
+            leg.tank_turn_start = None
+            logger.debug(
+                "GPS stall escape: pivot dir=%+.0f spd=%.2f hdg=%.1f°",
+                leg.gps_stall_pivot_dir, _pivot_spd, current_heading,
+            )
+        elif escape.force_gps_forward:
+            # GPS stall escape phase 2: straight forward to move to new ground.
+            left_speed = self.cruise_speed
+            right_speed = self.cruise_speed
+            leg.tank_turn_start = None
+            logger.debug(
+                "GPS stall escape: forward drive spd=%.2f hdg=%.1f°",
+                self.cruise_speed, current_heading,
+            )
+        elif escape.force_reverse_escape:
+            # Stage C: straight reverse to change ground contact
+            left_speed, right_speed = -0.35, -0.35
+            leg.tank_turn_start = None
+            logger.debug(
+                "Escape C: dispatching reverse (%.2f, %.2f) hdg=%.1f°",
+                left_speed, right_speed, current_heading,
+            )
+        elif leg.in_tank_mode:
+            if escape.force_tank_escape:
+                # Don't tick the watchdog during escape; reset it so normal
+                # tank turns get a clean 25 s window after escape succeeds.
+                leg.tank_turn_start = None
+            else:
+                if leg.tank_turn_start is None:
+                    leg.tank_turn_start = time.monotonic()
+                elif (time.monotonic() - leg.tank_turn_start) > self._TANK_TURN_TIMEOUT_S:
+                    logger.error(
+                        "Tank-turn watchdog: heading not converging after %.0f s "
+                        "(last err=%.1f°, hdg=%.1f°) — aborting waypoint",
+                        self._TANK_TURN_TIMEOUT_S,
+                        err,
+                        current_heading,
+                    )
+                    await self._enter_safety_hold(reason="tank-turn timeout")
+                    raise RuntimeError(
+                        f"Tank-turn timed out after {self._TANK_TURN_TIMEOUT_S:.0f} s "
+                        "without heading convergence"
+                    )
+            left_speed, right_speed = compute_tank_speeds(
+                err, max_speed=self.max_speed, stall_boost=escape.stall_boost
+            )
+        else:
+            leg.tank_turn_start = None
+
+            # Stanley path-tracker: combine filtered heading error with
+            # cross-track-error correction.  Falls back to raw heading error
+            # during bootstrap (no IMU) or before path anchor is established.
+            _steer = err
+            _loc_state = getattr(self._loc, "state", None)
+            _loc_vel = (
+                getattr(self._loc, "velocity", None)
+                if getattr(self._loc, "velocity", None) is not None
+                else (getattr(_loc_state, "velocity", None) if _loc_state is not None else None)
+            ) or 0.0
             if (
-                self._tc is not None
-                and not _force_reverse_escape
-                and not _force_tank_escape
-                and not _force_gps_pivot
-                and not _force_gps_forward
-                and not (_stall_boost > 0)
+                not heading.bootstrap
+                and leg.path_a_lat is not None
+                and leg.heading_ema is not None
             ):
-                _enc1, _enc2 = (
-                    self._encoder_rpm_provider()
-                    if self._encoder_rpm_provider is not None
-                    else (0.0, 0.0)
+                _cte = cross_track_error(
+                    (current_position.latitude, current_position.longitude),
+                    (leg.path_a_lat, leg.path_a_lon),
+                    (target_pos.latitude, target_pos.longitude),
                 )
-                self._tc.update_motor_feedback(_enc1, _enc2)
-                _loc_state = getattr(self._loc, "state", None)
-                _pos = getattr(_loc_state, "current_position", None)
-                _accuracy = getattr(_pos, "accuracy", None)
-                _quality = getattr(_loc_state, "quality", None)
-                self._tc.update_velocity_feedback(
-                    base_speed,
-                    getattr(_loc_state, "velocity", None) or 0.0,
-                    gps_accuracy=_accuracy,
-                    pose_quality=_quality,
+                _heading_err_path = heading_error(
+                    target=heading.target, current=leg.heading_ema
                 )
-                left_speed, right_speed = self._tc.apply_boost_to_command(
-                    left_speed, right_speed, max_speed=self.max_speed
+                _s_k_cte, _s_dead_band = self._tiered_stanley_params()
+                _steer = stanley_steer(
+                    _heading_err_path, _cte, _loc_vel,
+                    k_cte=_s_k_cte, dead_band_m=_s_dead_band,
                 )
-
-            # Dispatch drive command through gateway
-            _motor_attempts = 3
-            _motor_last_exc: Exception | None = None
-            for _attempt in range(1, _motor_attempts + 1):
-                try:
-                    ok = await self._gw.dispatch_drive_speeds(left_speed, right_speed)
-                    if ok:
-                        _motor_last_exc = None
-                        break
-                    raise RuntimeError("gateway rejected drive command")
-                except Exception as exc:
-                    _motor_last_exc = exc
-                    logger.warning(
-                        "Motor command attempt %d/%d failed: %s", _attempt, _motor_attempts, exc
-                    )
-                    if _attempt < _motor_attempts:
-                        await asyncio.sleep(0.15)
-            if _motor_last_exc is not None:
-                logger.error(
-                    "All %d motor command attempts failed: %s", _motor_attempts, _motor_last_exc
+                logger.debug(
+                    "STANLEY: path_bearing=%.1f° ema_hdg=%.1f° err=%.1f° "
+                    "cte=%.3fm steer=%.1f° k_cte=%.2f db=%.2fm",
+                    heading.target,
+                    leg.heading_ema,
+                    _heading_err_path,
+                    _cte,
+                    _steer,
+                    _s_k_cte,
+                    _s_dead_band,
                 )
-                # Before aborting the mission: check whether the RoboHAT watchdog
-                # has detected a firmware crash (REPL mode or freeze) and is in the
-                # process of auto-recovering.  Wait up to 15 s for motor_controller_ok
-                # to become True, then retry once so the mission can continue.
-                # Skip the wait if auto-recovery has been throttled — that means the
-                # firmware keeps crashing and operator intervention is needed.
-                try:
-                    from .robohat_service import get_robohat_service as _get_robohat
-                    _robohat = _get_robohat()
-                    if (
-                        _robohat is not None
-                        and _robohat.status.serial_connected
-                        and not _robohat.recovery_throttled
-                        and (_robohat._in_soft_reset or _robohat._in_repl)
-                    ):
-                        logger.warning(
-                            "RoboHAT firmware recovery in progress; suspending mission up to 15 s"
-                        )
-                        _recovery_deadline = time.monotonic() + 15.0
-                        while time.monotonic() < _recovery_deadline:
-                            if _robohat.status.motor_controller_ok:
-                                break
-                            await asyncio.sleep(0.5)
-                        if _robohat.status.motor_controller_ok:
-                            logger.info("RoboHAT recovered; retrying drive command")
-                            try:
-                                ok = await self._gw.dispatch_drive_speeds(left_speed, right_speed)
-                                if ok:
-                                    _motor_last_exc = None
-                            except Exception as exc:
-                                _motor_last_exc = exc
-                except Exception:
-                    pass  # recovery-wait is best-effort; original failure path applies
-
-                if _motor_last_exc is not None:
-                    await self._enter_safety_hold(reason="navigation command failure")
+                if abs(_cte) > self.max_operational_cross_track_error_m:
+                    await self._enter_safety_hold(reason="cross-track error limit")
                     raise RuntimeError(
-                        "Failed to deliver navigation motor command"
-                    ) from _motor_last_exc
+                        "Maximum operational cross-track error exceeded; revalidation required"
+                    )
 
-            # Store for next-iteration dead-reckoning
-            _prev_left_speed = left_speed
-            _prev_right_speed = right_speed
+            left_speed, right_speed = compute_blend_speeds(
+                _steer,
+                base_speed=base_speed,
+                stall_boost=escape.stall_boost,
+                max_speed=self.max_speed,
+                in_heading_bootstrap=heading.bootstrap,
+            )
 
-            # Update per-tick debug snapshot (read by NavigationService → telemetry.nav_debug)
-            _tc_boost = self._tc.state.underpower_boost if self._tc is not None else 0.0
-            _k_cte_now, _db_now = self._tiered_stanley_params()
-            self._debug_state = {
-                "mode": "tank" if _in_tank_mode else ("pre_rotate" if _pre_rotating else "blend"),
-                "heading_error_deg": round(err, 1) if err is not None else None,
-                "raw_heading_error_deg": round(_raw_abs_err, 1),
-                "cross_track_error_m": round(_cte, 3) if _cte is not None else None,
-                "along_track_progress_m": round(_along_track_m, 3),
-                "path_segment_length_m": round(_segment_len_m, 3),
-                "steer_deg": round(_steer, 1) if _steer is not None else None,
-                "path_bearing_deg": round(_path_bearing, 1) if _path_bearing is not None else None,
-                "velocity_mps": round(_loc_vel, 3) if _loc_vel is not None else None,
-                "heading_source": getattr(self._loc, "heading_source", None),
-                "pose_quality": getattr(self._loc, "quality", None),
-                "stanley_k_cte": _k_cte_now,
-                "stanley_dead_band_m": _db_now,
-                "distance_to_waypoint_m": round(distance_to_target, 2),
-                "left_speed_cmd": round(left_speed, 3),
-                "right_speed_cmd": round(right_speed, 3),
-                "base_speed": round(base_speed, 3),
-                "stall_boost": round(_stall_boost, 2),
-                "traction_boost": round(_tc_boost, 2),
-                "enc_rpm_a": round(_enc_rpm_a, 1),
-                "enc_rpm_b": round(_enc_rpm_b, 1),
-                "pre_rotating": _pre_rotating,
-                "in_tank_mode": _in_tank_mode,
-                "gps_accuracy_m": round(current_position.accuracy, 3)
-                    if current_position.accuracy is not None
-                    else None,
-            }
+        # Adaptive traction boost — suppressed during any escape phase or existing stall boost
+        if (
+            self._tc is not None
+            and not escape.force_reverse_escape
+            and not escape.force_tank_escape
+            and not escape.force_gps_pivot
+            and not escape.force_gps_forward
+            and not (escape.stall_boost > 0)
+        ):
+            _enc1, _enc2 = (
+                self._encoder_rpm_provider()
+                if self._encoder_rpm_provider is not None
+                else (0.0, 0.0)
+            )
+            self._tc.update_motor_feedback(_enc1, _enc2)
+            _loc_state = getattr(self._loc, "state", None)
+            _pos = getattr(_loc_state, "current_position", None)
+            _accuracy = getattr(_pos, "accuracy", None)
+            _quality = getattr(_loc_state, "quality", None)
+            self._tc.update_velocity_feedback(
+                base_speed,
+                getattr(_loc_state, "velocity", None) or 0.0,
+                gps_accuracy=_accuracy,
+                pose_quality=_quality,
+            )
+            left_speed, right_speed = self._tc.apply_boost_to_command(
+                left_speed, right_speed, max_speed=self.max_speed
+            )
+
+        return _DriveCommand(
+            left=left_speed,
+            right=right_speed,
+            base_speed=base_speed,
+            steer=_steer,
+            cte=_cte,
+            velocity=_loc_vel,
+        )
+
+    async def _dispatch_drive_command(self, left_speed: float, right_speed: float) -> None:
+        """Dispatch drive command through gateway, waiting out a RoboHAT firmware recovery."""
+        _motor_attempts = 3
+        _motor_last_exc: Exception | None = None
+        for _attempt in range(1, _motor_attempts + 1):
+            try:
+                ok = await self._gw.dispatch_drive_speeds(left_speed, right_speed)
+                if ok:
+                    _motor_last_exc = None
+                    break
+                raise RuntimeError("gateway rejected drive command")
+            except Exception as exc:
+                _motor_last_exc = exc
+                logger.warning(
+                    "Motor command attempt %d/%d failed: %s", _attempt, _motor_attempts, exc
+                )
+                if _attempt < _motor_attempts:
+                    await asyncio.sleep(0.15)
+        if _motor_last_exc is None:
+            return
+        logger.error(
+            "All %d motor command attempts failed: %s", _motor_attempts, _motor_last_exc
+        )
+        # Before aborting the mission: check whether the RoboHAT watchdog
+        # has detected a firmware crash (REPL mode or freeze) and is in the
+        # process of auto-recovering.  Wait up to 15 s for motor_controller_ok
+        # to become True, then retry once so the mission can continue.
+        # Skip the wait if auto-recovery has been throttled — that means the
+        # firmware keeps crashing and operator intervention is needed.
+        try:
+            from .robohat_service import get_robohat_service as _get_robohat
+            _robohat = _get_robohat()
+            if (
+                _robohat is not None
+                and _robohat.status.serial_connected
+                and not _robohat.recovery_throttled
+                and (_robohat._in_soft_reset or _robohat._in_repl)
+            ):
+                logger.warning(
+                    "RoboHAT firmware recovery in progress; suspending mission up to 15 s"
+                )
+                _recovery_deadline = time.monotonic() + 15.0
+                while time.monotonic() < _recovery_deadline:
+                    if _robohat.status.motor_controller_ok:
+                        break
+                    await asyncio.sleep(0.5)
+                if _robohat.status.motor_controller_ok:
+                    logger.info("RoboHAT recovered; retrying drive command")
+                    try:
+                        ok = await self._gw.dispatch_drive_speeds(left_speed, right_speed)
+                        if ok:
+                            _motor_last_exc = None
+                    except Exception as exc:
+                        _motor_last_exc = exc
+        except Exception:
+            pass  # recovery-wait is best-effort; original failure path applies
 
-            # Control loop at 5 Hz
-            await asyncio.sleep(0.2)
+        if _motor_last_exc is not None:
+            await self._enter_safety_hold(reason="navigation command failure")
+            raise RuntimeError(
+                "Failed to deliver navigation motor command"
+            ) from _motor_last_exc
 
     # ------------------------------------------------------------------
     # Mission orchestration loop (Task 7)
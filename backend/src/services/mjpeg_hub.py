@@ -0,0 +1,224 @@
+"""Single upstream fan-out for ``/camera/stream.mjpeg`` viewers.
+
+One pump task fetches frames from the camera owner at the fastest rate any
+viewer asked for, and builds the multipart chunk for each new frame once.
+Every viewer then receives that same ``bytes`` object, so adding a viewer
+costs a queue slot and a socket write instead of another frame fetch.
+
+Each viewer has a one-slot, latest-wins mailbox and its own FPS cap. A
+viewer whose previous chunk is still unsent when the next one arrives has
+that chunk replaced and the drop counted; after repeated drops its rate is
+halved, and it climbs back towards its cap once it keeps up again. The
+owner's JPEG quality is left alone: re-encoding here would cost a decode
+and an encode per frame, which is what this hub exists to avoid.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .sensor_scheduler import DeadlineTicker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FPS = 5.0
+MIN_FPS = 0.5
+MAX_FPS = 15.0
+# Drops in a row before a viewer's rate is halved.
+_DEGRADE_AFTER_DROPS = 3
+# Seconds a degraded viewer must keep up before its rate is doubled again.
+_RECOVER_AFTER_S = 5.0
+# An unchanged frame is resent this often so idle viewers and proxies stay open.
+_REPEAT_S = 1.0
+
+FrameSource = Callable[[], Awaitable[Any]]
+
+
+def build_mjpeg_chunk(frame_bytes: bytes) -> bytes:
+    """One ``multipart/x-mixed-replace`` part with ``boundary=frame``."""
+    return b"".join(
+        (
+            b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: ",
+            str(len(frame_bytes)).encode(),
+            b"\r\n\r\n",
+            frame_bytes,
+            b"\r\n",
+        )
+    )
+
+
+async def _runtime_frame() -> Any:
+    from .camera_runtime import camera_service
+
+    return await camera_service.get_current_frame()
+
+
+class MjpegViewer:
+    """Delivery state for one MJPEG connection."""
+
+    def __init__(self, viewer_id: int, max_fps: float) -> None:
+        self.viewer_id = viewer_id
+        self.max_fps = max_fps
+        self.fps = max_fps
+        self.next_due = 0.0
+        self.sent = 0
+        self.dropped = 0
+        self.degraded = 0
+        self._pending: bytes | None = None
+        self._last: bytes | None = None
+        self._last_offered_at = 0.0
+        self._drop_streak = 0
+        self._clean_since: float | None = None
+        self._wakeup = asyncio.Event()
+
+    def offer(self, chunk: bytes, now: float) -> None:
+        """Hand the viewer *chunk* if its cadence is up; an unsent chunk is replaced."""
+        if now < self.next_due:
+            return
+        if chunk is self._last and now - self._last_offered_at < _REPEAT_S:
+            return
+        self.next_due = now + 1.0 / self.fps
+        self._last, self._last_offered_at = chunk, now
+        if self._pending is not None:
+            self.dropped += 1
+            self._drop_streak += 1
+            self._clean_since = None
+            if self._drop_streak >= _DEGRADE_AFTER_DROPS and self.fps > MIN_FPS:
+                self.fps = max(MIN_FPS, self.fps / 2.0)
+                self.degraded += 1
+                self._drop_streak = 0
+        elif self.fps < self.max_fps:
+            if self._clean_since is None:
+                self._clean_since = now
+            elif now - self._clean_since >= _RECOVER_AFTER_S:
+                self.fps = min(self.max_fps, self.fps * 2.0)
+                self._clean_since = now
+        self._pending = chunk
+        self._wakeup.set()
+
+    async def next_chunk(self, timeout: float | None = None) -> bytes | None:
+        """Wait for the next chunk; ``None`` if *timeout* passes first."""
+        if self._pending is None:
+            self._wakeup.clear()
+            try:
+                async with asyncio.timeout(timeout):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                return None
+        chunk, self._pending = self._pending, None
+        if chunk is not None:
+            self.sent += 1
+            self._drop_streak = 0
+        return chunk
+
+
+class MjpegHub:
+    """Fetches each camera frame once and fans its multipart chunk out to viewers."""
+
+    def __init__(self, frame_source: FrameSource | None = None) -> None:
+        self._frame_source = frame_source or _runtime_frame
+        self._viewers: dict[int, MjpegViewer] = {}
+        self._ids = itertools.count(1)
+        self._task: asyncio.Task | None = None
+        self._chunk: bytes | None = None
+        self._frame_key: Any = None
+        self.frames_fetched = 0
+        self.chunks_built = 0
+        self.fetch_errors = 0
+
+    def subscribe(self, fps: float | None = None) -> MjpegViewer:
+        """Register a viewer capped at *fps* and make sure the pump is running."""
+        max_fps = DEFAULT_FPS if fps is None else max(MIN_FPS, min(MAX_FPS, float(fps)))
+        viewer = MjpegViewer(next(self._ids), max_fps)
+        self._viewers[viewer.viewer_id] = viewer
+        if self._chunk is not None:
+            # A new viewer sees the current frame at once, not after the next tick.
+            viewer.offer(self._chunk, time.monotonic())
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._pump(), name="mjpeg_hub_pump")
+        return viewer
+
+    def unsubscribe(self, viewer: MjpegViewer) -> None:
+        """Forget *viewer*; the pump exits on its next tick once none remain."""
+        self._viewers.pop(viewer.viewer_id, None)
+
+    async def shutdown(self) -> None:
+        self._viewers.clear()
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._chunk = None
+        self._frame_key = None
+
+    def stats(self) -> dict[str, Any]:
+        """Hub counters and per-viewer delivery state for ``/metrics``."""
+        viewers = list(self._viewers.values())
+        return {
+            "viewers": len(viewers),
+            "frames_fetched": self.frames_fetched,
+            "chunks_built": self.chunks_built,
+            "fetch_errors": self.fetch_errors,
+            "chunks_sent": sum(v.sent for v in viewers),
+            "chunks_dropped": sum(v.dropped for v in viewers),
+            "degraded_viewers": sum(1 for v in viewers if v.fps < v.max_fps),
+        }
+
+    def _pump_period(self) -> float:
+        return 1.0 / max(v.fps for v in self._viewers.values())
+
+    async def _pump(self) -> None:
+        ticker = DeadlineTicker(self._pump_period())
+        while self._viewers:
+            await self._tick()
+            if not self._viewers:
+                break
+            await ticker.wait(self._pump_period())
+
+    async def _tick(self) -> None:
+        try:
+            frame = await self._frame_source()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self.fetch_errors += 1
+            logger.debug("MJPEG hub frame fetch failed: %s", exc)
+            return
+        self.frames_fetched += 1
+        chunk = self._chunk_for(frame)
+        if chunk is None:
+            return
+        now = time.monotonic()
+        for viewer in list(self._viewers.values()):
+            viewer.offer(chunk, now)
+
+    def _chunk_for(self, frame: Any) -> bytes | None:
+        if frame is None:
+            return self._chunk
+        frame_bytes = frame.get_frame_data() if hasattr(frame, "get_frame_data") else None
+        if not frame_bytes:
+            return self._chunk
+        metadata = getattr(frame, "metadata", None)
+        frame_id = getattr(metadata, "frame_id", None)
+        # Ring reads hand back the same bytes until a new frame lands; socket
+        # fetches are new objects each time but carry the owner's frame id.
+        key = (frame_id, getattr(metadata, "sequence_number", None)) if frame_id else frame_bytes
+        if self._chunk is not None and (
+            key is self._frame_key or (frame_id and key == self._frame_key)
+        ):
+            return self._chunk
+        self._frame_key = key
+        self._chunk = build_mjpeg_chunk(frame_bytes)
+        self.chunks_built += 1
+        return self._chunk
+
+
+mjpeg_hub = MjpegHub()
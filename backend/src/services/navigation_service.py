@@ -655,6 +655,16 @@ class NavigationService:
 
         from .mission_executor import MissionExecutor
 
+        # Waypoint control loop rate (clamped to 5–20 Hz by MissionExecutor) and
+        # whether a fresh pose sample starts the next control tick early.
+        try:
+            control_rate_hz = float(os.getenv("LAWNBERRY_CONTROL_RATE_HZ", "10"))
+        except ValueError:
+            control_rate_hz = 10.0
+        wake_on_pose = os.getenv("LAWNBERRY_CONTROL_WAKE_ON_POSE", "0") == "1"
+        # (GPS sample id or fix time, IMU receive time) of the last pose wake.
+        self._last_pose_sample: tuple[Any, Any] | None = None
+
         self._localization_adapter = _NavStateLocalizationAdapter(self)
         self._gateway_adapter = _NavGatewayAdapter(self)
         self._mission_executor = MissionExecutor(
@@ -673,6 +683,8 @@ class NavigationService:
             max_waypoint_accuracy_m=self.max_waypoint_accuracy_m,
             position_verification_timeout_seconds=self.position_verification_timeout_seconds,
             max_operational_cross_track_error_m=self.max_operational_cross_track_error_m,
+            control_rate_hz=control_rate_hz,
+            wake_on_pose=wake_on_pose,
         )
 
     @staticmethod
@@ -747,6 +759,7 @@ class NavigationService:
             goal,
             snapshot.safe_boundary,
             obstacles=obstacle_polygons,
+            exclusions=snapshot.exclusions,
             grid_resolution_m=0.25,
             safety_margin_m=0.10,
             boundary_margin_m=self.coverage_endpoint_clearance_m,
@@ -2026,6 +2039,19 @@ class NavigationService:
         try:
             state = await _dispatch(sensor_data)
             self._update_gps_degradation_state()
+            if state.current_position is not None:
+                # Only a new GPS fix or IMU sample is a new pose; re-fused cached
+                # readings must not start control ticks early.
+                gps, imu = sensor_data.gps, sensor_data.imu
+                pose_sample = (
+                    (gps.sample_id if gps.sample_id is not None else gps.timestamp)
+                    if gps is not None
+                    else None,
+                    imu.monotonic_received_s if imu is not None else None,
+                )
+                if pose_sample != self._last_pose_sample:
+                    self._last_pose_sample = pose_sample
+                    self._mission_executor.notify_pose_sample()
             return state
         finally:
             duration_ms = (time.perf_counter() - start) * 1000.0
@@ -2,6 +2,14 @@
 
 This module keeps geofence checks in a local projected metre frame. Production
 motion must never buffer latitude/longitude degrees directly.
+
+Containment checks run against a per-snapshot ``_FreeSpaceIndex`` instead of
+buffering fresh geometries per call: a disc (or a segment swept by a disc) of
+radius ``r`` fits in free space exactly when its centre (or centre line) is
+covered and its nearest boundary edge, found through an STRtree, is at least
+``r`` away. A coarse signed-distance raster answers most single-point queries
+without touching the geometry, and whole paths are first tried in one call
+against a cached, slightly over-eroded copy of the free space.
 """
 
 from __future__ import annotations
@@ -9,10 +17,13 @@ from __future__ import annotations
 import json
 import math
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
+import shapely
+from shapely import STRtree
 from shapely.geometry import LineString, Point, Polygon
 from shapely.ops import nearest_points, unary_union
 
@@ -27,6 +38,16 @@ from .geofence_buffer import boundary_revision_hash
 
 LatLng = tuple[float, float]
 
+# Extra erosion, relative to the radius, covering the chord error of buffered
+# arcs (about 0.12 % at shapely's default 16 segments per quarter circle) so a
+# path accepted by the eroded polygon is always accepted by the exact check.
+_EROSION_TOLERANCE = 0.005
+_ERODED_CACHE_SIZE = 8
+# The raster is built once a snapshot has answered this many point queries.
+_RASTER_AFTER_QUERIES = 32
+_RASTER_MAX_CELLS = 65_536
+_RASTER_MIN_CELL_M = 0.10
+
 
 class OperatingAreaError(RuntimeError):
     """Raised when the operating area cannot authorize autonomy."""
@@ -55,22 +76,50 @@ class OperatingAreaSnapshot:
     _safe_outer_xy: Polygon
     _exclusions_xy: tuple[Polygon, ...]
     _free_space_xy: Any
+    _index: _FreeSpaceIndex | None = field(default=None, repr=False, compare=False)
 
     @property
     def valid(self) -> bool:
         return self.validity_state == "valid"
 
+    @property
+    def spatial_index(self) -> _FreeSpaceIndex:
+        index = self._index
+        if index is None:
+            index = _FreeSpaceIndex(self._free_space_xy)
+            object.__setattr__(self, "_index", index)
+        return index
+
     def contains_center(self, position: Position) -> bool:
-        return bool(self._free_space_xy.covers(self._point_xy(position)))
+        return self.spatial_index.covers_xy(*self._xy(position))
 
     def contains_footprint(self, position: Position, uncertainty_m: float = 0.0) -> bool:
-        radius = max(0.0, float(uncertainty_m))
-        return bool(self._free_space_xy.covers(self._point_xy(position).buffer(radius)))
+        x, y = self._xy(position)
+        return self.spatial_index.disc_is_clear(x, y, max(0.0, float(uncertainty_m)))
+
+    def footprints_are_safe(self, points: list[Position], uncertainty_m: float = 0.0) -> list[bool]:
+        """``contains_footprint`` for every point, in one vectorized query."""
+        if not points:
+            return []
+        clear = self.spatial_index.discs_are_clear(
+            self._xy_array(points), max(0.0, float(uncertainty_m))
+        )
+        return [bool(value) for value in clear]
 
     def distance_to_boundary(self, position: Position) -> float:
-        point = self._point_xy(position)
-        distance = float(point.distance(self._free_space_xy.boundary))
-        return distance if self._free_space_xy.covers(point) else -distance
+        return self.spatial_index.signed_distance(*self._xy(position))
+
+    def clearance_estimate(self, position: Position) -> tuple[float, float]:
+        """Signed boundary distance as a ``(value, max_error_m)`` raster lookup.
+
+        O(1) once the raster exists; falls back to the exact distance with zero
+        error before that or outside the rastered area.
+        """
+        return self.spatial_index.clearance(*self._xy(position))
+
+    def eroded_free_space(self, radius_m: float) -> Any:
+        """Free space shrunk by *radius_m*: where a disc of that radius may be centred."""
+        return self.spatial_index.eroded(max(0.0, float(radius_m)), tolerance=False)
 
     def safe_approach_position(
         self,
@@ -80,8 +129,7 @@ class OperatingAreaSnapshot:
         """Project a reference point to the nearest center-safe stand-off target."""
         if not self.valid:
             raise OperatingAreaError("SAFE_BOUNDARY_REQUIRED", self.validity_state)
-        clearance = max(0.0, float(clearance_m))
-        center_space = self._free_space_xy.buffer(-clearance)
+        center_space = self.eroded_free_space(clearance_m)
         if center_space.is_empty:
             raise OperatingAreaError(
                 "SAFE_BOUNDARY_COLLAPSED",
@@ -101,19 +149,38 @@ class OperatingAreaSnapshot:
         end: Position,
         margin_m: float = 0.0,
     ) -> bool:
+        """True when the flat-ended band of half-width *margin_m* along the segment is free."""
+        margin = max(0.0, float(margin_m))
         line = LineString([self._xy(start), self._xy(end)])
-        envelope = line.buffer(max(0.0, float(margin_m)), cap_style=2, join_style=2)
-        return bool(self._free_space_xy.covers(envelope))
+        index = self.spatial_index
+        # The round-capped band contains the flat one, so a clear sweep settles it.
+        if index.sweeps_are_clear([line], margin)[0]:
+            return True
+        if margin <= 0.0:
+            return False
+        return index.covers(line.buffer(margin, cap_style=2, join_style=2))
 
     def path_is_safe(self, points: list[Position], margin_m: float = 0.0) -> bool:
+        """Every point's footprint and every segment's band lie in free space.
+
+        Together those are the disc of radius *margin_m* swept along the path,
+        which is what ``trajectory_is_safe`` checks.
+        """
+        return self.trajectory_is_safe(points, margin_m)
+
+    def trajectory_is_safe(self, points: list[Position], radius_m: float) -> bool:
+        """Check a whole path or predicted trajectory swept by a disc in one call."""
         if not points:
             return False
-        if any(not self.contains_footprint(point, margin_m) for point in points):
-            return False
-        return all(
-            self.segment_is_safe(points[index], points[index + 1], margin_m)
-            for index in range(len(points) - 1)
-        )
+        radius = max(0.0, float(radius_m))
+        coords = self._xy_array(points)
+        index = self.spatial_index
+        if len(coords) == 1:
+            return bool(index.discs_are_clear(coords, radius)[0])
+        if index.eroded(radius).covers(LineString(coords)):
+            return True
+        segments = shapely.linestrings(np.stack([coords[:-1], coords[1:]], axis=1))
+        return bool(index.sweeps_are_clear(segments, radius).all())
 
     def swept_motion_is_safe(
         self,
@@ -131,13 +198,14 @@ class OperatingAreaSnapshot:
         braking_decel_mps2: float,
     ) -> bool:
         radius = max(0.0, footprint_radius_m + uncertainty_m + fixed_allowance_m)
-        point = self._point_xy(pose)
-        if not self._free_space_xy.covers(point.buffer(radius)):
+        x, y = self._xy(pose)
+        index = self.spatial_index
+        if not index.disc_is_clear(x, y, radius):
             return False
 
         linear = (float(left_speed) + float(right_speed)) / 2.0
         if abs(linear) < 1e-6:
-            return bool(self._free_space_xy.covers(point.buffer(radius)))
+            return True
 
         if heading_deg is None:
             return False
@@ -146,10 +214,8 @@ class OperatingAreaSnapshot:
         heading_rad = math.radians(float(heading_deg))
         north_m = math.cos(heading_rad) * distance_m * (1 if linear >= 0 else -1)
         east_m = math.sin(heading_rad) * distance_m * (1 if linear >= 0 else -1)
-        x, y = self._xy(pose)
-        end_xy = (x + east_m, y + north_m)
-        envelope = LineString([(x, y), end_xy]).buffer(radius, cap_style=1, join_style=1)
-        return bool(self._free_space_xy.covers(envelope))
+        sweep = LineString([(x, y), (x + east_m, y + north_m)])
+        return bool(index.sweeps_are_clear([sweep], radius)[0])
 
     def validate_ready_for_autonomy(
         self,
@@ -198,6 +264,160 @@ class OperatingAreaSnapshot:
     def _point_xy(self, position: Position) -> Point:
         return Point(self._xy(position))
 
+    def _xy_array(self, points: list[Position]) -> np.ndarray:
+        return np.array([self._xy(point) for point in points], dtype=float).reshape(-1, 2)
+
+
+class _FreeSpaceIndex:
+    """Precomputed query structures for one free-space geometry.
+
+    Built once per snapshot and only read afterwards, apart from the lazily
+    filled eroded-polygon cache and raster, whose worst race is building the
+    same value twice.
+    """
+
+    def __init__(self, free_space: Any) -> None:
+        self.free_space = free_space
+        shapely.prepare(free_space)
+        self.edges = _boundary_edges(free_space)
+        self.tree = STRtree(self.edges)
+        self._eroded: dict[float, Any] = {}
+        self._queries = 0
+        self._raster: _ClearanceRaster | None = None
+
+    def covers(self, geometry: Any) -> bool:
+        return bool(shapely.covers(self.free_space, geometry))
+
+    def covers_xy(self, x: float, y: float) -> bool:
+        return self.covers(Point(x, y))
+
+    def edge_distances(self, geometries: Any) -> np.ndarray:
+        """Distance from each geometry to its nearest free-space boundary edge."""
+        geometries = np.asarray(geometries, dtype=object)
+        result = np.full(len(geometries), np.inf)
+        if len(geometries) and len(self.edges):
+            (source, _edge), distances = self.tree.query_nearest(
+                geometries, return_distance=True
+            )
+            np.minimum.at(result, source, distances)
+        return result
+
+    def signed_distance(self, x: float, y: float) -> float:
+        point = Point(x, y)
+        distance = float(self.edge_distances([point])[0])
+        if not math.isfinite(distance):
+            return 0.0
+        return distance if self.covers(point) else -distance
+
+    def clearance(self, x: float, y: float) -> tuple[float, float]:
+        raster = self._raster_for_query()
+        if raster is not None:
+            estimate = raster.lookup(x, y)
+            if estimate is not None:
+                return estimate, raster.max_error_m
+        return self.signed_distance(x, y), 0.0
+
+    def disc_is_clear(self, x: float, y: float, radius: float) -> bool:
+        raster = self._raster_for_query()
+        if raster is not None:
+            estimate = raster.lookup(x, y)
+            # The distance field is 1-Lipschitz, so one cell settles clear cases.
+            if estimate is not None and estimate - raster.max_error_m >= radius:
+                return True
+            if estimate is not None and estimate + raster.max_error_m < radius:
+                return False
+        return bool(self.discs_are_clear(np.array([[x, y]]), radius)[0])
+
+    def discs_are_clear(self, coords: np.ndarray, radius: float) -> np.ndarray:
+        points = shapely.points(coords)
+        covered = shapely.covers(self.free_space, points)
+        if radius <= 0.0:
+            return covered
+        return covered & (self.edge_distances(points) >= radius)
+
+    def sweeps_are_clear(self, lines: Any, radius: float) -> np.ndarray:
+        """A disc of *radius* swept along each line stays inside free space."""
+        lines = np.asarray(lines, dtype=object)
+        covered = shapely.covers(self.free_space, lines)
+        if radius <= 0.0:
+            return covered
+        return covered & (self.edge_distances(lines) >= radius)
+
+    def eroded(self, radius: float, *, tolerance: bool = True) -> Any:
+        """Cached free space eroded by *radius*, by a little more with *tolerance*."""
+        depth = radius * (1.0 + _EROSION_TOLERANCE) if tolerance else radius
+        key = round(depth, 4)
+        cached = self._eroded.get(key)
+        if cached is None:
+            cached = self.free_space.buffer(-key) if key > 0.0 else self.free_space
+            shapely.prepare(cached)
+            if len(self._eroded) >= _ERODED_CACHE_SIZE:
+                self._eroded.pop(next(iter(self._eroded)))
+            self._eroded[key] = cached
+        return cached
+
+    def _raster_for_query(self) -> _ClearanceRaster | None:
+        if self._raster is None:
+            self._queries += 1
+            if self._queries < _RASTER_AFTER_QUERIES or self.free_space.is_empty:
+                return None
+            self._raster = _ClearanceRaster.build(self)
+        return self._raster
+
+
+class _ClearanceRaster:
+    """Signed boundary distance sampled at cell centres over the free space."""
+
+    def __init__(
+        self, origin_x: float, origin_y: float, cell_m: float, values: np.ndarray
+    ) -> None:
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.cell_m = cell_m
+        self.values = values
+        # Worst distance from a query point to the centre of its cell.
+        self.max_error_m = cell_m * math.sqrt(0.5)
+
+    @classmethod
+    def build(cls, index: _FreeSpaceIndex) -> _ClearanceRaster:
+        min_x, min_y, max_x, max_y = index.free_space.bounds
+        width = max(max_x - min_x, 1e-3)
+        height = max(max_y - min_y, 1e-3)
+        cell = max(_RASTER_MIN_CELL_M, math.sqrt(width * height / _RASTER_MAX_CELLS))
+        cols = max(1, math.ceil(width / cell))
+        rows = max(1, math.ceil(height / cell))
+        xs = min_x + (np.arange(cols) + 0.5) * cell
+        ys = min_y + (np.arange(rows) + 0.5) * cell
+        grid_x, grid_y = np.meshgrid(xs, ys)
+        centres = shapely.points(np.column_stack([grid_x.ravel(), grid_y.ravel()]))
+        distances = index.edge_distances(centres)
+        inside = shapely.covers(index.free_space, centres)
+        values = np.where(inside, distances, -distances).reshape(rows, cols)
+        return cls(min_x, min_y, cell, values)
+
+    def lookup(self, x: float, y: float) -> float | None:
+        col = math.floor((x - self.origin_x) / self.cell_m)
+        row = math.floor((y - self.origin_y) / self.cell_m)
+        rows, cols = self.values.shape
+        if not (0 <= row < rows and 0 <= col < cols):
+            return None
+        return float(self.values[row, col])
+
+
+def _boundary_edges(free_space: Any) -> np.ndarray:
+    """Every boundary ring of *free_space* split into two-point segments."""
+    segments = []
+    for part in shapely.get_parts(free_space):
+        if not isinstance(part, Polygon) or part.is_empty:
+            continue
+        for ring in shapely.get_rings(part):
+            coords = shapely.get_coordinates(ring)
+            if len(coords) >= 2:
+                segments.append(np.stack([coords[:-1], coords[1:]], axis=1))
+    if not segments:
+        return np.empty(0, dtype=object)
+    return shapely.linestrings(np.concatenate(segments))
+
 
 def load_operating_area_snapshot(
     *,
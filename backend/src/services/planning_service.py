@@ -28,7 +28,7 @@ from typing import Any
 
 from backend.src.models import Position
 from backend.src.models.mission import MissionLegType, MissionWaypoint
-from backend.src.nav.coverage_planner import plan_coverage_segments
+from backend.src.nav.coverage_planner import plan_coverage_segments, sweep_coverage_angles
 from backend.src.nav.path_planner import PathPlanner
 from backend.src.services.operating_area_service import load_operating_area_snapshot
 
@@ -87,6 +87,7 @@ class PlanningService:
             "blade_safe_connectors": True,
             "footprint_clearance": True,
             "dynamic_obstacle_replan": True,
+            "auto_angle": True,
         }
 
     # ------------------------------------------------------------------
@@ -112,7 +113,8 @@ class PlanningService:
         params:
             Planning parameters (all optional):
               - ``spacing_m``   (float, default 0.35) — scanline spacing in metres.
-              - ``angle_deg``   (float, default 0.0)  — scanline bearing.
+              - ``angle_deg``   (float, default 0.0)  — scanline bearing, or
+                ``"auto"`` to sweep bearings and use the cheapest.
               - ``speed_ms``    (float, default 0.5)  — travel speed m/s for duration estimate.
               - ``blade_on``    (bool, default True)  — set only on declared mow legs.
               - ``speed_pct``   (int,  default 50)    — waypoint speed 0-100 %.
@@ -165,7 +167,9 @@ class PlanningService:
 
         # Planning parameters
         spacing_m = float(params.get("spacing_m", 0.35))
-        angle_deg = float(params.get("angle_deg", 0.0))
+        raw_angle = params.get("angle_deg", 0.0)
+        auto_angle = isinstance(raw_angle, str) and raw_angle.strip().lower() == "auto"
+        angle_deg = 0.0 if auto_angle else float(raw_angle)
         speed_ms = float(params.get("speed_ms", 0.5))
         blade_on = bool(params.get("blade_on", True))
         speed_pct = int(params.get("speed_pct", 50))
@@ -175,6 +179,22 @@ class PlanningService:
         # Dispatch to the footprint-eroded coverage planner. It returns only
         # independent mow segments; every inter-segment connector is planned
         # and typed blade-off below.
+        if auto_angle:
+            sweep = sweep_coverage_angles(
+                boundary,
+                exclusions if exclusions else None,
+                spacing_m=spacing_m,
+                clearance_m=clearance_m + 0.10,
+            )
+            if sweep is not None:
+                angle_deg = sweep.best_angle_deg
+                logger.info(
+                    "Coverage angle sweep for zone %s chose %.1f° (%d turns)",
+                    zone_id,
+                    angle_deg,
+                    sweep.best.turns,
+                )
+
         if pattern == "parallel":
             segments, _row_count, mow_length_m = plan_coverage_segments(
                 boundary=boundary,
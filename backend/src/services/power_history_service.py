@@ -4,6 +4,10 @@ Records time-series power data (battery voltage/current, solar power, load power
 estimated SoC) tagged with the current mower activity (idle, mowing, manual,
 charging, etc.).  Provides query helpers for the Power History API endpoint.
 
+Raw rows back ``query_raw``; each sample is also folded into the persistence
+time-series rollups (``power.<field>`` tagged by activity and source), which
+serve ``query_history`` without re-aggregating raw rows.
+
 Sampling cadence:
   - Day (sun above civil-twilight threshold, -6°): every LOG_INTERVAL_DAY_S seconds
   - Night: every LOG_INTERVAL_NIGHT_S seconds
@@ -13,9 +17,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import UTC, datetime
 from typing import Any
 
+from .sensor_scheduler import DeadlineTicker
+
 logger = logging.getLogger(__name__)
 
 # Default sampling intervals (seconds)
@@ -52,8 +59,24 @@ CREATE TABLE IF NOT EXISTS power_history (
 CREATE INDEX IF NOT EXISTS idx_power_history_ts ON power_history(ts);
 """
 
-# Prune records older than this many days to keep the DB from growing unbounded
-_PRUNE_DAYS = 7
+# Raw rows only back the raw endpoint (max 24 h); charts read the rollup tiers,
+# which have their own retention.
+_PRUNE_DAYS = 2
+_PRUNE_INTERVAL_S = 3600.0
+
+# Fields folded into the time-series rollups as ``power.<field>``
+_SERIES_FIELDS = (
+    "batt_v",
+    "batt_a",
+    "batt_w",
+    "solar_w",
+    "load_w",
+    "soc_pct",
+    "sample_age_s",
+    "fresh",
+)
+_SERIES = tuple(f"power.{name}" for name in _SERIES_FIELDS)
+_BACKFILL_CHUNK = 5000
 
 class PowerHistoryService:
     """Logs power samples to SQLite and provides query helpers."""
@@ -110,15 +133,24 @@ class PowerHistoryService:
         logger.info("PowerHistoryService stopped")
 
     async def _run_loop(self) -> None:
+        try:
+            await asyncio.to_thread(self._backfill_rollups)
+        except Exception:
+            logger.exception("PowerHistoryService: rollup backfill failed")
+        next_prune = 0.0
+        ticker = DeadlineTicker(LOG_INTERVAL_DAY_S if self._is_day else LOG_INTERVAL_NIGHT_S)
         while self._running:
-            interval = LOG_INTERVAL_DAY_S if self._is_day else LOG_INTERVAL_NIGHT_S
-            await asyncio.sleep(interval)
+            await ticker.wait(LOG_INTERVAL_DAY_S if self._is_day else LOG_INTERVAL_NIGHT_S)
             if not self._running:
                 break
             try:
                 await self._log_sample()
             except Exception:
                 logger.exception("PowerHistoryService: error logging sample")
+            now = time.monotonic()
+            if now >= next_prune:
+                next_prune = now + _PRUNE_INTERVAL_S
+                await asyncio.to_thread(self.prune_old_records)
 
     async def _log_sample(self) -> None:
         from ..models.navigation_state import NavigationMode
@@ -177,6 +209,14 @@ class PowerHistoryService:
         )
 
     def _write_sample(self, **kwargs) -> None:
+        try:
+            self._persistence.timeseries.record(
+                {f"power.{name}": kwargs.get(name) for name in _SERIES_FIELDS},
+                ts=kwargs["ts"],
+                tags={"activity": kwargs.get("activity"), "source": kwargs.get("source")},
+            )
+        except Exception:
+            logger.exception("PowerHistoryService: failed to record rollups")
         try:
             with self._persistence.get_connection() as conn:
                 conn.execute(
@@ -193,6 +233,28 @@ class PowerHistoryService:
         except Exception:
             logger.exception("PowerHistoryService: failed to write sample")
 
+    def _backfill_rollups(self) -> None:
+        """Fold raw rows into the rollups once, for databases that predate them."""
+        store = self._persistence.timeseries
+        if store.has_series("power."):
+            return
+        with self._persistence.read_connection() as conn:
+            cursor = conn.execute(
+                f"SELECT ts, activity, source, {', '.join(_SERIES_FIELDS)} "
+                "FROM power_history ORDER BY ts ASC"
+            )
+            total = 0
+            while rows := cursor.fetchmany(_BACKFILL_CHUNK):
+                store.record_many(
+                    (row[0], series, value, {"activity": row[1], "source": row[2]})
+                    for row in rows
+                    for series, value in zip(_SERIES, row[3:], strict=True)
+                )
+                total += len(rows)
+        if total:
+            self._persistence.flush()
+            logger.info("PowerHistoryService: backfilled rollups from %d raw rows", total)
+
     # ------------------------------------------------------------------
     # Time-of-day control (called by PowerManager)
     # ------------------------------------------------------------------
@@ -214,73 +276,72 @@ class PowerHistoryService:
     ) -> list[dict[str, Any]]:
         """Return time-bucketed power history rows.
 
-        Rows are averaged into buckets of *resolution_minutes* width.
-        Returns newest-first order within each bucket for consistency with
-        UI rendering conventions.
+        Rows are averaged into buckets of *resolution_minutes* width, one row
+        per (bucket, activity), oldest first. Served from the coarsest rollup
+        tier that divides the bucket width, so a 7-day chart reads a few
+        hundred pre-aggregated rows rather than every raw sample.
         """
         now_ts = datetime.now(UTC).timestamp()
         since_ts = now_ts - hours * 3600.0
         bucket_s = max(1.0, resolution_minutes * 60.0)
-
-        activity_clause = ""
-        if activity_filter:
-            activity_clause = "AND activity = ?"
-
-        # Build query with all-positional params (sqlite3 doesn't allow mixing named + positional)
-        where_params: list[Any] = [since_ts]
-        if activity_filter:
-            where_params.append(activity_filter)
-        sql = f"""
-            SELECT
-                CAST(ts / {bucket_s} AS INTEGER) * {bucket_s} + {bucket_s} / 2 AS bucket_ts,
-                AVG(batt_v), AVG(batt_a), AVG(batt_w), AVG(solar_w), AVG(load_w),
-                AVG(soc_pct), GROUP_CONCAT(DISTINCT source), MAX(sample_age_s),
-                MIN(fresh), activity
-            FROM power_history
-            WHERE ts >= ?
-            {activity_clause}
-            GROUP BY CAST(ts / {bucket_s} AS INTEGER), activity
-            ORDER BY bucket_ts ASC
-        """
         try:
-            with self._persistence.get_connection() as conn:
-                cursor = conn.execute(sql, where_params)
-                rows = []
-                for row in cursor.fetchall():
-                    (
-                        bucket_ts,
-                        batt_v,
-                        batt_a,
-                        batt_w,
-                        solar_w,
-                        load_w,
-                        soc_pct,
-                        source,
-                        sample_age_s,
-                        fresh,
-                        activity,
-                    ) = row
-                    rows.append(
-                        {
-                            "ts": bucket_ts,
-                            "iso_ts": datetime.fromtimestamp(bucket_ts, UTC).isoformat(),
-                            "batt_v": round(batt_v, 3) if batt_v is not None else None,
-                            "batt_a": round(batt_a, 3) if batt_a is not None else None,
-                            "batt_w": round(batt_w, 2) if batt_w is not None else None,
-                            "solar_w": round(solar_w, 2) if solar_w is not None else None,
-                            "load_w": round(load_w, 2) if load_w is not None else None,
-                            "soc_pct": round(soc_pct, 1) if soc_pct is not None else None,
-                            "source": source,
-                            "sample_age_s": sample_age_s,
-                            "fresh": bool(fresh),
-                            "activity": activity,
-                        }
-                    )
-                return rows
+            points = self._persistence.timeseries.query(
+                _SERIES, since_ts=since_ts, bucket_s=bucket_s
+            )
         except Exception:
             logger.exception("PowerHistoryService: query_history failed")
             return []
 
+        # (bucket_ts, activity) -> field -> [count, sum, min, max]; several
+        # sources may feed one activity bucket.
+        buckets: dict[tuple[float, str], dict[str, list[float]]] = {}
+        sources: dict[tuple[float, str], set[str]] = {}
+        for point in points:
+            activity = point.tags.get("activity", ACTIVITY_UNKNOWN)
+            if activity_filter and activity != activity_filter:
+                continue
+            key = (point.bucket_ts, activity)
+            fields = buckets.setdefault(key, {})
+            source = point.tags.get("source")
+            if source:
+                sources.setdefault(key, set()).add(source)
+            name = point.series.removeprefix("power.")
+            acc = fields.get(name)
+            if acc is None:
+                fields[name] = [point.count, point.mean * point.count, point.min, point.max]
+            else:
+                acc[0] += point.count
+                acc[1] += point.mean * point.count
+                acc[2] = min(acc[2], point.min)
+                acc[3] = max(acc[3], point.max)
+
+        def _avg(fields: dict[str, list[float]], name: str, digits: int) -> float | None:
+            acc = fields.get(name)
+            return round(acc[1] / acc[0], digits) if acc else None
+
+        rows = []
+        for (bucket_ts, activity), fields in sorted(buckets.items()):
+            age = fields.get("sample_age_s")
+            fresh = fields.get("fresh")
+            source = sources.get((bucket_ts, activity))
+            rows.append(
+                {
+                    "ts": bucket_ts,
+                    "iso_ts": datetime.fromtimestamp(bucket_ts, UTC).isoformat(),
+                    "batt_v": _avg(fields, "batt_v", 3),
+                    "batt_a": _avg(fields, "batt_a", 3),
+                    "batt_w": _avg(fields, "batt_w", 2),
+                    "solar_w": _avg(fields, "solar_w", 2),
+                    "load_w": _avg(fields, "load_w", 2),
+                    "soc_pct": _avg(fields, "soc_pct", 1),
+                    "source": ",".join(sorted(source)) if source else None,
+                    "sample_age_s": age[3] if age else None,
+                    "fresh": bool(fresh[2]) if fresh else False,
+                    "activity": activity,
+                }
+            )
+        return rows
+
     def query_raw(
         self,
         *,
@@ -291,7 +352,7 @@ class PowerHistoryService:
         now_ts = datetime.now(UTC).timestamp()
         since_ts = now_ts - hours * 3600.0
         try:
-            with self._persistence.get_connection() as conn:
+            with self._persistence.read_connection() as conn:
                 cursor = conn.execute(
                     """
                     SELECT ts, iso_ts, batt_v, batt_a, batt_w, solar_w, load_w, soc_pct,
@@ -341,14 +402,20 @@ class PowerHistoryService:
             return []
 
     def prune_old_records(self) -> int:
-        """Delete records older than _PRUNE_DAYS days. Returns rows deleted."""
+        """Delete raw records older than _PRUNE_DAYS days and apply rollup retention.
+
+        Returns raw rows deleted.
+        """
         cutoff = datetime.now(UTC).timestamp() - _PRUNE_DAYS * 86400.0
         try:
             with self._persistence.get_connection() as conn:
                 cursor = conn.execute(
                     "DELETE FROM power_history WHERE ts < ?", (cutoff,)
                 )
-                return cursor.rowcount
+                conn.commit()
+                deleted = cursor.rowcount
+            self._persistence.timeseries.apply_retention()
+            return deleted
         except Exception:
             logger.exception("PowerHistoryService: prune failed")
             return 0
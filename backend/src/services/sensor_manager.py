@@ -8,11 +8,13 @@ import logging
 import math
 import time
 from collections import deque
+from collections.abc import Callable
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from datetime import date as _date
 from typing import Any
 
+from ..core.observability import observability
 from ..models import (
     ComponentId,
     ComponentStatus,
@@ -33,14 +35,26 @@ from ..models import (
     TofReading,
 )
 from ..utils.battery import battery_health_label, voltage_current_to_soc, voltage_to_soc
+from .sensor_sample_bus import AlignedSnapshot, SensorSampleBus
+from .sensor_scheduler import PRIORITY_SAFETY, PRIORITY_TELEMETRY, SensorScheduler
 
 logger = logging.getLogger(__name__)
 
 
+def _record_read_duration(sensor: str, started: float) -> None:
+    observability.metrics.record_timer(
+        "sensor_read_duration",
+        (time.perf_counter() - started) * 1000.0,
+        labels={"sensor": sensor},
+    )
+
+
 class SensorCoordinator:
     """Coordinates access to shared I2C/UART resources"""
 
     def __init__(self):
+        # Periodic and shared reads; jobs on one bus never run concurrently.
+        self.scheduler = SensorScheduler()
         self._i2c_lock = asyncio.Lock()
         self._uart_locks = {
             "UART0": asyncio.Lock(),
@@ -157,6 +171,13 @@ class GPSSensorInterface:
             self.status = SensorStatus.ERROR
             return None
 
+    def subscribe(self, callback: Callable[[GpsReading], None]) -> Callable[[], None]:
+        """Receive every GPS epoch the driver streams (called on its reader thread)."""
+        driver = getattr(self, "_driver", None)
+        if driver is None or not hasattr(driver, "subscribe"):
+            return lambda: None
+        return driver.subscribe(callback)
+
 
 class IMUSensorInterface:
     """BNO085 IMU sensor interface"""
@@ -241,6 +262,16 @@ class IMUSensorInterface:
             self.status = SensorStatus.ERROR
             return None
 
+    def samples_since(self, monotonic_s: float) -> list[dict[str, Any]]:
+        """Streamed IMU samples received after *monotonic_s*, oldest first."""
+        driver = getattr(self, "_driver", None)
+        if driver is None or not hasattr(driver, "samples_since"):
+            return []
+        return driver.samples_since(monotonic_s)
+
+
+_TOF_JOB = "tof"
+
 
 class ToFSensorInterface:
     """VL53L0X Time-of-Flight sensor interface"""
@@ -250,8 +281,7 @@ class ToFSensorInterface:
         self.left_reading: TofReading | None = None
         self.right_reading: TofReading | None = None
         self.status = SensorStatus.OFFLINE
-        self._owner_task: asyncio.Task | None = None
-        self._owner_stopping = False
+        self._owner_job_registered = False
         self._sample_id = 0
         self._outcomes: dict[str, deque[bool]] = {
             "left": deque(maxlen=20),
@@ -326,11 +356,16 @@ class ToFSensorInterface:
                 if left_ok and right_ok:
                     self.status = SensorStatus.ONLINE
                     await self._acquire_pair_once()
-                    self._owner_stopping = False
-                    self._owner_task = asyncio.create_task(
-                        self._acquisition_loop(),
-                        name="tof_acquisition_owner",
+                    # The scheduler is the sole I2C-reading owner's clock: fixed
+                    # deadlines, first in line on the bus.
+                    self.coordinator.scheduler.add_job(
+                        _TOF_JOB,
+                        self._acquire_pair_once,
+                        period_s=self._poll_interval_s,
+                        priority=PRIORITY_SAFETY,
+                        bus="i2c",
                     )
+                    self._owner_job_registered = True
                     return True
                 self.status = SensorStatus.ERROR
                 logger.warning(
@@ -359,17 +394,6 @@ class ToFSensorInterface:
         right = self.right_reading.model_copy(deep=True) if self.right_reading else None
         return left, right
 
-    async def _acquisition_loop(self) -> None:
-        """Continuously acquire both sensors as the sole I2C-reading owner."""
-        while not self._owner_stopping:
-            try:
-                await self._acquire_pair_once()
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:
-                logger.warning("ToF acquisition owner failed: %s", exc)
-            await asyncio.sleep(self._poll_interval_s)
-
     async def _acquire_pair_once(self) -> None:
         if self._left is None or self._right is None:
             return
@@ -429,20 +453,18 @@ class ToFSensorInterface:
             }
 
         return {
-            "owner_running": bool(self._owner_task and not self._owner_task.done()),
+            "owner_running": bool(
+                getattr(self, "_owner_job_registered", False)
+                and self.coordinator.scheduler.is_running(_TOF_JOB)
+            ),
             "left": side_payload("left", self.left_reading, self._left),
             "right": side_payload("right", self.right_reading, self._right),
         }
 
     async def shutdown(self) -> None:
-        self._owner_stopping = True
-        if self._owner_task and not self._owner_task.done():
-            self._owner_task.cancel()
-            try:
-                await self._owner_task
-            except asyncio.CancelledError:
-                pass
-        self._owner_task = None
+        if getattr(self, "_owner_job_registered", False):
+            await self.coordinator.scheduler.remove_job(_TOF_JOB)
+            self._owner_job_registered = False
         for driver in (self._left, self._right):
             if driver is not None:
                 await driver.stop()
@@ -584,10 +606,11 @@ class PowerSensorInterface:
             return None
 
         try:
-            # Per-driver timeouts allow a stalled Victron BLE read to be cancelled
-            # without discarding INA3221 data that already succeeded.
+            # Per-driver timeouts allow a stalled driver read to be cancelled
+            # without discarding data that already succeeded. Victron reads are
+            # served from the BLE reader's cache and never wait on BLE I/O.
             _INA_TIMEOUT_S = 1.0
-            _VICTRON_TIMEOUT_S = 4.0
+            _VICTRON_TIMEOUT_S = 1.0
 
             async def _safe_driver_read(name: str, driver, timeout: float):
                 if driver is None:
@@ -990,9 +1013,9 @@ class SensorManager:
     # BNO085 uses SHTP Game Rotation Vector (1.0s per-read); GPS F9P_USB is fast.
     # 2.5 s is ample for all non-BLE sensors.
     SENSOR_READ_TIMEOUT_SECONDS = 2.5
-    # Inner driver timeouts sum to ≤5 s (INA 1 s + Victron 4 s, parallel).
-    # The outer budget is kept slightly above that as a backstop.
-    POWER_READ_TIMEOUT_SECONDS = 5.0
+    # Inner driver timeouts are 1 s each (INA and cached Victron, parallel).
+    # The outer budget is kept above that as a backstop.
+    POWER_READ_TIMEOUT_SECONDS = 2.0
 
     def __init__(
         self,
@@ -1031,6 +1054,19 @@ class SensorManager:
         # loop always gets a fresh read while HTTP bursts are served from cache.
         _CACHE_TTL_S: float = 0.18
         self._CACHE_TTL_S = _CACHE_TTL_S
+        # Environmental and power are read by both the telemetry and the slow
+        # safety path; these jobs let one physical read serve both.
+        scheduler = self.coordinator.scheduler
+        scheduler.add_job(
+            "environmental",
+            lambda: self.environmental.read_environmental(),
+            priority=PRIORITY_TELEMETRY,
+            bus="i2c",
+        )
+        scheduler.add_job("power", lambda: self.power.read_power(), priority=PRIORITY_TELEMETRY)
+        # Every reading that passes through here, with its acquisition time.
+        self.samples = SensorSampleBus()
+        self._gps_unsubscribe: Any = None
 
     async def initialize(self) -> bool:
         """Initialize all sensors"""
@@ -1047,6 +1083,11 @@ class SensorManager:
 
         success_count = sum(1 for result in results if result is True)
         total_sensors = len(results)
+        if self._gps_unsubscribe is None:
+            # A streaming GPS driver publishes every epoch, not just polled ones.
+            self._gps_unsubscribe = self.gps.subscribe(
+                lambda reading: self.samples.publish("gps", reading)
+            )
 
         logger.info(f"Sensor initialization: {success_count}/{total_sensors} successful")
 
@@ -1089,11 +1130,14 @@ class SensorManager:
         """
 
         async def _read_with_timeout(name: str, coro: Any, timeout: float) -> Any:
+            started = time.perf_counter()
             try:
                 return await asyncio.wait_for(coro, timeout=timeout)
             except TimeoutError:
                 logger.warning("Timed out reading fast safety %s after %.2fs", name, timeout)
                 return None
+            finally:
+                _record_read_duration(name, started)
 
         imu_timeout_s = 0.08
         tof_timeout_s = min(0.20, max(0.05, float(self._CACHE_TTL_S)))
@@ -1104,7 +1148,7 @@ class SensorManager:
         tof_left, tof_right = (None, None)
         if isinstance(tof_data, tuple):
             tof_left, tof_right = tof_data
-        return SensorData(
+        sensor_data = SensorData(
             imu=imu_data,
             tof_left=tof_left,
             tof_right=tof_right,
@@ -1114,6 +1158,8 @@ class SensorManager:
                 SensorType.TOF_RIGHT: self.tof.status,
             },
         )
+        self._publish_samples(sensor_data)
+        return sensor_data
 
     async def read_slow_safety_sensors(self) -> SensorData:
         """Read slower safety-relevant samples without blocking the fast loop."""
@@ -1126,10 +1172,12 @@ class SensorManager:
                 return None
 
         env_data, power_data = await asyncio.gather(
-            _read_with_timeout("environmental", self.environmental.read_environmental(), 1.0),
-            _read_with_timeout("power", self.power.read_power(), self.POWER_READ_TIMEOUT_SECONDS),
+            _read_with_timeout("environmental", self._shared_read("environmental"), 1.0),
+            _read_with_timeout(
+                "power", self._shared_read("power"), self.POWER_READ_TIMEOUT_SECONDS
+            ),
         )
-        return SensorData(
+        sensor_data = SensorData(
             environmental=env_data,
             power=power_data,
             sensor_health={
@@ -1137,6 +1185,8 @@ class SensorManager:
                 SensorType.POWER: self.power.status,
             },
         )
+        self._publish_samples(sensor_data)
+        return sensor_data
 
     async def _do_read_all_sensors(self, bootstrap_mode: bool = False) -> SensorData:
         """Perform a real hardware read of all sensors (called under _read_lock).
@@ -1149,6 +1199,7 @@ class SensorManager:
 
         async def _read_with_timeout(name: str, coro: Any, timeout: float | None = None) -> Any:
             t = timeout if timeout is not None else self.SENSOR_READ_TIMEOUT_SECONDS
+            started = time.perf_counter()
             try:
                 return await asyncio.wait_for(coro, timeout=t)
             except TimeoutError:
@@ -1158,6 +1209,8 @@ class SensorManager:
                     t,
                 )
                 return None
+            finally:
+                _record_read_duration(name, started)
 
         # Read all sensors concurrently; power and GPS get custom timeouts.
         # GPS timeout is reduced from 2.5s to 1.5s to prevent watchdog starvation
@@ -1172,9 +1225,9 @@ class SensorManager:
             _read_with_timeout("gps", self.gps.read_gps(), timeout=GPS_READ_TIMEOUT_SECONDS),
             _read_with_timeout("imu", self.imu.read_imu()),
             _read_with_timeout("tof", self.tof.read_tof_sensors()),
-            _read_with_timeout("environmental", self.environmental.read_environmental()),
+            _read_with_timeout("environmental", self._shared_read("environmental")),
             _read_with_timeout(
-                "power", self.power.read_power(), timeout=self.POWER_READ_TIMEOUT_SECONDS
+                "power", self._shared_read("power"), timeout=self.POWER_READ_TIMEOUT_SECONDS
             ),
         ]
 
@@ -1209,8 +1262,37 @@ class SensorManager:
         if self.validation_enabled:
             self._validate_sensor_data(sensor_data)
 
+        self._publish_samples(sensor_data)
         return sensor_data
 
+    async def _shared_read(self, name: str) -> Any:
+        """One physical read for every caller due within the cache TTL."""
+        return await self.coordinator.scheduler.read(name, max_age_s=self._CACHE_TTL_S)
+
+    def _publish_samples(self, sensor_data: SensorData) -> None:
+        for name in ("gps", "imu", "tof_left", "tof_right", "environmental", "power"):
+            self.samples.publish(name, getattr(sensor_data, name))
+
+    def aligned_snapshot(
+        self,
+        target_s: float | None = None,
+        *,
+        interpolate: bool = False,
+        max_age_s: float | None = None,
+    ) -> AlignedSnapshot:
+        """Per-sensor samples aligned to monotonic *target_s* (default: now).
+
+        Unlike ``read_all_sensors`` this never touches hardware: it picks from
+        samples already read (or streamed) and reports each one's age, so
+        fusion can compensate for latency instead of assuming simultaneity.
+        """
+        return self.samples.snapshot(target_s, interpolate=interpolate, max_age_s=max_age_s)
+
+    def sample_ages(self) -> dict[str, float]:
+        """Seconds since each sensor's newest sample was acquired."""
+        bus = getattr(self, "samples", None)
+        return bus.ages() if bus is not None else {}
+
     def _validate_sensor_data(self, sensor_data: SensorData):
         """Validate sensor data for consistency and reasonable values"""
         # GPS validation
@@ -1251,11 +1333,21 @@ class SensorManager:
             "power_status": self.power.status,
             "active_sensors": list(self.coordinator._active_sensors),
             "validation_enabled": self.validation_enabled,
+            "sample_ages_s": self.sample_ages(),
+            "scheduler": (
+                self.coordinator.scheduler.stats()
+                if hasattr(self.coordinator, "scheduler")
+                else None
+            ),
         }
 
     async def shutdown(self):
         """Shutdown sensor manager"""
         logger.info("Shutting down sensor manager")
+        await self.coordinator.scheduler.stop()
+        if self._gps_unsubscribe is not None:
+            self._gps_unsubscribe()
+            self._gps_unsubscribe = None
         await self.tof.shutdown()
         self.initialized = False
 
@@ -0,0 +1,278 @@
+"""Timestamped sensor samples and time-aligned snapshots.
+
+Every reading that reaches ``SensorManager`` is published here with a
+monotonic acquisition time and a per-sensor sequence id. Acquisition time is
+the driver's ``monotonic_received_s`` when it has one; otherwise it is derived
+from the reading's wall-clock ``timestamp``. Cached re-serves of an earlier
+sample keep that sample's time and id, so a 1.5 s old GPS fix no longer looks
+simultaneous with a fresh IMU sample.
+
+``SensorSampleBus.snapshot(target_s)`` picks, per sensor, the sample nearest
+to ``target_s`` or interpolates between the two samples bracketing it, and
+reports how old each chosen sample is relative to the target. Publishing is
+thread-safe because drivers with their own reader thread (GPS) publish from
+that thread.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from ..models.sensor_data import SensorData
+
+# Two seconds of GPS at 20 Hz; far more than slower sensors ever need.
+DEFAULT_HISTORY = 64
+
+GPS = "gps"
+IMU = "imu"
+TOF_LEFT = "tof_left"
+TOF_RIGHT = "tof_right"
+ENVIRONMENTAL = "environmental"
+POWER = "power"
+SENSORS: tuple[str, ...] = (GPS, IMU, TOF_LEFT, TOF_RIGHT, ENVIRONMENTAL, POWER)
+
+# Interpolated wrapping at 360 degrees rather than linearly.
+_ANGLE_FIELDS = frozenset({"yaw", "roll", "pitch", "heading"})
+
+
+@dataclass(frozen=True, slots=True)
+class SensorSample:
+    """One reading as it was acquired."""
+
+    sensor: str
+    seq: int
+    acquired_s: float
+    value: Any
+
+
+@dataclass
+class AlignedSnapshot:
+    """Per-sensor samples chosen for one target time."""
+
+    target_s: float
+    samples: dict[str, SensorSample] = field(default_factory=dict)
+    interpolated: frozenset[str] = frozenset()
+
+    @property
+    def ages_s(self) -> dict[str, float]:
+        """How far each chosen sample lies before the target (negative = after)."""
+        return {name: self.target_s - s.acquired_s for name, s in self.samples.items()}
+
+    @property
+    def skew_s(self) -> float:
+        """Spread between the oldest and newest chosen sample."""
+        if not self.samples:
+            return 0.0
+        times = [s.acquired_s for s in self.samples.values()]
+        return max(times) - min(times)
+
+    def value(self, sensor: str) -> Any:
+        sample = self.samples.get(sensor)
+        return sample.value if sample is not None else None
+
+    def to_sensor_data(self, **extra: Any) -> SensorData:
+        return SensorData(
+            gps=self.value(GPS),
+            imu=self.value(IMU),
+            tof_left=self.value(TOF_LEFT),
+            tof_right=self.value(TOF_RIGHT),
+            environmental=self.value(ENVIRONMENTAL),
+            power=self.value(POWER),
+            **extra,
+        )
+
+
+def acquisition_time(value: Any, *, now_s: float | None = None) -> float:
+    """Monotonic acquisition time of a reading model."""
+    received = getattr(value, "monotonic_received_s", None)
+    if isinstance(received, (int, float)):
+        return float(received)
+    now_s = time.monotonic() if now_s is None else now_s
+    stamp = getattr(value, "timestamp", None)
+    if isinstance(stamp, datetime):
+        if stamp.tzinfo is None:
+            stamp = stamp.replace(tzinfo=UTC)
+        return now_s - max(0.0, (datetime.now(UTC) - stamp).total_seconds())
+    return now_s
+
+
+class SensorSampleBus:
+    """Bounded per-sensor history of timestamped samples."""
+
+    def __init__(self, history: int = DEFAULT_HISTORY) -> None:
+        self.history = max(2, int(history))
+        self._rings: dict[str, deque[SensorSample]] = {}
+        self._seq: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def publish(
+        self, sensor: str, value: Any, *, acquired_s: float | None = None
+    ) -> SensorSample | None:
+        """Record *value*; a re-served sample returns the already recorded one."""
+        if value is None:
+            return None
+        if acquired_s is None:
+            acquired_s = acquisition_time(value)
+        with self._lock:
+            ring = self._rings.get(sensor)
+            if ring is None:
+                ring = self._rings[sensor] = deque(maxlen=self.history)
+            if ring:
+                last = ring[-1]
+                if acquired_s == last.acquired_s or _same_id(last.value, value):
+                    return last
+                if acquired_s < last.acquired_s:
+                    # A slow read finishing late; keep the history time-ordered.
+                    return self._insert_sorted(ring, sensor, value, acquired_s)
+            return self._append(ring, sensor, value, acquired_s)
+
+    def _append(
+        self, ring: deque[SensorSample], sensor: str, value: Any, acquired_s: float
+    ) -> SensorSample:
+        seq = self._seq.get(sensor, 0) + 1
+        self._seq[sensor] = seq
+        sample = SensorSample(sensor, seq, acquired_s, value)
+        ring.append(sample)
+        return sample
+
+    def _insert_sorted(
+        self, ring: deque[SensorSample], sensor: str, value: Any, acquired_s: float
+    ) -> SensorSample | None:
+        items = list(ring)
+        for existing in items:
+            if existing.acquired_s == acquired_s or _same_id(existing.value, value):
+                return existing
+        if len(items) == ring.maxlen and acquired_s < items[0].acquired_s:
+            return None  # older than everything kept
+        sample = self._append(ring, sensor, value, acquired_s)
+        items.append(sample)
+        items.sort(key=lambda s: s.acquired_s)
+        ring.clear()
+        ring.extend(items)
+        return sample
+
+    def latest(self, sensor: str) -> SensorSample | None:
+        ring = self._rings.get(sensor)
+        return ring[-1] if ring else None
+
+    def since(self, sensor: str, acquired_s: float) -> list[SensorSample]:
+        """Samples acquired strictly after *acquired_s*, oldest first."""
+        with self._lock:
+            ring = list(self._rings.get(sensor, ()))
+        return [s for s in ring if s.acquired_s > acquired_s]
+
+    def ages(self, now_s: float | None = None) -> dict[str, float]:
+        """Age of the newest sample per sensor."""
+        now_s = time.monotonic() if now_s is None else now_s
+        with self._lock:
+            newest = {name: ring[-1] for name, ring in self._rings.items() if ring}
+        return {name: now_s - s.acquired_s for name, s in newest.items()}
+
+    def snapshot(
+        self,
+        target_s: float | None = None,
+        *,
+        sensors: Iterable[str] = SENSORS,
+        interpolate: bool = False,
+        max_age_s: float | None = None,
+    ) -> AlignedSnapshot:
+        """Samples aligned to *target_s* (default: now).
+
+        With ``interpolate`` numeric fields of GPS and IMU readings are blended
+        between the samples bracketing the target; other sensors, and targets
+        outside the recorded span, use the nearest sample. Samples further than
+        ``max_age_s`` from the target are left out.
+        """
+        target_s = time.monotonic() if target_s is None else target_s
+        chosen: dict[str, SensorSample] = {}
+        blended: set[str] = set()
+        for sensor in sensors:
+            with self._lock:
+                ring = list(self._rings.get(sensor, ()))
+            if not ring:
+                continue
+            before, after = _bracket(ring, target_s)
+            if interpolate and sensor in (GPS, IMU) and before is not None and after is not None:
+                sample = _interpolate(before, after, target_s)
+                if sample is not after and sample is not before:
+                    blended.add(sensor)
+            else:
+                sample = _nearest(before, after, target_s)
+            if sample is None:
+                continue
+            if max_age_s is not None and abs(target_s - sample.acquired_s) > max_age_s:
+                continue
+            chosen[sensor] = sample
+        return AlignedSnapshot(target_s, chosen, frozenset(blended))
+
+
+def _same_id(old: Any, new: Any) -> bool:
+    if old is new:
+        return True
+    old_id = getattr(old, "sample_id", None)
+    return old_id is not None and old_id == getattr(new, "sample_id", None)
+
+
+def _bracket(
+    ring: list[SensorSample], target_s: float
+) -> tuple[SensorSample | None, SensorSample | None]:
+    """Newest sample at or before *target_s* and oldest one after it."""
+    after: SensorSample | None = None
+    for sample in reversed(ring):
+        if sample.acquired_s <= target_s:
+            return sample, after
+        after = sample
+    return None, after
+
+
+def _nearest(
+    before: SensorSample | None, after: SensorSample | None, target_s: float
+) -> SensorSample | None:
+    if before is None or after is None:
+        return before or after
+    if target_s - before.acquired_s <= after.acquired_s - target_s:
+        return before
+    return after
+
+
+def _interpolate(before: SensorSample, after: SensorSample, target_s: float) -> SensorSample:
+    span = after.acquired_s - before.acquired_s
+    if span <= 0.0:
+        return after
+    fraction = (target_s - before.acquired_s) / span
+    base = before if fraction < 0.5 else after
+    model_copy = getattr(base.value, "model_copy", None)
+    if model_copy is None:
+        return base
+    update: dict[str, float] = {}
+    for name, a in vars(before.value).items():
+        b = getattr(after.value, name, None)
+        # Only float fields blend; counts, ids and flags come from the nearer sample.
+        if name == "monotonic_received_s":
+            continue
+        if not isinstance(a, float) or not isinstance(b, float):
+            continue
+        if name in _ANGLE_FIELDS:
+            delta = (b - a + 180.0) % 360.0 - 180.0
+            value = a + delta * fraction
+            update[name] = (value + 180.0) % 360.0 - 180.0 if a < 0 or b < 0 else value % 360.0
+        else:
+            update[name] = a + (b - a) * fraction
+    update["monotonic_received_s"] = target_s
+    return SensorSample(base.sensor, base.seq, target_s, model_copy(update=update))
+
+
+__all__ = [
+    "AlignedSnapshot",
+    "DEFAULT_HISTORY",
+    "SENSORS",
+    "SensorSample",
+    "SensorSampleBus",
+    "acquisition_time",
+]
@@ -0,0 +1,355 @@
+"""Deadline-based scheduling for sensor acquisition.
+
+Periodic loops that ``sleep(period)`` after their work drift by the work's
+duration, and independent loops sharing one I2C bus end up contending for it
+at arbitrary moments. ``SensorScheduler`` runs registered jobs on fixed
+deadlines instead:
+
+* each job has a period (or is on-demand only), a priority and optionally a
+  bus; jobs due at the same instant start in priority order, and jobs on the
+  same bus take turns in a priority-ordered lane, so a safety-critical ToF
+  read is never queued behind a telemetry read on the same bus;
+* a job still running at its next deadline is an overrun: that slot is
+  skipped (never doubled up) and counted, as are slots lost to a late start;
+* ``read(name, max_age_s)`` lets several consumers share one physical read:
+  a result younger than ``max_age_s`` is reused and an in-flight read is
+  joined rather than repeated.
+
+``DeadlineTicker`` gives the same fixed-rate behaviour to a plain loop that
+owns its own work (live safety, telemetry broadcast, power history).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_SAFETY = 0
+PRIORITY_CONTROL = 10
+PRIORITY_TELEMETRY = 20
+
+# Upper bound on one dispatcher sleep, so clock jumps and new jobs are noticed.
+_MAX_IDLE_S = 0.5
+
+
+class DeadlineTicker:
+    """Fixed-rate deadlines for a loop that does its own work between waits.
+
+    ``await ticker.wait()`` sleeps until the next slot, measured from the
+    previous deadline rather than from when the work finished. When the work
+    overran one or more slots the next iteration starts immediately, the
+    schedule re-anchors to now, and the lost slots are counted instead of
+    being replayed back to back.
+    """
+
+    def __init__(self, period_s: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.period_s = max(0.001, float(period_s))
+        self._clock = clock
+        self.next_due: float | None = None
+        self.ticks = 0
+        self.overruns = 0
+        self.missed_slots = 0
+        self.max_lateness_s = 0.0
+
+    def next_delay(self, period_s: float | None = None) -> float:
+        """Advance to the next deadline and return how long to sleep until it."""
+        now = self._clock()
+        if period_s is not None and abs(float(period_s) - self.period_s) > 1e-9:
+            self.period_s = max(0.001, float(period_s))
+            self.next_due = None
+        self.ticks += 1
+        if self.next_due is None:
+            self.next_due = now + self.period_s
+            return self.period_s
+        self.next_due += self.period_s
+        late = now - self.next_due
+        if late > 0.0:
+            self.overruns += 1
+            self.missed_slots += int(late // self.period_s)
+            self.max_lateness_s = max(self.max_lateness_s, late)
+            self.next_due = now
+            return 0.0
+        return -late
+
+    async def wait(self, period_s: float | None = None) -> None:
+        await asyncio.sleep(self.next_delay(period_s))
+
+    def reset(self) -> None:
+        self.next_due = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "period_s": self.period_s,
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "missed_slots": self.missed_slots,
+            "max_lateness_s": self.max_lateness_s,
+        }
+
+
+class _BusLane:
+    """One job at a time on a bus; waiters are admitted by priority, then FIFO."""
+
+    def __init__(self) -> None:
+        self._busy = False
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+
+    async def acquire(self, priority: int) -> None:
+        if not self._busy and not self._waiters:
+            self._busy = True
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # handed the lane as we were cancelled; pass it on
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _priority, _order, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy = False
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    read: Callable[[], Awaitable[Any]]
+    period_s: float | None
+    priority: int
+    bus: str | None
+    timeout_s: float | None
+    next_due: float = 0.0
+    runs: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    overruns: int = 0
+    missed_slots: int = 0
+    shared_reads: int = 0
+    last_duration_s: float | None = None
+    max_duration_s: float = 0.0
+    last_completed_s: float | None = None
+    last_result: Any = None
+    inflight: asyncio.Task | None = field(default=None, repr=False)
+
+    def stats(self, now: float) -> dict[str, Any]:
+        return {
+            "period_s": self.period_s,
+            "priority": self.priority,
+            "bus": self.bus,
+            "runs": self.runs,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "overruns": self.overruns,
+            "missed_slots": self.missed_slots,
+            "shared_reads": self.shared_reads,
+            "last_duration_s": self.last_duration_s,
+            "max_duration_s": self.max_duration_s,
+            "result_age_s": (
+                None if self.last_completed_s is None else max(0.0, now - self.last_completed_s)
+            ),
+        }
+
+
+class SensorScheduler:
+    """Runs sensor reads on deadlines, by priority, one job per bus at a time."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._jobs: dict[str, ScheduledJob] = {}
+        self._lanes: dict[str, _BusLane] = {}
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+
+    def add_job(
+        self,
+        name: str,
+        read: Callable[[], Awaitable[Any]],
+        *,
+        period_s: float | None = None,
+        priority: int = PRIORITY_TELEMETRY,
+        bus: str | None = None,
+        timeout_s: float | None = None,
+    ) -> ScheduledJob:
+        """Register (or replace) *name*; a periodic job first runs right away."""
+        job = ScheduledJob(
+            name=name,
+            read=read,
+            period_s=max(0.001, float(period_s)) if period_s else None,
+            priority=int(priority),
+            bus=bus,
+            timeout_s=timeout_s,
+            next_due=self._clock(),
+        )
+        previous = self._jobs.get(name)
+        if previous is not None and previous.inflight is not None:
+            previous.inflight.cancel()
+        self._jobs[name] = job
+        if job.period_s is not None:
+            self._ensure_running()
+        return job
+
+    async def remove_job(self, name: str) -> None:
+        job = self._jobs.pop(name, None)
+        if job is None or job.inflight is None:
+            return
+        job.inflight.cancel()
+        try:
+            await job.inflight
+        except asyncio.CancelledError:
+            pass
+
+    def job(self, name: str) -> ScheduledJob | None:
+        return self._jobs.get(name)
+
+    def is_running(self, name: str) -> bool:
+        """True while *name* is registered as a periodic job and being dispatched."""
+        job = self._jobs.get(name)
+        return bool(
+            job is not None
+            and job.period_s is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def read(self, name: str, *, max_age_s: float = 0.0) -> Any:
+        """Result of job *name*, shared with every other consumer asking now.
+
+        Reuses a result younger than *max_age_s* and joins a read already in
+        flight. Cancelling one caller never cancels the shared read.
+        """
+        job = self._jobs[name]
+        if (
+            job.last_completed_s is not None
+            and self._clock() - job.last_completed_s <= max_age_s
+        ):
+            job.shared_reads += 1
+            return job.last_result
+        if job.inflight is not None:
+            job.shared_reads += 1
+            task = job.inflight
+        else:
+            task = self._dispatch(job)
+        return await asyncio.shield(task)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        inflight = [job.inflight for job in self._jobs.values() if job.inflight is not None]
+        for running in inflight:
+            running.cancel()
+        if inflight:
+            await asyncio.gather(*inflight, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        now = self._clock()
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "jobs": {name: job.stats(now) for name, job in self._jobs.items()},
+        }
+
+    def _ensure_running(self) -> None:
+        if self._task is not None and not self._task.done():
+            if self._wake is not None:
+                self._wake.set()
+            return
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="sensor_scheduler")
+
+    def _dispatch(self, job: ScheduledJob) -> asyncio.Task:
+        task = asyncio.create_task(self._execute(job), name=f"sensor_job_{job.name}")
+        job.inflight = task
+
+        def _done(finished: asyncio.Task, job: ScheduledJob = job) -> None:
+            if job.inflight is finished:
+                job.inflight = None
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _execute(self, job: ScheduledJob) -> Any:
+        lane = self._lanes.setdefault(job.bus, _BusLane()) if job.bus else None
+        if lane is not None:
+            await lane.acquire(job.priority)
+        started = self._clock()
+        try:
+            if job.timeout_s is not None:
+                result = await asyncio.wait_for(job.read(), timeout=job.timeout_s)
+            else:
+                result = await job.read()
+        except TimeoutError:
+            job.timeouts += 1
+            logger.warning("Sensor job %s timed out after %.2fs", job.name, job.timeout_s)
+            return None
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            job.failures += 1
+            logger.warning("Sensor job %s failed: %s", job.name, exc)
+            return None
+        finally:
+            if lane is not None:
+                lane.release()
+            finished = self._clock()
+            job.last_duration_s = finished - started
+            job.max_duration_s = max(job.max_duration_s, job.last_duration_s)
+        job.runs += 1
+        job.last_result = result
+        job.last_completed_s = finished
+        return result
+
+    async def _run(self) -> None:
+        wake = self._wake
+        assert wake is not None
+        while True:
+            periodic = [job for job in self._jobs.values() if job.period_s is not None]
+            if not periodic:
+                return  # restarted by the next add_job
+            now = self._clock()
+            for job in sorted(periodic, key=lambda j: (j.priority, j.next_due)):
+                if job.next_due > now:
+                    continue
+                if job.inflight is not None:
+                    job.overruns += 1
+                else:
+                    self._dispatch(job)
+                job.next_due += job.period_s
+                if job.next_due <= now:
+                    # Started late: drop the lost slots and re-anchor.
+                    job.missed_slots += int((now - job.next_due) // job.period_s) + 1
+                    job.next_due = now + job.period_s
+            delay = min(job.next_due for job in periodic) - self._clock()
+            wake.clear()
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=min(_MAX_IDLE_S, max(0.0, delay)))
+            except TimeoutError:
+                pass
+
+
+__all__ = [
+    "DeadlineTicker",
+    "PRIORITY_CONTROL",
+    "PRIORITY_SAFETY",
+    "PRIORITY_TELEMETRY",
+    "ScheduledJob",
+    "SensorScheduler",
+]
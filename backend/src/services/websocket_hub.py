@@ -1,19 +1,93 @@
 import asyncio
+import hashlib
+import itertools
 import json
 import logging
 import time
+from collections import OrderedDict, deque
 from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import WebSocket
 from fastapi.encoders import jsonable_encoder
 
+from ..core.observability import observability
 from ..core.state_manager import AppState
+from ..services.sensor_scheduler import DeadlineTicker
 from ..services.telemetry_service import telemetry_service
 
 logger = logging.getLogger(__name__)
 
+# Encoded frames retained per topic so delta clients can patch against a
+# recently acknowledged base instead of falling back to a full frame.
+_DELTA_HISTORY = 4
+# Pending outbound messages per client. Telemetry topics coalesce latest-wins,
+# so this only overflows when one-shot events pile up behind a stalled socket.
+_CLIENT_QUEUE_MAXLEN = 32
+_SEND_TIMEOUT_S = 2.0
+_MIN_CADENCE_HZ = 1.0
+_MAX_CADENCE_HZ = 10.0
+
+
+@dataclass
+class _TopicFrame:
+    """One telemetry topic payload, encoded once per change."""
+
+    seq: int
+    digest: bytes
+    data: Any
+    message: str
+
+
+@dataclass
+class _ClientStream:
+    """Per-client delivery state: encoding, cadence, outbound queue and stats."""
+
+    delta: bool = False
+    sent: dict[str, int] = field(default_factory=dict)  # topic -> last seq sent
+    acked: dict[str, int] = field(default_factory=dict)  # topic -> last seq acked
+    cadence_hz: float | None = None  # None -> hub default
+    next_due: float = 0.0
+    pending: OrderedDict[Any, str] = field(default_factory=OrderedDict)
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    writer: asyncio.Task | None = None
+    sending: bool = False
+    dropped: int = 0
+    coalesced: int = 0
+    sent_count: int = 0
+    send_total_ms: float = 0.0
+    send_max_ms: float = 0.0
+    send_last_ms: float = 0.0
+
+
+def _json_pointer_token(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _json_diff(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """Return RFC 6902 operations transforming *old* into *new*.
+
+    Objects are diffed key by key; lists and scalars are replaced wholesale,
+    which keeps the patch cheap to compute and trivial to apply client-side.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_json_pointer_token(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_json_pointer_token(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(_json_diff(old[key], value, child))
+        return ops
+    if type(old) is type(new) and old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
 
 class WebSocketHub:
     def __init__(self):
@@ -28,6 +102,9 @@ class WebSocketHub:
         self._calibration_lock = asyncio.Lock()
         self._last_telemetry_snapshot: dict[str, Any] | None = None
         self._last_telemetry_at: float = 0.0
+        self._topic_frames: dict[str, deque[_TopicFrame]] = {}
+        self._client_streams: dict[str, _ClientStream] = {}
+        self._control_seq = itertools.count()
 
     def bind_app_state(self, state: Any) -> None:
         """Expose app.state to the hub."""
@@ -92,69 +169,111 @@ class WebSocketHub:
             self.disconnect(client_id)
 
     async def broadcast(self, message: str):
-        disconnected_clients = []
-        for client_id, websocket in list(self.clients.items()):
-            try:
-                await websocket.send_text(message)
-            except Exception:
-                disconnected_clients.append(client_id)
-
-        for client_id in disconnected_clients:
-            self.disconnect(client_id)
+        for client_id in list(self.clients):
+            self._enqueue(client_id, self._next_control_key(), message)
 
     def disconnect(self, client_id: str):
         if client_id in self.clients:
             del self.clients[client_id]
         for _topic, subscribers in self.subscriptions.items():
             subscribers.discard(client_id)
+        stream = self._client_streams.pop(client_id, None)
+        if stream is not None and stream.writer is not None:
+            try:
+                current = asyncio.current_task()
+            except RuntimeError:
+                current = None
+            if stream.writer is not current:
+                stream.writer.cancel()
 
     async def subscribe(self, client_id: str, topic: str):
         if topic not in self.subscriptions:
             self.subscriptions[topic] = set()
         self.subscriptions[topic].add(client_id)
-
-        if client_id in self.clients:
-            await self.clients[client_id].send_text(
-                json.dumps(
-                    {
-                        "event": "subscription.confirmed",
-                        "topic": topic,
-                        "timestamp": datetime.now(UTC).isoformat(),
-                    }
-                )
-            )
+        # A (re)subscription always starts from a full frame.
+        stream = self._client_streams.get(client_id)
+        if stream is not None:
+            stream.sent.pop(topic, None)
+            stream.acked.pop(topic, None)
+
+        self._enqueue_control(
+            client_id,
+            {
+                "event": "subscription.confirmed",
+                "topic": topic,
+                "timestamp": datetime.now(UTC).isoformat(),
+            },
+        )
 
     async def unsubscribe(self, client_id: str, topic: str):
         if topic in self.subscriptions:
             self.subscriptions[topic].discard(client_id)
-
-        if client_id in self.clients:
-            await self.clients[client_id].send_text(
-                json.dumps(
-                    {
-                        "event": "unsubscription.confirmed",
-                        "topic": topic,
-                        "timestamp": datetime.now(UTC).isoformat(),
-                    }
-                )
-            )
+        stream = self._client_streams.get(client_id)
+        if stream is not None:
+            stream.sent.pop(topic, None)
+            stream.acked.pop(topic, None)
+
+        self._enqueue_control(
+            client_id,
+            {
+                "event": "unsubscription.confirmed",
+                "topic": topic,
+                "timestamp": datetime.now(UTC).isoformat(),
+            },
+        )
 
     async def set_cadence(self, client_id: str, cadence_hz: float):
-        cadence_hz = max(1.0, min(10.0, cadence_hz))
-        self.telemetry_cadence_hz = cadence_hz
+        """Set the telemetry cadence for one client.
 
-        if client_id in self.clients:
-            await self.clients[client_id].send_text(
-                json.dumps(
-                    {
-                        "event": "cadence.updated",
-                        "cadence_hz": cadence_hz,
-                        "timestamp": datetime.now(UTC).isoformat(),
-                    }
-                )
-            )
+        ``telemetry_cadence_hz`` remains the default for clients that never
+        ask; the loop ticks at the fastest cadence any client requested.
+        """
+        cadence_hz = max(_MIN_CADENCE_HZ, min(_MAX_CADENCE_HZ, cadence_hz))
+        stream = self._stream_for(client_id)
+        stream.cadence_hz = cadence_hz
+        stream.next_due = 0.0
+
+        self._enqueue_control(
+            client_id,
+            {
+                "event": "cadence.updated",
+                "cadence_hz": cadence_hz,
+                "timestamp": datetime.now(UTC).isoformat(),
+            },
+        )
+
+    async def set_encoding(self, client_id: str, encoding: str):
+        """Switch a client between full frames and RFC 6902 delta frames."""
+        encoding = "delta" if str(encoding).lower() == "delta" else "full"
+        stream = self._stream_for(client_id)
+        stream.delta = encoding == "delta"
+        stream.acked.clear()
+
+        self._enqueue_control(
+            client_id,
+            {
+                "event": "encoding.updated",
+                "encoding": encoding,
+                "timestamp": datetime.now(UTC).isoformat(),
+            },
+        )
+
+    def acknowledge(self, client_id: str, topic: str, seq: int) -> None:
+        """Record the latest telemetry frame a client has applied for *topic*."""
+        if client_id not in self.clients:
+            return
+        stream = self._stream_for(client_id)
+        if seq > stream.acked.get(topic, -1):
+            stream.acked[topic] = seq
+
+    async def broadcast_to_topic(self, topic: str, data: dict, *, coalesce: bool = False):
+        """Send a one-shot event to *topic* subscribers.
 
-    async def broadcast_to_topic(self, topic: str, data: dict):
+        Each event is queued on its own so a slow client still receives every
+        one in order. Pass ``coalesce=True`` for periodic streams where only
+        the newest message matters; it then replaces an older one for the same
+        topic that is still waiting in a client's queue.
+        """
         if topic not in self.subscriptions:
             return
 
@@ -165,24 +284,227 @@ class WebSocketHub:
             "data": data,
         }
         message = json.dumps(jsonable_encoder(payload), default=str)
+        for client_id in list(self.subscriptions[topic]):
+            key = topic if coalesce else (topic, next(self._control_seq))
+            self._enqueue(client_id, key, message)
+
+    async def publish_telemetry_frame(
+        self, topic: str, data: Any, due: set[str] | None = None
+    ) -> None:
+        """Fan out a periodic telemetry topic, encoding it at most once per tick.
+
+        Unlike ``broadcast_to_topic`` (used for one-shot events), frames whose
+        content is unchanged since the previous tick are not re-sent to clients
+        that already have them. Clients in delta mode receive a
+        ``telemetry.delta`` patch against the last frame they acknowledged when
+        that is smaller than the full frame. When *due* is given, only those
+        clients (the ones whose cadence is up this tick) are considered.
+        """
+        subscribers = self.subscriptions.get(topic)
+        if not subscribers:
+            return
 
-        async def _send_one(client_id: str) -> str | None:
-            if client_id not in self.clients:
-                return client_id
-            try:
-                await asyncio.wait_for(
-                    self.clients[client_id].send_text(message),
-                    timeout=2.0,
+        frame = self._encode_topic_frame(topic, data)
+        history = self._topic_frames[topic]
+        deltas: dict[int, str] = {}
+        for client_id in list(subscribers):
+            if due is not None and client_id not in due:
+                continue
+            stream = self._stream_for(client_id)
+            if stream.sent.get(topic) == frame.seq:
+                continue
+            message = frame.message
+            base_seq = stream.acked.get(topic) if stream.delta else None
+            if base_seq is not None and base_seq != frame.seq:
+                if base_seq not in deltas:
+                    base = next((f for f in history if f.seq == base_seq), None)
+                    deltas[base_seq] = (
+                        self._encode_delta(topic, base, frame) if base is not None else ""
+                    )
+                delta = deltas[base_seq]
+                if delta and len(delta) < len(message):
+                    message = delta
+            stream.sent[topic] = frame.seq
+            self._enqueue(client_id, topic, message)
+
+    def _encode_topic_frame(self, topic: str, data: Any) -> _TopicFrame:
+        encoded = jsonable_encoder(data)
+        data_text = json.dumps(encoded, default=str)
+        digest = hashlib.blake2b(data_text.encode("utf-8"), digest_size=16).digest()
+
+        history = self._topic_frames.setdefault(topic, deque(maxlen=_DELTA_HISTORY))
+        if history and history[-1].digest == digest:
+            return history[-1]
+
+        seq = history[-1].seq + 1 if history else 0
+        # The envelope is assembled around the pre-encoded payload so the data
+        # itself is serialised exactly once regardless of subscriber count.
+        message = (
+            '{"event": "telemetry.data", "topic": '
+            + json.dumps(topic)
+            + ', "timestamp": '
+            + json.dumps(datetime.now(UTC).isoformat())
+            + ', "seq": '
+            + str(seq)
+            + ', "data": '
+            + data_text
+            + "}"
+        )
+        frame = _TopicFrame(seq=seq, digest=digest, data=encoded, message=message)
+        history.append(frame)
+        return frame
+
+    @staticmethod
+    def _encode_delta(topic: str, base: _TopicFrame, frame: _TopicFrame) -> str:
+        return json.dumps(
+            {
+                "event": "telemetry.delta",
+                "topic": topic,
+                "timestamp": datetime.now(UTC).isoformat(),
+                "seq": frame.seq,
+                "base_seq": base.seq,
+                "patch": _json_diff(base.data, frame.data),
+            },
+            default=str,
+        )
+
+    def _enqueue(self, client_id: str, key: Any, message: str) -> None:
+        """Queue *message* for the client's writer task without awaiting it.
+
+        Messages sharing *key* (a topic name) coalesce latest-wins in place;
+        one-shot events and control replies use unique ``(name, seq)`` keys.
+        When the queue is full the oldest coalescing topic message is dropped
+        before any of those is.
+        """
+        if client_id not in self.clients:
+            return
+        stream = self._stream_for(client_id)
+        pending = stream.pending
+        if key in pending:
+            pending[key] = message
+            stream.coalesced += 1
+        else:
+            if len(pending) >= _CLIENT_QUEUE_MAXLEN:
+                victim = next((k for k in pending if isinstance(k, str)), next(iter(pending)))
+                del pending[victim]
+                if isinstance(victim, str):
+                    # The dropped frame was never delivered; let the next tick
+                    # re-send it even if the topic content is unchanged.
+                    stream.sent.pop(victim, None)
+                stream.dropped += 1
+                observability.metrics.increment_counter("websocket_messages_dropped")
+            pending[key] = message
+        stream.wakeup.set()
+        if stream.writer is None or stream.writer.done():
+            stream.writer = asyncio.create_task(self._client_writer(client_id, stream))
+
+    def _enqueue_control(self, client_id: str, payload: dict[str, Any]) -> None:
+        self._enqueue(client_id, self._next_control_key(), json.dumps(payload))
+
+    def _next_control_key(self) -> tuple[str, int]:
+        # Control replies never coalesce with each other or with topic frames.
+        return ("control", next(self._control_seq))
+
+    async def _client_writer(self, client_id: str, stream: _ClientStream) -> None:
+        """Dedicated sender for one socket; a stalled client only stalls itself."""
+        while True:
+            await stream.wakeup.wait()
+            stream.wakeup.clear()
+            while stream.pending:
+                key, message = stream.pending.popitem(last=False)
+                websocket = self.clients.get(client_id)
+                if websocket is None:
+                    return
+                started = time.perf_counter()
+                stream.sending = True
+                try:
+                    # asyncio.timeout rather than wait_for: on 3.11 wait_for can
+                    # swallow a cancel that races a completed send, which would
+                    # leave this task parked on ``wakeup`` through shutdown.
+                    async with asyncio.timeout(_SEND_TIMEOUT_S):
+                        await websocket.send_text(message)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.disconnect(client_id)
+                    return
+                finally:
+                    stream.sending = False
+                elapsed_ms = (time.perf_counter() - started) * 1000.0
+                stream.sent_count += 1
+                stream.send_total_ms += elapsed_ms
+                stream.send_last_ms = elapsed_ms
+                stream.send_max_ms = max(stream.send_max_ms, elapsed_ms)
+                observability.metrics.record_timer(
+                    "websocket_send",
+                    elapsed_ms,
+                    labels={"topic": key if isinstance(key, str) else key[0]},
                 )
-                return None
-            except Exception:
-                return client_id
 
-        client_ids = list(self.subscriptions[topic])
-        results = await asyncio.gather(*(_send_one(cid) for cid in client_ids))
-        for client_id in results:
-            if client_id is not None:
-                self.disconnect(client_id)
+    async def flush(self, timeout: float = _SEND_TIMEOUT_S) -> bool:
+        """Wait until every client's outbound queue has been written.
+
+        Returns ``False`` if messages were still pending after *timeout*.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while any(s.pending or s.sending for s in self._client_streams.values()):
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(0.005)
+        return True
+
+    def get_client_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-client queue depth, drops, cadence and send latency for ``/metrics``."""
+        stats: dict[str, dict[str, Any]] = {}
+        for client_id, stream in list(self._client_streams.items()):
+            if client_id not in self.clients:
+                continue
+            stats[client_id] = {
+                "queue_depth": len(stream.pending),
+                "dropped": stream.dropped,
+                "coalesced": stream.coalesced,
+                "sent": stream.sent_count,
+                "cadence_hz": self._client_cadence_hz(stream),
+                "send_avg_ms": (
+                    stream.send_total_ms / stream.sent_count if stream.sent_count else 0.0
+                ),
+                "send_last_ms": stream.send_last_ms,
+                "send_max_ms": stream.send_max_ms,
+            }
+        return stats
+
+    def _client_cadence_hz(self, stream: _ClientStream) -> float:
+        if stream.cadence_hz is not None:
+            return stream.cadence_hz
+        return self.telemetry_cadence_hz
+
+    def _due_clients(self, now: float) -> set[str]:
+        """Return clients whose cadence is up and schedule their next frame."""
+        # Half a loop tick of slack so a client whose cadence matches the loop
+        # rate is not skipped by scheduling jitter.
+        slack = 0.5 / self._loop_cadence_hz()
+        due: set[str] = set()
+        for client_id in list(self.clients):
+            stream = self._stream_for(client_id)
+            if now + slack >= stream.next_due:
+                due.add(client_id)
+                stream.next_due = now + 1.0 / self._client_cadence_hz(stream)
+        return due
+
+    def _loop_cadence_hz(self) -> float:
+        """Tick at the fastest cadence any connected client wants."""
+        cadence = self.telemetry_cadence_hz
+        for stream in self._client_streams.values():
+            if stream.cadence_hz is not None:
+                cadence = max(cadence, stream.cadence_hz)
+        return cadence
+
+    def _stream_for(self, client_id: str) -> _ClientStream:
+        stream = self._client_streams.get(client_id)
+        if stream is None:
+            stream = self._client_streams[client_id] = _ClientStream()
+        return stream
 
     async def start_telemetry_loop(self):
         if self._telemetry_task is not None:
@@ -201,6 +523,7 @@ class WebSocketHub:
     async def _telemetry_loop(self):
         import os
 
+        ticker = DeadlineTicker(1.0 / self._loop_cadence_hz())
         while True:
             try:
                 sim_mode = os.getenv("SIM_MODE", "0") != "0"
@@ -218,30 +541,39 @@ class WebSocketHub:
                 # Broadcast topics
                 await self._broadcast_telemetry_topics(telemetry_data)
 
-                await asyncio.sleep(1.0 / self.telemetry_cadence_hz)
+                await ticker.wait(1.0 / self._loop_cadence_hz())
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Telemetry loop error: {e}")
                 await asyncio.sleep(1.0)
+                ticker.reset()
 
     async def _broadcast_telemetry_topics(self, telemetry_data: dict):
-        """Broadcast telemetry data to appropriate topics."""
+        """Broadcast telemetry data to appropriate topics.
+
+        Only clients whose cadence is due this tick are considered; frames are
+        queued to per-client writers, so nothing here waits on a socket.
+        """
+        due = self._due_clients(time.monotonic())
+        if not due:
+            return
 
         # Power
         if "power" in telemetry_data:
-            await self.broadcast_to_topic(
+            await self.publish_telemetry_frame(
                 "telemetry.power",
                 {
                     "power": telemetry_data["power"],
                     "battery": telemetry_data.get("battery"),
                     "source": telemetry_data.get("source"),
                 },
+                due=due,
             )
 
         # Navigation
         if "position" in telemetry_data:
-            await self.broadcast_to_topic(
+            await self.publish_telemetry_frame(
                 "telemetry.navigation",
                 {
                     "position": telemetry_data["position"],
@@ -254,30 +586,34 @@ class WebSocketHub:
                     "nav_heading_source": telemetry_data.get("nav_heading_source"),
                     "source": telemetry_data.get("source"),
                 },
+                due=due,
             )
 
         # Sensors (IMU)
         if "imu" in telemetry_data:
-            await self.broadcast_to_topic(
+            await self.publish_telemetry_frame(
                 "telemetry.sensors",
                 {"imu": telemetry_data["imu"], "source": telemetry_data.get("source")},
+                due=due,
             )
 
         # Environmental
         if "environmental" in telemetry_data:
-            await self.broadcast_to_topic(
+            await self.publish_telemetry_frame(
                 "telemetry.environmental",
                 {
                     "environmental": telemetry_data["environmental"],
                     "source": telemetry_data.get("source"),
                 },
+                due=due,
             )
 
         # ToF
         if "tof" in telemetry_data:
-            await self.broadcast_to_topic(
+            await self.publish_telemetry_frame(
                 "telemetry.tof",
                 {"tof": telemetry_data["tof"], "source": telemetry_data.get("source")},
+                due=due,
             )
 
         # System
@@ -286,18 +622,19 @@ class WebSocketHub:
             "uptime_seconds": telemetry_data.get("uptime_seconds"),
             "source": telemetry_data.get("source"),
         }
-        await self.broadcast_to_topic("telemetry.system", system_data)
-        await self.broadcast_to_topic("system.health", system_data)
+        await self.publish_telemetry_frame("telemetry.system", system_data, due=due)
+        await self.publish_telemetry_frame("system.health", system_data, due=due)
 
         # Nav debug (mission executor per-tick state — only present during active navigation)
         if "nav_debug" in telemetry_data:
-            await self.broadcast_to_topic(
+            await self.publish_telemetry_frame(
                 "telemetry.nav_debug",
                 telemetry_data["nav_debug"],
+                due=due,
             )
 
         # Legacy full update
-        await self.broadcast_to_topic("telemetry/updates", telemetry_data)
+        await self.publish_telemetry_frame("telemetry/updates", telemetry_data, due=due)
 
     async def get_last_telemetry(self, max_age_s: float = 0.5) -> dict[str, Any]:
         """Return the most recent cached telemetry snapshot if it is fresh enough.